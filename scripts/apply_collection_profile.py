@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""CLI script to migrate an existing Qdrant collection to a vector storage profile.
+
+Usage:
+    uv run python scripts/apply_collection_profile.py --collection conversations --profile on_disk
+    uv run python scripts/apply_collection_profile.py --collection knowledge_base --profile scalar --hnsw-m 32
+    uv run python scripts/apply_collection_profile.py --collection conversations --profile default  # undo
+
+Connects with the KNOWLEDGE_* settings from the environment or .env file.
+The profile is applied in place with update_collection: Qdrant quantizes,
+moves vectors and rebuilds HNSW indexes in the background while the
+collection keeps serving searches. Set KNOWLEDGE_KNOWLEDGE_PROFILE /
+KNOWLEDGE_CONVERSATIONS_PROFILE to the same profile so searches use the
+matching search params and newly created collections get it too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Ensure project root is on sys.path so we can import src.knowledge
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dotenv import load_dotenv  # noqa: E402
+
+# Load .env from project root
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+
+def _describe(info) -> str:
+    """One-line summary of a collection's dense vector storage settings."""
+    dense = info.config.params.vectors["dense"]
+    quantization = dense.quantization_config or info.config.quantization_config
+    hnsw = dense.hnsw_config or info.config.hnsw_config
+    return (
+        f"on_disk={bool(dense.on_disk)} "
+        f"quantization={type(quantization).__name__ if quantization else 'none'} "
+        f"hnsw(m={hnsw.m}, ef_construct={hnsw.ef_construct}) "
+        f"status={info.status} points={info.points_count}"
+    )
+
+
+async def apply(args: argparse.Namespace) -> None:
+    """Apply the requested profile and report the before/after settings."""
+    from qdrant_client import AsyncQdrantClient
+
+    from src.knowledge.collection_profiles import apply_profile, get_profile
+    from src.knowledge.config import KnowledgeBaseConfig
+
+    config = KnowledgeBaseConfig()
+    profile = get_profile(args.profile, args.hnsw_m, args.hnsw_ef_construct, args.hnsw_ef)
+
+    if config.qdrant_url:
+        client = AsyncQdrantClient(
+            url=config.qdrant_url,
+            api_key=config.qdrant_api_key,
+            prefer_grpc=config.qdrant_prefer_grpc,
+            grpc_port=config.qdrant_grpc_port,
+            timeout=config.qdrant_timeout,
+        )
+    else:
+        client = AsyncQdrantClient(path=config.qdrant_path)
+
+    try:
+        if not await client.collection_exists(args.collection):
+            print(f"Collection {args.collection} does not exist")
+            sys.exit(1)
+
+        print(f"Before: {_describe(await client.get_collection(args.collection))}")
+        print(f"Applying profile {profile.name}: {profile.model_dump(exclude={'name'})}")
+        if args.dry_run:
+            return
+
+        await apply_profile(client, args.collection, profile)
+        print(f"After:  {_describe(await client.get_collection(args.collection))}")
+        if profile.hnsw_ef is not None:
+            print(f"Note: hnsw_ef={profile.hnsw_ef} is a search-time setting; set KNOWLEDGE_HNSW_EF to use it.")
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Apply a vector storage profile to an existing Qdrant collection.",
+    )
+    parser.add_argument("--collection", required=True, help="Collection name (e.g. conversations)")
+    parser.add_argument(
+        "--profile",
+        required=True,
+        choices=["default", "scalar", "binary", "on_disk"],
+        help="Profile to apply",
+    )
+    parser.add_argument("--hnsw-m", type=int, default=None, help="Override HNSW m")
+    parser.add_argument("--hnsw-ef-construct", type=int, default=None, help="Override HNSW ef_construct")
+    parser.add_argument("--hnsw-ef", type=int, default=None, help="Override search-time HNSW ef")
+    parser.add_argument("--dry-run", action="store_true", help="Show current settings and the profile only")
+    asyncio.run(apply(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
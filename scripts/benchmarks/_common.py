@@ -0,0 +1,77 @@
+"""Shared helpers for the offline benchmark scripts.
+
+Every benchmark in this package is a standalone script that prints a small
+summary table. These helpers keep the measurement and reporting consistent
+across scripts so results can be compared side by side.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Ensure project root is on sys.path so benchmarks can import src modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of samples, or 0.0 if empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize_ms(samples: list[float]) -> str:
+    """Format seconds samples as 'mean / p50 / p95 / max' in milliseconds."""
+    if not samples:
+        return "n/a"
+    return (
+        f"mean={statistics.fmean(samples) * 1000:8.2f}ms  "
+        f"p50={percentile(samples, 50) * 1000:8.2f}ms  "
+        f"p95={percentile(samples, 95) * 1000:8.2f}ms  "
+        f"max={max(samples) * 1000:8.2f}ms"
+    )
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes a periodic sleeper.
+
+    A coroutine sleeps for ``interval`` seconds in a loop; the difference
+    between the requested and actual wake-up time is the loop lag. Any
+    blocking call on the loop shows up directly as lag samples.
+
+    Args:
+        interval: Sleep interval between probes in seconds.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self.samples: list[float] = []
+
+    async def _probe(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self._interval))
+
+    def start(self) -> None:
+        """Begin sampling loop lag."""
+        self.samples = []
+        self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> list[float]:
+        """Stop sampling and return the collected lag samples."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        return self.samples
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Benchmark recall and latency of the Qdrant collection profiles.
+
+Creates one collection per profile (default, scalar, binary, on_disk and
+any --hnsw-* overrides) filled with the same synthetic 1536-d vectors,
+waits for indexing to finish, then runs the same queries against each.
+Recall@k is measured against exact (brute-force, unquantized) search on
+the first collection; latency is per query with the profile's search params.
+
+Vectors are drawn around a few hundred random centroids so neighbourhoods
+look more like real embeddings than uniform noise does.
+
+Quantization and HNSW only exist in the Qdrant server, so point this at a
+local server (e.g. the qdrant service in docker-compose.yml). Local path
+mode always searches exactly and is not supported.
+
+Usage:
+    uv run python scripts/benchmarks/collection_profiles.py --url http://localhost:6333
+    uv run python scripts/benchmarks/collection_profiles.py --url http://localhost:6333 --points 50000 --hnsw-ef 128
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from _common import summarize_ms
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct, QuantizationSearchParams, SearchParams
+
+from src.knowledge.collection_profiles import COLLECTION_PROFILES, CollectionProfile, get_profile
+
+COLLECTION_PREFIX = "bench_profile_"
+
+
+def _vectors(count: int, dims: int, centroids: int) -> list[list[float]]:
+    centers = [[random.gauss(0.0, 1.0) for _ in range(dims)] for _ in range(centroids)]
+    return [
+        [c + random.gauss(0.0, 0.35) for c in random.choice(centers)] for _ in range(count)
+    ]
+
+
+async def _seed(client: AsyncQdrantClient, name: str, profile: CollectionProfile, vectors, dims: int) -> float:
+    """(Re)create a profile collection, upload vectors and wait until indexed."""
+    if await client.collection_exists(name):
+        await client.delete_collection(name)
+    await client.create_collection(
+        collection_name=name, vectors_config={"dense": profile.vector_params(dims)}
+    )
+    start = time.perf_counter()
+    for offset in range(0, len(vectors), 256):
+        await client.upsert(
+            collection_name=name,
+            points=[
+                PointStruct(id=offset + i, vector={"dense": vector})
+                for i, vector in enumerate(vectors[offset : offset + 256])
+            ],
+        )
+    while (await client.get_collection(name)).status != "green":
+        await asyncio.sleep(0.5)
+    return time.perf_counter() - start
+
+
+async def _search(
+    client: AsyncQdrantClient, name: str, queries, top_k: int, params: SearchParams | None
+) -> tuple[list[list[int]], list[float]]:
+    results: list[list[int]] = []
+    latencies: list[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        response = await client.query_points(
+            collection_name=name, query=query, using="dense", limit=top_k, search_params=params
+        )
+        latencies.append(time.perf_counter() - start)
+        results.append([int(point.id) for point in response.points])
+    return results, latencies
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    client = AsyncQdrantClient(url=args.url, timeout=args.timeout)
+
+    print(f"Generating {args.points} points + {args.queries} queries ({args.dims}d)...")
+    vectors = _vectors(args.points, args.dims, args.centroids)
+    queries = _vectors(args.queries, args.dims, args.centroids)
+
+    profiles = [
+        get_profile(name, args.hnsw_m, args.hnsw_ef_construct, args.hnsw_ef)
+        for name in args.profiles
+    ]
+
+    rows = []
+    truth: list[list[int]] | None = None
+    for profile in profiles:
+        name = f"{COLLECTION_PREFIX}{profile.name}"
+        print(f"Seeding {name}...")
+        index_seconds = await _seed(client, name, profile, vectors, args.dims)
+
+        if truth is None:
+            exact = SearchParams(exact=True, quantization=QuantizationSearchParams(ignore=True))
+            truth, _ = await _search(client, name, queries, args.top_k, exact)
+
+        # Warm up caches (memory-mapped vectors, quantized copies) before timing
+        await _search(client, name, queries[: min(20, len(queries))], args.top_k, profile.search_params())
+        results, latencies = await _search(client, name, queries, args.top_k, profile.search_params())
+        recall = sum(
+            len(set(found) & set(expected)) / len(expected)
+            for found, expected in zip(results, truth, strict=True)
+        ) / len(queries)
+        rows.append((profile, recall, latencies, index_seconds))
+
+        if not args.keep:
+            await client.delete_collection(name)
+
+    await client.close()
+
+    print(f"\n{'=' * 78}")
+    print(f"{args.points} points, {args.queries} queries, top_k={args.top_k}, recall vs exact search")
+    print(f"{'=' * 78}")
+    for profile, recall, latencies, index_seconds in rows:
+        print(f"\n{profile.name}  {profile.model_dump(exclude={'name'}, exclude_none=True)}")
+        print(f"  recall@{args.top_k}:   {recall:.4f}")
+        print(f"  latency:    {summarize_ms(latencies)}")
+        print(f"  load+index: {index_seconds:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare recall and latency of Qdrant collection profiles.",
+    )
+    parser.add_argument("--url", default="http://localhost:6333", help="Qdrant server URL")
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(COLLECTION_PROFILES),
+        choices=list(COLLECTION_PROFILES),
+        help="Profiles to compare (default: all)",
+    )
+    parser.add_argument("--points", type=int, default=20000, help="Points per collection (default: 20000)")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per profile (default: 200)")
+    parser.add_argument("--dims", type=int, default=1536, help="Vector dimensions (default: 1536)")
+    parser.add_argument("--centroids", type=int, default=300, help="Vector clusters (default: 300)")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--hnsw-m", type=int, default=None, help="Override HNSW m for every profile")
+    parser.add_argument("--hnsw-ef-construct", type=int, default=None, help="Override HNSW ef_construct")
+    parser.add_argument("--hnsw-ef", type=int, default=None, help="Override search-time HNSW ef")
+    parser.add_argument("--timeout", type=int, default=60, help="Request timeout seconds (default: 60)")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
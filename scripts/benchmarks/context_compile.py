@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Benchmark working-context compilation over 200-message sessions.
+
+Compares WorkingContextCompiler.compile() with:
+- per-string encoding (before): every message, memory and prompt is encoded
+  individually with tiktoken on every compile, nothing is cached
+- shared TokenCounter, cold: batch encoding, empty count cache each compile
+- shared TokenCounter, warm: a conversation advancing one message per turn,
+  so each compile sees the previous turn's messages already counted
+- thread window: as warm, with compile(..., thread_id=...) so only the new
+  turn is keyed and counted
+
+--growth instead grows one conversation to the largest --sizes and reports
+per-turn compile time at each size, with and without the thread window;
+with the window, compile time stays flat as the session grows.
+
+Messages are synthetic sales-conversation text of varying length; the
+encoding is tiktoken's cl100k_base (downloaded on first use if not cached).
+
+Usage:
+    uv run python scripts/benchmarks/context_compile.py
+    uv run python scripts/benchmarks/context_compile.py --messages 500 --tier fast --turns 100
+    uv run python scripts/benchmarks/context_compile.py --growth --sizes 100 1000 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+import structlog
+from _common import summarize_ms
+
+from src.app.context.working import WorkingContextCompiler
+from src.knowledge.tokenizer import TokenCounter
+
+WORDS = (
+    "pricing renewal discount champion budget timeline procurement security "
+    "review integration billing charging rollout pilot stakeholder approval "
+    "legal contract volume tier usage forecast quarter migration onboarding"
+).split()
+
+
+class PerStringCompiler(WorkingContextCompiler):
+    """The compiler as it counted before: one uncached encode per string."""
+
+    def _count_tokens(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._tokens.encoding.encode(text))
+
+    def _message_tokens(self, messages: list[dict]) -> list[int]:
+        return [
+            self._count_tokens(m.get("content", "")) + self._count_tokens(m.get("role", "")) + 4
+            for m in messages
+        ]
+
+    def _truncate_to_budget(self, text: str, max_tokens: int) -> str:
+        if not text:
+            return text
+        tokens = self._tokens.encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self._tokens.encoding.decode(tokens[:max_tokens])
+
+
+def _message(i: int) -> dict:
+    words = random.randint(15, 220)
+    return {
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": " ".join(random.choices(WORDS, k=words)) + f" (turn {i})",
+    }
+
+
+def _inputs(messages: int) -> tuple[str, list[dict], list[str], dict]:
+    system_prompt = "You are an enterprise sales agent. " * 60
+    session = [_message(i) for i in range(messages)]
+    memories = [" ".join(random.choices(WORDS, k=80)) for _ in range(40)]
+    task = {"type": "deal_analysis", "description": " ".join(random.choices(WORDS, k=120))}
+    return system_prompt, session, memories, task
+
+
+async def _time_compiles(
+    compiler, inputs, incoming: list[dict], reset=None, thread_id: str | None = None
+) -> list[float]:
+    """Compile once per incoming message, sliding the session window by one."""
+    system_prompt, session, memories, task = inputs
+    samples: list[float] = []
+    for message in incoming:
+        if reset is not None:
+            reset()
+        session = session[1:] + [message]
+        start = time.perf_counter()
+        await compiler.compile(system_prompt, session, memories, task, thread_id=thread_id)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    # compile() logs every call at info level
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    random.seed(args.seed)
+    inputs = _inputs(args.messages)
+    incoming = [_message(args.messages + turn) for turn in range(args.turns)]
+
+    counter = TokenCounter()
+    counter.encode("warm up")  # load the encoding outside the timed region
+
+    before = await _time_compiles(
+        PerStringCompiler(args.tier, token_counter=counter), inputs, incoming
+    )
+    cold = await _time_compiles(
+        WorkingContextCompiler(args.tier, token_counter=counter),
+        inputs,
+        incoming,
+        reset=counter.clear,
+    )
+    counter.clear()
+    compiler = WorkingContextCompiler(args.tier, token_counter=counter)
+    await compiler.compile(*inputs)  # first turn of the conversation
+    warm = await _time_compiles(compiler, inputs, incoming)
+    compiler = WorkingContextCompiler(args.tier, token_counter=counter)
+    await compiler.compile(*inputs, thread_id="bench")
+    windowed = await _time_compiles(compiler, inputs, incoming, thread_id="bench")
+
+    print(f"\n{'=' * 78}")
+    print(f"compile(): {args.messages}-message session, tier={args.tier}, {args.turns} turns")
+    print(f"{'=' * 78}")
+    print(f"per-string encoding (before): {summarize_ms(before)}")
+    print(f"shared counter, cold cache:   {summarize_ms(cold)}")
+    print(f"shared counter, warm cache:   {summarize_ms(warm)}")
+    print(f"thread window:                {summarize_ms(windowed)}")
+    print(f"\nspeedup warm vs before: {sum(before) / sum(warm):.1f}x")
+    print(f"speedup window vs warm: {sum(warm) / sum(windowed):.1f}x")
+    print(f"cached counts after run: {len(counter)}")
+
+
+async def benchmark_growth(args: argparse.Namespace) -> None:
+    """Per-turn compile time as one conversation grows through --sizes."""
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    random.seed(args.seed)
+    system_prompt, _, memories, task = _inputs(0)
+    sizes = sorted(args.sizes)
+
+    counter = TokenCounter(cache_size=max(sizes) * 4)
+    counter.encode("warm up")
+    stateless = WorkingContextCompiler(args.tier, token_counter=counter)
+    windowed = WorkingContextCompiler(args.tier, token_counter=counter)
+
+    print(f"\n{'=' * 78}")
+    print(f"compile() per turn as the session grows, tier={args.tier}, {args.turns} turns/size")
+    print(f"{'=' * 78}")
+    session: list[dict] = []
+    for size in sizes:
+        session.extend(_message(i) for i in range(len(session), size - args.turns))
+        results: dict[str, list[float]] = {"stateless": [], "windowed": []}
+        # Both compilers have seen every earlier turn; time the last --turns
+        await stateless.compile(system_prompt, session, memories, task)
+        await windowed.compile(system_prompt, session, memories, task, thread_id="bench")
+        for i in range(len(session), size):
+            session.append(_message(i))
+            for name, compiler, thread_id in (
+                ("stateless", stateless, None),
+                ("windowed", windowed, "bench"),
+            ):
+                start = time.perf_counter()
+                await compiler.compile(system_prompt, session, memories, task, thread_id=thread_id)
+                results[name].append(time.perf_counter() - start)
+        print(f"{size:>6} messages  warm cache:    {summarize_ms(results['stateless'])}")
+        print(f"{'':>6}           thread window: {summarize_ms(results['windowed'])}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare context compilation with per-string vs shared cached token counting.",
+    )
+    parser.add_argument("--messages", type=int, default=200, help="Messages per session (default: 200)")
+    parser.add_argument("--turns", type=int, default=50, help="Compiles per variant (default: 50)")
+    parser.add_argument(
+        "--tier", default="reasoning", choices=["fast", "reasoning"], help="Token budget tier"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--growth", action="store_true", help="Report compile time as one session grows"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 500, 1000, 2500, 5000],
+        help="Session sizes for --growth (default: 100 500 1000 2500 5000)",
+    )
+    args = parser.parse_args()
+    asyncio.run(benchmark_growth(args) if args.growth else benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark per-hit conversion cost of hybrid search results.
+
+Compares turning a Qdrant ScoredPoint into:
+- a full KnowledgeChunk from the full payload (hybrid_search_batch)
+- a slim KnowledgeHit from the RETRIEVAL_PAYLOAD_FIELDS projection
+  (search_hits_batch, used by MultiSourceRetriever)
+
+Points are built in memory with payloads shaped exactly like the ones
+upsert_chunks writes, so only the conversion is measured. The payload size
+line shows the JSON bytes each hit would transfer with and without the
+projection.
+
+Usage:
+    uv run python scripts/benchmarks/knowledge_hit_conversion.py
+    uv run python scripts/benchmarks/knowledge_hit_conversion.py --hits 50 --rounds 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+from _common import percentile
+from qdrant_client.models import ScoredPoint
+
+from src.knowledge.models import chunk_content_hash
+from src.knowledge.qdrant_client import RETRIEVAL_PAYLOAD_FIELDS, QdrantKnowledgeStore
+
+WORDS = (
+    "pricing subscription usage billing charging invoice enterprise tier "
+    "discount volume rating mediation revenue partner settlement catalog"
+).split()
+
+
+def _full_payload(words: int) -> dict:
+    """A payload shaped like QdrantKnowledgeStore.upsert_chunks writes."""
+    content = " ".join(random.choices(WORDS, k=words))
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "tenant_id": "bench",
+        "content": content,
+        "content_hash": chunk_content_hash(content),
+        "product_category": "billing",
+        "buyer_persona": ["technical", "business"],
+        "sales_stage": ["discovery", "evaluation"],
+        "region": ["emea", "global"],
+        "content_type": "product",
+        "source_document": "data/products/billing.md",
+        "version": 3,
+        "valid_from": now,
+        "valid_until": None,
+        "is_current": True,
+        "cross_references": ["Billing Platform", "Charging"],
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _points(count: int, words: int, fields: tuple[str, ...] | None) -> list[ScoredPoint]:
+    points = []
+    for rank in range(count):
+        payload = _full_payload(words)
+        if fields is not None:
+            payload = {key: payload[key] for key in fields}
+        points.append(
+            ScoredPoint(id=str(uuid.uuid4()), version=0, score=1 / (rank + 2), payload=payload)
+        )
+    return points
+
+
+def _measure(label: str, convert, points: list[ScoredPoint], rounds: int) -> float:
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for point in points:
+            convert(point)
+        samples.append((time.perf_counter() - start) / len(points))
+
+    payload_bytes = sum(len(json.dumps(p.payload)) for p in points) / len(points)
+    mean_us = sum(samples) / len(samples) * 1_000_000
+    print(f"\n{label}")
+    print(
+        f"  per hit:       mean={mean_us:8.2f}us  "
+        f"p50={percentile(samples, 50) * 1_000_000:8.2f}us  "
+        f"p95={percentile(samples, 95) * 1_000_000:8.2f}us"
+    )
+    print(f"  payload:       {payload_bytes:.0f} bytes/hit")
+    return mean_us
+
+
+def benchmark(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    full_points = _points(args.hits, args.words, None)
+    projected_points = _points(args.hits, args.words, RETRIEVAL_PAYLOAD_FIELDS)
+
+    print(f"{'=' * 78}")
+    print(f"Converting {args.hits} hits x {args.rounds} rounds ({args.words} words/chunk)")
+    print(f"{'=' * 78}")
+
+    full_us = _measure(
+        "KnowledgeChunk from full payload (before)",
+        lambda point: QdrantKnowledgeStore._point_to_chunk(point, "bench"),
+        full_points,
+        args.rounds,
+    )
+    hit_us = _measure(
+        f"KnowledgeHit from projection {RETRIEVAL_PAYLOAD_FIELDS}",
+        QdrantKnowledgeStore._point_to_hit,
+        projected_points,
+        args.rounds,
+    )
+    print(f"\nspeedup: {full_us / hit_us:.1f}x per hit")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-hit conversion cost of full chunks vs slim hits.",
+    )
+    parser.add_argument("--hits", type=int, default=20, help="Hits per round (default: 20)")
+    parser.add_argument("--words", type=int, default=90, help="Words per chunk (default: 90)")
+    parser.add_argument("--rounds", type=int, default=500, help="Rounds per variant (default: 500)")
+    parser.add_argument("--seed", type=int, default=7)
+    benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop lag under concurrent Qdrant searches.
+
+Compares the previous pattern (synchronous QdrantClient called from inside
+``async def``) with the AsyncQdrantClient now used by QdrantKnowledgeStore
+and ConversationStore. Fires --concurrency searches at a time and records
+per-search latency plus how late the event loop wakes a 5ms sleeper.
+
+Point it at a real Qdrant server for meaningful numbers. Local path mode
+runs in-process, so both variants block the loop there and show the same
+lag; it is kept only as a smoke test.
+
+Usage:
+    uv run python scripts/benchmarks/qdrant_event_loop_lag.py --url http://localhost:6333
+    uv run python scripts/benchmarks/qdrant_event_loop_lag.py --url http://localhost:6333 --prefer-grpc
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+
+from _common import EventLoopLagMonitor, summarize_ms
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+COLLECTION = "bench_event_loop_lag"
+
+
+def _random_vector(dims: int) -> list[float]:
+    return [random.uniform(-1.0, 1.0) for _ in range(dims)]
+
+
+def _seed(client: QdrantClient, points: int, dims: int) -> None:
+    """(Re)create the benchmark collection and fill it with random points."""
+    if client.collection_exists(COLLECTION):
+        client.delete_collection(COLLECTION)
+    client.create_collection(
+        collection_name=COLLECTION,
+        vectors_config={"dense": VectorParams(size=dims, distance=Distance.COSINE)},
+    )
+    batch: list[PointStruct] = []
+    for i in range(points):
+        batch.append(
+            PointStruct(
+                id=str(uuid.uuid4()),
+                vector={"dense": _random_vector(dims)},
+                payload={"tenant_id": "bench", "content": f"point {i}"},
+            )
+        )
+        if len(batch) == 256:
+            client.upsert(collection_name=COLLECTION, points=batch)
+            batch = []
+    if batch:
+        client.upsert(collection_name=COLLECTION, points=batch)
+
+
+async def _run(search, queries: int, concurrency: int, dims: int) -> tuple[float, list[float], list[float]]:
+    """Run `queries` searches with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await search(_random_vector(dims))
+            latencies.append(time.perf_counter() - start)
+
+    monitor = EventLoopLagMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(queries)))
+    wall = time.perf_counter() - start
+    lag = await monitor.stop()
+    return wall, latencies, lag
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    local_path = None if args.url else tempfile.mkdtemp(prefix="qdrant_bench_")
+    connect = {"url": args.url, "timeout": args.timeout} if args.url else {"path": local_path}
+
+    sync_client = QdrantClient(**connect)
+    print(f"Seeding {args.points} points ({args.dims}d)...")
+    _seed(sync_client, args.points, args.dims)
+
+    async def sync_search(vector: list[float]) -> None:
+        # Previous behaviour: blocking network call inside a coroutine
+        sync_client.query_points(
+            collection_name=COLLECTION, query=vector, using="dense", limit=args.top_k
+        )
+
+    sync_result = await _run(sync_search, args.queries, args.concurrency, args.dims)
+    sync_client.close()
+
+    if args.url:
+        async_client = AsyncQdrantClient(
+            url=args.url,
+            prefer_grpc=args.prefer_grpc,
+            timeout=args.timeout,
+            pool_size=args.pool_size,
+        )
+    else:
+        async_client = AsyncQdrantClient(path=local_path)
+
+    async def async_search(vector: list[float]) -> None:
+        await async_client.query_points(
+            collection_name=COLLECTION, query=vector, using="dense", limit=args.top_k
+        )
+
+    async_result = await _run(async_search, args.queries, args.concurrency, args.dims)
+    await async_client.delete_collection(COLLECTION)
+    await async_client.close()
+
+    print(f"\n{'=' * 78}")
+    print(f"{args.queries} searches, concurrency={args.concurrency}, top_k={args.top_k}")
+    print(f"{'=' * 78}")
+    for label, (wall, latencies, lag) in (
+        ("sync QdrantClient (before)", sync_result),
+        ("AsyncQdrantClient (after)", async_result),
+    ):
+        print(f"\n{label}")
+        print(f"  wall time:   {wall * 1000:.1f}ms  ({args.queries / wall:.1f} searches/s)")
+        print(f"  latency:     {summarize_ms(latencies)}")
+        print(f"  loop lag:    {summarize_ms(lag)}")
+
+    if not args.url:
+        print("\nNote: local path mode runs in-process; use --url for a meaningful comparison.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare event-loop lag of sync vs async Qdrant clients under concurrency.",
+    )
+    parser.add_argument("--url", default=None, help="Qdrant server URL (omit for local path smoke test)")
+    parser.add_argument("--prefer-grpc", action="store_true", help="Use gRPC for the async client")
+    parser.add_argument("--points", type=int, default=5000, help="Points to seed (default: 5000)")
+    parser.add_argument("--dims", type=int, default=1536, help="Vector dimensions (default: 1536)")
+    parser.add_argument("--queries", type=int, default=500, help="Searches per variant (default: 500)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Searches in flight (default: 32)")
+    parser.add_argument("--top-k", type=int, default=7, help="Results per search (default: 7)")
+    parser.add_argument("--timeout", type=int, default=10, help="Request timeout seconds (default: 10)")
+    parser.add_argument("--pool-size", type=int, default=32, help="Async connection pool size (default: 32)")
+    asyncio.run(benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark AgenticRAGPipeline grading modes: latency and token cost.
+
+Grades the same set of retrieved chunks with:
+- per_chunk, grading_concurrency=1 (the previous sequential behaviour)
+- per_chunk, grading_concurrency=N
+- batch (one structured call for all chunks)
+
+The grading LLM is simulated: each call sleeps for a fixed round-trip
+latency plus a per-token cost derived from the real prompt and response,
+counted with tiktoken (cl100k_base). This isolates the grading strategy
+from provider variance while keeping token counts exact.
+
+Usage:
+    uv run python scripts/benchmarks/rag_grading.py
+    uv run python scripts/benchmarks/rag_grading.py --chunks 14 --rtt-ms 800 --concurrency 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+import tiktoken
+from _common import summarize_ms
+
+from src.knowledge.rag.pipeline import AgenticRAGPipeline, RAGState
+from src.knowledge.rag.retriever import RetrievedChunk
+
+WORDS = (
+    "pricing subscription usage billing charging invoice enterprise tier "
+    "discount volume rating mediation revenue partner settlement catalog"
+).split()
+
+
+class SimulatedGradingLLM:
+    """Grading LLM stand-in that charges latency per call and per token."""
+
+    def __init__(self, rtt_ms: float, ms_per_input_1k: float, ms_per_output_token: float) -> None:
+        self._rtt = rtt_ms / 1000
+        self._per_input = ms_per_input_1k / 1000 / 1000
+        self._per_output = ms_per_output_token / 1000
+        self._encoding = tiktoken.get_encoding("cl100k_base")
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    async def ainvoke(self, prompt: str, **kwargs) -> str:
+        if "For each document below" in prompt:
+            count = prompt.count("\n[")
+            response = "{" + ", ".join(f'"{i}": "yes"' for i in range(1, count + 1)) + "}"
+        else:
+            response = "yes"
+
+        input_tokens = len(self._encoding.encode(prompt))
+        output_tokens = len(self._encoding.encode(response))
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+        await asyncio.sleep(
+            self._rtt + input_tokens * self._per_input + output_tokens * self._per_output
+        )
+        return response
+
+
+def _chunks(count: int, words: int) -> list[RetrievedChunk]:
+    return [
+        RetrievedChunk(
+            chunk_id=f"chunk-{i}",
+            content=" ".join(random.choices(WORDS, k=words)),
+            relevance_score=0.5,
+            source_type="product",
+        )
+        for i in range(count)
+    ]
+
+
+async def _measure(label: str, args: argparse.Namespace, chunks: list[RetrievedChunk], **kwargs) -> None:
+    llm = SimulatedGradingLLM(args.rtt_ms, args.ms_per_input_1k, args.ms_per_output_token)
+    pipeline = AgenticRAGPipeline(
+        decomposer=None,
+        retriever=None,
+        synthesizer=None,
+        grading_llm=llm,
+        **kwargs,
+    )
+
+    latencies: list[float] = []
+    for _ in range(args.rounds):
+        state = RAGState(query=args.query, tenant_id="bench", retrieved_chunks=chunks)
+        start = time.perf_counter()
+        await pipeline._grade(state)
+        latencies.append(time.perf_counter() - start)
+
+    print(f"\n{label}")
+    print(f"  latency:       {summarize_ms(latencies)}")
+    print(f"  calls/grade:   {llm.calls / args.rounds:.1f}")
+    print(f"  input tokens:  {llm.input_tokens / args.rounds:.0f} per grade")
+    print(f"  output tokens: {llm.output_tokens / args.rounds:.0f} per grade")
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    chunks = _chunks(args.chunks, args.words)
+
+    print(f"{'=' * 78}")
+    print(
+        f"Grading {args.chunks} chunks x {args.rounds} rounds  "
+        f"(rtt={args.rtt_ms}ms, {args.ms_per_input_1k}ms/1k input tok, "
+        f"{args.ms_per_output_token}ms/output tok)"
+    )
+    print(f"{'=' * 78}")
+
+    await _measure("per_chunk, concurrency=1 (before)", args, chunks, grading_concurrency=1)
+    await _measure(
+        f"per_chunk, concurrency={args.concurrency}",
+        args,
+        chunks,
+        grading_concurrency=args.concurrency,
+    )
+    await _measure("batch (single structured call)", args, chunks, grading_mode="batch")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare latency and token cost of RAG grading modes.",
+    )
+    parser.add_argument("--chunks", type=int, default=7, help="Chunks to grade (default: 7)")
+    parser.add_argument("--words", type=int, default=90, help="Words per chunk (default: 90)")
+    parser.add_argument("--rounds", type=int, default=5, help="Grading rounds per mode (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Per-chunk concurrency (default: 4)")
+    parser.add_argument("--rtt-ms", type=float, default=400.0, help="Per-call round trip (default: 400)")
+    parser.add_argument(
+        "--ms-per-input-1k", type=float, default=20.0, help="Prefill ms per 1k input tokens (default: 20)"
+    )
+    parser.add_argument(
+        "--ms-per-output-token", type=float, default=10.0, help="Decode ms per output token (default: 10)"
+    )
+    parser.add_argument("--query", default="What is Monetization Platform pricing for EMEA?")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
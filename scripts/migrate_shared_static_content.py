@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""CLI script to move bundled methodology/regional content into the shared partition.
+
+Usage:
+    uv run python scripts/migrate_shared_static_content.py
+
+Connects with the KNOWLEDGE_* settings from the environment or .env file.
+Tenants provisioned before the shared partition (KNOWLEDGE_SHARED_TENANT_ID)
+existed each hold their own copy of the bundled methodology and regional
+sections; since searches also match the shared partition, those tenants
+would get every methodology hit twice. This one-time migration loads the
+bundled content into the shared partition (embedding it once, if missing)
+and deletes the per-tenant copies of the bundled files, invalidating the
+cached answers built from them. Content a tenant ingested itself is kept.
+Safe to rerun.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+# Ensure project root is on sys.path so we can import src.knowledge
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dotenv import load_dotenv  # noqa: E402
+
+# Load .env from project root
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+
+async def migrate() -> None:
+    """Load the shared static content and remove the per-tenant copies."""
+    from src.knowledge.config import KnowledgeBaseConfig
+    from src.knowledge.embeddings import EmbeddingService
+    from src.knowledge.methodology.loader import MethodologyLoader
+    from src.knowledge.qdrant_client import QdrantKnowledgeStore
+
+    config = KnowledgeBaseConfig()
+    if config.shared_tenant_id is None:
+        print("KNOWLEDGE_SHARED_TENANT_ID is unset; static content stays per tenant")
+        sys.exit(1)
+
+    embedder = EmbeddingService(config)
+    store = QdrantKnowledgeStore(config, embedder)
+    try:
+        await store.initialize_collections()
+        before = (await store.client.count(config.collection_knowledge, exact=True)).count
+        counts = await MethodologyLoader(store, embedder).load_all(config.shared_tenant_id)
+        after = (await store.client.count(config.collection_knowledge, exact=True)).count
+    finally:
+        await embedder.close()
+        await store.close()
+
+    print(
+        f"Shared partition {config.shared_tenant_id}: "
+        f"{counts['methodology']} methodology and {counts['regional']} regional chunks"
+    )
+    print(f"{config.collection_knowledge}: {before} -> {after} points")
+
+
+def main() -> None:
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""CLI script to rebuild the knowledge base into a new collection and swap its alias.
+
+Usage:
+    uv run python scripts/reindex_knowledge.py
+    uv run python scripts/reindex_knowledge.py --max-points-per-second 200 --concurrency 2
+    uv run python scripts/reindex_knowledge.py --no-swap      # build + verify only
+    uv run python scripts/reindex_knowledge.py --drop-previous
+
+Connects with the KNOWLEDGE_* settings from the environment or .env file.
+Set the new embedding model/dimensions or KNOWLEDGE_KNOWLEDGE_PROFILE there
+first: the shadow collection (knowledge_base_vN) is created and filled with
+those settings while searches keep hitting the current collection through
+the knowledge_base alias. The alias is swapped only after every tenant's
+point count matches.
+
+A deployment from before aliases has a plain knowledge_base collection.
+Swapping it is a one-time cutover that is NOT zero-downtime: the plain
+collection is deleted and then replaced by the alias, and searches fail in
+between. Unless --drop-previous is given, it is first copied as-is to
+knowledge_base_v0 for rollback. Run the first reindex of such a deployment
+in a maintenance window.
+
+Progress is checkpointed to --state-file; rerun the same command after a
+crash or interruption to resume (including a cutover that died after the
+delete). If the embedding dimensions changed, also
+recreate the semantic answer cache collection, whose vectors use them too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# Ensure project root is on sys.path so we can import src.knowledge
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dotenv import load_dotenv  # noqa: E402
+
+# Load .env from project root
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+
+async def reindex(args: argparse.Namespace) -> None:
+    """Run (or resume) the reindex job and print its report."""
+    from src.knowledge.config import KnowledgeBaseConfig
+    from src.knowledge.embeddings import EmbeddingService
+    from src.knowledge.qdrant_client import QdrantKnowledgeStore
+    from src.knowledge.reindex import KnowledgeReindexer, ReindexError
+
+    config = KnowledgeBaseConfig()
+    embedder = EmbeddingService(config)
+    store = QdrantKnowledgeStore(config, embedder)
+    reindexer = KnowledgeReindexer(
+        store,
+        state_path=args.state_file,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        max_points_per_second=args.max_points_per_second,
+        drop_previous=args.drop_previous,
+    )
+
+    try:
+        report = await reindexer.run(swap=not args.no_swap)
+    except ReindexError as e:
+        print(f"Reindex failed: {e}")
+        sys.exit(1)
+    finally:
+        await embedder.close()
+        await store.close()
+
+    print(f"{report.source} -> {report.target}{' (resumed)' if report.resumed else ''}")
+    print(f"  copied:     {report.copied}")
+    print(f"  reconciled: {report.reconciled}")
+    for tenant_id, count in sorted(report.tenant_counts.items()):
+        print(f"  {tenant_id}: {count} points")
+    alias = config.collection_knowledge
+    if report.swapped:
+        print(f"Alias {alias} now points at {report.target}")
+        if report.cutover:
+            print(
+                f"One-time cutover: the plain {alias} collection was replaced by the alias; "
+                "searches failed between its deletion and the alias creation"
+            )
+        if report.rollback:
+            print(f"Previous data kept in {report.rollback}; point {alias} back at it to roll back")
+        else:
+            print("Previous collection dropped (--drop-previous); no rollback copy kept")
+    else:
+        print(f"Verified {report.target}; rerun without --no-swap to swap the alias")
+        if report.cutover:
+            print(
+                f"Note: {alias} is a plain pre-alias collection. The swap deletes it and then "
+                "creates the alias (brief search outage, one time only); run it in a maintenance window"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the knowledge base into a new collection and swap its alias.",
+    )
+    parser.add_argument(
+        "--state-file",
+        default=".reindex/knowledge_base.json",
+        help="Checkpoint file used to resume (default: .reindex/knowledge_base.json)",
+    )
+    parser.add_argument("--batch-size", type=int, default=128, help="Points per embedding batch (default: 128)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Batches in flight (default: 4)")
+    parser.add_argument(
+        "--max-points-per-second",
+        type=float,
+        default=None,
+        help="Throughput cap to leave room for live traffic (default: unthrottled)",
+    )
+    parser.add_argument("--no-swap", action="store_true", help="Build and verify, but keep the current alias")
+    parser.add_argument(
+        "--drop-previous",
+        action="store_true",
+        help="Delete the old collection after the swap (no rollback copy)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging output")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(name)s %(levelname)s: %(message)s",
+    )
+    asyncio.run(reindex(args))
+
+
+if __name__ == "__main__":
+    main()
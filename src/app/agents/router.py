@@ -80,11 +80,21 @@ class HybridRouter:
     Args:
         registry: AgentRegistry for looking up available agents.
         llm_service: LLMService for LLM-based routing and decomposition.
+        cache_ttl: Seconds an identical routing or decomposition prompt is
+            answered from the LLM response cache. None always calls the LLM.
     """
 
-    def __init__(self, registry: AgentRegistry, llm_service: LLMService) -> None:
+    DEFAULT_CACHE_TTL = 900
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        llm_service: LLMService,
+        cache_ttl: int | None = DEFAULT_CACHE_TTL,
+    ) -> None:
         self._registry = registry
         self._llm_service = llm_service
+        self._cache_ttl = cache_ttl
         self._rules: list[tuple[Callable[[dict[str, Any]], bool], str]] = []
 
     def add_rule(self, matcher: Callable[[dict[str, Any]], bool], agent_id: str) -> None:
@@ -204,6 +214,7 @@ Respond with ONLY a JSON object (no markdown, no explanation outside the JSON):
             model="fast",
             temperature=0.0,
             max_tokens=256,
+            cache_ttl=self._cache_ttl,
         )
 
         content = response.get("content", "").strip()
@@ -300,6 +311,7 @@ Rules:
             model="reasoning",
             temperature=0.0,
             max_tokens=1024,
+            cache_ttl=self._cache_ttl,
         )
 
         content = response.get("content", "").strip()
@@ -9,6 +9,8 @@ tone, formality, question style, and methodology emphasis to the target persona
 Exports:
     PERSONA_CONFIGS: Per-persona communication style configuration.
     VOSS_METHODOLOGY_PROMPT: Core tactical empathy instructions.
+    STATIC_SYSTEM_PROMPT: Role and methodology text that leads every system
+        prompt; email/chat messages mark it as the cacheable prompt prefix.
     CHANNEL_CONFIGS: Channel-specific formatting guidance.
     build_system_prompt: Compose full system prompt from persona + channel + stage.
     build_email_prompt: Ready-to-use messages list for email LLM calls.
@@ -21,6 +23,7 @@ from __future__ import annotations
 
 from src.app.agents.sales.qbs.prompts import QBS_METHODOLOGY_PROMPT
 from src.app.agents.sales.schemas import Channel, DealStage, PersonaType
+from src.app.services.llm import CACHE_PREFIX_KEY
 
 
 # ── Persona Configurations ──────────────────────────────────────────────────
@@ -224,6 +227,21 @@ _DEAL_STAGE_GUIDANCE: dict[DealStage, str] = {
 }
 
 
+# ── Static System Prompt Prefix ─────────────────────────────────────────────
+
+# Identical for every persona, channel and deal stage, so it comes first in
+# every system prompt and is cached by the provider as a prompt prefix.
+STATIC_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a top 1% enterprise sales professional. You combine deep "
+    "product expertise with masterful relationship-building skills. You "
+    "are executing the ESW (Enterprise Sales Workflow) methodology, which "
+    "integrates BANT and MEDDIC qualification frameworks with Chris Voss's "
+    "tactical empathy approach from 'Never Split the Difference.'",
+    VOSS_METHODOLOGY_PROMPT,
+    QBS_METHODOLOGY_PROMPT,
+])
+
+
 # ── Prompt Builders ─────────────────────────────────────────────────────────
 
 
@@ -358,16 +376,8 @@ def build_system_prompt(
         "and build on established rapport."
     )
 
-    # Assemble prompt parts -- methodologies first, then context
-    parts = [
-        "You are a top 1% enterprise sales professional. You combine deep "
-        "product expertise with masterful relationship-building skills. You "
-        "are executing the ESW (Enterprise Sales Workflow) methodology, which "
-        "integrates BANT and MEDDIC qualification frameworks with Chris Voss's "
-        "tactical empathy approach from 'Never Split the Difference.'",
-        VOSS_METHODOLOGY_PROMPT,
-        QBS_METHODOLOGY_PROMPT,
-    ]
+    # Assemble prompt parts -- static methodologies first, then context
+    parts = [STATIC_SYSTEM_PROMPT]
 
     if qbs_guidance:
         parts.append(qbs_guidance)
@@ -422,7 +432,7 @@ def build_email_prompt(
     )
 
     return [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": system_prompt, CACHE_PREFIX_KEY: STATIC_SYSTEM_PROMPT},
         {"role": "user", "content": user_message},
     ]
 
@@ -462,7 +472,7 @@ def build_chat_prompt(
     )
 
     return [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": system_prompt, CACHE_PREFIX_KEY: STATIC_SYSTEM_PROMPT},
         {"role": "user", "content": user_message},
     ]
 
@@ -43,7 +43,7 @@ class QBSQuestionEngine:
 
     Args:
         llm_service: LLMService instance (typed as object to avoid import
-            cycle; only needs .router attribute for model config).
+            cycle; only needs .structured_completion()).
     """
 
     # Depth ordering for comparison (lower index = shallower)
@@ -58,8 +58,9 @@ class QBSQuestionEngine:
         """Initialize with LLM service reference.
 
         Args:
-            llm_service: LLMService instance (used to get model config).
-                Typed as object to avoid import cycle; only needs .router attribute.
+            llm_service: LLMService instance (used for structured extraction).
+                Typed as object to avoid import cycle; only needs .structured_completion().
+                None uses the shared service from get_llm_service().
         """
         self._llm_service = llm_service
 
@@ -85,10 +86,8 @@ class QBSQuestionEngine:
             QBSQuestionRecommendation with blended question type, MEDDIC/BANT
             target, and Voss delivery technique.
         """
-        import instructor
-        import litellm
-
         from src.app.agents.sales.qbs.prompts import build_qbs_analysis_prompt
+        from src.app.services.llm import get_llm_service
 
         # Load pain state from conversation metadata
         pain_state = self._load_pain_state(conversation_state)
@@ -121,17 +120,13 @@ class QBSQuestionEngine:
                 qualification_gaps=qualification_gaps,
             )
 
-            # Create instructor client with LiteLLM async completion
-            client = instructor.from_litellm(litellm.acompletion)
-
-            # Resolve fast model for low-latency analysis
-            model = self._resolve_model("fast")
-
             # Single LLM call for signal analysis and question recommendation
-            recommendation = await client.chat.completions.create(
-                model=model,
-                response_model=QBSQuestionRecommendation,
+            # (fast model for low latency)
+            llm_service = self._llm_service or get_llm_service()
+            recommendation = await llm_service.structured_completion(
                 messages=messages,
+                response_model=QBSQuestionRecommendation,
+                model="fast",
                 max_tokens=512,
                 temperature=0.3,
                 max_retries=2,
@@ -320,25 +315,6 @@ class QBSQuestionEngine:
             return PainFunnelState(**data)
         return PainFunnelState()
 
-    def _resolve_model(self, model_name: str) -> str:
-        """Resolve model name to LiteLLM model identifier.
-
-        Looks up the model name in the LLM service router config.
-        Defaults to claude-sonnet-4-20250514 if not found.
-
-        Args:
-            model_name: Logical model name (e.g. "fast", "reasoning").
-
-        Returns:
-            LiteLLM model identifier string.
-        """
-        default = "anthropic/claude-sonnet-4-20250514"
-        if hasattr(self._llm_service, "router") and self._llm_service.router:
-            for m in self._llm_service.router.model_list:
-                if m.get("model_name") == model_name:
-                    return m["litellm_params"]["model"]
-        return default
-
     @staticmethod
     def _build_qualification_gaps(qualification: QualificationState) -> str:
         """Build a comma-separated string of unidentified qualification dimensions.
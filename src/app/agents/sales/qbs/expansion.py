@@ -35,14 +35,15 @@ class AccountExpansionDetector:
 
     Args:
         llm_service: LLMService instance (typed as object to avoid import
-            cycle; only needs .router attribute for model config).
+            cycle; only needs .structured_completion()).
     """
 
     def __init__(self, llm_service: object) -> None:
         """Initialize with LLM service reference.
 
         Args:
-            llm_service: LLMService instance (used to get model config).
+            llm_service: LLMService instance (used for structured extraction).
+                None uses the shared service from get_llm_service().
         """
         self._llm_service = llm_service
 
@@ -71,12 +72,10 @@ class AccountExpansionDetector:
         Returns:
             List of ExpansionTrigger objects. Empty list on LLM failure.
         """
-        import instructor
-        import litellm
-
         from src.app.agents.sales.qbs.prompts import (
             build_expansion_detection_prompt,
         )
+        from src.app.services.llm import get_llm_service
 
         try:
             # Build prompt messages
@@ -85,17 +84,13 @@ class AccountExpansionDetector:
                 existing_contacts=existing_contacts,
             )
 
-            # Create instructor client with LiteLLM async completion
-            client = instructor.from_litellm(litellm.acompletion)
-
-            # Resolve fast model for low-latency extraction
-            model = self._resolve_model("fast")
-
             # Single LLM call for expansion trigger detection
-            result = await client.chat.completions.create(
-                model=model,
-                response_model=ExpansionRecommendation,
+            # (fast model for low latency)
+            llm_service = self._llm_service or get_llm_service()
+            result = await llm_service.structured_completion(
                 messages=messages,
+                response_model=ExpansionRecommendation,
+                model="fast",
                 max_tokens=512,
                 temperature=0.2,
                 max_retries=1,
@@ -126,25 +121,6 @@ class AccountExpansionDetector:
             )
             return []
 
-    def _resolve_model(self, model_name: str) -> str:
-        """Resolve model name to LiteLLM model identifier.
-
-        Looks up the model name in the LLM service router config.
-        Defaults to claude-sonnet-4-20250514 if not found.
-
-        Args:
-            model_name: Logical model name (e.g. "fast", "reasoning").
-
-        Returns:
-            LiteLLM model identifier string.
-        """
-        default = "anthropic/claude-sonnet-4-20250514"
-        if hasattr(self._llm_service, "router") and self._llm_service.router:
-            for m in self._llm_service.router.model_list:
-                if m.get("model_name") == model_name:
-                    return m["litellm_params"]["model"]
-        return default
-
     @staticmethod
     def save_expansion_state(
         state: ConversationState,
@@ -1,8 +1,9 @@
 """Qualification signal extraction and incremental merge logic.
 
 Provides structured LLM extraction of BANT and MEDDIC qualification signals
-from conversation text using instructor + LiteLLM, and pure merge functions
-that preserve existing high-confidence data while incorporating new evidence.
+from conversation text via LLMService.structured_completion, and pure merge
+functions that preserve existing high-confidence data while incorporating
+new evidence.
 
 Merge strategy (anti-Pitfall 3: never overwrite existing qualification data):
 - For each signal field: only update if new value has higher confidence OR
@@ -16,7 +17,7 @@ Exports:
     merge_bant_signals: Merge two BANTSignals preserving higher-confidence data.
     merge_meddic_signals: Merge two MEDDICSignals preserving higher-confidence data.
     merge_qualification_signals: Merge two QualificationState objects.
-    QualificationExtractor: LLM-powered extraction using instructor + LiteLLM.
+    QualificationExtractor: LLM-powered extraction via LLMService.structured_completion.
 """
 
 from __future__ import annotations
@@ -263,11 +264,11 @@ def merge_qualification_signals(
 
 
 class QualificationExtractor:
-    """LLM-powered qualification signal extraction using instructor + LiteLLM.
+    """LLM-powered qualification signal extraction via structured LLM output.
 
     Extracts structured BANT + MEDDIC signals from conversation text in a
-    single LLM call. Uses instructor for structured output validation against
-    the QualificationState Pydantic model.
+    single LLM call. Uses LLMService.structured_completion (instructor) for
+    output validation against the QualificationState Pydantic model.
 
     If existing_state is provided, the new extraction is merged with it using
     merge_qualification_signals() to preserve existing high-confidence data.
@@ -276,15 +277,16 @@ class QualificationExtractor:
     consistent with 02-03 fail-open for LLM failures).
 
     Args:
-        llm_service: LLMService instance from Phase 1 (used for model config).
+        llm_service: LLMService instance from Phase 1.
     """
 
     def __init__(self, llm_service: object) -> None:
         """Initialize with LLM service reference.
 
         Args:
-            llm_service: LLMService instance (used to get model config).
-                Typed as object to avoid import cycle; only needs .router attribute.
+            llm_service: LLMService instance (used for structured extraction).
+                Typed as object to avoid import cycle; only needs .structured_completion().
+                None uses the shared service from get_llm_service().
         """
         self._llm_service = llm_service
 
@@ -295,7 +297,7 @@ class QualificationExtractor:
     ) -> QualificationState:
         """Extract qualification signals from conversation text.
 
-        Uses instructor with LiteLLM for structured extraction of BANT + MEDDIC
+        Uses LLMService.structured_completion for extraction of BANT + MEDDIC
         signals in a single LLM call. Merges with existing_state if provided.
 
         Args:
@@ -305,10 +307,8 @@ class QualificationExtractor:
         Returns:
             QualificationState with extracted (and optionally merged) signals.
         """
-        import instructor
-        import litellm
-
         from src.app.agents.sales.prompts import build_qualification_extraction_prompt
+        from src.app.services.llm import get_llm_service
 
         try:
             # Build the extraction prompt
@@ -320,23 +320,12 @@ class QualificationExtractor:
                 existing_state=existing_dict,
             )
 
-            # Create instructor client with LiteLLM async completion
-            client = instructor.from_litellm(litellm.acompletion)
-
-            # Determine model to use -- prefer reasoning model from router config
-            model = "anthropic/claude-sonnet-4-20250514"
-            if hasattr(self._llm_service, "router") and self._llm_service.router:
-                # Extract model from router's model list
-                for m in self._llm_service.router.model_list:
-                    if m.get("model_name") == "reasoning":
-                        model = m["litellm_params"]["model"]
-                        break
-
             # Single LLM call to extract ALL BANT + MEDDIC signals
-            extracted = await client.chat.completions.create(
-                model=model,
-                response_model=QualificationState,
+            llm_service = self._llm_service or get_llm_service()
+            extracted = await llm_service.structured_completion(
                 messages=messages,
+                response_model=QualificationState,
+                model="reasoning",
                 max_tokens=4096,
                 temperature=0.1,  # Low temp for consistent extraction
                 max_retries=2,
@@ -59,14 +59,18 @@ async def _check_dependencies() -> dict:
 
         kb_config = KnowledgeBaseConfig()
         if kb_config.qdrant_url:
-            from qdrant_client import QdrantClient
+            from qdrant_client import AsyncQdrantClient
 
-            client = QdrantClient(url=kb_config.qdrant_url, api_key=kb_config.qdrant_api_key)
+            client = AsyncQdrantClient(
+                url=kb_config.qdrant_url,
+                api_key=kb_config.qdrant_api_key,
+                timeout=kb_config.qdrant_timeout,
+            )
             try:
-                client.get_collections()
+                await client.get_collections()
                 checks["qdrant"] = "ok"
             finally:
-                client.close()
+                await client.close()
         else:
             checks["qdrant"] = "local"
     except Exception as e:
@@ -0,0 +1,86 @@
+"""REST API endpoints for knowledge base question answering.
+
+Streams answers from the agentic RAG pipeline over Server-Sent Events so
+clients see sub-queries, sources and the first answer tokens as soon as
+they are available instead of waiting for the full synthesis.
+
+The pipeline is accessed from ``request.app.state.rag_pipeline`` with a 503
+fallback when it is not initialized (matching the sales.py pattern).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.app.api.deps import get_current_user, get_tenant
+from src.app.core.tenant import TenantContext
+from src.app.models.tenant import User
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/knowledge", tags=["knowledge"])
+
+
+# ── Request Schemas ──────────────────────────────────────────────────────────
+
+
+class KnowledgeQueryRequest(BaseModel):
+    """Request body for a knowledge base question."""
+
+    query: str = Field(..., min_length=1, description="Natural language question")
+    filters: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Metadata filters merged into every sub-query",
+    )
+
+
+# ── Endpoints ────────────────────────────────────────────────────────────────
+
+
+@router.post("/query/stream")
+async def query_stream(
+    body: KnowledgeQueryRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    tenant: TenantContext = Depends(get_tenant),
+):
+    """Answer a knowledge base question via Server-Sent Events.
+
+    Emits one SSE event per pipeline event: ``sub_queries``, ``sources``,
+    ``token`` (repeated, one per answer piece) and ``done`` with the final
+    citations and confidence. An ``error`` event is sent if the pipeline
+    fails mid-stream.
+
+    Raises:
+        HTTPException(503): If the RAG pipeline is not initialized.
+    """
+    pipeline = getattr(request.app.state, "rag_pipeline", None)
+    if pipeline is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Knowledge pipeline not available",
+        )
+
+    async def event_generator():
+        try:
+            async for event in pipeline.run_stream(
+                query=body.query,
+                tenant_id=tenant.tenant_id,
+                base_filters=body.filters or None,
+            ):
+                yield f"event: {event.type}\ndata: {json.dumps(event.data)}\n\n"
+        except Exception:
+            logger.exception("knowledge_stream_failed", tenant_id=tenant.tenant_id)
+            yield 'event: error\ndata: {"detail": "Knowledge query failed"}\n\n'
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+    )
@@ -4,7 +4,18 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from src.app.api.v1 import auth, deals, health, intelligence, learning, llm, meetings, sales, tenants
+from src.app.api.v1 import (
+    auth,
+    deals,
+    health,
+    intelligence,
+    knowledge,
+    learning,
+    llm,
+    meetings,
+    sales,
+    tenants,
+)
 
 router = APIRouter()
 
@@ -17,3 +28,4 @@ router.include_router(learning.router)
 router.include_router(deals.router)
 router.include_router(meetings.router)
 router.include_router(intelligence.router)
+router.include_router(knowledge.router)
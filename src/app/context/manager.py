@@ -10,11 +10,22 @@ Also exposes convenience methods for storing and searching memories.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
+
 import structlog
 
 from src.app.context.memory import LongTermMemory, MemoryEntry
 from src.app.context.session import SessionStore
 from src.app.context.working import WorkingContextCompiler
+from src.app.core.monitoring import (
+    context_compilation_duration_seconds,
+    context_compilation_stage_duration_seconds,
+)
+
+T = TypeVar("T")
 
 logger = structlog.get_logger(__name__)
 
@@ -54,6 +65,20 @@ class ContextManager:
         self._session_store = session_store
         self._memory = memory
         self._compiler = compiler
+        # One compiler per tier, all sharing the same token count cache
+        self._compilers: dict[str, WorkingContextCompiler] = {
+            compiler.model_tier: compiler
+        }
+
+    def _compiler_for(self, model_tier: str) -> WorkingContextCompiler:
+        """Return the compiler for a tier, creating it on first use."""
+        compiler = self._compilers.get(model_tier)
+        if compiler is None:
+            compiler = WorkingContextCompiler(
+                model_tier, token_counter=self._compiler.token_counter
+            )
+            self._compilers[model_tier] = compiler
+        return compiler
 
     async def compile_working_context(
         self,
@@ -65,9 +90,12 @@ class ContextManager:
     ) -> dict:
         """Compile working context from all three tiers.
 
-        Step 1: Get session messages from the checkpointer.
-        Step 2: Search long-term memory for relevant facts.
-        Step 3: Compile everything within the token budget.
+        Step 1: Get session messages from the checkpointer and, concurrently,
+                search long-term memory for relevant facts.
+        Step 2: Compile everything within the token budget.
+
+        Each stage is timed; the durations are logged with
+        context_manager.compiled and recorded in Prometheus.
 
         Args:
             tenant_id: The tenant scope for memory search.
@@ -80,31 +108,52 @@ class ContextManager:
             Compiled working context dict with system_prompt, messages,
             context (memories), task, and token_usage.
         """
-        # Step 1: Get session history
-        session_messages = await self._session_store.get_session_messages(
-            thread_id
-        )
+        start = time.perf_counter()
+        timings: dict[str, float] = {}
 
-        # Step 2: Search relevant memories using task description
+        # Step 1: Session history and memory search are independent I/O
+        # against different backends, so run them concurrently
         query = task.get("description", "")
+        session_fetch = self._timed(
+            "session",
+            timings,
+            self._session_store.get_session_messages(thread_id),
+        )
         memories: list[MemoryEntry] = []
         if query:
-            memories = await self._memory.search(
-                tenant_id=tenant_id, query=query, limit=10
+            session_messages, memories = await asyncio.gather(
+                session_fetch,
+                self._timed(
+                    "memory",
+                    timings,
+                    self._memory.search(tenant_id=tenant_id, query=query, limit=10),
+                ),
             )
+        else:
+            session_messages = await session_fetch
+        timings["fetch"] = time.perf_counter() - start
 
-        # Step 3: Compile working context with token budget
-        # Use a tier-specific compiler if the tier differs
-        compiler = self._compiler
-        if model_tier != compiler._model_tier:
-            compiler = WorkingContextCompiler(model_tier)
-
-        result = await compiler.compile(
-            system_prompt=system_prompt,
-            session_messages=session_messages,
-            relevant_memories=[m.content for m in memories],
-            task=task,
+        # Step 2: Compile working context with token budget
+        result = await self._timed(
+            "compile",
+            timings,
+            self._compiler_for(model_tier).compile(
+                system_prompt=system_prompt,
+                session_messages=session_messages,
+                relevant_memories=[m.content for m in memories],
+                task=task,
+                thread_id=thread_id,
+            ),
         )
+        total = time.perf_counter() - start
+
+        for stage, seconds in timings.items():
+            context_compilation_stage_duration_seconds.labels(
+                stage=stage, model_tier=model_tier
+            ).observe(seconds)
+        context_compilation_duration_seconds.labels(
+            tenant_id=tenant_id, model_tier=model_tier
+        ).observe(total)
 
         logger.info(
             "context_manager.compiled",
@@ -113,6 +162,11 @@ class ContextManager:
             session_messages=len(session_messages),
             memories_found=len(memories),
             total_tokens=result["token_usage"]["total"],
+            total_ms=round(total * 1000, 2),
+            **{
+                f"{stage}_ms": round(seconds * 1000, 2)
+                for stage, seconds in timings.items()
+            },
         )
 
         return result
@@ -153,6 +207,45 @@ class ContextManager:
         )
         return memory_id
 
+    async def store_memories(
+        self,
+        tenant_id: str,
+        agent_id: str,
+        contents: list[str],
+        metadata: dict | None = None,
+    ) -> list[str]:
+        """Store several long-term memories in one batch.
+
+        All contents are embedded in one call and inserted in one round
+        trip, for hooks and agents that learn several facts at once.
+
+        Args:
+            tenant_id: The tenant these memories belong to.
+            agent_id: The agent that learned these facts.
+            contents: The factual contents to store.
+            metadata: Optional metadata applied to every entry.
+
+        Returns:
+            The memory_ids of the stored entries, in input order.
+        """
+        entries = [
+            MemoryEntry(
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                content=content,
+                metadata=dict(metadata or {}),
+            )
+            for content in contents
+        ]
+        memory_ids = await self._memory.store_many(entries)
+        logger.info(
+            "context_manager.memories_stored",
+            count=len(memory_ids),
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+        )
+        return memory_ids
+
     async def search_memory(
         self, tenant_id: str, query: str, limit: int = 10
     ) -> list[MemoryEntry]:
@@ -170,6 +263,15 @@ class ContextManager:
             tenant_id=tenant_id, query=query, limit=limit
         )
 
+    @staticmethod
+    async def _timed(stage: str, timings: dict[str, float], awaitable: Awaitable[T]) -> T:
+        """Await awaitable and record its duration in timings[stage]."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[stage] = time.perf_counter() - start
+
     @property
     def session(self) -> SessionStore:
         """Access the session store (e.g., for LangGraph checkpointer).
@@ -9,21 +9,149 @@ LOCKED DECISIONS:
 - Facts vs workflow: stores learned facts, not conversation flow
 - Survives deal lifecycle (permanent)
 - Vector searchable via pgvector embeddings
+
+Indexing:
+- HNSW (default) needs no training data, keeps recall as the table grows
+  and trades recall for speed per query via hnsw.ef_search. IVFFlat is
+  still available; its list count is fixed at build time and only suits
+  the row count it was built for.
+- A composite (tenant_id, agent_id, created_at) B-tree serves the filtered
+  and recency queries. Tenants large enough to deserve their own ANN index
+  get a partial HNSW index (create_tenant_index), which the planner uses
+  for that tenant's searches instead of post-filtering the global one.
+  Searches force custom plans: a generic plan of the prepared statement
+  cannot prove tenant_id = $2 implies the index predicate and would
+  silently stop using the partial index.
+- Every pooled connection registers pgvector's binary codec, so embeddings
+  travel as packed float32 instead of 1536 formatted decimals.
+
+Writes:
+- store_many() embeds all entries in one batch call and inserts them with
+  one pipelined executemany. With an EmbeddingService it embeds through the
+  knowledge base's shared path (searches also use its cache; writes do not
+  fill it); without one, through LiteLLM.
+- remember() is fire-and-forget capture: entries are buffered and written
+  with store_many() in batches. Call flush() (or close()) on shutdown.
+  Best-effort: a failed batch is logged and dropped, and entries still
+  buffered when the process dies are lost.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import asyncpg
 import litellm
 import structlog
+from pgvector.asyncpg import register_vector
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from src.knowledge.embeddings import EmbeddingService
+
 logger = structlog.get_logger(__name__)
 
+IndexType = Literal["hnsw", "ivfflat"]
+
+MEMORIES_TABLE = "shared.agent_memories"
+
+# Index names per type, so switching index_type replaces the old index
+# instead of IF NOT EXISTS silently keeping it
+EMBEDDING_INDEX_NAMES: dict[str, str] = {
+    "hnsw": "idx_memories_embedding_hnsw",
+    "ivfflat": "idx_memories_embedding",
+}
+
+
+def build_embedding_index_sql(
+    index_type: IndexType,
+    *,
+    name: str,
+    table: str = MEMORIES_TABLE,
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 64,
+    ivfflat_lists: int = 100,
+    where: str | None = None,
+) -> str:
+    """CREATE INDEX statement for a cosine ANN index on the embedding column.
+
+    Args:
+        index_type: "hnsw" or "ivfflat".
+        name: Index name.
+        table: Schema-qualified table name.
+        hnsw_m: Max connections per HNSW graph node.
+        hnsw_ef_construction: Candidate list size while building the graph.
+        ivfflat_lists: Number of IVFFlat lists (about rows / 1000).
+        where: Optional partial-index predicate (already quoted SQL).
+
+    Raises:
+        ValueError: If index_type is not recognized.
+    """
+    if index_type == "hnsw":
+        options = f"m = {int(hnsw_m)}, ef_construction = {int(hnsw_ef_construction)}"
+    elif index_type == "ivfflat":
+        options = f"lists = {int(ivfflat_lists)}"
+    else:
+        raise ValueError(
+            f"Unknown index type '{index_type}'. Must be one of: {list(EMBEDDING_INDEX_NAMES)}"
+        )
+    sql = (
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+        f"USING {index_type} (embedding vector_cosine_ops) WITH ({options})"
+    )
+    if where:
+        sql += f" WHERE {where}"
+    return sql
+
+
+def build_search_sql(table: str = MEMORIES_TABLE, by_agent: bool = False) -> str:
+    """Tenant-filtered cosine top-k query run by LongTermMemory.search.
+
+    Parameters: $1 query embedding, $2 tenant_id, then agent_id ($3) when
+    by_agent, then the limit.
+    """
+    agent_filter = " AND agent_id = $3" if by_agent else ""
+    limit_param = "$4" if by_agent else "$3"
+    return f"""
+        SELECT id, tenant_id, agent_id, content, metadata,
+               created_at, updated_at,
+               embedding <=> $1::vector AS distance
+        FROM {table}
+        WHERE tenant_id = $2{agent_filter}
+        ORDER BY distance ASC
+        LIMIT {limit_param}
+    """
+
+
+async def configure_search(conn: asyncpg.Connection, ef_search: int) -> None:
+    """Apply transaction-local settings for one search (call inside a transaction).
+
+    SET LOCAL scope: the settings end with the transaction, so they never
+    leak to the next user of a pooled connection. force_custom_plan keeps
+    asyncpg's prepared statement on per-tenant plans, which tenant partial
+    indexes need.
+    """
+    await conn.execute(
+        "SELECT set_config('hnsw.ef_search', $1, true), "
+        "set_config('plan_cache_mode', 'force_custom_plan', true)",
+        str(ef_search),
+    )
+
+
+def tenant_index_name(tenant_id: str, agent_id: str | None = None) -> str:
+    """Stable, identifier-safe name of a tenant's partial HNSW index."""
+    digest = hashlib.sha1(f"{tenant_id}\x00{agent_id or ''}".encode()).hexdigest()[:16]
+    return f"idx_memories_hnsw_{digest}"
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as an SQL literal (standard_conforming_strings on)."""
+    return "'" + value.replace("'", "''") + "'"
+
 
 class MemoryEntry(BaseModel):
     """A single long-term memory entry."""
@@ -59,6 +187,12 @@ class LongTermMemory:
         )
         memory_id = await memory.store(entry)
 
+        # Several facts at once: one embedding call, one round trip
+        memory_ids = await memory.store_many([entry_a, entry_b])
+
+        # Fire-and-forget capture, written in batches in the background
+        memory.remember(entry)
+
         # Semantic search
         results = await memory.search("t1", "what is Acme's budget?")
     """
@@ -67,6 +201,14 @@ class LongTermMemory:
         self,
         database_url: str,
         embedding_model: str = "text-embedding-3-small",
+        index_type: IndexType = "hnsw",
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+        ef_search: int = 40,
+        ivfflat_lists: int = 100,
+        embedding_service: EmbeddingService | None = None,
+        write_batch_size: int = 32,
+        write_max_delay: float = 0.5,
     ) -> None:
         """Initialize long-term memory.
 
@@ -75,25 +217,61 @@ class LongTermMemory:
                 asyncpg scheme if needed (asyncpg requires plain
                 postgresql:// URLs, not postgresql+asyncpg://).
             embedding_model: LiteLLM embedding model name.
+            index_type: ANN index on the embedding column, "hnsw" or
+                "ivfflat".
+            hnsw_m: HNSW max connections per node (build time).
+            hnsw_ef_construction: HNSW build candidate list size.
+            ef_search: Default HNSW search candidate list size per query;
+                must be at least the search limit for full results.
+            ivfflat_lists: IVFFlat list count, about rows / 1000.
+            embedding_service: Shared knowledge base EmbeddingService used
+                for (cached) embeddings instead of LiteLLM. Its model and
+                dimensions must match the vector(1536) column.
+            write_batch_size: Buffered entries that trigger a remember()
+                flush.
+            write_max_delay: Seconds a remember() entry may wait for its
+                batch.
+
+        Raises:
+            ValueError: If index_type is not recognized.
         """
+        if index_type not in EMBEDDING_INDEX_NAMES:
+            raise ValueError(
+                f"Unknown index type '{index_type}'. "
+                f"Must be one of: {list(EMBEDDING_INDEX_NAMES)}"
+            )
         # asyncpg requires plain postgresql:// URLs
         self._database_url = database_url.replace(
             "postgresql+asyncpg://", "postgresql://"
         )
         self._embedding_model = embedding_model
+        self._index_type = index_type
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_construction = hnsw_ef_construction
+        self._ef_search = ef_search
+        self._ivfflat_lists = ivfflat_lists
+        self._embeddings = embedding_service
+        self._write_batch_size = write_batch_size
+        self._write_max_delay = write_max_delay
+        self._pending: list[MemoryEntry] = []
+        self._flush_timer: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
         self._pool: asyncpg.Pool | None = None
 
     async def setup(self) -> None:
-        """Initialize connection pool and create tables.
+        """Create the schema objects, then the connection pool.
 
-        Creates the pgvector extension and agent_memories table in the
-        shared schema if they don't exist.
-        """
-        self._pool = await asyncpg.create_pool(
-            self._database_url, min_size=2, max_size=10
-        )
+        Creates the pgvector extension, the agent_memories table and its
+        indexes in the shared schema if they don't exist. This runs on a
+        dedicated connection first: the pool registers the binary vector
+        codec on every connection, which needs the vector type to exist.
 
-        async with self._pool.acquire() as conn:
+        Building an HNSW index over an existing large table takes a while
+        (raise maintenance_work_mem for the session doing it); it only
+        happens once, or when index_type changes.
+        """
+        conn = await asyncpg.connect(self._database_url)
+        try:
             # Enable pgvector extension
             await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
@@ -117,28 +295,92 @@ class LongTermMemory:
                 ON shared.agent_memories(tenant_id)
             """)
 
-            # IVFFlat index for cosine similarity search
-            # Note: IVFFlat requires rows to exist for optimal list count.
-            # lists=100 is reasonable for up to ~100k memories.
-            # For small datasets, the index still works but may not be
-            # used by the planner until enough rows exist.
-            try:
-                await conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_memories_embedding
-                    ON shared.agent_memories
-                    USING ivfflat (embedding vector_cosine_ops)
-                    WITH (lists = 100)
-                """)
-            except asyncpg.exceptions.InvalidParameterValueError:
-                # IVFFlat index creation fails on empty tables with some
-                # pgvector versions. This is fine -- exact search works
-                # and the index can be created later when data exists.
-                logger.warning(
-                    "memory.ivfflat_index_deferred",
-                    reason="table may be empty or have too few rows",
+            # Composite index for agent-filtered and most-recent-first queries
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_tenant_agent
+                ON shared.agent_memories(tenant_id, agent_id, created_at DESC)
+            """)
+
+            await self._create_embedding_index(conn)
+        finally:
+            await conn.close()
+
+        self._pool = await asyncpg.create_pool(
+            self._database_url, min_size=2, max_size=10, init=register_vector
+        )
+
+        logger.info(
+            "long_term_memory.setup_complete", index_type=self._index_type
+        )
+
+    async def _create_embedding_index(self, conn: asyncpg.Connection) -> None:
+        """Create the configured ANN index and drop the other type's index."""
+        for index_type, name in EMBEDDING_INDEX_NAMES.items():
+            if index_type != self._index_type:
+                result = await conn.execute(f"DROP INDEX IF EXISTS shared.{name}")
+                logger.debug("memory.embedding_index_dropped", index=name, result=result)
+
+        try:
+            await conn.execute(
+                build_embedding_index_sql(
+                    self._index_type,
+                    name=EMBEDDING_INDEX_NAMES[self._index_type],
+                    hnsw_m=self._hnsw_m,
+                    hnsw_ef_construction=self._hnsw_ef_construction,
+                    ivfflat_lists=self._ivfflat_lists,
                 )
+            )
+        except asyncpg.exceptions.InvalidParameterValueError:
+            # IVFFlat index creation fails on empty tables with some
+            # pgvector versions. This is fine -- exact search works
+            # and the index can be created later when data exists.
+            logger.warning(
+                "memory.ivfflat_index_deferred",
+                reason="table may be empty or have too few rows",
+            )
+
+    async def create_tenant_index(
+        self, tenant_id: str, agent_id: str | None = None
+    ) -> str:
+        """Create a partial HNSW index covering one tenant (or tenant + agent).
+
+        Searching a large tenant through the global ANN index means
+        filtering hnsw.ef_search candidates drawn from every tenant, which
+        can return fewer than limit rows. A partial index holds only that
+        tenant's vectors, so the planner can use it directly. Worth it for
+        the few tenants with hundreds of thousands of memories; small
+        tenants are served well by the composite B-tree and exact search.
 
-        logger.info("long_term_memory.setup_complete")
+        Args:
+            tenant_id: The tenant to index.
+            agent_id: Optionally narrow the index to one agent's memories.
+
+        Returns:
+            The index name.
+        """
+        name = tenant_index_name(tenant_id, agent_id)
+        where = f"tenant_id = {_quote_literal(tenant_id)}"
+        if agent_id:
+            where += f" AND agent_id = {_quote_literal(agent_id)}"
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                build_embedding_index_sql(
+                    "hnsw",
+                    name=name,
+                    hnsw_m=self._hnsw_m,
+                    hnsw_ef_construction=self._hnsw_ef_construction,
+                    where=where,
+                )
+            )
+
+        logger.info(
+            "memory.tenant_index_created",
+            index=name,
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+        )
+        return name
 
     @property
     def pool(self) -> asyncpg.Pool:
@@ -156,18 +398,38 @@ class LongTermMemory:
     async def _generate_embedding(self, text: str) -> list[float]:
         """Generate an embedding vector for the given text.
 
-        Uses LiteLLM for provider-agnostic embedding generation.
-
         Args:
             text: The text to embed.
 
         Returns:
             A list of floats representing the embedding vector.
         """
+        return (await self._generate_embeddings([text]))[0]
+
+    async def _generate_embeddings(
+        self, texts: list[str], populate_cache: bool = True
+    ) -> list[list[float]]:
+        """Generate embedding vectors for several texts in one call.
+
+        Uses the shared EmbeddingService (and its cache) when configured,
+        otherwise LiteLLM for provider-agnostic embedding generation.
+
+        Args:
+            texts: The texts to embed.
+            populate_cache: Store the embeddings in the EmbeddingService
+                cache. Writes pass False: memory content is rarely
+                embedded twice and would evict hot query embeddings.
+
+        Returns:
+            One embedding vector per text, in input order.
+        """
+        if self._embeddings is not None:
+            embedded = await self._embeddings.embed_batch(texts, populate_cache=populate_cache)
+            return [dense for dense, _ in embedded]
         response = await litellm.aembedding(
-            model=self._embedding_model, input=[text]
+            model=self._embedding_model, input=texts
         )
-        return response.data[0]["embedding"]
+        return [item["embedding"] for item in response.data]
 
     async def store(self, entry: MemoryEntry) -> str:
         """Store a memory entry with its embedding.
@@ -181,46 +443,134 @@ class LongTermMemory:
         Returns:
             The memory_id of the stored entry.
         """
-        # Generate embedding if not already provided
-        if entry.embedding is None:
-            entry.embedding = await self._generate_embedding(entry.content)
+        return (await self.store_many([entry]))[0]
 
-        pool = self.pool
-        async with pool.acquire() as conn:
-            # Convert embedding to pgvector format string
-            embedding_str = "[" + ",".join(str(x) for x in entry.embedding) + "]"
+    async def store_many(self, entries: list[MemoryEntry]) -> list[str]:
+        """Store several memory entries with one embedding call and one insert.
 
-            await conn.execute(
+        Entries without an embedding are embedded together in a single
+        batch; all entries are then inserted with one pipelined
+        executemany in a single transaction.
+
+        Args:
+            entries: The memory entries to store.
+
+        Returns:
+            The memory_ids of the stored entries, in input order.
+        """
+        if not entries:
+            return []
+
+        # Generate embeddings for entries that don't already have one
+        missing = [entry for entry in entries if entry.embedding is None]
+        if missing:
+            embeddings = await self._generate_embeddings(
+                [entry.content for entry in missing], populate_cache=False
+            )
+            for entry, embedding in zip(missing, embeddings, strict=True):
+                entry.embedding = embedding
+
+        pool = self.pool
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.executemany(
                 """
                 INSERT INTO shared.agent_memories
                     (id, tenant_id, agent_id, content, metadata, embedding,
                      created_at, updated_at)
                 VALUES ($1::uuid, $2, $3, $4, $5::jsonb, $6::vector, $7, $8)
                 """,
-                uuid.UUID(entry.memory_id),
-                entry.tenant_id,
-                entry.agent_id,
-                entry.content,
-                _dict_to_json(entry.metadata),
-                embedding_str,
-                entry.created_at,
-                entry.updated_at,
+                [
+                    (
+                        uuid.UUID(entry.memory_id),
+                        entry.tenant_id,
+                        entry.agent_id,
+                        entry.content,
+                        _dict_to_json(entry.metadata),
+                        entry.embedding,
+                        entry.created_at,
+                        entry.updated_at,
+                    )
+                    for entry in entries
+                ],
             )
 
-        logger.info(
-            "memory.stored",
-            memory_id=entry.memory_id,
-            tenant_id=entry.tenant_id,
-            agent_id=entry.agent_id,
-        )
+        for entry in entries:
+            logger.info(
+                "memory.stored",
+                memory_id=entry.memory_id,
+                tenant_id=entry.tenant_id,
+                agent_id=entry.agent_id,
+            )
+        return [entry.memory_id for entry in entries]
+
+    def remember(self, entry: MemoryEntry) -> str:
+        """Queue a memory for a background batched write (fire-and-forget).
+
+        The entry is written with the next store_many() batch, once
+        write_batch_size entries are buffered or write_max_delay seconds
+        after the first one. Must be called from a running event loop.
+
+        Args:
+            entry: The memory entry to store.
+
+        Returns:
+            The memory_id the entry will be stored under.
+        """
+        self._pending.append(entry)
+        if len(self._pending) >= self._write_batch_size:
+            self._schedule_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_after_delay())
         return entry.memory_id
 
+    @property
+    def pending_count(self) -> int:
+        """Number of remember() entries not yet handed to store_many()."""
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """Write all buffered remember() entries now and wait for in-flight batches.
+
+        Call on shutdown (close() does). Failed batches are logged.
+        """
+        self._schedule_flush()
+        while self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _schedule_flush(self) -> None:
+        """Detach the buffered entries and write them in a background task."""
+        if self._flush_timer is not None and self._flush_timer is not asyncio.current_task():
+            self._flush_timer.cancel()
+        self._flush_timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._write_batch(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self._write_max_delay)
+        self._schedule_flush()
+
+    async def _write_batch(self, batch: list[MemoryEntry]) -> None:
+        try:
+            await self.store_many(batch)
+        except Exception:
+            logger.error(
+                "memory.buffered_write_failed",
+                entries=len(batch),
+                tenant_ids=sorted({entry.tenant_id for entry in batch}),
+                exc_info=True,
+            )
+
     async def search(
         self,
         tenant_id: str,
         query: str,
         limit: int = 10,
         agent_id: str | None = None,
+        ef_search: int | None = None,
     ) -> list[MemoryEntry]:
         """Search memories by semantic similarity.
 
@@ -232,47 +582,32 @@ class LongTermMemory:
             query: The search query text.
             limit: Maximum number of results to return.
             agent_id: Optional filter by agent that created the memory.
+            ef_search: HNSW candidate list size for this query (default:
+                the instance's ef_search, raised to limit if smaller).
+                Higher values improve recall at the cost of latency.
 
         Returns:
             List of MemoryEntry objects ordered by similarity (most
             similar first).
         """
         query_embedding = await self._generate_embedding(query)
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+        ef_search = max(ef_search or self._ef_search, limit)
 
         pool = self.pool
 
-        async with pool.acquire() as conn:
+        async with pool.acquire() as conn, conn.transaction():
+            await configure_search(conn, ef_search)
             if agent_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT id, tenant_id, agent_id, content, metadata,
-                           created_at, updated_at,
-                           embedding <=> $1::vector AS distance
-                    FROM shared.agent_memories
-                    WHERE tenant_id = $2 AND agent_id = $3
-                    ORDER BY distance ASC
-                    LIMIT $4
-                    """,
-                    embedding_str,
+                    build_search_sql(by_agent=True),
+                    query_embedding,
                     tenant_id,
                     agent_id,
                     limit,
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT id, tenant_id, agent_id, content, metadata,
-                           created_at, updated_at,
-                           embedding <=> $1::vector AS distance
-                    FROM shared.agent_memories
-                    WHERE tenant_id = $2
-                    ORDER BY distance ASC
-                    LIMIT $3
-                    """,
-                    embedding_str,
-                    tenant_id,
-                    limit,
+                    build_search_sql(), query_embedding, tenant_id, limit
                 )
 
         return [_row_to_entry(row) for row in rows]
@@ -349,7 +684,8 @@ class LongTermMemory:
         return [_row_to_entry(row) for row in rows]
 
     async def close(self) -> None:
-        """Close the connection pool."""
+        """Flush buffered memories, then close the connection pool."""
+        await self.flush()
         if self._pool:
             await self._pool.close()
             self._pool = None
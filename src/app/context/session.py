@@ -6,15 +6,219 @@ LOCKED DECISION: explicit-clear-only (no time-based expiration).
 
 The checkpointer stores full conversation state keyed by thread_id,
 enabling seamless conversation resumption even after long pauses.
+
+Fast read path: every root-graph checkpoint write also upserts the
+thread's most recent window_size messages (as role/content dicts) into
+the session_message_window table. get_session_messages reads that one
+small row instead of deserializing the full channel state of the latest
+checkpoint; threads without a row (written before the table existed) are
+read from the checkpoint once and backfilled.
+
+Compaction: compact_session keeps the last keep_checkpoints checkpoints
+of a thread (plus the writes and blobs they reference) and rolls all but
+the newest keep_recent_messages messages into a running summary. Reads
+return the summary followed by the messages after it, so no message falls
+between the two. It runs in the background every compact_every checkpoint writes
+of a thread, and can be called directly. The latest checkpoint's state is
+never rewritten, so the graph itself keeps its full message history.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
 import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
 
 logger = structlog.get_logger(__name__)
 
+CREATE_WINDOW_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS session_message_window (
+        thread_id TEXT PRIMARY KEY,
+        checkpoint_id TEXT NOT NULL,
+        messages JSONB NOT NULL,
+        total_messages INTEGER NOT NULL,
+        summary TEXT,
+        summarized_messages INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+"""
+
+# Checkpoint IDs are time-ordered, so a late write of an older checkpoint
+# never overwrites a newer window
+UPSERT_WINDOW_SQL = """
+    INSERT INTO session_message_window
+        (thread_id, checkpoint_id, messages, total_messages, updated_at)
+    VALUES (%s, %s, %s, %s, now())
+    ON CONFLICT (thread_id) DO UPDATE SET
+        checkpoint_id = EXCLUDED.checkpoint_id,
+        messages = EXCLUDED.messages,
+        total_messages = EXCLUDED.total_messages,
+        updated_at = now()
+    WHERE session_message_window.checkpoint_id <= EXCLUDED.checkpoint_id
+"""
+
+SELECT_WINDOW_SQL = """
+    SELECT messages, total_messages, summary, summarized_messages
+    FROM session_message_window
+    WHERE thread_id = %s
+"""
+
+# Keep the newest keep_checkpoints checkpoints per namespace of a thread
+DELETE_OLD_CHECKPOINTS_SQL = """
+    DELETE FROM checkpoints c
+    USING (
+        SELECT checkpoint_ns, checkpoint_id,
+               row_number() OVER (
+                   PARTITION BY checkpoint_ns ORDER BY checkpoint_id DESC
+               ) AS position
+        FROM checkpoints
+        WHERE thread_id = %s
+    ) ranked
+    WHERE c.thread_id = %s
+      AND c.checkpoint_ns = ranked.checkpoint_ns
+      AND c.checkpoint_id = ranked.checkpoint_id
+      AND ranked.position > %s
+"""
+
+DELETE_ORPHAN_WRITES_SQL = """
+    DELETE FROM checkpoint_writes w
+    WHERE w.thread_id = %s
+      AND NOT EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = w.thread_id
+            AND c.checkpoint_ns = w.checkpoint_ns
+            AND c.checkpoint_id = w.checkpoint_id
+      )
+"""
+
+# A blob is live while any remaining checkpoint references its version
+DELETE_ORPHAN_BLOBS_SQL = """
+    DELETE FROM checkpoint_blobs b
+    WHERE b.thread_id = %s
+      AND NOT EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = b.thread_id
+            AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+      )
+"""
+
+
+class LLMServiceProtocol(Protocol):
+    """Minimal interface for LLM summarization calls."""
+
+    async def completion(
+        self, *, messages: list[dict[str, str]], model: str, **kwargs: Any
+    ) -> dict[str, Any]: ...
+
+
+@dataclass
+class CompactionResult:
+    """Rows removed and messages summarized by one compact_session call."""
+
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    blobs_deleted: int = 0
+    messages_summarized: int = 0
+
+
+def _message_to_dict(msg: Any) -> dict | None:
+    """Convert a LangGraph message object (or dict) to a role/content dict."""
+    if hasattr(msg, "type") and hasattr(msg, "content"):
+        # LangGraph BaseMessage objects
+        role = "assistant" if msg.type == "ai" else msg.type
+        return {"role": role, "content": msg.content}
+    if isinstance(msg, dict):
+        return msg
+    return None
+
+
+def _messages_to_dicts(messages: list[Any]) -> list[dict]:
+    return [d for d in (_message_to_dict(m) for m in messages) if d is not None]
+
+
+class WindowedPostgresSaver(AsyncPostgresSaver):
+    """AsyncPostgresSaver that also maintains the recent-message window.
+
+    After each root-graph checkpoint is stored, the last window_size
+    messages of its "messages" channel are upserted into
+    session_message_window in a separate small statement.
+
+    Args:
+        conn: psycopg connection or pool (as for AsyncPostgresSaver).
+        window_size: Messages kept in the projection.
+        on_put: Called with the thread_id after every projected write.
+    """
+
+    def __init__(
+        self,
+        conn: Any,
+        window_size: int = 100,
+        on_put: Callable[[str], None] | None = None,
+    ) -> None:
+        super().__init__(conn)
+        self._window_size = window_size
+        self._on_put = on_put
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = await super().aput(config, checkpoint, metadata, new_versions)
+
+        configurable = config["configurable"]
+        messages = checkpoint["channel_values"].get("messages")
+        if configurable.get("checkpoint_ns", "") == "" and isinstance(messages, list):
+            thread_id = str(configurable["thread_id"])
+            try:
+                await self.put_window(thread_id, checkpoint["id"], messages)
+            except Exception:
+                # The checkpoint is stored; a stale window self-heals on the
+                # next write, so never fail the graph step over it
+                logger.warning(
+                    "session_store.window_update_failed",
+                    thread_id=thread_id,
+                    exc_info=True,
+                )
+            else:
+                if self._on_put is not None:
+                    self._on_put(thread_id)
+        return next_config
+
+    async def put_window(
+        self, thread_id: str, checkpoint_id: str, messages: list[Any]
+    ) -> list[dict]:
+        """Upsert the recent-message window of a thread.
+
+        Returns:
+            The projected window (role/content dicts).
+        """
+        window = _messages_to_dicts(messages[-self._window_size :])
+        async with self._cursor() as cur:
+            await cur.execute(
+                UPSERT_WINDOW_SQL,
+                (
+                    thread_id,
+                    checkpoint_id,
+                    Jsonb(window, dumps=lambda v: json.dumps(v, default=str)),
+                    len(messages),
+                ),
+            )
+        return window
+
 
 class SessionStore:
     """Session state persistence wrapping LangGraph's AsyncPostgresSaver.
@@ -29,11 +233,27 @@ class SessionStore:
         # Retrieve session messages for context compilation
         messages = await store.get_session_messages("thread-123")
 
+        # Trim checkpoint history and roll old messages into the summary
+        await store.compact_session("thread-123")
+
         # Explicit clear only (no time-based expiration)
         await store.clear_session("thread-123")
     """
 
-    def __init__(self, database_url: str) -> None:
+    # Characters per token used to cap the rule-based summary length
+    CHARS_PER_TOKEN = 4
+
+    def __init__(
+        self,
+        database_url: str,
+        window_size: int = 100,
+        keep_checkpoints: int = 20,
+        compact_every: int | None = 25,
+        llm_service: LLMServiceProtocol | None = None,
+        max_summary_tokens: int = 500,
+        pool_max_size: int = 10,
+        keep_recent_messages: int = 20,
+    ) -> None:
         """Initialize SessionStore with a database URL.
 
         Args:
@@ -41,28 +261,71 @@ class SessionStore:
                 asyncpg scheme (postgresql+asyncpg://), it will be
                 converted to the standard postgresql:// scheme required
                 by the LangGraph checkpointer (which uses psycopg).
+            window_size: Most recent messages kept in the fast-read
+                projection (should be at least the largest read limit).
+            keep_checkpoints: Checkpoints per thread kept by compaction.
+            compact_every: Compact a thread in the background after this
+                many checkpoint writes to it (None disables).
+            llm_service: Optional LLM service for summarizing messages
+                that leave the window; without it (or if it fails) a
+                rule-based summary is used.
+            max_summary_tokens: Approximate cap on the summary length.
+            pool_max_size: Maximum psycopg connections.
+            keep_recent_messages: Newest messages compaction leaves out
+                of the summary. Reads see every message after the summary
+                while keep_recent_messages + compact_every stays below
+                their limit.
         """
         # AsyncPostgresSaver uses psycopg, not asyncpg.
         # Convert asyncpg URLs to standard postgres URLs.
         self._database_url = database_url.replace(
             "postgresql+asyncpg://", "postgresql://"
         )
-        self._checkpointer: AsyncPostgresSaver | None = None
+        self._window_size = window_size
+        self._keep_checkpoints = keep_checkpoints
+        self._compact_every = compact_every
+        self._llm_service = llm_service
+        self._max_summary_tokens = max_summary_tokens
+        self._pool_max_size = pool_max_size
+        self._keep_recent_messages = min(keep_recent_messages, window_size)
+        self._pool: AsyncConnectionPool | None = None
+        self._checkpointer: WindowedPostgresSaver | None = None
+        self._puts_since_compaction: dict[str, int] = {}
+        self._compactions: dict[str, asyncio.Task[CompactionResult]] = {}
 
     async def setup(self) -> None:
         """Initialize the checkpointer and create required tables.
 
         Must be called before using the checkpointer. Creates the
-        LangGraph checkpoint tables in the database.
+        LangGraph checkpoint tables and the message window table.
         """
-        self._checkpointer = AsyncPostgresSaver.from_conn_string(
-            self._database_url
+        self._pool = AsyncConnectionPool(
+            self._database_url,
+            max_size=self._pool_max_size,
+            open=False,
+            # Settings AsyncPostgresSaver requires of its connections
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+        await self._pool.open()
+        self._checkpointer = WindowedPostgresSaver(
+            self._pool, window_size=self._window_size, on_put=self._after_put
         )
         await self._checkpointer.setup()
+        async with self._pool.connection() as conn:
+            await conn.execute(CREATE_WINDOW_TABLE_SQL)
         logger.info("session_store.setup_complete")
 
+    async def close(self) -> None:
+        """Wait for background compactions, then close the connection pool."""
+        if self._compactions:
+            await asyncio.gather(*self._compactions.values(), return_exceptions=True)
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            self._checkpointer = None
+
     @property
-    def checkpointer(self) -> AsyncPostgresSaver:
+    def checkpointer(self) -> WindowedPostgresSaver:
         """Get the underlying checkpointer for LangGraph graph compilation.
 
         Raises:
@@ -79,8 +342,11 @@ class SessionStore:
     ) -> list[dict]:
         """Retrieve recent messages from a session thread.
 
-        Reads the latest checkpoint for the given thread_id and extracts
-        the message history from channel_values.
+        Reads the thread's recent-message window; only a thread without
+        one falls back to loading the latest checkpoint (and backfills
+        the window). If older messages have been summarized, the summary
+        is returned first as a system message, followed by the newest of
+        the messages it does not cover, within limit.
 
         Args:
             thread_id: The conversation thread identifier.
@@ -90,30 +356,24 @@ class SessionStore:
             List of message dicts with 'role' and 'content' keys.
             Returns empty list if no session exists for the thread.
         """
-        checkpointer = self.checkpointer
-        config = {"configurable": {"thread_id": thread_id}}
+        _ = self.checkpointer  # raises if setup() has not been called
 
         try:
-            checkpoint_tuple = await checkpointer.aget_tuple(config)
-            if checkpoint_tuple is None:
-                return []
-
-            checkpoint = checkpoint_tuple.checkpoint
-            channel_values = checkpoint.get("channel_values", {})
-            messages = channel_values.get("messages", [])
-
-            # Convert LangGraph message objects to dicts
-            result = []
-            for msg in messages:
-                if hasattr(msg, "type") and hasattr(msg, "content"):
-                    # LangGraph BaseMessage objects
-                    role = "assistant" if msg.type == "ai" else msg.type
-                    result.append({"role": role, "content": msg.content})
-                elif isinstance(msg, dict):
-                    result.append(msg)
-
-            # Return most recent messages up to limit
-            return result[-limit:]
+            row = await self._read_window(thread_id)
+            if row is None:
+                return (await self._load_from_checkpoint(thread_id))[-limit:]
+
+            messages = row["messages"]
+            if row["summary"] and limit > 1:
+                summary = {
+                    "role": "system",
+                    "content": f"Summary of earlier conversation: {row['summary']}",
+                }
+                # Window messages the summary already covers are not repeated
+                window_start = row["total_messages"] - len(messages)
+                recent = messages[max(0, row["summarized_messages"] - window_start) :]
+                return [summary, *recent[-(limit - 1) :]]
+            return messages[-limit:]
 
         except Exception:
             logger.warning(
@@ -123,6 +383,185 @@ class SessionStore:
             )
             return []
 
+    @property
+    def pool(self) -> AsyncConnectionPool:
+        """The psycopg pool shared with the checkpointer.
+
+        Raises:
+            RuntimeError: If setup() has not been called.
+        """
+        if self._pool is None:
+            raise RuntimeError(
+                "SessionStore not initialized -- call setup() first"
+            )
+        return self._pool
+
+    async def _read_window(self, thread_id: str) -> dict | None:
+        """The thread's session_message_window row, or None."""
+        async with self.pool.connection() as conn:
+            cur = await conn.execute(SELECT_WINDOW_SQL, (thread_id,))
+            return await cur.fetchone()
+
+    async def _checkpoint_messages(self, thread_id: str) -> tuple[str, list[Any]] | None:
+        """Latest checkpoint ID and raw messages of a thread (the slow path)."""
+        config = {"configurable": {"thread_id": thread_id}}
+        checkpoint_tuple = await self.checkpointer.aget_tuple(config)
+        if checkpoint_tuple is None:
+            return None
+        checkpoint = checkpoint_tuple.checkpoint
+        channel_values = checkpoint.get("channel_values", {})
+        return checkpoint["id"], channel_values.get("messages", [])
+
+    async def _load_from_checkpoint(self, thread_id: str) -> list[dict]:
+        """Read messages from the latest checkpoint and backfill the window."""
+        loaded = await self._checkpoint_messages(thread_id)
+        if loaded is None:
+            return []
+        checkpoint_id, messages = loaded
+        window = await self.checkpointer.put_window(thread_id, checkpoint_id, messages)
+        logger.info(
+            "session_store.window_backfilled",
+            thread_id=thread_id,
+            messages=len(messages),
+        )
+        return window
+
+    # ── Compaction ─────────────────────────────────────────────────────────
+
+    def _after_put(self, thread_id: str) -> None:
+        """Count checkpoint writes and schedule compaction every compact_every."""
+        if not self._compact_every:
+            return
+        puts = self._puts_since_compaction.get(thread_id, 0) + 1
+        if puts < self._compact_every or thread_id in self._compactions:
+            self._puts_since_compaction[thread_id] = puts
+            return
+
+        self._puts_since_compaction.pop(thread_id, None)
+        task = asyncio.create_task(self.compact_session(thread_id))
+        self._compactions[thread_id] = task
+        task.add_done_callback(lambda t: self._compaction_done(thread_id, t))
+
+    def _compaction_done(self, thread_id: str, task: asyncio.Task[CompactionResult]) -> None:
+        self._compactions.pop(thread_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "session_store.compaction_failed",
+                thread_id=thread_id,
+                exc_info=task.exception(),
+            )
+
+    async def compact_session(
+        self, thread_id: str, keep_checkpoints: int | None = None
+    ) -> CompactionResult:
+        """Trim a thread's checkpoint history and summarize old messages.
+
+        Deletes all but the newest keep_checkpoints checkpoints of each
+        namespace of the thread, then the writes and blobs no remaining
+        checkpoint references. Messages older than the newest
+        keep_recent_messages that are not yet summarized are folded into
+        the thread's running summary.
+
+        Args:
+            thread_id: The conversation thread to compact.
+            keep_checkpoints: Override of the store's keep_checkpoints.
+
+        Returns:
+            Counts of removed rows and newly summarized messages.
+        """
+        keep = keep_checkpoints if keep_checkpoints is not None else self._keep_checkpoints
+        result = CompactionResult()
+
+        async with self.pool.connection() as conn, conn.transaction():
+            cur = await conn.execute(
+                DELETE_OLD_CHECKPOINTS_SQL, (thread_id, thread_id, max(1, keep))
+            )
+            result.checkpoints_deleted = cur.rowcount
+            cur = await conn.execute(DELETE_ORPHAN_WRITES_SQL, (thread_id,))
+            result.writes_deleted = cur.rowcount
+            cur = await conn.execute(DELETE_ORPHAN_BLOBS_SQL, (thread_id,))
+            result.blobs_deleted = cur.rowcount
+
+        result.messages_summarized = await self._roll_summary(thread_id)
+
+        logger.info(
+            "session_store.compacted",
+            thread_id=thread_id,
+            checkpoints_deleted=result.checkpoints_deleted,
+            writes_deleted=result.writes_deleted,
+            blobs_deleted=result.blobs_deleted,
+            messages_summarized=result.messages_summarized,
+        )
+        return result
+
+    async def _roll_summary(self, thread_id: str) -> int:
+        """Fold all but the newest keep_recent_messages into the summary.
+
+        Returns:
+            Number of messages newly summarized.
+        """
+        row = await self._read_window(thread_id)
+        if row is None:
+            return 0
+        rolled_end = row["total_messages"] - self._keep_recent_messages
+        start = row["summarized_messages"]
+        if rolled_end <= start:
+            return 0
+
+        window = row["messages"]
+        window_start = row["total_messages"] - len(window)
+        if start >= window_start:
+            rolled = window[start - window_start : rolled_end - window_start]
+        else:
+            # Messages already gone from the window need the full state,
+            # read once per batch of them
+            loaded = await self._checkpoint_messages(thread_id)
+            if loaded is None:
+                return 0
+            rolled = _messages_to_dicts(loaded[1][start:rolled_end])
+        summary = await self._summarize(row["summary"], rolled)
+
+        async with self.pool.connection() as conn:
+            await conn.execute(
+                """
+                UPDATE session_message_window
+                SET summary = %s, summarized_messages = %s
+                WHERE thread_id = %s AND summarized_messages = %s
+                """,
+                (summary, rolled_end, thread_id, start),
+            )
+        return rolled_end - start
+
+    async def _summarize(self, previous: str | None, messages: list[dict]) -> str:
+        """Running summary of previous plus messages (LLM, or rule-based fallback)."""
+        max_chars = self._max_summary_tokens * self.CHARS_PER_TOKEN
+        transcript = "\n".join(f"{m.get('role')}: {m.get('content')}" for m in messages)
+
+        if self._llm_service is not None:
+            prompt = (
+                "Update the running summary of a sales conversation with the "
+                "messages below. Keep facts, decisions, commitments and open "
+                "questions; drop pleasantries. Reply with the summary only.\n\n"
+                f"Current summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}"
+            )
+            try:
+                result = await self._llm_service.completion(
+                    messages=[{"role": "user", "content": prompt}],
+                    model="fast",
+                )
+                # LLMService.completion returns a dict with the text in "content"
+                content = result.get("content", "") if isinstance(result, dict) else result
+                if content:
+                    return content[:max_chars]
+            except Exception:
+                logger.warning("session_store.summary_llm_failed", exc_info=True)
+
+        # Rule-based: keep the most recent text within the character cap
+        combined = f"{previous}\n{transcript}" if previous else transcript
+        if len(combined) > max_chars:
+            combined = "..." + combined[-max_chars:]
+        return combined
+
     async def clear_session(self, thread_id: str) -> None:
         """Clear session state for a thread (explicit-clear-only lifetime).
 
@@ -135,22 +574,14 @@ class SessionStore:
         checkpointer = self.checkpointer
 
         try:
-            # Use the checkpointer's connection to delete checkpoint data
-            # for this thread. The checkpointer stores data in checkpoint
-            # tables keyed by thread_id.
-            async with checkpointer._get_connection() as conn:
-                await conn.execute(
-                    "DELETE FROM checkpoint_writes WHERE thread_id = %s",
-                    (thread_id,),
-                )
-                await conn.execute(
-                    "DELETE FROM checkpoint_blobs WHERE thread_id = %s",
-                    (thread_id,),
-                )
+            # Deletes the thread's checkpoints, writes and blobs
+            await checkpointer.adelete_thread(thread_id)
+            async with self.pool.connection() as conn:
                 await conn.execute(
-                    "DELETE FROM checkpoints WHERE thread_id = %s",
+                    "DELETE FROM session_message_window WHERE thread_id = %s",
                     (thread_id,),
                 )
+            self._puts_since_compaction.pop(thread_id, None)
             logger.info(
                 "session_store.session_cleared", thread_id=thread_id
             )
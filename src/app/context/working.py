@@ -9,24 +9,67 @@ Budget allocation (from research recommendation):
 - 35% session history (most recent messages preserved)
 - 35% relevant context (memories, highest relevance preserved)
 - 15% task data + response buffer
+
+Incremental compilation: a budget-trimmed system prompt is cached per
+prompt (i.e. per agent), and compile(..., thread_id=...) keeps a rolling
+window of the thread's session messages with their token counts. Each
+compile then only keys and counts the turns added since the previous one
+and trims the oldest from the window, instead of re-walking the whole
+session. Message keys are the message's "id" when present, else a hash of
+role and content; if the messages the window was built from no longer line
+up with the incoming session (history edited, summary replaced), the
+window is rebuilt from scratch.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 
 import structlog
-import tiktoken
+
+from src.knowledge.tokenizer import TokenCounter, get_token_counter
 
 logger = structlog.get_logger(__name__)
 
 
+def _message_key(message: dict) -> str:
+    """Stable identity of a session message: its ID, else a content hash."""
+    message_id = message.get("id")
+    if message_id is not None:
+        return f"id:{message_id}"
+    content = message.get("content", "")
+    if not isinstance(content, str):
+        content = json.dumps(content, sort_keys=True, default=str)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(message.get("role", "")).encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class _ThreadWindow:
+    """Budget-trimmed tail of a thread's session messages.
+
+    keys/tokens describe the newest messages that fit the session budget,
+    oldest first; total is the sum of tokens.
+    """
+
+    keys: deque[str] = field(default_factory=deque)
+    tokens: deque[int] = field(default_factory=deque)
+    total: int = 0
+
+
 class WorkingContextCompiler:
     """Token-budgeted working context compiler.
 
     Compiles working context for each agent invocation by assembling
     system prompt, session history, retrieved memories, and task data
-    within a strict token budget. Uses tiktoken for accurate counting.
+    within a strict token budget. Token counts come from the shared
+    TokenCounter, so messages seen by an earlier compile are not re-encoded.
 
     Usage:
         compiler = WorkingContextCompiler("reasoning")  # 32k budget
@@ -51,12 +94,20 @@ class WorkingContextCompiler:
         "task_and_buffer": 0.15,     # 15%
     }
 
-    def __init__(self, model_tier: str = "reasoning") -> None:
+    # Bounds of the per-compiler incremental caches
+    MAX_SYSTEM_PROMPTS = 128
+    MAX_THREADS = 4096
+
+    def __init__(
+        self, model_tier: str = "reasoning", token_counter: TokenCounter | None = None
+    ) -> None:
         """Initialize the compiler with a model tier.
 
         Args:
             model_tier: One of "fast" or "reasoning". Determines the
                 total token budget.
+            token_counter: Token counter to use (default: the shared
+                process-wide cl100k_base counter).
 
         Raises:
             ValueError: If model_tier is not recognized.
@@ -68,12 +119,25 @@ class WorkingContextCompiler:
             )
         self._model_tier = model_tier
         self._total_budget = self.TOKEN_BUDGETS[model_tier]
-        # cl100k_base works as a reasonable approximation for both
-        # Claude and GPT models
-        self._encoding = tiktoken.get_encoding("cl100k_base")
+        self._tokens = token_counter if token_counter is not None else get_token_counter()
+        # system prompt -> (budget-trimmed prompt, token count). Keyed by the
+        # string itself: an agent passes the same str object every time, and
+        # str caches its hash, so a hit costs no hashing of the prompt.
+        self._system_prompts: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._threads: OrderedDict[str, _ThreadWindow] = OrderedDict()
+
+    @property
+    def model_tier(self) -> str:
+        """The token budget tier this compiler assembles for."""
+        return self._model_tier
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        """The token counter (and count cache) this compiler uses."""
+        return self._tokens
 
     def _count_tokens(self, text: str) -> int:
-        """Count tokens in a text string using tiktoken.
+        """Count tokens in a text string.
 
         Args:
             text: The text to count tokens for.
@@ -81,9 +145,16 @@ class WorkingContextCompiler:
         Returns:
             Number of tokens.
         """
-        if not text:
-            return 0
-        return len(self._encoding.encode(text))
+        return self._tokens.count(text)
+
+    def _message_tokens(self, messages: list[dict]) -> list[int]:
+        """Token cost of each message: content + role + ~4 tokens of overhead."""
+        texts: list[str] = []
+        for msg in messages:
+            texts.append(msg.get("content", ""))
+            texts.append(msg.get("role", ""))
+        counts = self._tokens.count_batch(texts)
+        return [counts[i] + counts[i + 1] + 4 for i in range(0, len(counts), 2)]
 
     def _truncate_to_budget(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within a token budget.
@@ -99,15 +170,7 @@ class WorkingContextCompiler:
         Returns:
             The text, truncated if necessary.
         """
-        if not text:
-            return text
-
-        tokens = self._encoding.encode(text)
-        if len(tokens) <= max_tokens:
-            return text
-
-        truncated_tokens = tokens[:max_tokens]
-        return self._encoding.decode(truncated_tokens)
+        return self._tokens.truncate(text, max_tokens)
 
     def _truncate_messages_to_budget(
         self, messages: list[dict], max_tokens: int
@@ -128,33 +191,115 @@ class WorkingContextCompiler:
             return messages
 
         # Calculate total tokens per message
-        message_tokens = []
-        for msg in messages:
-            content = msg.get("content", "")
-            role = msg.get("role", "")
-            # Account for role label overhead (~4 tokens per message)
-            tokens = self._count_tokens(content) + self._count_tokens(role) + 4
-            message_tokens.append(tokens)
+        message_tokens = self._message_tokens(messages)
 
         total = sum(message_tokens)
         if total <= max_tokens:
             return messages
 
         # Remove oldest messages first until within budget
-        result = list(messages)
-        result_tokens = list(message_tokens)
-        while sum(result_tokens) > max_tokens and len(result) > 1:
-            result.pop(0)
-            result_tokens.pop(0)
+        start = 0
+        while total > max_tokens and start < len(messages) - 1:
+            total -= message_tokens[start]
+            start += 1
+        result = messages[start:]
 
         # If single remaining message still exceeds budget, truncate it
-        if result and sum(result_tokens) > max_tokens:
-            content = result[0].get("content", "")
-            truncated = self._truncate_to_budget(content, max_tokens - 8)
-            result[0] = {**result[0], "content": truncated}
+        if total > max_tokens:
+            result = self._truncate_single_message(result[0], max_tokens)
 
         return result
 
+    def _truncate_single_message(self, message: dict, max_tokens: int) -> list[dict]:
+        """The one message left over budget, with its content truncated."""
+        content = message.get("content", "")
+        truncated = self._truncate_to_budget(content, max_tokens - 8)
+        return [{**message, "content": truncated}]
+
+    def _compile_system_prompt(self, system_prompt: str, max_tokens: int) -> tuple[str, int]:
+        """Budget-trimmed system prompt and its token count (cached per prompt)."""
+        cached = self._system_prompts.get(system_prompt)
+        if cached is not None:
+            self._system_prompts.move_to_end(system_prompt)
+            return cached
+        compiled = self._truncate_to_budget(system_prompt, max_tokens)
+        cached = (compiled, self._count_tokens(compiled))
+        self._system_prompts[system_prompt] = cached
+        if len(self._system_prompts) > self.MAX_SYSTEM_PROMPTS:
+            self._system_prompts.popitem(last=False)
+        return cached
+
+    def _compile_thread_messages(
+        self, thread_id: str, messages: list[dict], max_tokens: int
+    ) -> tuple[list[dict], int]:
+        """Budget-trimmed session messages using the thread's rolling window.
+
+        Equivalent to _truncate_messages_to_budget, but only the messages
+        after the window's newest one are keyed and counted.
+
+        Returns:
+            The compiled messages and their total token count.
+        """
+        window = self._threads.pop(thread_id, None)
+        new_start = self._window_overlap(window, messages) if window else None
+        if window is None or new_start is None:
+            window, new_start = _ThreadWindow(), 0
+        self._threads[thread_id] = window
+        if len(self._threads) > self.MAX_THREADS:
+            self._threads.popitem(last=False)
+
+        new_messages = messages[new_start:]
+        if new_messages:
+            window.keys.extend(_message_key(m) for m in new_messages)
+            counts = self._message_tokens(new_messages)
+            window.tokens.extend(counts)
+            window.total += sum(counts)
+        while window.total > max_tokens and len(window.keys) > 1:
+            window.keys.popleft()
+            window.total -= window.tokens.popleft()
+
+        if not window.keys:
+            return [], 0
+        result = messages[len(messages) - len(window.keys) :]
+        if window.total > max_tokens:
+            result = self._truncate_single_message(result[0], max_tokens)
+            return result, sum(self._message_tokens(result))
+        return result, window.total
+
+    @staticmethod
+    def _window_overlap(window: _ThreadWindow, messages: list[dict]) -> int | None:
+        """Index in messages right after the window's newest message.
+
+        Searches from the end, so the cost is proportional to the number of
+        new turns. A position only matches if every window key equals the
+        key of the message in that place: keys of messages without an id
+        are content hashes, so repeated messages (e.g. "ok") can match the
+        window's ends at the wrong offset. Returns None if the window is
+        not found in place (the window must be rebuilt).
+        """
+        size = len(window.keys)
+        if not size:
+            return None
+        message_keys: dict[int, str] = {}
+
+        def key_at(index: int) -> str:
+            if index not in message_keys:
+                message_keys[index] = _message_key(messages[index])
+            return message_keys[index]
+
+        newest = window.keys[-1]
+        for i in range(len(messages) - 1, size - 2, -1):
+            if key_at(i) != newest:
+                continue
+            first = i - size + 1
+            if all(key_at(first + k) == key for k, key in enumerate(window.keys)):
+                return i + 1
+        return None
+
+    def forget_thread(self, thread_id: str) -> None:
+        """Drop the rolling window of a thread (e.g. when its session is cleared)."""
+        self._threads.pop(thread_id, None)
+
     def _truncate_memories_to_budget(
         self, memories: list[str], max_tokens: int
     ) -> list[str]:
@@ -199,6 +344,7 @@ class WorkingContextCompiler:
         session_messages: list[dict],
         relevant_memories: list[str],
         task: dict,
+        thread_id: str | None = None,
     ) -> dict:
         """Compile working context within token budget.
 
@@ -216,6 +362,9 @@ class WorkingContextCompiler:
             relevant_memories: Memory content strings ordered by
                 relevance (from semantic search).
             task: Task data dict with at minimum a 'description' key.
+            thread_id: Conversation thread of session_messages. When given,
+                the thread's rolling message window is reused, so only
+                turns added since the last compile are counted.
 
         Returns:
             Dict with compiled context and token usage metrics:
@@ -248,19 +397,20 @@ class WorkingContextCompiler:
         )
 
         # 1. Truncate system prompt (defensive -- usually fits)
-        compiled_system = self._truncate_to_budget(system_prompt, system_budget)
-        system_tokens = self._count_tokens(compiled_system)
+        compiled_system, system_tokens = self._compile_system_prompt(
+            system_prompt, system_budget
+        )
 
         # 2. Truncate session messages (oldest removed first)
-        compiled_messages = self._truncate_messages_to_budget(
-            session_messages, session_budget
-        )
-        session_tokens = sum(
-            self._count_tokens(m.get("content", ""))
-            + self._count_tokens(m.get("role", ""))
-            + 4
-            for m in compiled_messages
-        )
+        if thread_id is not None:
+            compiled_messages, session_tokens = self._compile_thread_messages(
+                thread_id, session_messages, session_budget
+            )
+        else:
+            compiled_messages = self._truncate_messages_to_budget(
+                session_messages, session_budget
+            )
+            session_tokens = sum(self._message_tokens(compiled_messages))
 
         # 3. Truncate memories (least relevant removed first)
         compiled_memories = self._truncate_memories_to_budget(
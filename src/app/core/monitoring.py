@@ -61,6 +61,24 @@ llm_tokens_used_total = Counter(
     ["model", "tenant_id", "token_type"],
 )
 
+llm_cache_requests_total = Counter(
+    "llm_cache_requests_total",
+    "LLM response cache lookups",
+    ["model", "tenant_id", "result"],  # result: memory_hit, redis_hit, miss
+)
+
+llm_cache_tokens_saved_total = Counter(
+    "llm_cache_tokens_saved_total",
+    "LLM tokens served from the response cache instead of the provider",
+    ["model", "tenant_id", "token_type"],
+)
+
+llm_coalesced_requests_total = Counter(
+    "llm_coalesced_requests_total",
+    "LLM requests that joined an identical in-flight request instead of calling the provider",
+    ["model", "tenant_id"],
+)
+
 # ── Platform Metrics ─────────────────────────────────────────────────────────
 
 active_tenants = Gauge(
@@ -107,6 +125,13 @@ context_compilation_duration_seconds = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
 )
 
+context_compilation_stage_duration_seconds = Histogram(
+    "context_compilation_stage_duration_seconds",
+    "Duration of each context compilation stage in seconds",
+    ["stage", "model_tier"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
 
 # ── Agent Metrics Helper ──────────────────────────────────────────────────
 
@@ -79,6 +79,10 @@ class TenantRedis:
         """Set TTL on an existing key."""
         return bool(await self._redis.expire(self._key(key), seconds))
 
+    async def ttl(self, key: str) -> int:
+        """Remaining TTL in seconds (-1: no expiry, -2: missing key)."""
+        return await self._redis.ttl(self._key(key))
+
     async def keys(self, pattern: str = "*") -> list[str]:
         """Get keys matching a pattern (within tenant namespace)."""
         full_pattern = self._key(pattern)
@@ -1,7 +1,7 @@
 """Opportunity signal detection from conversation text.
 
-Uses instructor + LiteLLM (matching QualificationExtractor pattern from Phase 4)
-to extract structured OpportunitySignals from conversations. Includes existing
+Uses LLMService.structured_completion (matching QualificationExtractor pattern
+from Phase 4) to extract structured OpportunitySignals from conversations. Includes existing
 opportunities in the detection prompt to prevent duplicate creation (Pitfall 3).
 
 Creation threshold is >0.80 for precision bias (CONTEXT.md locked decision):
@@ -22,7 +22,7 @@ logger = structlog.get_logger(__name__)
 
 
 class OpportunityDetector:
-    """Detect opportunity signals from conversation text using instructor + LiteLLM.
+    """Detect opportunity signals from conversation text via structured LLM output.
 
     Analyzes conversation content to determine if a new opportunity should be
     created or an existing one updated. Uses structured LLM extraction with
@@ -37,14 +37,17 @@ class OpportunityDetector:
     the product line differs OR the timeline differs by >3 months.
 
     Args:
-        model: LiteLLM model name to use (default: "reasoning" for router lookup).
+        model: Router model group to use (default: "reasoning").
+        llm_service: LLMService for structured extraction. Defaults to the
+            shared service from get_llm_service().
     """
 
     CREATION_THRESHOLD = 0.80  # Locked decision: >80% for precision bias
     UPDATE_THRESHOLD = 0.70  # Lower bar for updating existing
 
-    def __init__(self, model: str = "reasoning") -> None:
+    def __init__(self, model: str = "reasoning", llm_service: object | None = None) -> None:
         self._model = model
+        self._llm_service = llm_service
 
     async def detect_signals(
         self,
@@ -54,7 +57,7 @@ class OpportunityDetector:
     ) -> OpportunitySignals:
         """Extract opportunity signals from conversation text.
 
-        Uses instructor.from_litellm(litellm.acompletion) for structured extraction
+        Uses LLMService.structured_completion for structured extraction
         of OpportunitySignals. The system prompt includes existing opportunities
         to prevent duplicate creation (Pitfall 3).
 
@@ -69,8 +72,7 @@ class OpportunityDetector:
             OpportunitySignals with deal_potential_confidence, product_line,
             is_new_opportunity flag, and optional matching_opportunity_id.
         """
-        import instructor
-        import litellm
+        from src.app.services.llm import get_llm_service
 
         try:
             messages = self._build_detection_prompt(
@@ -79,12 +81,11 @@ class OpportunityDetector:
                 existing_opportunities=existing_opportunities,
             )
 
-            client = instructor.from_litellm(litellm.acompletion)
-
-            extracted = await client.chat.completions.create(
-                model=self._model,
-                response_model=OpportunitySignals,
+            llm_service = self._llm_service or get_llm_service()
+            extracted = await llm_service.structured_completion(
                 messages=messages,
+                response_model=OpportunitySignals,
+                model=self._model,
                 max_tokens=2048,
                 temperature=0.1,  # Low temp for deterministic extraction
                 max_retries=2,
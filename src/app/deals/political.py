@@ -75,7 +75,9 @@ class PoliticalMapper:
     - ic: Individual contributor (default for unknown titles)
 
     Args:
-        model: LiteLLM model name to use (default: "fast" for speed).
+        model: Router model group to use (default: "fast" for speed).
+        llm_service: LLMService for structured extraction. Defaults to the
+            shared service from get_llm_service().
     """
 
     TITLE_HEURISTICS: dict[str, dict[str, int]] = {
@@ -94,8 +96,9 @@ class PoliticalMapper:
         (re.compile(r"\bManager\b", re.IGNORECASE), "manager"),
     ]
 
-    def __init__(self, model: str = "fast") -> None:
+    def __init__(self, model: str = "fast", llm_service: object | None = None) -> None:
         self._model = model
+        self._llm_service = llm_service
 
     def score_from_title(self, title: str | None) -> StakeholderScores:
         """Generate baseline political scores from a stakeholder's job title.
@@ -124,7 +127,7 @@ class PoliticalMapper:
     ) -> tuple[StakeholderScores, dict[str, str]]:
         """Refine stakeholder scores using conversation signals via LLM.
 
-        Uses instructor + LiteLLM to extract relationship signals from
+        Uses LLMService.structured_completion to extract relationship signals from
         conversation text. Conversation signals can ONLY increase scores,
         never decrease them (per Pitfall 5).
 
@@ -139,8 +142,7 @@ class PoliticalMapper:
             Tuple of (updated StakeholderScores, evidence dict).
             Evidence maps score field names to evidence strings.
         """
-        import instructor
-        import litellm
+        from src.app.services.llm import get_llm_service
 
         try:
             messages = [
@@ -168,11 +170,11 @@ class PoliticalMapper:
                 },
             ]
 
-            client = instructor.from_litellm(litellm.acompletion)
-            refinement = await client.chat.completions.create(
-                model=self._model,
-                response_model=ConversationScoreRefinement,
+            llm_service = self._llm_service or get_llm_service()
+            refinement = await llm_service.structured_completion(
                 messages=messages,
+                response_model=ConversationScoreRefinement,
+                model=self._model,
                 max_tokens=1024,
                 temperature=0.1,
                 max_retries=2,
@@ -271,8 +273,7 @@ class PoliticalMapper:
             List of StakeholderRole enums detected from conversation.
             Empty list on LLM failure (fail-open).
         """
-        import instructor
-        import litellm
+        from src.app.services.llm import get_llm_service
 
         try:
             messages = [
@@ -300,11 +301,11 @@ class PoliticalMapper:
                 },
             ]
 
-            client = instructor.from_litellm(litellm.acompletion)
-            detection = await client.chat.completions.create(
-                model=self._model,
-                response_model=RoleDetection,
+            llm_service = self._llm_service or get_llm_service()
+            detection = await llm_service.structured_completion(
                 messages=messages,
+                response_model=RoleDetection,
+                model=self._model,
                 max_tokens=512,
                 temperature=0.1,
                 max_retries=2,
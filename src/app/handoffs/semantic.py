@@ -9,6 +9,7 @@ Key design decisions:
 - Uses model="fast" (Claude Haiku) for speed -- semantic checks must not bottleneck handoffs
 - Temperature=0.0 for deterministic validation results
 - Fail-open on LLM errors to prevent blocking all handoffs when LLM is unavailable
+- Identical checks are served from the LLM response cache (cache_ttl)
 """
 
 from __future__ import annotations
@@ -73,10 +74,17 @@ class SemanticValidator:
 
     Args:
         llm_service: The LLMService instance for making LLM calls.
+        cache_ttl: Seconds an identical validation result is reused from
+            the LLM response cache. None always calls the LLM.
     """
 
-    def __init__(self, llm_service: LLMService) -> None:
+    DEFAULT_CACHE_TTL = 3600
+
+    def __init__(
+        self, llm_service: LLMService, cache_ttl: int | None = DEFAULT_CACHE_TTL
+    ) -> None:
         self._llm = llm_service
+        self._cache_ttl = cache_ttl
 
     async def validate(
         self,
@@ -122,6 +130,7 @@ class SemanticValidator:
                 temperature=0.0,
                 max_tokens=1024,
                 metadata={"purpose": "handoff_semantic_validation", "handoff_id": payload.handoff_id},
+                cache_ttl=self._cache_ttl,
             )
 
             content = response.get("content", "")
@@ -6,7 +6,9 @@ Partitions interaction timelines into three tiers by age:
 - Old (>90 days): summarized per month
 
 Supports LLM-based summarization when an llm_service is available,
-with a deterministic rule-based fallback for offline/test usage.
+with a deterministic rule-based fallback for offline/test usage. Medium
+and old periods are closed, so their LLM summaries are generated at
+temperature 0 and reused from the LLM response cache for cache_ttl seconds.
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ from typing import Any, Protocol
 import structlog
 
 from src.app.intelligence.consolidation.schemas import ChannelInteraction
+from src.knowledge.tokenizer import get_token_counter
 
 logger = structlog.get_logger(__name__)
 
@@ -29,7 +32,7 @@ class LLMServiceProtocol(Protocol):
 
     async def completion(
         self, *, messages: list[dict[str, str]], model: str, **kwargs: Any
-    ) -> str: ...
+    ) -> dict[str, Any]: ...
 
 
 # ── SummarizedTimeline ────────────────────────────────────────────────────────
@@ -80,6 +83,8 @@ class ContextSummarizer:
             When None, a deterministic rule-based fallback is used.
         max_tokens_per_summary: Maximum character length for each
             group summary (default 500).
+        cache_ttl: Seconds an identical period summary is reused from the
+            LLM response cache. None always calls the LLM.
     """
 
     RECENT_WINDOW_DAYS: int = 30
@@ -87,14 +92,17 @@ class ContextSummarizer:
     OLD_WINDOW_DAYS: int = 365
 
     CHARS_PER_TOKEN: float = 4.0  # Matches 03-02 convention
+    DEFAULT_CACHE_TTL: int = 86400
 
     def __init__(
         self,
         llm_service: LLMServiceProtocol | None = None,
         max_tokens_per_summary: int = 500,
+        cache_ttl: int | None = DEFAULT_CACHE_TTL,
     ) -> None:
         self._llm_service = llm_service
         self._max_tokens_per_summary = max_tokens_per_summary
+        self._cache_ttl = cache_ttl
 
     # ── Public API ────────────────────────────────────────────────────────
 
@@ -191,18 +199,15 @@ class ContextSummarizer:
     # ── Token estimation ──────────────────────────────────────────────────
 
     def _compute_token_estimate(self, text: str) -> int:
-        """Estimate token count from text length.
-
-        Uses the CHARS_PER_TOKEN constant (matching the 03-02 convention
-        of approximately 4 characters per token).
+        """Count tokens in text with the shared (cached) token counter.
 
         Args:
-            text: Text to estimate token count for.
+            text: Text to count tokens for.
 
         Returns:
-            Estimated token count (integer).
+            Token count (integer).
         """
-        return int(len(text) / self.CHARS_PER_TOKEN)
+        return get_token_counter().count(text)
 
     # ── Summarization ─────────────────────────────────────────────────────
 
@@ -269,10 +274,13 @@ class ContextSummarizer:
             result = await self._llm_service.completion(  # type: ignore[union-attr]
                 messages=[{"role": "user", "content": prompt}],
                 model="fast",
+                temperature=0.0,
+                cache_ttl=self._cache_ttl,
             )
+            content = result.get("content", "") if isinstance(result, dict) else result
             # Truncate to max_tokens equivalent in characters
             max_chars = int(self._max_tokens_per_summary * self.CHARS_PER_TOKEN)
-            return result[:max_chars]
+            return content[:max_chars]
         except Exception:
             logger.warning(
                 "summarizer.llm_failed",
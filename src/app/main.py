@@ -54,8 +54,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Session store (LangGraph checkpointer)
     try:
         from src.app.context.session import SessionStore
-
-        session_store = SessionStore(settings.DATABASE_URL)
+        from src.app.services.llm import get_llm_service
+
+        session_store = SessionStore(
+            settings.DATABASE_URL,
+            window_size=settings.SESSION_WINDOW_SIZE,
+            keep_checkpoints=settings.SESSION_KEEP_CHECKPOINTS,
+            compact_every=settings.SESSION_COMPACT_EVERY or None,
+            llm_service=get_llm_service(),
+        )
         await session_store.setup()
         app.state.session_store = session_store
         log.info("phase2.session_store_initialized")
@@ -63,11 +70,45 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         log.warning("phase2.session_store_init_failed", exc_info=True)
         app.state.session_store = None
 
+    # ── Knowledge Base: Embedding Service Warm Start ─────────────────────
+    # Loads the BM25 model before the first request so no user waits on the
+    # model load. Embeddings are cached in Redis shared across workers.
+    try:
+        from src.knowledge.config import KnowledgeBaseConfig
+        from src.knowledge.embeddings import EmbeddingService
+
+        embedding_service = EmbeddingService(
+            KnowledgeBaseConfig(), redis_client=get_redis_pool()
+        )
+        await embedding_service.warm_up()
+        app.state.embedding_service = embedding_service
+        log.info("knowledge.embedding_service_initialized")
+    except Exception:
+        log.warning("knowledge.embedding_service_init_failed", exc_info=True)
+        app.state.embedding_service = None
+
     # Long-term memory (pgvector)
     try:
         from src.app.context.memory import LongTermMemory
-
-        long_term_memory = LongTermMemory(settings.DATABASE_URL)
+        from src.knowledge.config import KnowledgeBaseConfig
+
+        # The knowledge embedder (and its cache) replaces LiteLLM only when
+        # it has its own API key and fits the vector(1536) column;
+        # deployments that set just OPENAI_API_KEY keep the LiteLLM path
+        knowledge_config = KnowledgeBaseConfig()
+        memory_embeddings = app.state.embedding_service
+        if not knowledge_config.openai_api_key or knowledge_config.embedding_dimensions != 1536:
+            memory_embeddings = None
+
+        long_term_memory = LongTermMemory(
+            settings.DATABASE_URL,
+            index_type=settings.MEMORY_INDEX_TYPE,
+            hnsw_m=settings.MEMORY_HNSW_M,
+            hnsw_ef_construction=settings.MEMORY_HNSW_EF_CONSTRUCTION,
+            ef_search=settings.MEMORY_HNSW_EF_SEARCH,
+            ivfflat_lists=settings.MEMORY_IVFFLAT_LISTS,
+            embedding_service=memory_embeddings,
+        )
         await long_term_memory.setup()
         app.state.long_term_memory = long_term_memory
         log.info("phase2.long_term_memory_initialized")
@@ -569,8 +610,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         deal_repository = DealRepository(session_factory=_get_deal_session)
         app.state.deal_repository = deal_repository
 
-        detector = OpportunityDetector()
-        political_mapper = PoliticalMapper()
+        deal_llm_service = getattr(app.state, "llm_service", None)
+        detector = OpportunityDetector(llm_service=deal_llm_service)
+        political_mapper = PoliticalMapper(llm_service=deal_llm_service)
         plan_manager = PlanManager(repository=deal_repository)
         progression_engine = StageProgressionEngine()
 
@@ -916,7 +958,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             except Exception:
                 log.warning("phase6.pipeline_cleanup_error", meeting_id=mid, exc_info=True)
 
-    # Close long-term memory pool if it was initialized
+    # Close the session store (waits for background compactions)
+    session_store_ref = getattr(app.state, "session_store", None)
+    if session_store_ref is not None:
+        try:
+            await session_store_ref.close()
+        except Exception:
+            log.warning("phase2.session_store_close_failed", exc_info=True)
+
+    # Flush buffered memories and close the long-term memory pool. Runs
+    # before the embedding service closes: the flush still embeds.
     ltm = getattr(app.state, "long_term_memory", None)
     if ltm is not None:
         try:
@@ -924,6 +975,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception:
             log.warning("phase2.long_term_memory_close_failed", exc_info=True)
 
+    # Stop the knowledge embedding service's sparse encoding executor
+    embedding_service_ref = getattr(app.state, "embedding_service", None)
+    if embedding_service_ref is not None:
+        await embedding_service_ref.close()
+
     await close_db()
     await close_redis()
 
@@ -5,7 +5,7 @@ Generates briefings in three formats per CONTEXT.md:
 2. Bullet -- concise bullet-point summary for quick scanning
 3. Adaptive -- detailed for new contacts, brief for ongoing relationships
 
-Uses instructor + litellm pattern (established in Phase 4) for LLM-powered
+Uses LLMService.structured_completion (established in Phase 4) for LLM-powered
 content generation with model='reasoning' (quality model) since briefings
 are not latency-sensitive. Falls back to rule-based content if LLM is
 unavailable.
@@ -435,8 +435,8 @@ class BriefingGenerator:
     ) -> tuple[list[str], list[str]]:
         """Generate objectives and talk tracks via LLM.
 
-        Uses instructor + litellm pattern (Phase 4) with model='reasoning'
-        for quality content generation.
+        Uses LLMService.structured_completion (Phase 4 pattern) with
+        model='reasoning' for quality content generation.
 
         Args:
             meeting: Meeting context.
@@ -446,11 +446,6 @@ class BriefingGenerator:
         Returns:
             Tuple of (objectives, talk_tracks) from LLM extraction.
         """
-        import instructor
-        import litellm
-
-        client = instructor.from_litellm(litellm.acompletion)
-
         prompt = (
             f"Generate meeting preparation content for a sales meeting.\n\n"
             f"Meeting: {meeting.title}\n"
@@ -461,7 +456,7 @@ class BriefingGenerator:
             f"suggested talk tracks based on the deal stage and QBS methodology."
         )
 
-        extraction = await client.chat.completions.create(
+        extraction = await self._llm_service.structured_completion(
             model="reasoning",
             messages=[
                 {
@@ -477,6 +472,7 @@ class BriefingGenerator:
             ],
             response_model=BriefingExtraction,
             temperature=0.3,
+            max_retries=1,
         )
 
         return extraction.objectives, extraction.talk_tracks
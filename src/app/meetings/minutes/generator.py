@@ -1,6 +1,6 @@
 """MinutesGenerator -- structured meeting minutes extraction from transcripts.
 
-Uses the instructor + litellm pattern (Phase 4: QualificationExtractor,
+Uses LLMService.structured_completion (Phase 4: QualificationExtractor,
 Phase 5: OpportunityDetector) for structured LLM extraction. Handles long
 transcripts via map-reduce: chunk at speaker boundaries, summarize each
 chunk, then synthesize final minutes.
@@ -27,6 +27,7 @@ from __future__ import annotations
 import re
 import uuid
 from datetime import datetime, timezone
+from typing import Any
 
 import structlog
 from pydantic import BaseModel, Field
@@ -45,7 +46,7 @@ logger = structlog.get_logger(__name__)
 # ── Constants ────────────────────────────────────────────────────────────────
 
 MAX_TOKENS_PER_CHUNK = 12_000  # ~15 minutes of conversation
-MODEL_REASONING = "anthropic/claude-sonnet-4-20250514"  # Quality model for minutes
+MODEL_REASONING = "reasoning"  # Router model group (quality model) for minutes
 CHARS_PER_TOKEN = 4.0  # Per 03-02 decision for token estimation
 
 
@@ -140,13 +141,15 @@ REDUCE_SYSTEM_PROMPT = (
 class MinutesGenerator:
     """Generates structured meeting minutes from transcripts.
 
-    Uses instructor + litellm for structured LLM extraction (Phase 4 pattern).
+    Uses LLMService.structured_completion for structured LLM extraction
+    (Phase 4 pattern).
     Handles long transcripts via map-reduce: chunk at speaker boundaries,
     summarize each chunk, then synthesize final minutes.
 
     Args:
         repository: MeetingRepository for persisting generated minutes.
-        llm_service: Optional LLM service (used for model routing if available).
+        llm_service: Optional LLM service for structured extraction. Defaults
+            to the shared service from get_llm_service().
     """
 
     def __init__(
@@ -248,8 +251,6 @@ class MinutesGenerator:
     ) -> ExtractedMinutes:
         """Extract structured minutes in a single LLM call.
 
-        Uses instructor.from_litellm(litellm.acompletion) pattern.
-
         Args:
             transcript_text: Full transcript text.
             attendees: Meeting participants.
@@ -258,16 +259,10 @@ class MinutesGenerator:
         Returns:
             ExtractedMinutes with all fields populated.
         """
-        import instructor
-        import litellm
-
-        client = instructor.from_litellm(litellm.acompletion)
-
-        model = self._resolve_model()
         attendee_names = ", ".join(a.name for a in attendees)
 
-        return await client.chat.completions.create(
-            model=model,
+        return await self._llm().structured_completion(
+            model=MODEL_REASONING,
             response_model=ExtractedMinutes,
             messages=[
                 {"role": "system", "content": SINGLE_PASS_SYSTEM_PROMPT},
@@ -283,6 +278,7 @@ class MinutesGenerator:
             ],
             max_tokens=4096,
             temperature=0.1,
+            max_retries=1,
         )
 
     async def _summarize_chunk(self, chunk_text: str) -> ChunkSummary:
@@ -294,14 +290,8 @@ class MinutesGenerator:
         Returns:
             ChunkSummary with summary and extracted items.
         """
-        import instructor
-        import litellm
-
-        client = instructor.from_litellm(litellm.acompletion)
-        model = self._resolve_model()
-
-        return await client.chat.completions.create(
-            model=model,
+        return await self._llm().structured_completion(
+            model=MODEL_REASONING,
             response_model=ChunkSummary,
             messages=[
                 {"role": "system", "content": CHUNK_SUMMARY_SYSTEM_PROMPT},
@@ -312,6 +302,7 @@ class MinutesGenerator:
             ],
             max_tokens=2048,
             temperature=0.1,
+            max_retries=1,
         )
 
     async def _extract_map_reduce(
@@ -333,9 +324,6 @@ class MinutesGenerator:
         Returns:
             ExtractedMinutes synthesized from all chunks.
         """
-        import instructor
-        import litellm
-
         # MAP phase: chunk and summarize
         chunks = _chunk_transcript(transcript_text)
         summaries: list[ChunkSummary] = []
@@ -351,12 +339,10 @@ class MinutesGenerator:
             for i, s in enumerate(summaries)
         )
 
-        client = instructor.from_litellm(litellm.acompletion)
-        model = self._resolve_model()
         attendee_names = ", ".join(a.name for a in attendees)
 
-        return await client.chat.completions.create(
-            model=model,
+        return await self._llm().structured_completion(
+            model=MODEL_REASONING,
             response_model=ExtractedMinutes,
             messages=[
                 {"role": "system", "content": REDUCE_SYSTEM_PROMPT},
@@ -372,22 +358,16 @@ class MinutesGenerator:
             ],
             max_tokens=4096,
             temperature=0.1,
+            max_retries=1,
         )
 
-    def _resolve_model(self) -> str:
-        """Resolve the LLM model to use for minutes extraction.
-
-        Prefers model from router config if available, falls back to
-        MODEL_REASONING constant.
+    def _llm(self) -> Any:
+        """Return the injected LLM service, or the shared one from get_llm_service()."""
+        if self._llm_service is not None:
+            return self._llm_service
+        from src.app.services.llm import get_llm_service
 
-        Returns:
-            Model identifier string for litellm.
-        """
-        if hasattr(self._llm_service, "router") and self._llm_service.router:
-            for m in self._llm_service.router.model_list:
-                if m.get("model_name") == "reasoning":
-                    return m["litellm_params"]["model"]
-        return MODEL_REASONING
+        return get_llm_service()
 
 
 # ── Module-Level Helpers ─────────────────────────────────────────────────────
@@ -5,22 +5,40 @@ Provides a tenant-aware LLM service with:
 - GPT-4o as fallback when Claude is unavailable
 - Prompt injection detection and sanitization
 - Tenant metadata in every LLM call for cost tracking
+- Structured (instructor) output through the same Router and metrics
+- Opt-in response cache for deterministic calls (see llm_cache)
+- Anthropic prompt caching of stable prompt prefixes
+- Single-flight coalescing of identical concurrent completions per tenant
 - Streaming support via async generators
 """
 
 from __future__ import annotations
 
 import re
-from typing import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import TypeVar
 
 import structlog
 from litellm import Router
+from pydantic import BaseModel
 
 from src.app.config import get_settings
+from src.app.core.monitoring import (
+    llm_cache_requests_total,
+    llm_cache_tokens_saved_total,
+    llm_coalesced_requests_total,
+    llm_requests_total,
+    track_llm_call,
+)
+from src.app.core.redis import get_tenant_redis
 from src.app.core.tenant import get_current_tenant
+from src.app.services.llm_cache import LLMResponseCache, response_cache_key
+from src.knowledge.singleflight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
+ResponseModelT = TypeVar("ResponseModelT", bound=BaseModel)
+
 # ── Prompt Injection Detection ────────────────────────────────────────────────
 
 # Patterns that indicate prompt injection attempts
@@ -129,6 +147,98 @@ def sanitize_messages(messages: list[dict]) -> list[dict]:
     return sanitized
 
 
+# ── Prompt Caching ───────────────────────────────────────────────────────────
+
+# Message key naming the stable leading part of the message content (a str
+# the content starts with). Prompt builders set it when a system prompt
+# mixes static methodology text with per-call sections placed after it, or
+# to the whole content when the message is entirely static.
+CACHE_PREFIX_KEY = "cache_prefix"
+
+# Anthropic only caches prefixes of at least 1024-2048 tokens (model
+# dependent); shorter prompts are not worth a breakpoint (~4 chars/token).
+PROMPT_CACHE_MIN_CHARS = 4096
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def apply_prompt_caching(messages: list[dict], enabled: bool = True) -> list[dict]:
+    """Mark the stable prompt prefix with an Anthropic cache_control breakpoint.
+
+    The breakpoint goes after the cache_prefix of the first message that
+    sets one (everything before that message is part of the cached prefix
+    too) if the prefix is long enough to be cached. Messages without a
+    cache_prefix are never marked: a system message that embeds per-call
+    context would pay a cache write on every call and never be read back.
+    The marked message's content becomes text
+    blocks, the first carrying cache_control. LiteLLM strips cache_control
+    for OpenAI deployments (which cache long prefixes automatically), so
+    Router fallbacks receive plain text blocks.
+
+    Args:
+        messages: Message dicts, possibly carrying a cache_prefix key.
+        enabled: When False, only the cache_prefix keys are removed.
+
+    Returns:
+        New message list without cache_prefix keys.
+    """
+    target, prefix = None, None
+    if enabled:
+        target = next(
+            (i for i, m in enumerate(messages) if m.get(CACHE_PREFIX_KEY)), None
+        )
+        if target is not None:
+            prefix = messages[target][CACHE_PREFIX_KEY]
+
+    cached_chars = sum(len(str(m.get("content", ""))) for m in messages[:target or 0])
+    result = []
+    for index, msg in enumerate(messages):
+        if CACHE_PREFIX_KEY in msg:
+            msg = {k: v for k, v in msg.items() if k != CACHE_PREFIX_KEY}
+        content = msg.get("content")
+        if (
+            index == target
+            and isinstance(content, str)
+            and isinstance(prefix, str)
+            and content.startswith(prefix)
+            and cached_chars + len(prefix) >= PROMPT_CACHE_MIN_CHARS
+        ):
+            blocks: list[dict] = [
+                {"type": "text", "text": prefix, "cache_control": _CACHE_CONTROL}
+            ]
+            if len(content) > len(prefix):
+                blocks.append({"type": "text", "text": content[len(prefix):]})
+            msg = {**msg, "content": blocks}
+        result.append(msg)
+    return result
+
+
+def _token_count(source: object, name: str) -> int:
+    value = getattr(source, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def extract_usage(usage: object) -> dict:
+    """Token usage of a LiteLLM response, including prompt cache activity.
+
+    cache_read_tokens are prompt tokens served from the provider's prompt
+    cache (Anthropic cache_read_input_tokens, OpenAI cached_tokens);
+    cache_write_tokens were written to it (Anthropic only).
+    """
+    if not usage:
+        return {}
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+        "cache_read_tokens": (
+            _token_count(usage, "cache_read_input_tokens")
+            or _token_count(getattr(usage, "prompt_tokens_details", None), "cached_tokens")
+        ),
+        "cache_write_tokens": _token_count(usage, "cache_creation_input_tokens"),
+    }
+
+
 # ── LLM Service ──────────────────────────────────────────────────────────────
 
 
@@ -137,10 +247,22 @@ class LLMService:
 
     Configures Claude Sonnet 4 as primary reasoning model with GPT-4o as
     fallback. All calls include tenant metadata for cost tracking.
+
+    Args:
+        response_cache: Optional cache for calls that pass a cache_ttl.
+            Without one, every call goes to the provider.
+        coalesce: Share one provider call between concurrent calls with
+            identical requests from the same tenant.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, response_cache: LLMResponseCache | None = None, coalesce: bool = True
+    ) -> None:
         settings = get_settings()
+        self.response_cache = response_cache
+        self._coalesce = coalesce
+        # (tenant_id, request key) -> in-flight provider call
+        self._inflight: SingleFlight[tuple[str, str], dict] = SingleFlight()
 
         model_list = []
 
@@ -198,6 +320,9 @@ class LLMService:
         max_tokens: int = 4096,
         temperature: float = 0.7,
         metadata: dict | None = None,
+        cache_ttl: int | None = None,
+        bypass_cache: bool = False,
+        prompt_caching: bool = True,
     ) -> dict:
         """Execute a completion call through the LiteLLM Router.
 
@@ -207,9 +332,19 @@ class LLMService:
             max_tokens: Maximum tokens in the response.
             temperature: Sampling temperature (0-2).
             metadata: Additional metadata to include in the call.
+            cache_ttl: Seconds to cache the response for. Caching is opt-in:
+                None (the default) always calls the provider.
+            bypass_cache: Skip the response cache for this call even if
+                cache_ttl is set (neither read nor written).
+            prompt_caching: Mark the stable prompt prefix as cacheable for
+                Anthropic models (see apply_prompt_caching).
 
         Returns:
-            Dict with content, model, usage, and tenant_id.
+            Dict with content, model, usage, and tenant_id. usage includes
+            cache_read_tokens and cache_write_tokens for provider prompt
+            caching. Responses served from the response cache also carry
+            cached=True; responses shared with an identical concurrent
+            request carry coalesced=True.
 
         Raises:
             RuntimeError: If no LLM API keys are configured.
@@ -218,14 +353,7 @@ class LLMService:
             raise RuntimeError("No LLM API keys configured")
 
         # Get tenant context for cost tracking
-        try:
-            tenant = get_current_tenant()
-            tenant_metadata = {
-                "tenant_id": tenant.tenant_id,
-                "tenant_slug": tenant.tenant_slug,
-            }
-        except RuntimeError:
-            tenant_metadata = {}
+        tenant_metadata = self._tenant_metadata()
 
         # Merge caller metadata with tenant metadata
         call_metadata = {**tenant_metadata, **(metadata or {})}
@@ -233,30 +361,204 @@ class LLMService:
         # Sanitize messages for prompt injection
         safe_messages = sanitize_messages(messages)
 
-        # Call LiteLLM Router
-        response = await self.router.acompletion(
-            model=model,
-            messages=safe_messages,
+        tenant_id = tenant_metadata.get("tenant_id", "")
+        request_key = response_cache_key(
+            model, safe_messages, max_tokens=max_tokens, temperature=temperature
+        )
+
+        async def call_provider() -> dict:
+            response = await self.router.acompletion(
+                model=model,
+                messages=apply_prompt_caching(safe_messages, enabled=prompt_caching),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                metadata=call_metadata,
+            )
+            return {
+                "content": response.choices[0].message.content,
+                "model": response.model,
+                "usage": extract_usage(getattr(response, "usage", None)),
+                "tenant_id": tenant_id,
+            }
+
+        return await self._serve(
+            model,
+            tenant_id,
+            request_key,
+            call_provider,
+            metadata=call_metadata,
+            cache_ttl=None if bypass_cache else cache_ttl,
+        )
+
+    async def structured_completion(
+        self,
+        messages: list[dict],
+        response_model: type[ResponseModelT],
+        model: str = "reasoning",
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        max_retries: int = 2,
+        metadata: dict | None = None,
+        cache_ttl: int | None = None,
+        bypass_cache: bool = False,
+        prompt_caching: bool = True,
+    ) -> ResponseModelT:
+        """Extract a validated Pydantic model through the LiteLLM Router.
+
+        The gateway for instructor structured output: the call goes through
+        the Router (fallbacks, retries, cooldowns) and shares completion()'s
+        tenant metadata, sanitization, prompt caching, response cache,
+        single-flight coalescing and metrics. The cache and coalescing key
+        includes the response model's JSON schema.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            response_model: Pydantic model the response is validated against.
+            model: Model group name ("reasoning" or "fast").
+            max_tokens: Maximum tokens in the response.
+            temperature: Sampling temperature (0-2).
+            max_retries: Instructor re-asks when validation fails.
+            metadata: Additional metadata to include in the call.
+            cache_ttl: As for completion().
+            bypass_cache: As for completion().
+            prompt_caching: As for completion().
+
+        Returns:
+            A new response_model instance per caller, so callers may mutate it.
+
+        Raises:
+            RuntimeError: If no LLM API keys are configured.
+        """
+        if not self.router:
+            raise RuntimeError("No LLM API keys configured")
+
+        call_metadata = {**self._tenant_metadata(), **(metadata or {})}
+        safe_messages = sanitize_messages(messages)
+
+        tenant_id = call_metadata.get("tenant_id", "")
+        request_key = response_cache_key(
+            model,
+            safe_messages,
             max_tokens=max_tokens,
             temperature=temperature,
-            metadata=call_metadata,
+            max_retries=max_retries,
+            response_schema=response_model.model_json_schema(),
         )
 
-        # Extract usage info
-        usage = {}
-        if hasattr(response, "usage") and response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
+        import instructor
+
+        client = instructor.from_litellm(self.router.acompletion)
+
+        async def call_provider() -> dict:
+            parsed, response = await client.chat.completions.create_with_completion(
+                model=model,
+                response_model=response_model,
+                messages=apply_prompt_caching(safe_messages, enabled=prompt_caching),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                max_retries=max_retries,
+                metadata=call_metadata,
+            )
+            return {
+                "content": parsed.model_dump_json(),
+                "model": response.model,
+                "usage": extract_usage(getattr(response, "usage", None)),
+                "tenant_id": tenant_id,
             }
 
-        return {
-            "content": response.choices[0].message.content,
-            "model": response.model,
-            "usage": usage,
-            "tenant_id": tenant_metadata.get("tenant_id", ""),
-        }
+        result = await self._serve(
+            model,
+            tenant_id,
+            request_key,
+            call_provider,
+            metadata=call_metadata,
+            cache_ttl=None if bypass_cache else cache_ttl,
+        )
+        return response_model.model_validate_json(result["content"])
+
+    @staticmethod
+    def _tenant_metadata() -> dict:
+        """Tenant id and slug of the current context for cost tracking."""
+        try:
+            tenant = get_current_tenant()
+        except RuntimeError:
+            return {}
+        return {"tenant_id": tenant.tenant_id, "tenant_slug": tenant.tenant_slug}
+
+    async def _serve(
+        self,
+        model: str,
+        tenant_id: str,
+        request_key: str,
+        call_provider: Callable[[], Awaitable[dict]],
+        *,
+        metadata: dict,
+        cache_ttl: int | None,
+    ) -> dict:
+        """Answer a request from the response cache, an identical in-flight
+        call, or call_provider() -- timed and counted by track_llm_call.
+        """
+        cache_key = None
+        if cache_ttl and self.response_cache is not None:
+            cache_key = request_key
+            cached = await self.response_cache.get(tenant_id, cache_key)
+            if cached is not None:
+                result, tier = cached
+                self._record_cache_hit(model, tenant_id, tier, result, metadata)
+                return {**result, "tenant_id": tenant_id, "cached": True}
+            llm_cache_requests_total.labels(
+                model=model, tenant_id=tenant_id, result="miss"
+            ).inc()
+
+        async def call_tracked() -> dict:
+            async with track_llm_call(model, tenant_id) as tracker:
+                result = await call_provider()
+                tracker["prompt_tokens"] = result["usage"].get("prompt_tokens", 0)
+                tracker["completion_tokens"] = result["usage"].get("completion_tokens", 0)
+            if cache_key is not None:
+                await self.response_cache.set(tenant_id, cache_key, result, cache_ttl)
+            return result
+
+        if not self._coalesce:
+            return await call_tracked()
+
+        # Identical concurrent requests from this tenant share one call
+        result, shared = await self._inflight.do((tenant_id, request_key), call_tracked)
+        if not shared:
+            return result
+        llm_coalesced_requests_total.labels(model=model, tenant_id=tenant_id).inc()
+        return {**result, "usage": dict(result["usage"]), "coalesced": True}
+
+    @staticmethod
+    def _record_cache_hit(
+        model: str, tenant_id: str, tier: str, result: dict, metadata: dict
+    ) -> None:
+        """Record a cached response in usage analytics.
+
+        The provider is not called, so LiteLLM's Langfuse callback never
+        sees the request: count it here, along with the tokens it would
+        have used, and log it with the caller's metadata.
+        """
+        usage = result.get("usage") or {}
+        llm_cache_requests_total.labels(
+            model=model, tenant_id=tenant_id, result=f"{tier}_hit"
+        ).inc()
+        llm_requests_total.labels(model=model, tenant_id=tenant_id, status="cache_hit").inc()
+        for token_type in ("prompt", "completion"):
+            tokens = usage.get(f"{token_type}_tokens")
+            if tokens:
+                llm_cache_tokens_saved_total.labels(
+                    model=model, tenant_id=tenant_id, token_type=token_type
+                ).inc(tokens)
+        logger.info(
+            "llm.cache_hit",
+            model=model,
+            served_model=result.get("model"),
+            tier=tier,
+            tenant_id=tenant_id,
+            usage=usage,
+            purpose=metadata.get("purpose"),
+        )
 
     async def streaming_completion(
         self,
@@ -265,23 +567,18 @@ class LLMService:
         max_tokens: int = 4096,
         temperature: float = 0.7,
         metadata: dict | None = None,
+        prompt_caching: bool = True,
     ) -> AsyncGenerator[str, None]:
         """Execute a streaming completion call.
 
-        Yields content chunks as strings for SSE streaming.
+        Yields content chunks as strings for SSE streaming. prompt_caching
+        is as for completion().
         """
         if not self.router:
             raise RuntimeError("No LLM API keys configured")
 
         # Get tenant context
-        try:
-            tenant = get_current_tenant()
-            tenant_metadata = {
-                "tenant_id": tenant.tenant_id,
-                "tenant_slug": tenant.tenant_slug,
-            }
-        except RuntimeError:
-            tenant_metadata = {}
+        tenant_metadata = self._tenant_metadata()
 
         call_metadata = {**tenant_metadata, **(metadata or {})}
 
@@ -290,7 +587,7 @@ class LLMService:
 
         response = await self.router.acompletion(
             model=model,
-            messages=safe_messages,
+            messages=apply_prompt_caching(safe_messages, enabled=prompt_caching),
             max_tokens=max_tokens,
             temperature=temperature,
             metadata=call_metadata,
@@ -311,5 +608,12 @@ def get_llm_service() -> LLMService:
     """Get or create the LLM service singleton."""
     global _llm_service
     if _llm_service is None:
-        _llm_service = LLMService()
+        settings = get_settings()
+        response_cache = None
+        if settings.LLM_RESPONSE_CACHE_ENABLED:
+            response_cache = LLMResponseCache(
+                redis=get_tenant_redis(),
+                max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            )
+        _llm_service = LLMService(response_cache=response_cache)
     return _llm_service
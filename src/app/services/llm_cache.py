@@ -0,0 +1,148 @@
+"""Two-tier response cache for deterministic LLM completions.
+
+Many completion calls repeat verbatim (temperature-0 handoff checks,
+routing prompts, period summaries). LLMService consults this cache when a
+call site opts in with a TTL:
+
+1. In-process LRU: no network round trip; entries keep their own expiry.
+2. Redis via TenantRedis: shared across workers, keys live under the
+   tenant's t:{tenant_id}: prefix, so cached answers never cross tenants.
+
+Keys are derived from the model group, a hash of the normalized messages
+and the sampling parameters. The in-process tier is also keyed by tenant.
+Redis failures are logged and treated as misses -- the cache never fails
+a completion.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+import structlog
+
+from src.app.core.redis import TenantRedis
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "llm:cache:"
+
+# Fields of a cached completion result (tenant_id is filled in per call)
+CACHED_FIELDS = ("content", "model", "usage")
+
+
+def normalize_messages(messages: list[dict]) -> list[dict]:
+    """Canonical form of messages for hashing.
+
+    Keeps the fields that affect the completion, sorts keys and strips
+    surrounding whitespace from string content, so formatting-only
+    differences between call sites map to the same key.
+    """
+    normalized = []
+    for message in messages:
+        item = {k: v for k, v in message.items() if v is not None}
+        content = item.get("content")
+        if isinstance(content, str):
+            item["content"] = content.strip()
+        normalized.append(item)
+    return normalized
+
+
+def response_cache_key(
+    model: str,
+    messages: list[dict],
+    *,
+    max_tokens: int,
+    temperature: float,
+    **params: Any,
+) -> str:
+    """Cache key for a completion: model group + message hash + sampling params."""
+    payload = json.dumps(
+        {
+            "messages": normalize_messages(messages),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **params,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}{model}:{digest}"
+
+
+class LLMResponseCache:
+    """In-process LRU in front of a tenant-prefixed Redis cache.
+
+    Args:
+        redis: TenantRedis wrapper for the shared tier. None keeps the
+            cache in-process only.
+        max_entries: Capacity of the in-process LRU.
+    """
+
+    def __init__(self, redis: TenantRedis | None = None, max_entries: int = 2048) -> None:
+        self._redis = redis
+        self._max_entries = max_entries
+        # (tenant_id, key) -> (expires_at monotonic, result)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, tenant_id: str, key: str) -> tuple[dict[str, Any], str] | None:
+        """Look up a cached result.
+
+        Returns:
+            (result, tier) where tier is "memory" or "redis", or None on a miss.
+        """
+        local_key = (tenant_id, key)
+        entry = self._entries.get(local_key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(local_key)
+                return result, "memory"
+            del self._entries[local_key]
+
+        # The Redis tier is tenant-prefixed and needs a tenant context
+        if self._redis is None or not tenant_id:
+            return None
+        try:
+            raw = await self._redis.get(key)
+            if raw is None:
+                return None
+            ttl = await self._redis.ttl(key)
+        except Exception:
+            logger.warning("llm_cache.redis_get_failed", key=key, exc_info=True)
+            return None
+
+        result = json.loads(raw)
+        if ttl and ttl > 0:
+            self._put_local(local_key, result, ttl)
+        return result, "redis"
+
+    async def set(self, tenant_id: str, key: str, result: dict[str, Any], ttl: int) -> None:
+        """Store a result in both tiers for ttl seconds."""
+        cached = {field: result.get(field) for field in CACHED_FIELDS}
+        self._put_local((tenant_id, key), cached, ttl)
+
+        if self._redis is None or not tenant_id:
+            return
+        try:
+            await self._redis.set(key, json.dumps(cached), ex=ttl)
+        except Exception:
+            logger.warning("llm_cache.redis_set_failed", key=key, exc_info=True)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire by TTL)."""
+        self._entries.clear()
+
+    def _put_local(self, local_key: tuple[str, str], result: dict[str, Any], ttl: int) -> None:
+        self._entries[local_key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(local_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
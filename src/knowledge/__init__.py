@@ -4,12 +4,15 @@ Provides Qdrant-backed vector storage with payload-based multi-tenant isolation,
 hybrid search (dense + sparse BM25), and Pydantic models for knowledge chunks.
 """
 
+from src.knowledge.answer_cache import SemanticAnswerCache
 from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.embedding_cache import EmbeddingCache
 from src.knowledge.embeddings import EmbeddingService
 from src.knowledge.models import (
     ChunkMetadata,
     ConversationMessage,
     KnowledgeChunk,
+    KnowledgeHit,
     TenantConfig,
 )
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
@@ -17,9 +20,12 @@ from src.knowledge.qdrant_client import QdrantKnowledgeStore
 __all__ = [
     "ChunkMetadata",
     "ConversationMessage",
+    "EmbeddingCache",
     "EmbeddingService",
     "KnowledgeBaseConfig",
     "KnowledgeChunk",
+    "KnowledgeHit",
     "QdrantKnowledgeStore",
+    "SemanticAnswerCache",
     "TenantConfig",
 ]
@@ -0,0 +1,312 @@
+"""Tenant-scoped semantic answer cache for the agentic RAG pipeline.
+
+Stores complete RAG answers in a small dedicated Qdrant collection keyed by
+the dense embedding of the user's query. A later query from the same tenant
+(with the same base filters) whose embedding is within the configured cosine
+similarity threshold returns the stored answer without running decompose,
+retrieve, grade and synthesize again.
+
+Each entry records the chunk IDs and source documents its answer was
+synthesized from, so entries are invalidated when:
+- QdrantKnowledgeStore.delete_chunks removes any of those chunks, or
+- IngestionPipeline.update_document versions any of those documents.
+
+Entries also expire after a TTL as a safety net for changes that are not
+tracked (e.g. a brand-new document that would now answer the question).
+Lookups ignore expired entries; store() deletes them at most once per TTL
+so the collection does not grow without a separate scheduled job.
+
+Lookups record the best match similarity in a histogram whether or not it
+clears the threshold, so the threshold can be tuned from real traffic.
+Qdrant errors are logged and treated as misses -- the cache never fails a
+RAG request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+from pydantic import BaseModel
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.models.models import KeywordIndexParams
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchAny,
+    MatchValue,
+    PayloadSchemaType,
+    PointStruct,
+    Range,
+    VectorParams,
+)
+
+from src.knowledge.config import KnowledgeBaseConfig
+
+logger = logging.getLogger(__name__)
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+rag_answer_cache_requests_total = Counter(
+    "rag_answer_cache_requests_total",
+    "Semantic answer cache lookups by result (hit, miss, error)",
+    ["result"],
+)
+
+rag_answer_cache_similarity = Histogram(
+    "rag_answer_cache_similarity",
+    "Cosine similarity of the closest cached query on each lookup",
+    buckets=(0.5, 0.7, 0.8, 0.85, 0.9, 0.92, 0.94, 0.96, 0.98, 0.99, 1.0),
+)
+
+rag_answer_cache_invalidations_total = Counter(
+    "rag_answer_cache_invalidations_total",
+    "Semantic answer cache invalidation requests by trigger",
+    ["trigger"],
+)
+
+
+def filters_key(filters: dict[str, Any] | None) -> str:
+    """Stable digest of base filters so differently-filtered queries never share answers."""
+    canonical = json.dumps(filters or {}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class SemanticAnswerCache:
+    """Qdrant-backed cache of RAG answers keyed by tenant and query embedding.
+
+    Args:
+        client: Async Qdrant client (shared with QdrantKnowledgeStore).
+        embedding_service: Service providing embed_text(text) -> (dense, sparse).
+        config: Knowledge base configuration (collection name, threshold, TTL).
+    """
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        embedding_service: Any,
+        config: KnowledgeBaseConfig,
+    ) -> None:
+        self._client = client
+        self._embeddings = embedding_service
+        self._collection = config.collection_answer_cache
+        self._dimensions = config.embedding_dimensions
+        self._threshold = config.answer_cache_similarity_threshold
+        self._ttl = config.answer_cache_ttl_seconds
+        self._next_purge_at = 0.0
+
+    @property
+    def similarity_threshold(self) -> float:
+        """Minimum cosine similarity for a cached answer to be returned."""
+        return self._threshold
+
+    async def initialize(self) -> None:
+        """Create the answer cache collection if it doesn't already exist."""
+        if await self._client.collection_exists(self._collection):
+            return
+
+        await self._client.create_collection(
+            collection_name=self._collection,
+            vectors_config={
+                "dense": VectorParams(size=self._dimensions, distance=Distance.COSINE),
+            },
+        )
+        await self._client.create_payload_index(
+            collection_name=self._collection,
+            field_name="tenant_id",
+            field_schema=KeywordIndexParams(type="keyword", is_tenant=True),
+        )
+        for field in ["filters_key", "chunk_ids", "source_documents"]:
+            await self._client.create_payload_index(
+                collection_name=self._collection,
+                field_name=field,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+        await self._client.create_payload_index(
+            collection_name=self._collection,
+            field_name="expires_at",
+            field_schema=PayloadSchemaType.INTEGER,
+        )
+        logger.info("Created %s collection", self._collection)
+
+    async def lookup(
+        self,
+        query: str,
+        tenant_id: str,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the cached answer for a near-duplicate query, if any.
+
+        Args:
+            query: The user's natural language query.
+            tenant_id: Tenant scope.
+            filters: Base filters the answer must have been produced with.
+
+        Returns:
+            The stored response dict (as passed to store()), or None on miss.
+        """
+        try:
+            dense, _ = await self._embeddings.embed_text(query)
+            results = await self._client.query_points(
+                collection_name=self._collection,
+                query=dense,
+                using="dense",
+                query_filter=self._scope_filter(tenant_id, filters),
+                limit=1,
+                with_payload=True,
+            )
+        except Exception:
+            logger.warning("Answer cache lookup failed, treating as miss", exc_info=True)
+            rag_answer_cache_requests_total.labels(result="error").inc()
+            return None
+
+        if not results.points:
+            rag_answer_cache_requests_total.labels(result="miss").inc()
+            return None
+
+        best = results.points[0]
+        rag_answer_cache_similarity.observe(best.score)
+        if best.score < self._threshold:
+            rag_answer_cache_requests_total.labels(result="miss").inc()
+            return None
+
+        try:
+            response = json.loads((best.payload or {})["response"])
+        except Exception:
+            logger.warning("Answer cache entry is unreadable, treating as miss", exc_info=True)
+            rag_answer_cache_requests_total.labels(result="error").inc()
+            return None
+
+        rag_answer_cache_requests_total.labels(result="hit").inc()
+        logger.debug(
+            "Answer cache hit for tenant %s (similarity %.3f)", tenant_id, best.score
+        )
+        return response
+
+    async def store(
+        self,
+        query: str,
+        tenant_id: str,
+        response: BaseModel,
+        chunk_ids: list[str],
+        source_documents: list[str],
+        filters: dict[str, Any] | None = None,
+    ) -> None:
+        """Cache an answer along with the chunks and documents it depends on.
+
+        Args:
+            query: The user's natural language query.
+            tenant_id: Tenant scope.
+            response: The answer model to cache (serialized to JSON).
+            chunk_ids: IDs of every chunk the answer was synthesized from.
+            source_documents: Source documents of those chunks.
+            filters: Base filters the answer was produced with.
+        """
+        try:
+            dense, _ = await self._embeddings.embed_text(query)
+            await self._client.upsert(
+                collection_name=self._collection,
+                points=[
+                    PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector={"dense": dense},
+                        payload={
+                            "tenant_id": tenant_id,
+                            "query": query,
+                            "filters_key": filters_key(filters),
+                            "chunk_ids": sorted(set(chunk_ids)),
+                            "source_documents": sorted(set(source_documents)),
+                            "expires_at": int(time.time()) + self._ttl,
+                            "response": response.model_dump_json(),
+                        },
+                    )
+                ],
+            )
+        except Exception:
+            logger.warning("Answer cache store failed", exc_info=True)
+            return
+
+        if time.monotonic() >= self._next_purge_at:
+            self._next_purge_at = time.monotonic() + max(self._ttl, 60)
+            await self.purge_expired()
+
+    async def invalidate_chunks(self, tenant_id: str, chunk_ids: list[str]) -> None:
+        """Drop every cached answer that was built from any of chunk_ids."""
+        if chunk_ids:
+            await self._invalidate(tenant_id, "chunk_ids", chunk_ids, trigger="chunks_deleted")
+
+    async def invalidate_chunks_all_tenants(self, chunk_ids: list[str]) -> None:
+        """Drop cached answers of every tenant built from shared chunk_ids."""
+        if chunk_ids:
+            await self._delete(
+                Filter(must=[FieldCondition(key="chunk_ids", match=MatchAny(any=list(chunk_ids)))]),
+                "shared_chunks_replaced",
+            )
+
+    async def invalidate_documents(
+        self, tenant_id: str, source_documents: list[str]
+    ) -> None:
+        """Drop every cached answer that cites any of source_documents."""
+        if source_documents:
+            await self._invalidate(
+                tenant_id, "source_documents", source_documents, trigger="document_updated"
+            )
+
+    async def clear_tenant(self, tenant_id: str) -> None:
+        """Drop every cached answer for a tenant."""
+        await self._delete(Filter(must=[self._tenant_condition(tenant_id)]), "tenant_cleared")
+
+    async def purge_expired(self) -> None:
+        """Delete entries past their TTL (lookups already ignore them).
+
+        store() calls this at most once per TTL window.
+        """
+        await self._delete(
+            Filter(must=[FieldCondition(key="expires_at", range=Range(lte=int(time.time())))]),
+            "expired",
+        )
+
+    async def _invalidate(
+        self, tenant_id: str, field: str, values: list[str], trigger: str
+    ) -> None:
+        await self._delete(
+            Filter(
+                must=[
+                    self._tenant_condition(tenant_id),
+                    FieldCondition(key=field, match=MatchAny(any=list(values))),
+                ]
+            ),
+            trigger,
+        )
+
+    async def _delete(self, selector: Filter, trigger: str) -> None:
+        rag_answer_cache_invalidations_total.labels(trigger=trigger).inc()
+        try:
+            await self._client.delete(
+                collection_name=self._collection,
+                points_selector=FilterSelector(filter=selector),
+            )
+        except Exception:
+            logger.warning("Answer cache invalidation (%s) failed", trigger, exc_info=True)
+
+    @staticmethod
+    def _tenant_condition(tenant_id: str) -> FieldCondition:
+        return FieldCondition(key="tenant_id", match=MatchValue(value=tenant_id))
+
+    @classmethod
+    def _scope_filter(cls, tenant_id: str, filters: dict[str, Any] | None) -> Filter:
+        """Tenant + base-filter scope, restricted to unexpired entries."""
+        return Filter(
+            must=[
+                cls._tenant_condition(tenant_id),
+                FieldCondition(key="filters_key", match=MatchValue(value=filters_key(filters))),
+                FieldCondition(key="expires_at", range=Range(gt=int(time.time()))),
+            ]
+        )
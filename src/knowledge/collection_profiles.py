@@ -0,0 +1,177 @@
+"""Vector storage profiles for the Qdrant collections.
+
+A profile decides how the dense vectors of a collection are stored and
+searched: quantization, whether original vectors live on disk, HNSW graph
+parameters, and the matching search-time parameters (hnsw_ef, rescoring
+with oversampling).
+
+Profiles:
+- default: float32 vectors in RAM, Qdrant's HNSW defaults.
+- scalar: int8 scalar quantization held in RAM (4x smaller), originals in
+  RAM for rescoring.
+- binary: 1-bit binary quantization held in RAM (32x smaller), originals
+  in RAM, rescored with 3x oversampling. Suited to 1536-d OpenAI vectors.
+- on_disk: originals memory-mapped from disk, int8 quantized copy in RAM,
+  top candidates rescored from disk. For collections that grow without
+  bound, such as conversations.
+
+KnowledgeBaseConfig selects a profile per collection and can override the
+HNSW m / ef_construct / ef settings of any profile. apply_profile migrates
+an existing collection in place (Qdrant rebuilds indexes in the background).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Disabled,
+    Distance,
+    HnswConfigDiff,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionProfile(BaseModel):
+    """Storage and search settings for a collection's dense vectors.
+
+    Attributes:
+        name: Profile name.
+        quantization: Quantized copy kept for search (None = full precision only).
+        on_disk: Store original vectors on disk (memory-mapped) instead of RAM.
+        hnsw_m: HNSW graph degree (None = Qdrant default, 16).
+        hnsw_ef_construct: HNSW build-time beam width (None = Qdrant default, 100).
+        hnsw_ef: Search-time beam width (None = Qdrant default).
+        rescore: Re-rank quantized candidates with the original vectors.
+        oversampling: Candidates fetched per result before rescoring.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    quantization: Literal["scalar", "binary"] | None = None
+    on_disk: bool = False
+    hnsw_m: int | None = None
+    hnsw_ef_construct: int | None = None
+    hnsw_ef: int | None = None
+    rescore: bool = True
+    oversampling: float | None = None
+
+    def vector_params(self, size: int) -> VectorParams:
+        """VectorParams for creating a dense vector with this profile."""
+        return VectorParams(
+            size=size,
+            distance=Distance.COSINE,
+            on_disk=self.on_disk,
+            hnsw_config=self.hnsw_config(),
+            quantization_config=self.quantization_config(),
+        )
+
+    def hnsw_config(self) -> HnswConfigDiff | None:
+        """HNSW overrides, or None to keep the collection defaults."""
+        if self.hnsw_m is None and self.hnsw_ef_construct is None:
+            return None
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self) -> ScalarQuantization | BinaryQuantization | None:
+        """Quantization config for the dense vector (quantized copy kept in RAM)."""
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def search_params(self) -> SearchParams | None:
+        """Search-time params matching this profile, or None for Qdrant defaults."""
+        quantization = None
+        if self.quantization is not None:
+            quantization = QuantizationSearchParams(
+                rescore=self.rescore, oversampling=self.oversampling
+            )
+        if quantization is None and self.hnsw_ef is None:
+            return None
+        return SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
+
+
+COLLECTION_PROFILES: dict[str, CollectionProfile] = {
+    "default": CollectionProfile(name="default"),
+    "scalar": CollectionProfile(name="scalar", quantization="scalar", oversampling=1.5),
+    "binary": CollectionProfile(name="binary", quantization="binary", oversampling=3.0),
+    "on_disk": CollectionProfile(
+        name="on_disk", quantization="scalar", on_disk=True, oversampling=2.0
+    ),
+}
+
+
+def get_profile(
+    name: str,
+    hnsw_m: int | None = None,
+    hnsw_ef_construct: int | None = None,
+    hnsw_ef: int | None = None,
+) -> CollectionProfile:
+    """Look up a named profile, applying any HNSW overrides.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    profile = COLLECTION_PROFILES.get(name)
+    if profile is None:
+        known = ", ".join(sorted(COLLECTION_PROFILES))
+        raise ValueError(f"Unknown collection profile '{name}'. Known profiles: {known}")
+
+    overrides = {
+        key: value
+        for key, value in {
+            "hnsw_m": hnsw_m,
+            "hnsw_ef_construct": hnsw_ef_construct,
+            "hnsw_ef": hnsw_ef,
+        }.items()
+        if value is not None
+    }
+    return profile.model_copy(update=overrides) if overrides else profile
+
+
+async def apply_profile(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    profile: CollectionProfile,
+    vector_name: str = "dense",
+) -> None:
+    """Migrate an existing collection's dense vector to a profile in place.
+
+    Switching away from a quantized profile disables quantization. Qdrant
+    re-optimizes segments in the background; the collection stays
+    searchable throughout.
+    """
+    quantization = profile.quantization_config() or Disabled.DISABLED
+    await client.update_collection(
+        collection_name=collection_name,
+        vectors_config={
+            vector_name: VectorParamsDiff(
+                on_disk=profile.on_disk,
+                hnsw_config=profile.hnsw_config(),
+                quantization_config=quantization,
+            )
+        },
+    )
+    logger.info(
+        "Applied collection profile %s to %s (vector %s)",
+        profile.name,
+        collection_name,
+        vector_name,
+    )
@@ -6,6 +6,8 @@ For example, KNOWLEDGE_QDRANT_PATH sets qdrant_path.
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,11 +19,43 @@ class KnowledgeBaseConfig(BaseSettings):
         qdrant_url: Remote Qdrant server URL (production mode). If set, takes
             precedence over qdrant_path.
         qdrant_api_key: API key for remote Qdrant authentication.
+        qdrant_prefer_grpc: Use gRPC instead of REST for remote Qdrant calls.
+        qdrant_grpc_port: gRPC port of the remote Qdrant server.
+        qdrant_timeout: Per-request timeout in seconds for remote Qdrant calls.
+        qdrant_pool_size: Maximum pooled connections (REST) or channels (gRPC)
+            kept open to the remote Qdrant server.
         openai_api_key: OpenAI API key for dense embedding generation.
         embedding_model: OpenAI embedding model name.
         embedding_dimensions: Dimensionality of dense embeddings.
+        embedding_cache_enabled: Cache embeddings in-process (and in Redis when
+            a client is supplied to EmbeddingService).
+        embedding_cache_max_entries: Maximum entries in the in-process LRU.
+        embedding_cache_ttl_seconds: Time-to-live for cached embeddings.
+        sparse_executor: Where BM25 encoding runs: "thread" (one dedicated
+            thread, keeps the event loop free) or "process" (process pool,
+            parallel across cores for large ingestion batches).
+        sparse_max_workers: Process pool size (0 = one per CPU core).
+        sparse_batch_size: Texts per BM25 encoding slice submitted to the executor.
         collection_knowledge: Name of the knowledge base collection in Qdrant.
         collection_conversations: Name of the conversations collection in Qdrant.
+        collection_answer_cache: Name of the semantic answer cache collection.
+        shared_tenant_id: Reserved tenant_id of the read-only partition that
+            holds the bundled methodology and regional content once for all
+            tenants; every tenant's knowledge search includes it. None stores
+            a copy of that content per tenant instead.
+        answer_cache_enabled: Create the semantic answer cache alongside the
+            knowledge store (pipelines opt in by passing it).
+        answer_cache_similarity_threshold: Minimum cosine similarity between a
+            new query and a cached one for the cached answer to be reused.
+        answer_cache_ttl_seconds: Time-to-live for cached answers.
+        knowledge_profile: Vector storage profile for the knowledge_base
+            collection (see collection_profiles: default, scalar, binary,
+            on_disk).
+        conversations_profile: Vector storage profile for the conversations
+            collection.
+        hnsw_m: Optional HNSW graph degree override for both profiles.
+        hnsw_ef_construct: Optional HNSW build beam width override.
+        hnsw_ef: Optional HNSW search beam width override.
         default_top_k: Default number of results returned by search.
         chunk_size: Target token count per knowledge chunk.
         chunk_overlap_pct: Overlap percentage between consecutive chunks (0.0-1.0).
@@ -38,15 +72,39 @@ class KnowledgeBaseConfig(BaseSettings):
     qdrant_path: str = "./qdrant_data"
     qdrant_url: str | None = None
     qdrant_api_key: str | None = None
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout: int = 10
+    qdrant_pool_size: int = 32
 
     # Embedding
     openai_api_key: str = ""
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536
+    embedding_cache_enabled: bool = True
+    embedding_cache_max_entries: int = 2_000
+    embedding_cache_ttl_seconds: int = 86_400
+    sparse_executor: Literal["thread", "process"] = "thread"
+    sparse_max_workers: int = 0
+    sparse_batch_size: int = 64
 
     # Collections
     collection_knowledge: str = "knowledge_base"
     collection_conversations: str = "conversations"
+    collection_answer_cache: str = "rag_answer_cache"
+    shared_tenant_id: str | None = "__shared__"
+
+    # Semantic answer cache
+    answer_cache_enabled: bool = True
+    answer_cache_similarity_threshold: float = 0.95
+    answer_cache_ttl_seconds: int = 3_600
+
+    # Vector storage profiles
+    knowledge_profile: Literal["default", "scalar", "binary", "on_disk"] = "default"
+    conversations_profile: Literal["default", "scalar", "binary", "on_disk"] = "default"
+    hnsw_m: int | None = None
+    hnsw_ef_construct: int | None = None
+    hnsw_ef: int | None = None
 
     # Search
     default_top_k: int = 7
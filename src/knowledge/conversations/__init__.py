@@ -5,13 +5,16 @@ Provides persistent conversation memory for sales agents, enabling:
 - Semantic search over conversation history
 - Cross-session context assembly for agent context windows
 - Session lifecycle management with metadata tracking
+- Write-behind batching of message writes with a durable local spill
 """
 
 from src.knowledge.conversations.session import ConversationSession, SessionManager
 from src.knowledge.conversations.store import ConversationStore
+from src.knowledge.conversations.write_buffer import ConversationWriteBuffer
 
 __all__ = [
     "ConversationSession",
     "ConversationStore",
+    "ConversationWriteBuffer",
     "SessionManager",
 ]
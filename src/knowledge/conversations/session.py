@@ -11,6 +11,7 @@ prior sessions so the agent "remembers" what was discussed before.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import uuid
@@ -25,6 +26,15 @@ from src.knowledge.models import ConversationMessage
 logger = logging.getLogger(__name__)
 
 
+def _log_write_failure(future: asyncio.Future[str]) -> None:
+    """Retrieve a write-behind future's outcome so a failed write is logged, not lost."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(
+            "Conversation message write failed; it stays pending and is retried: %s",
+            future.exception(),
+        )
+
+
 # ── Stop words for keyword extraction ──────────────────────────────────────
 
 _STOP_WORDS = frozenset({
@@ -128,7 +138,8 @@ class SessionManager:
 
         Creates a ConversationMessage with the session's tenant/session/channel
         context, persists it via ConversationStore, and updates the session's
-        activity tracking.
+        activity tracking. When the store uses write-behind, the message is
+        durably spilled and stored with the next batch instead of awaited.
 
         Args:
             session: The session to add the message to.
@@ -148,7 +159,8 @@ class SessionManager:
             metadata=metadata or {},
         )
 
-        await self._store.add_message(message)
+        future = await self._store.submit_message(message)
+        future.add_done_callback(_log_write_failure)
 
         # Update session tracking
         session.last_activity = message.timestamp
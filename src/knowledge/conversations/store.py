@@ -6,6 +6,7 @@ are tenant-scoped to enforce multi-tenant isolation.
 
 Key capabilities:
 - Add individual or batched messages with dense embeddings
+- Optional write-behind batching (submit_message) with a durable local spill
 - Retrieve session history (ordered by timestamp)
 - Retrieve channel history across sessions
 - Semantic search over conversation history with optional filters
@@ -15,11 +16,13 @@ Key capabilities:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     DatetimeRange,
     FieldCondition,
@@ -28,8 +31,10 @@ from qdrant_client.models import (
     OrderBy,
     PointStruct,
     Range,
+    SearchParams,
 )
 
+from src.knowledge.conversations.write_buffer import ConversationWriteBuffer
 from src.knowledge.embeddings import EmbeddingService
 from src.knowledge.models import ConversationMessage
 
@@ -43,21 +48,95 @@ class ConversationStore:
     collection, enabling both exact-match retrieval (by session, channel)
     and semantic search over conversation history.
 
+    With spill_dir set, submit_message() goes through a write-behind
+    buffer that coalesces messages per tenant into add_messages() batches
+    (see ConversationWriteBuffer). Call recover_spilled() at startup and
+    close() on shutdown. Several worker processes may share one spill_dir.
+
     Args:
-        qdrant_client: Initialized Qdrant client instance.
+        qdrant_client: Initialized async Qdrant client instance.
         embedder: Embedding service for generating dense vectors.
         collection_name: Qdrant collection for conversations.
+        spill_dir: Directory for the write-behind spill. None disables
+            write-behind (submit_message writes through).
+        write_batch_size: Pending messages per tenant that trigger a flush.
+        write_max_delay: Seconds a pending message may wait for its batch.
+        search_params: Optional dense search params matching the collection
+            profile (QdrantKnowledgeStore.conversations_profile.search_params()).
     """
 
     def __init__(
         self,
-        qdrant_client: QdrantClient,
+        qdrant_client: AsyncQdrantClient,
         embedder: EmbeddingService,
         collection_name: str = "conversations",
+        spill_dir: str | Path | None = None,
+        write_batch_size: int = 64,
+        write_max_delay: float = 0.2,
+        search_params: SearchParams | None = None,
     ) -> None:
         self._client = qdrant_client
         self._embedder = embedder
         self._collection = collection_name
+        self._search_params = search_params
+        self._write_buffer: ConversationWriteBuffer | None = None
+        if spill_dir is not None:
+            self._write_buffer = ConversationWriteBuffer(
+                writer=self.add_messages,
+                spill_dir=spill_dir,
+                max_batch_size=write_batch_size,
+                max_delay=write_max_delay,
+            )
+
+    @property
+    def write_behind(self) -> bool:
+        """Whether submit_message() batches writes behind a durable spill."""
+        return self._write_buffer is not None
+
+    async def submit_message(self, message: ConversationMessage) -> asyncio.Future[str]:
+        """Accept a message for persistence and return a future for its ID.
+
+        With write-behind enabled this returns once the message is spilled
+        to local disk; the future resolves when its tenant's batch has been
+        embedded and upserted. Without write-behind the message is written
+        through and the future is already resolved.
+
+        Args:
+            message: The conversation message to persist.
+
+        Returns:
+            Future resolving to the message ID once stored in Qdrant.
+        """
+        if self._write_buffer is not None:
+            return await self._write_buffer.submit(message)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        future.set_result(await self.add_message(message))
+        return future
+
+    async def flush(self) -> None:
+        """Write all buffered messages now (shutdown hook; no-op without write-behind)."""
+        if self._write_buffer is not None:
+            await self._write_buffer.flush()
+
+    async def close(self) -> None:
+        """Flush buffered messages and release the spill (shutdown hook).
+
+        Messages that still fail to store stay spilled for recover_spilled().
+        """
+        if self._write_buffer is not None:
+            await self._write_buffer.flush()
+            self._write_buffer.close()
+
+    async def recover_spilled(self) -> int:
+        """Replay messages spilled by processes that are gone (startup hook).
+
+        Returns:
+            Number of messages replayed (0 without write-behind).
+        """
+        if self._write_buffer is None:
+            return 0
+        return await self._write_buffer.recover()
 
     async def add_message(self, message: ConversationMessage) -> str:
         """Persist a single conversation message with its embedding.
@@ -79,7 +158,7 @@ class ConversationStore:
             payload=self._message_to_payload(message),
         )
 
-        self._client.upsert(
+        await self._client.upsert(
             collection_name=self._collection,
             points=[point],
         )
@@ -108,7 +187,7 @@ class ConversationStore:
 
         # Batch embed all message contents
         texts = [m.content for m in messages]
-        embeddings = await self._embedder.embed_batch(texts)
+        embeddings = await self._embedder.embed_batch(texts, populate_cache=False)
 
         points: list[PointStruct] = []
         for message, (dense_vector, _sparse) in zip(messages, embeddings, strict=True):
@@ -119,7 +198,7 @@ class ConversationStore:
             )
             points.append(point)
 
-        self._client.upsert(
+        await self._client.upsert(
             collection_name=self._collection,
             points=points,
         )
@@ -140,10 +219,13 @@ class ConversationStore:
             session_id: Session to retrieve messages for.
             limit: Maximum number of messages to return.
 
+        Messages accepted by submit_message() but not yet flushed are
+        included, so a session reads its own writes.
+
         Returns:
             List of ConversationMessage objects ordered by timestamp ascending.
         """
-        results = self._client.scroll(
+        results = await self._client.scroll(
             collection_name=self._collection,
             scroll_filter=Filter(
                 must=[
@@ -158,7 +240,17 @@ class ConversationStore:
         )
 
         points, _next_page = results
-        return [self._payload_to_message(str(p.id), p.payload or {}) for p in points]
+        messages = [self._payload_to_message(str(p.id), p.payload or {}) for p in points]
+
+        if self._write_buffer is not None:
+            pending = self._write_buffer.pending(tenant_id, session_id)
+            if pending:
+                stored_ids = {m.id for m in messages}
+                messages.extend(m for m in pending if m.id not in stored_ids)
+                messages.sort(key=lambda m: m.timestamp)
+                messages = messages[:limit]
+
+        return messages
 
     async def get_channel_history(
         self, tenant_id: str, channel: str, limit: int = 50
@@ -176,7 +268,7 @@ class ConversationStore:
         Returns:
             List of ConversationMessage objects ordered by timestamp descending.
         """
-        results = self._client.scroll(
+        results = await self._client.scroll(
             collection_name=self._collection,
             scroll_filter=Filter(
                 must=[
@@ -201,6 +293,7 @@ class ConversationStore:
         session_id: str | None = None,
         channel: str | None = None,
         time_range: tuple[datetime, datetime] | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[ConversationMessage]:
         """Semantic search over conversation history.
 
@@ -215,11 +308,42 @@ class ConversationStore:
             session_id: Optional filter to search within a specific session.
             channel: Optional filter to search within a specific channel.
             time_range: Optional (start, end) datetime tuple to restrict results.
+            query_vector: Optional precomputed dense embedding of the query.
 
         Returns:
             List of ConversationMessage objects ranked by semantic similarity.
         """
-        dense_vector, _sparse = await self._embedder.embed_text(query)
+        scored = await self.search_conversations_scored(
+            tenant_id=tenant_id,
+            query=query,
+            top_k=top_k,
+            session_id=session_id,
+            channel=channel,
+            time_range=time_range,
+            query_vector=query_vector,
+        )
+        return [message for message, _score in scored]
+
+    async def search_conversations_scored(
+        self,
+        tenant_id: str,
+        query: str,
+        top_k: int = 10,
+        session_id: str | None = None,
+        channel: str | None = None,
+        time_range: tuple[datetime, datetime] | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[tuple[ConversationMessage, float]]:
+        """Semantic search returning each message with its cosine similarity.
+
+        Same arguments as search_conversations(). Scores are the cosine
+        similarities Qdrant returns, clamped to 0.0-1.0.
+
+        Returns:
+            List of (ConversationMessage, score) pairs ranked by similarity.
+        """
+        if query_vector is None:
+            query_vector, _sparse = await self._embedder.embed_text(query)
 
         # Build filter conditions
         must_conditions: list[FieldCondition] = [
@@ -250,17 +374,21 @@ class ConversationStore:
 
         query_filter = Filter(must=must_conditions)
 
-        results = self._client.query_points(
+        results = await self._client.query_points(
             collection_name=self._collection,
-            query=dense_vector,
+            query=query_vector,
             using="dense",
             query_filter=query_filter,
+            search_params=self._search_params,
             limit=top_k,
             with_payload=True,
         )
 
         return [
-            self._payload_to_message(str(p.id), p.payload or {})
+            (
+                self._payload_to_message(str(p.id), p.payload or {}),
+                max(0.0, min(1.0, p.score)),
+            )
             for p in results.points
         ]
 
@@ -279,7 +407,7 @@ class ConversationStore:
         Returns:
             List of ConversationMessage objects ordered by timestamp descending.
         """
-        results = self._client.scroll(
+        results = await self._client.scroll(
             collection_name=self._collection,
             scroll_filter=Filter(
                 must=[
@@ -306,7 +434,7 @@ class ConversationStore:
             Number of messages deleted.
         """
         # First count messages to report how many were deleted
-        points, _ = self._client.scroll(
+        points, _ = await self._client.scroll(
             collection_name=self._collection,
             scroll_filter=Filter(
                 must=[
@@ -323,7 +451,7 @@ class ConversationStore:
         if count > 0:
             from qdrant_client.models import FilterSelector
 
-            self._client.delete(
+            await self._client.delete(
                 collection_name=self._collection,
                 points_selector=FilterSelector(
                     filter=Filter(
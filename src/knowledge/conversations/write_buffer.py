@@ -0,0 +1,328 @@
+"""Write-behind buffer that coalesces conversation messages into bulk writes.
+
+ConversationStore.add_message embeds and upserts one message at a time. At
+peak, thousands of email and chat messages a minute arrive, so the buffer
+collects messages per tenant and hands each batch to a single writer call
+(ConversationStore.add_messages: one embed_batch plus one bulk upsert).
+
+A tenant's batch is flushed when it reaches max_batch_size messages or
+max_delay seconds after its first message arrived, whichever comes first.
+
+Durability: before a message is accepted it is appended (and fsynced) to a
+local JSONL spill segment for its tenant. Each batch owns one segment,
+which is deleted only after the writer succeeds. A failed batch goes back
+into pending (it stays readable through pending()) and is retried with
+exponential backoff. If the process dies, its segments stay on disk and
+recover() replays them on the next start. Replays are idempotent because
+points are keyed by message ID.
+
+Each buffer spills into its own subdirectory of spill_dir and holds an
+exclusive flock on a lock file there for its lifetime, so several worker
+processes can share one spill_dir: recover() only replays directories
+whose lock it can take, i.e. those of processes that are gone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+from urllib.parse import quote
+
+from src.knowledge.models import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+MessageWriter = Callable[[list[ConversationMessage]], Awaitable[list[str]]]
+
+_LOCK_FILE = ".lock"
+
+
+@dataclass
+class _TenantBuffer:
+    """Pending messages for one tenant and the spill segment backing them."""
+
+    segment: Path
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: list[tuple[ConversationMessage, asyncio.Future[str]]] = field(default_factory=list)
+    in_flight: list[list[tuple[ConversationMessage, asyncio.Future[str]]]] = field(
+        default_factory=list
+    )
+    timer: asyncio.Task[None] | None = None
+    failures: int = 0
+
+
+class ConversationWriteBuffer:
+    """Per-tenant write-behind buffer with a durable local spill.
+
+    Args:
+        writer: Coroutine persisting a batch of messages of one tenant and
+            returning their IDs (typically ConversationStore.add_messages).
+        spill_dir: Directory for spill segments (created if missing).
+        max_batch_size: Pending messages per tenant that trigger a flush.
+        max_delay: Seconds after a tenant's first pending message before
+            its batch is flushed regardless of size.
+        fsync: fsync every spill append (disable only where losing the last
+            few messages on power loss is acceptable).
+        retry_delay: Seconds before the first retry of a failed batch;
+            doubled on each further failure.
+        max_retry_delay: Upper bound for the retry backoff.
+    """
+
+    def __init__(
+        self,
+        writer: MessageWriter,
+        spill_dir: str | Path,
+        max_batch_size: int = 64,
+        max_delay: float = 0.2,
+        fsync: bool = True,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ) -> None:
+        self._writer = writer
+        self._spill_dir = Path(spill_dir)
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._fsync = fsync
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._tenants: dict[str, _TenantBuffer] = {}
+        self._flushes: set[asyncio.Task[None]] = set()
+
+        self._owner_dir = self._spill_dir / uuid.uuid4().hex
+        self._owner_dir.mkdir(parents=True)
+        self._lock_file = (self._owner_dir / _LOCK_FILE).open("w")
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    async def submit(self, message: ConversationMessage) -> asyncio.Future[str]:
+        """Spill a message durably and queue it for the next bulk write.
+
+        Returns once the message is on disk. The returned future resolves to
+        the message ID when its batch is stored, or raises the writer's
+        error if the first write attempt fails (the message then stays
+        pending and is retried in the background).
+        """
+        buffer = self._tenants.get(message.tenant_id)
+        if buffer is None:
+            buffer = _TenantBuffer(segment=self._new_segment(message.tenant_id))
+            self._tenants[message.tenant_id] = buffer
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        async with buffer.lock:
+            await asyncio.to_thread(self._append, buffer.segment, message.model_dump_json())
+            buffer.pending.append((message, future))
+
+            if len(buffer.pending) >= self._max_batch_size and not buffer.failures:
+                self._schedule_flush(message.tenant_id)
+            elif buffer.timer is None:
+                buffer.timer = asyncio.create_task(
+                    self._flush_after_delay(message.tenant_id, self._max_delay)
+                )
+        return future
+
+    def pending(self, tenant_id: str, session_id: str | None = None) -> list[ConversationMessage]:
+        """Messages accepted for a tenant (optionally one session) but not yet stored."""
+        buffer = self._tenants.get(tenant_id)
+        if buffer is None:
+            return []
+        return [
+            message
+            for batch in (*buffer.in_flight, buffer.pending)
+            for message, _ in batch
+            if session_id is None or message.session_id == session_id
+        ]
+
+    async def flush(self) -> None:
+        """Write every pending batch now and wait for in-flight writes.
+
+        Call on shutdown, before close(). Failed batches are logged and left
+        spilled.
+        """
+        for tenant_id in list(self._tenants):
+            self._schedule_flush(tenant_id)
+        while self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def close(self) -> None:
+        """Stop pending retries and release this buffer's spill directory.
+
+        Whatever is still spilled is left for recover() in another process.
+        """
+        for buffer in self._tenants.values():
+            if buffer.timer is not None:
+                buffer.timer.cancel()
+                buffer.timer = None
+        if not self._lock_file.closed:
+            self._lock_file.close()
+
+    async def recover(self) -> int:
+        """Replay spill segments left by processes that are gone.
+
+        Call at startup, before submitting new messages. Directories whose
+        lock is still held belong to live workers and are skipped. Each
+        segment is written with one writer call and deleted once stored;
+        segments that fail stay on disk for the next attempt.
+
+        Returns:
+            Number of messages replayed.
+        """
+        replayed = 0
+        for owner_dir in sorted(p for p in self._spill_dir.iterdir() if p.is_dir()):
+            if owner_dir == self._owner_dir:
+                continue
+            lock_file = self._try_lock(owner_dir)
+            if lock_file is None:
+                continue
+            try:
+                replayed += await self._replay_owner(owner_dir)
+            finally:
+                lock_file.close()
+
+        if replayed:
+            logger.info("Recovered %d spilled conversation messages", replayed)
+        return replayed
+
+    async def _replay_owner(self, owner_dir: Path) -> int:
+        """Replay one dead owner's segments; remove the directory once empty."""
+        replayed = 0
+        failed = False
+        for segment in sorted(owner_dir.glob("*.jsonl")):
+            messages = await asyncio.to_thread(self._read_segment, segment)
+            if messages:
+                try:
+                    await self._writer(messages)
+                except Exception:
+                    logger.exception("Failed to replay spilled messages from %s", segment)
+                    failed = True
+                    continue
+                replayed += len(messages)
+            await asyncio.to_thread(segment.unlink, missing_ok=True)
+
+        if not failed:
+            (owner_dir / _LOCK_FILE).unlink(missing_ok=True)
+            try:
+                owner_dir.rmdir()
+            except OSError:
+                logger.warning("Spill directory %s not empty after replay", owner_dir)
+        return replayed
+
+    @staticmethod
+    def _try_lock(owner_dir: Path) -> TextIO | None:
+        """Take a dead owner's lock, or return None while its process holds it."""
+        try:
+            lock_file = (owner_dir / _LOCK_FILE).open("a")
+        except FileNotFoundError:
+            # Another process finished replaying and removed the directory.
+            return None
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def _schedule_flush(self, tenant_id: str) -> None:
+        """Start a background flush of a tenant's pending batch."""
+        task = asyncio.create_task(self._flush_tenant(tenant_id))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush_after_delay(self, tenant_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._tenants[tenant_id].timer = None
+        self._schedule_flush(tenant_id)
+
+    async def _flush_tenant(self, tenant_id: str) -> None:
+        """Detach a tenant's batch onto a fresh segment, write it, then drop its spill."""
+        buffer = self._tenants[tenant_id]
+        async with buffer.lock:
+            if not buffer.pending:
+                return
+            batch, segment = buffer.pending, buffer.segment
+            buffer.pending = []
+            buffer.in_flight.append(batch)
+            buffer.segment = self._new_segment(tenant_id)
+            if buffer.timer is not None and buffer.timer is not asyncio.current_task():
+                buffer.timer.cancel()
+            buffer.timer = None
+
+        try:
+            ids = await self._writer([message for message, _ in batch])
+        except Exception as e:
+            await self._requeue(tenant_id, batch, segment, e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        buffer.in_flight = [b for b in buffer.in_flight if b is not batch]
+        await asyncio.to_thread(segment.unlink, missing_ok=True)
+        buffer.failures = 0
+        for (_, future), message_id in zip(batch, ids, strict=True):
+            if not future.done():
+                future.set_result(message_id)
+        logger.debug("Write-behind flushed %d messages for tenant %s", len(batch), tenant_id)
+
+    async def _requeue(
+        self,
+        tenant_id: str,
+        batch: list[tuple[ConversationMessage, asyncio.Future[str]]],
+        segment: Path,
+        error: Exception,
+    ) -> None:
+        """Put a failed batch back ahead of pending and schedule a retry.
+
+        The batch is re-spilled into the tenant's current segment before its
+        own segment is dropped, so it is on disk throughout.
+        """
+        buffer = self._tenants[tenant_id]
+        async with buffer.lock:
+            lines = [message.model_dump_json() for message, _ in batch]
+            await asyncio.to_thread(self._append, buffer.segment, *lines)
+            await asyncio.to_thread(segment.unlink, missing_ok=True)
+            buffer.in_flight = [b for b in buffer.in_flight if b is not batch]
+            buffer.pending = batch + buffer.pending
+            buffer.failures += 1
+            delay = min(self._retry_delay * 2 ** (buffer.failures - 1), self._max_retry_delay)
+            if buffer.timer is not None:
+                buffer.timer.cancel()
+            buffer.timer = asyncio.create_task(self._flush_after_delay(tenant_id, delay))
+
+        logger.error(
+            "Write-behind flush of %d messages for tenant %s failed (attempt %d), "
+            "retrying in %.1fs: %s",
+            len(batch),
+            tenant_id,
+            buffer.failures,
+            delay,
+            error,
+        )
+
+    def _new_segment(self, tenant_id: str) -> Path:
+        return self._owner_dir / f"{quote(tenant_id, safe='')}.{uuid.uuid4().hex}.jsonl"
+
+    def _append(self, segment: Path, *lines: str) -> None:
+        with segment.open("a", encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in lines)
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _read_segment(segment: Path) -> list[ConversationMessage]:
+        """Parse a spill segment, skipping a torn final line from a crash."""
+        messages: list[ConversationMessage] = []
+        for line in segment.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                messages.append(ConversationMessage.model_validate_json(line))
+            except ValueError:
+                logger.warning("Skipping unreadable spilled message in %s", segment)
+        return messages
@@ -0,0 +1,208 @@
+"""Two-tier cache for dense + sparse embeddings.
+
+Sits in front of EmbeddingService so repeated texts (decomposed sub-queries,
+rewrite-loop retries, recurring task descriptions) skip the OpenAI round trip
+and the BM25 pass entirely.
+
+Tiers:
+- L1: In-process LRU with per-entry TTL and a maximum entry count.
+- L2: Optional shared Redis layer (raw redis.asyncio client) so every worker
+  benefits from embeddings computed by any other worker.
+
+Dense vectors are held as float32 (array("f") in the LRU, base64-encoded
+float32 bytes in Redis) -- the precision OpenAI embeddings carry anyway --
+which is about a tenth of the memory of a list of Python floats.
+
+Keys combine the embedding model, dimensions and a SHA-256 of the normalized
+text, so a model or dimension change can never return stale vectors. Keys
+carry no tenant prefix: the key is a one-way hash and an embedding of
+identical text is identical for every tenant.
+
+Redis errors are logged and treated as misses -- the cache never fails an
+embedding request.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+EmbeddingPair = tuple[list[float], dict]
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+embedding_cache_requests_total = Counter(
+    "embedding_cache_requests_total",
+    "Embedding cache lookups by tier and result",
+    ["tier", "result"],
+)
+
+embedding_cache_entries = Gauge(
+    "embedding_cache_entries",
+    "Entries currently held in the in-process embedding cache",
+)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying (NFC, collapsed whitespace, stripped)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """In-process LRU embedding cache with an optional Redis second tier.
+
+    Args:
+        model: Embedding model name (part of every key).
+        dimensions: Dense embedding dimensionality (part of every key).
+        max_entries: Maximum entries held in the in-process LRU.
+        ttl_seconds: Time-to-live for both tiers.
+        redis_client: Optional raw async Redis client for the shared tier.
+        key_prefix: Namespace prefix for Redis keys.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        dimensions: int,
+        max_entries: int = 2_000,
+        ttl_seconds: int = 86_400,
+        redis_client: Any = None,
+        key_prefix: str = "emb",
+    ) -> None:
+        self._model = model
+        self._dimensions = dimensions
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._redis = redis_client
+        self._prefix = key_prefix
+        self._entries: OrderedDict[str, tuple[float, array, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, text: str) -> str:
+        """Build the cache key for a text under the current model/dimensions."""
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self._prefix}:{self._model}:{self._dimensions}:{digest}"
+
+    async def get_many(self, texts: list[str]) -> list[EmbeddingPair | None]:
+        """Look up embeddings for texts, checking L1 then L2.
+
+        Redis hits are promoted into the in-process LRU.
+
+        Args:
+            texts: Texts to look up.
+
+        Returns:
+            List aligned with texts; None where neither tier has an entry.
+        """
+        keys = [self.key_for(t) for t in texts]
+        results: list[EmbeddingPair | None] = [self._get_local(k) for k in keys]
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        embedding_cache_requests_total.labels(tier="memory", result="hit").inc(
+            len(keys) - len(missing)
+        )
+        embedding_cache_requests_total.labels(tier="memory", result="miss").inc(len(missing))
+
+        if missing and self._redis is not None:
+            remote = await self._get_remote([keys[i] for i in missing])
+            hits = 0
+            for i, value in zip(missing, remote, strict=True):
+                if value is not None:
+                    results[i] = value
+                    self._put_local(keys[i], value)
+                    hits += 1
+            embedding_cache_requests_total.labels(tier="redis", result="hit").inc(hits)
+            embedding_cache_requests_total.labels(tier="redis", result="miss").inc(
+                len(missing) - hits
+            )
+
+        return results
+
+    async def set_many(self, texts: list[str], values: list[EmbeddingPair]) -> None:
+        """Store embeddings in both tiers.
+
+        Args:
+            texts: Source texts.
+            values: (dense, sparse) pairs aligned with texts.
+        """
+        keys = [self.key_for(t) for t in texts]
+        for key, value in zip(keys, values, strict=True):
+            self._put_local(key, value)
+
+        if self._redis is not None and keys:
+            await self._set_remote(keys, values)
+
+    def clear(self) -> None:
+        """Drop every in-process entry (Redis entries expire via TTL)."""
+        self._entries.clear()
+        embedding_cache_entries.set(0)
+
+    # ── L1: in-process LRU ────────────────────────────────────────────────
+
+    def _get_local(self, key: str) -> EmbeddingPair | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, dense, sparse = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            embedding_cache_entries.set(len(self._entries))
+            return None
+        self._entries.move_to_end(key)
+        return dense.tolist(), sparse
+
+    def _put_local(self, key: str, value: EmbeddingPair) -> None:
+        dense, sparse = value
+        self._entries[key] = (time.monotonic() + self._ttl, array("f", dense), sparse)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        embedding_cache_entries.set(len(self._entries))
+
+    # ── L2: Redis ─────────────────────────────────────────────────────────
+
+    async def _get_remote(self, keys: list[str]) -> list[EmbeddingPair | None]:
+        try:
+            raw_values = await self._redis.mget(keys)
+        except Exception:
+            logger.warning("Embedding cache Redis read failed, treating as miss", exc_info=True)
+            return [None] * len(keys)
+
+        values: list[EmbeddingPair | None] = []
+        for raw in raw_values:
+            if raw is None:
+                values.append(None)
+                continue
+            try:
+                data = json.loads(raw)
+                dense = data["dense"]
+                if isinstance(dense, str):
+                    dense = array("f", base64.b64decode(dense)).tolist()
+                values.append((dense, data["sparse"]))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                # ValueError covers bad base64 and byte counts not a multiple of 4
+                values.append(None)
+        return values
+
+    async def _set_remote(self, keys: list[str], values: list[EmbeddingPair]) -> None:
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, (dense, sparse) in zip(keys, values, strict=True):
+                packed = base64.b64encode(array("f", dense).tobytes()).decode("ascii")
+                pipe.set(key, json.dumps({"dense": packed, "sparse": sparse}), ex=self._ttl)
+            await pipe.execute()
+        except Exception:
+            logger.warning("Embedding cache Redis write failed", exc_info=True)
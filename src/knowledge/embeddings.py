@@ -5,21 +5,90 @@ the hybrid search system. Dense vectors capture semantic meaning via OpenAI
 text-embedding-3-small, while sparse BM25 vectors capture exact keyword
 matches via fastembed.
 
-Rate limit handling uses exponential backoff on OpenAI API calls.
+Rate limit handling uses exponential backoff on OpenAI API calls. Results
+are memoized by EmbeddingCache (in-process LRU, optionally backed by Redis)
+so repeated texts skip both the OpenAI call and the BM25 pass. Texts that
+concurrent callers are already embedding are not sent again: the callers
+share the in-flight request (SingleFlight).
+
+BM25 encoding is CPU-bound and synchronous, so it never runs on the event
+loop. It runs in a dedicated single-thread executor by default, or in a
+process pool (sparse_executor="process") so large ingestion batches, split
+into sparse_batch_size slices, encode in parallel across cores. The dense
+OpenAI request and the sparse encoding of a batch run concurrently.
+warm_up() loads the BM25 model ahead of the first request.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 from openai import AsyncOpenAI, RateLimitError
+from prometheus_client import Counter, Histogram
 
 from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.embedding_cache import EmbeddingCache
+from src.knowledge.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+embedding_sparse_encode_seconds = Histogram(
+    "embedding_sparse_encode_seconds",
+    "Wall time to BM25-encode one batch of texts (all slices)",
+    ["executor"],
+)
+
+embedding_sparse_texts_total = Counter(
+    "embedding_sparse_texts_total",
+    "Texts BM25-encoded",
+    ["executor"],
+)
+
+embedding_coalesced_texts_total = Counter(
+    "embedding_coalesced_texts_total",
+    "Texts served by joining another caller's in-flight embedding request",
+)
+
+
+# ── BM25 worker (process pool) ──────────────────────────────────────────────
+
+_worker_bm25_model: Any = None
+
+
+def _load_bm25_model() -> Any:
+    """Load the fastembed BM25 model (heavy import, downloads on first use)."""
+    from fastembed import SparseTextEmbedding
+
+    return SparseTextEmbedding(model_name="Qdrant/bm25")
+
+
+def _to_sparse_dicts(results: Any) -> list[dict]:
+    """Convert fastembed SparseEmbedding results to Qdrant-style dicts."""
+    return [
+        {"indices": result.indices.tolist(), "values": result.values.tolist()}
+        for result in results
+    ]
+
+
+def _init_sparse_worker() -> None:
+    """Process pool initializer: load the BM25 model once per worker."""
+    global _worker_bm25_model
+    if _worker_bm25_model is None:
+        _worker_bm25_model = _load_bm25_model()
+
+
+def _sparse_worker_encode(texts: list[str]) -> list[dict]:
+    """BM25-encode texts inside a process pool worker."""
+    _init_sparse_worker()
+    return _to_sparse_dicts(_worker_bm25_model.embed(texts))
+
 
 class EmbeddingService:
     """Generates dense and sparse embeddings for knowledge base operations.
@@ -30,29 +99,95 @@ class EmbeddingService:
 
     Args:
         config: Knowledge base configuration with API keys and model settings.
+        redis_client: Optional raw async Redis client used as the shared
+            second cache tier. Ignored when caching is disabled.
+
+    Call close() on shutdown to stop the sparse encoding executor.
     """
 
-    def __init__(self, config: KnowledgeBaseConfig) -> None:
+    def __init__(self, config: KnowledgeBaseConfig, redis_client: Any = None) -> None:
         self._config = config
         self._openai = AsyncOpenAI(api_key=config.openai_api_key)
         self._model = config.embedding_model
         self._dimensions = config.embedding_dimensions
 
-        # Lazy-initialize BM25 model on first use (heavy import)
+        self._cache: EmbeddingCache | None = None
+        if config.embedding_cache_enabled:
+            self._cache = EmbeddingCache(
+                model=self._model,
+                dimensions=self._dimensions,
+                max_entries=config.embedding_cache_max_entries,
+                ttl_seconds=config.embedding_cache_ttl_seconds,
+                redis_client=redis_client,
+            )
+
+        # Texts being embedded right now, keyed like the cache
+        self._inflight: SingleFlight[str, tuple[list[float], dict]] = SingleFlight()
+
+        # BM25 model is loaded on first use (heavy import) or by warm_up()
         self._bm25_model: Any = None
 
+        # Sparse encoding executor: BM25 never runs on the event loop
+        self._sparse_mode = config.sparse_executor
+        self._sparse_batch_size = max(1, config.sparse_batch_size)
+        self._sparse_executor: Executor
+        if self._sparse_mode == "process":
+            workers = config.sparse_max_workers or os.cpu_count() or 1
+            self._sparse_workers = workers
+            self._sparse_executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_sparse_worker
+            )
+        else:
+            # One thread: BM25 tokenization holds the GIL, so more threads
+            # would not add throughput, only contention.
+            self._sparse_workers = 1
+            self._sparse_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bm25"
+            )
+
     def _get_bm25_model(self) -> Any:
-        """Lazy-load the fastembed BM25 model.
+        """Lazy-load the fastembed BM25 model (thread executor mode).
 
         Returns:
             Initialized BM25 sparse embedding model.
         """
         if self._bm25_model is None:
-            from fastembed import SparseTextEmbedding
-
-            self._bm25_model = SparseTextEmbedding(model_name="Qdrant/bm25")
+            self._bm25_model = _load_bm25_model()
         return self._bm25_model
 
+    async def warm_up(self) -> None:
+        """Load the BM25 model before the first request.
+
+        In thread mode the model is loaded on the executor thread; in
+        process mode every worker process is started and loads its copy.
+        """
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        if self._sparse_mode == "process":
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._sparse_executor, _sparse_worker_encode, ["warm up"])
+                    for _ in range(self._sparse_workers)
+                )
+            )
+        else:
+            await loop.run_in_executor(self._sparse_executor, self._get_bm25_model)
+        logger.info(
+            "BM25 model warmed up in %.2fs (%s executor, %d worker(s))",
+            time.perf_counter() - start,
+            self._sparse_mode,
+            self._sparse_workers,
+        )
+
+    async def close(self) -> None:
+        """Shut down the sparse encoding executor."""
+        self._sparse_executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """The embedding cache, or None if caching is disabled."""
+        return self._cache
+
     async def embed_text(self, text: str) -> tuple[list[float], dict]:
         """Generate dense and sparse embeddings for a single text.
 
@@ -63,26 +198,102 @@ class EmbeddingService:
             Tuple of (dense_vector, sparse_vector) where sparse_vector has
             format {"indices": [...], "values": [...]}.
         """
-        dense = await self._embed_dense([text])
-        sparse = self._embed_sparse([text])
-        return dense[0], sparse[0]
+        results = await self.embed_batch([text])
+        return results[0]
 
-    async def embed_batch(self, texts: list[str]) -> list[tuple[list[float], dict]]:
+    async def embed_batch(
+        self, texts: list[str], populate_cache: bool = True
+    ) -> list[tuple[list[float], dict]]:
         """Generate dense and sparse embeddings for a batch of texts.
 
         More efficient than calling embed_text() in a loop because the
-        OpenAI API supports batch embedding in a single request.
+        OpenAI API supports batch embedding in a single request. Cached
+        texts are served from the cache; only the distinct misses are sent
+        to OpenAI and BM25, minus those another caller is already
+        embedding, whose results are shared.
 
         Args:
             texts: List of input texts to embed.
+            populate_cache: Store newly embedded texts in the cache. Bulk
+                write paths (ingestion, reindexing, conversation storage)
+                pass False: their texts are rarely embedded twice and
+                would only evict hot query embeddings.
 
         Returns:
             List of (dense_vector, sparse_vector) tuples, one per input text.
         """
-        dense_vectors = await self._embed_dense(texts)
-        sparse_vectors = self._embed_sparse(texts)
+        if not texts:
+            return []
+
+        cache = self._cache
+        results: list[tuple[list[float], dict] | None]
+        results = await cache.get_many(texts) if cache is not None else [None] * len(texts)
+
+        # Group misses by cache key so duplicate texts are embedded once
+        pending: dict[str, list[int]] = {}
+        for i, cached in enumerate(results):
+            if cached is None:
+                key = cache.key_for(texts[i]) if cache is not None else texts[i]
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            text_for = {key: texts[indices[0]] for key, indices in pending.items()}
+
+            async def embed_missing(keys: list[str]) -> list[tuple[list[float], dict]]:
+                unique_texts = [text_for[key] for key in keys]
+                embedded = await self._embed_uncached(unique_texts)
+                if cache is not None and populate_cache:
+                    await cache.set_many(unique_texts, embedded)
+                return embedded
+
+            embedded, coalesced = await self._inflight.do_many(list(pending), embed_missing)
+            if coalesced:
+                embedding_coalesced_texts_total.inc(coalesced)
+            for indices, pair in zip(pending.values(), embedded, strict=True):
+                for i in indices:
+                    results[i] = pair
+
+        return results  # type: ignore[return-value]
+
+    async def _embed_uncached(self, texts: list[str]) -> list[tuple[list[float], dict]]:
+        """Embed texts with OpenAI (dense) and BM25 (sparse), bypassing the cache.
+
+        The OpenAI request and the off-loop BM25 encoding run concurrently.
+        """
+        dense_vectors, sparse_vectors = await asyncio.gather(
+            self._embed_dense(texts),
+            self._encode_sparse(texts),
+        )
         return list(zip(dense_vectors, sparse_vectors, strict=True))
 
+    async def _encode_sparse(self, texts: list[str]) -> list[dict]:
+        """BM25-encode texts on the sparse executor, never on the event loop.
+
+        Texts are split into sparse_batch_size slices submitted together, so
+        a process pool encodes a large batch across all cores. Results keep
+        input order.
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        slices = [
+            texts[i : i + self._sparse_batch_size]
+            for i in range(0, len(texts), self._sparse_batch_size)
+        ]
+        encode = _sparse_worker_encode if self._sparse_mode == "process" else self._embed_sparse
+
+        start = time.perf_counter()
+        encoded = await asyncio.gather(
+            *(loop.run_in_executor(self._sparse_executor, encode, batch) for batch in slices)
+        )
+        embedding_sparse_encode_seconds.labels(executor=self._sparse_mode).observe(
+            time.perf_counter() - start
+        )
+        embedding_sparse_texts_total.labels(executor=self._sparse_mode).inc(len(texts))
+
+        return [vector for batch in encoded for vector in batch]
+
     async def _embed_dense(
         self, texts: list[str], max_retries: int = 3
     ) -> list[list[float]]:
@@ -122,7 +333,10 @@ class EmbeddingService:
         raise RuntimeError("Exhausted retries for dense embedding")  # pragma: no cover
 
     def _embed_sparse(self, texts: list[str]) -> list[dict]:
-        """Generate sparse BM25 embeddings via fastembed.
+        """Generate sparse BM25 embeddings via fastembed (blocking).
+
+        Runs on the sparse thread executor via _encode_sparse; do not call
+        from the event loop.
 
         Args:
             texts: Input texts to embed.
@@ -131,14 +345,4 @@ class EmbeddingService:
             List of sparse vectors in {"indices": [...], "values": [...]} format
             matching Qdrant SparseVector expectations.
         """
-        model = self._get_bm25_model()
-        results = list(model.embed(texts))
-        sparse_vectors: list[dict] = []
-        for result in results:
-            sparse_vectors.append(
-                {
-                    "indices": result.indices.tolist(),
-                    "values": result.values.tolist(),
-                }
-            )
-        return sparse_vectors
+        return _to_sparse_dicts(self._get_bm25_model().embed(texts))
@@ -9,20 +9,28 @@ The pipeline flow is:
     -> MetadataExtractor.enrich_chunks() -> EmbeddingService.embed_batch()
     -> QdrantKnowledgeStore.upsert_chunks()
 
-This produces embedded KnowledgeChunk objects stored in Qdrant.
+This produces embedded KnowledgeChunk objects stored in Qdrant. Documents
+are streamed through it in bounded batches (DocumentLoader.iter_sections()
+-> KnowledgeChunker.iter_chunk_batches()).
 """
 
 from src.knowledge.ingestion.chunker import KnowledgeChunker
-from src.knowledge.ingestion.loaders import DocumentLoader, RawSection, load_document
+from src.knowledge.ingestion.loaders import DocumentLoader, RawSection, iter_document, load_document
 from src.knowledge.ingestion.metadata_extractor import MetadataExtractor
-from src.knowledge.ingestion.pipeline import IngestionPipeline, IngestionResult
+from src.knowledge.ingestion.pipeline import (
+    DirectoryIngestionReport,
+    IngestionPipeline,
+    IngestionResult,
+)
 
 __all__ = [
+    "DirectoryIngestionReport",
     "DocumentLoader",
     "IngestionPipeline",
     "IngestionResult",
     "KnowledgeChunker",
     "MetadataExtractor",
     "RawSection",
+    "iter_document",
     "load_document",
 ]
@@ -5,7 +5,9 @@ that fit within the chunk size are kept intact, while larger sections are
 split using RecursiveCharacterTextSplitter with proper overlap.
 
 Each chunk produces a KnowledgeChunk object ready for metadata enrichment
-and vector storage.
+and vector storage. iter_chunks() / iter_chunk_batches() consume sections
+as a stream (e.g. from DocumentLoader.iter_sections()) so large documents
+never have to be held in memory as a whole.
 """
 
 from __future__ import annotations
@@ -13,13 +15,14 @@ from __future__ import annotations
 import logging
 import re
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 
-import tiktoken
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from src.knowledge.ingestion.loaders import RawSection
 from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+from src.knowledge.tokenizer import get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +38,8 @@ DEFAULT_PRODUCT_NAMES: list[str] = [
 
 
 def _count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
-    """Count tokens in text using tiktoken encoding."""
-    enc = tiktoken.get_encoding(encoding_name)
-    return len(enc.encode(text))
+    """Count tokens in text with the shared (cached) token counter."""
+    return get_token_counter(encoding_name).count(text)
 
 
 def _estimate_chars_per_token(encoding_name: str = "cl100k_base") -> float:
@@ -64,6 +66,10 @@ class KnowledgeChunker:
     Usage:
         chunker = KnowledgeChunker(chunk_size=512, overlap_pct=0.15)
         chunks = chunker.chunk_sections(sections, "tenant-1", "product-doc.md")
+
+        # Streaming: bounded batches from a lazily loaded document
+        for batch in chunker.iter_chunk_batches(loader.iter_sections(path), "tenant-1", str(path)):
+            ...
     """
 
     def __init__(
@@ -110,10 +116,6 @@ class KnowledgeChunker:
         Returns:
             List of KnowledgeChunk objects with partial metadata.
         """
-        chunks: list[KnowledgeChunk] = []
-        chunk_index = 0
-        now = datetime.now(timezone.utc)
-
         # Extract frontmatter from first section if available
         frontmatter = None
         for section in sections:
@@ -121,16 +123,63 @@ class KnowledgeChunker:
                 frontmatter = section.frontmatter
                 break
 
-        # Infer product_category from frontmatter or document source
-        product_category = self._infer_product_category(frontmatter, document_source)
+        chunks = list(self.iter_chunks(sections, tenant_id, document_source, frontmatter=frontmatter))
+
+        logger.info(
+            "Chunked %d sections into %d chunks for %s (tenant: %s)",
+            len(sections),
+            len(chunks),
+            document_source,
+            tenant_id,
+        )
+        return chunks
+
+    def iter_chunks(
+        self,
+        sections: Iterable[RawSection],
+        tenant_id: str,
+        document_source: str,
+        frontmatter: dict | None = None,
+    ) -> Iterator[KnowledgeChunk]:
+        """Lazily split a stream of sections into chunks.
+
+        Same strategy as chunk_sections, but sections are consumed one at a
+        time and chunks are yielded as soon as they are produced. Because
+        the stream cannot be scanned ahead, product_category is inferred
+        from the given frontmatter or, if None, from the first section's
+        (markdown loaders attach the document frontmatter to every section).
+
+        Args:
+            sections: Raw sections, typically DocumentLoader.iter_sections().
+            tenant_id: Tenant identifier for chunk ownership.
+            document_source: Original document path/name.
+            frontmatter: Document frontmatter, if already known.
+
+        Yields:
+            KnowledgeChunk objects with partial metadata, in document order.
+        """
+        chunk_index = 0
+        now = datetime.now(timezone.utc)
+        product_category: str | None = None
 
         for section in sections:
-            section_tokens = _count_tokens(section.content)
+            if product_category is None:
+                # Infer product_category from frontmatter or document source
+                product_category = self._infer_product_category(
+                    frontmatter if frontmatter is not None else section.frontmatter,
+                    document_source,
+                )
 
-            if section_tokens <= self.chunk_size:
+            if _count_tokens(section.content) <= self.chunk_size:
                 # Section fits in one chunk -- keep intact
-                chunk = self._create_chunk(
-                    content=section.content,
+                sub_texts = [section.content]
+            else:
+                # Section too large -- split it
+                sub_texts = self._splitter.split_text(section.content)
+
+            for sub_text in sub_texts:
+                yield self._create_chunk(
+                    content=sub_text,
                     tenant_id=tenant_id,
                     document_source=document_source,
                     section=section,
@@ -138,32 +187,39 @@ class KnowledgeChunker:
                     chunk_index=chunk_index,
                     now=now,
                 )
-                chunks.append(chunk)
                 chunk_index += 1
-            else:
-                # Section too large -- split it
-                sub_texts = self._splitter.split_text(section.content)
-                for sub_text in sub_texts:
-                    chunk = self._create_chunk(
-                        content=sub_text,
-                        tenant_id=tenant_id,
-                        document_source=document_source,
-                        section=section,
-                        product_category=product_category,
-                        chunk_index=chunk_index,
-                        now=now,
-                    )
-                    chunks.append(chunk)
-                    chunk_index += 1
 
-        logger.info(
-            "Chunked %d sections into %d chunks for %s (tenant: %s)",
-            len(sections),
-            len(chunks),
-            document_source,
-            tenant_id,
-        )
-        return chunks
+    def iter_chunk_batches(
+        self,
+        sections: Iterable[RawSection],
+        tenant_id: str,
+        document_source: str,
+        batch_size: int = 256,
+        frontmatter: dict | None = None,
+    ) -> Iterator[list[KnowledgeChunk]]:
+        """Lazily chunk a stream of sections into lists of at most batch_size.
+
+        Peak memory is bounded by one batch of chunks plus the section being
+        split, independent of document size.
+
+        Args:
+            sections: Raw sections, typically DocumentLoader.iter_sections().
+            tenant_id: Tenant identifier for chunk ownership.
+            document_source: Original document path/name.
+            batch_size: Maximum chunks per yielded batch.
+            frontmatter: Document frontmatter, if already known.
+
+        Yields:
+            Non-empty lists of KnowledgeChunk objects, in document order.
+        """
+        batch: list[KnowledgeChunk] = []
+        for chunk in self.iter_chunks(sections, tenant_id, document_source, frontmatter=frontmatter):
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
     def _create_chunk(
         self,
@@ -5,17 +5,24 @@ parsers based on file extension. Each loader produces RawSection objects
 preserving document structure (headers, hierarchy, page numbers).
 
 Supported formats: Markdown, PDF, Word (docx), JSON, CSV, plain text.
+
+DocumentLoader.iter_sections() yields sections incrementally instead of
+building the full list. CSV files are read row by row from disk and PDFs
+are partitioned a window of pages at a time, so memory stays bounded by the
+consumer's batch size rather than the file size.
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import json
 import logging
 import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import chardet
 import yaml
@@ -23,6 +30,12 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Bytes sampled from the start of a streamed file for encoding detection
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Pages handed to the PDF partitioner per call when streaming
+PDF_PAGES_PER_BATCH = 20
+
 # ── Raw Section Model ──────────────────────────────────────────────────────
 
 
@@ -68,6 +81,28 @@ def _decode_content(raw_bytes: bytes) -> str:
         return raw_bytes.decode(encoding, errors="replace")
 
 
+def _open_text(file_path: Path) -> IO[str]:
+    """Open a text file for streaming with encoding detection.
+
+    Only the first ENCODING_SAMPLE_BYTES are inspected: UTF-8 if the sample
+    decodes cleanly (a multi-byte character cut at the sample boundary is
+    allowed), otherwise the chardet guess. Undecodable bytes later in the
+    file are replaced rather than aborting the stream.
+    """
+    with file_path.open("rb") as f:
+        sample = f.read(ENCODING_SAMPLE_BYTES)
+
+    encoding = "utf-8"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        detected = chardet.detect(sample)
+        encoding = detected.get("encoding", "utf-8") or "utf-8"
+        logger.info("Detected encoding: %s (confidence: %s)", encoding, detected.get("confidence"))
+
+    return file_path.open("r", encoding=encoding, errors="replace", newline="")
+
+
 def _parse_frontmatter(text: str) -> tuple[dict[str, Any] | None, str]:
     """Extract YAML frontmatter from text.
 
@@ -248,30 +283,24 @@ def _load_json(file_path: Path, content: str) -> list[RawSection]:
     return sections
 
 
-def _load_csv(file_path: Path, content: str) -> list[RawSection]:
-    """Load CSV file, each row becomes a section with column headers as context."""
+def _iter_csv(file_path: Path) -> Iterator[RawSection]:
+    """Stream a CSV file from disk, each row becomes a section with column headers as context."""
     source = str(file_path)
-    sections: list[RawSection] = []
-
-    reader = csv.DictReader(io.StringIO(content))
-    for i, row in enumerate(reader):
-        # Format each row as key: value pairs
-        lines = [f"{col}: {val}" for col, val in row.items() if val]
-        section_content = "\n".join(lines)
-        # Try to use first column value as title
-        first_val = next(iter(row.values()), None) if row else None
-        title = str(first_val) if first_val else f"Row {i + 1}"
-
-        sections.append(
-            RawSection(
+    with _open_text(file_path) as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            # Format each row as key: value pairs
+            lines = [f"{col}: {val}" for col, val in row.items() if val]
+            section_content = "\n".join(lines)
+            # Try to use first column value as title
+            first_val = next(iter(row.values()), None) if row else None
+            title = str(first_val) if first_val else f"Row {i + 1}"
+
+            yield RawSection(
                 content=section_content,
                 source=source,
                 section_title=title,
                 hierarchy=[title],
             )
-        )
-
-    return sections
 
 
 def _load_text(file_path: Path, content: str) -> list[RawSection]:
@@ -286,71 +315,79 @@ def _load_text(file_path: Path, content: str) -> list[RawSection]:
     ]
 
 
-def _load_pdf(file_path: Path) -> list[RawSection]:
-    """Load PDF using unstructured library.
+def _iter_pdf(file_path: Path, pages_per_batch: int = PDF_PAGES_PER_BATCH) -> Iterator[RawSection]:
+    """Stream a PDF, partitioning pages_per_batch pages at a time.
 
-    Falls back to a simple error if unstructured is not installed.
+    Each window of pages is copied into an in-memory PDF with pypdf (an
+    unstructured[pdf] dependency) and partitioned on its own, so only one
+    window's elements are alive at once. Without pypdf the whole file is
+    partitioned in one call and its elements are yielded one by one.
     """
-    source = str(file_path)
     try:
         from unstructured.partition.pdf import partition_pdf
-
-        elements = partition_pdf(str(file_path))
-        sections: list[RawSection] = []
-        current_page = 1
-
-        for element in elements:
-            page = getattr(element.metadata, "page_number", current_page) or current_page
-            current_page = page
-            sections.append(
-                RawSection(
-                    content=str(element),
-                    source=source,
-                    section_title=getattr(element.metadata, "section", None),
-                    hierarchy=[],
-                    page_number=page,
-                )
-            )
-
-        return sections
     except ImportError:
         raise ImportError(
             "PDF loading requires the 'unstructured' library. "
             "Install with: pip install 'unstructured[all-docs]'"
         )
 
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        yield from _iter_elements(file_path, partition_pdf(str(file_path)), first_page=1)
+        return
+
+    reader = PdfReader(str(file_path))
+    total_pages = len(reader.pages)
+    for start in range(0, total_pages, pages_per_batch):
+        writer = PdfWriter()
+        for page in reader.pages[start : start + pages_per_batch]:
+            writer.add_page(page)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        buffer.seek(0)
+
+        elements = partition_pdf(file=buffer, starting_page_number=start + 1)
+        yield from _iter_elements(file_path, elements, first_page=start + 1)
 
-def _load_docx(file_path: Path) -> list[RawSection]:
-    """Load Word document using unstructured library.
 
-    Falls back to a simple error if unstructured is not installed.
+def _iter_elements(file_path: Path, elements: list[Any], first_page: int | None) -> Iterator[RawSection]:
+    """Convert unstructured elements into sections, tracking page numbers.
+
+    With first_page set, elements lacking a page number inherit the last
+    seen page; with None, missing page numbers stay None.
     """
     source = str(file_path)
-    try:
-        from unstructured.partition.docx import partition_docx
+    current_page = first_page
+    for element in elements:
+        page = getattr(element.metadata, "page_number", current_page) or current_page
+        current_page = page
+        yield RawSection(
+            content=str(element),
+            source=source,
+            section_title=getattr(element.metadata, "section", None),
+            hierarchy=[],
+            page_number=page,
+        )
 
-        elements = partition_docx(str(file_path))
-        sections: list[RawSection] = []
 
-        for element in elements:
-            page = getattr(element.metadata, "page_number", None)
-            sections.append(
-                RawSection(
-                    content=str(element),
-                    source=source,
-                    section_title=getattr(element.metadata, "section", None),
-                    hierarchy=[],
-                    page_number=page,
-                )
-            )
+def _iter_docx(file_path: Path) -> Iterator[RawSection]:
+    """Stream a Word document's elements as sections.
 
-        return sections
+    A .docx is a zipped XML package that unstructured parses in one pass,
+    so the element list is still built up front; sections are yielded
+    lazily from it instead of being materialized as a second list.
+    """
+    try:
+        from unstructured.partition.docx import partition_docx
     except ImportError:
         raise ImportError(
             "Word document loading requires the 'unstructured' library. "
             "Install with: pip install 'unstructured[all-docs]'"
         )
 
+    yield from _iter_elements(file_path, partition_docx(str(file_path)), first_page=None)
+
 
 # ── Supported Format Registry ─────────────────────────────────────────────
 
@@ -375,6 +412,10 @@ class DocumentLoader:
         loader = DocumentLoader()
         sections = loader.load("path/to/document.md")
 
+        # Large files: consume sections as they are parsed
+        for section in loader.iter_sections("path/to/price-book.csv"):
+            ...
+
     Supported formats: .md, .markdown, .pdf, .docx, .json, .csv, .txt
     """
 
@@ -393,6 +434,31 @@ class DocumentLoader:
             ValueError: If file format is not supported.
             ImportError: If required library for format is not installed.
         """
+        return list(self.iter_sections(file_path, content_type))
+
+    def iter_sections(self, file_path: str | Path, content_type: str | None = None) -> Iterator[RawSection]:
+        """Load a document lazily, yielding sections as they are parsed.
+
+        CSV and PDF are streamed from disk; Word is yielded lazily from the
+        partitioned elements. Markdown, JSON and text are small structured
+        formats that are parsed whole and then yielded.
+
+        The path and format are validated eagerly, so FileNotFoundError and
+        ValueError are raised by this call rather than on first iteration.
+
+        Args:
+            file_path: Path to the document file.
+            content_type: Optional format hint (overrides extension detection).
+
+        Returns:
+            Iterator of RawSection objects in document order.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file format is not supported.
+            ImportError: On first iteration, if the library required for the
+                format is not installed.
+        """
         path = Path(file_path)
 
         if not path.exists():
@@ -412,25 +478,29 @@ class DocumentLoader:
                 )
 
         # Dispatch to format-specific loader
-        if fmt in ("pdf",):
-            return _load_pdf(path)
-        elif fmt in ("word",):
-            return _load_docx(path)
+        if fmt == "pdf":
+            return _iter_pdf(path)
+        elif fmt == "word":
+            return _iter_docx(path)
+        elif fmt == "csv":
+            return _iter_csv(path)
+        elif fmt in ("markdown", "json", "text"):
+            return self._iter_whole_file(path, fmt)
+        else:
+            raise ValueError(f"Unknown content type: {fmt}")
+
+    @staticmethod
+    def _iter_whole_file(path: Path, fmt: str) -> Iterator[RawSection]:
+        """Read and decode a text-based file in full, then yield its sections."""
+        raw_bytes = _read_file_bytes(path)
+        content = _decode_content(raw_bytes)
+
+        if fmt == "markdown":
+            yield from _load_markdown(path, content)
+        elif fmt == "json":
+            yield from _load_json(path, content)
         else:
-            # Text-based formats: read and decode
-            raw_bytes = _read_file_bytes(path)
-            content = _decode_content(raw_bytes)
-
-            if fmt == "markdown":
-                return _load_markdown(path, content)
-            elif fmt == "json":
-                return _load_json(path, content)
-            elif fmt == "csv":
-                return _load_csv(path, content)
-            elif fmt == "text":
-                return _load_text(path, content)
-            else:
-                raise ValueError(f"Unknown content type: {fmt}")
+            yield from _load_text(path, content)
 
 
 def load_document(file_path: str | Path, content_type: str | None = None) -> list[RawSection]:
@@ -447,3 +517,19 @@ def load_document(file_path: str | Path, content_type: str | None = None) -> lis
     """
     loader = DocumentLoader()
     return loader.load(file_path, content_type)
+
+
+def iter_document(file_path: str | Path, content_type: str | None = None) -> Iterator[RawSection]:
+    """Convenience function to stream a document's sections.
+
+    Delegates to DocumentLoader().iter_sections().
+
+    Args:
+        file_path: Path to the document file.
+        content_type: Optional format hint.
+
+    Returns:
+        Iterator of RawSection objects.
+    """
+    loader = DocumentLoader()
+    return loader.iter_sections(file_path, content_type)
@@ -8,11 +8,33 @@ Orchestrates the complete document ingestion flow:
 
 Supports single document, directory, and document update (versioning) operations.
 All operations are tenant-scoped.
+
+Documents are streamed: DocumentLoader.iter_sections() feeds
+KnowledgeChunker.iter_chunk_batches(), and each batch of at most
+stream_batch_size chunks is enriched, embedded and stored before the next
+one is loaded, so memory is bounded by the batch size rather than the size
+of the file (a 50k-row CSV price book or a several-hundred-page PDF).
+
+Bulk loads use ingest_directory_pipelined, which overlaps three stages
+connected by bounded queues (a full queue blocks the stage upstream of it):
+
+    load workers (load/chunk/enrich in threads) -> embed packer (chunks from
+    many documents packed into provider-maximal embed_batch calls)
+    -> upserter (large multi-document upsert_chunks batches)
+
+Document updates are incremental: every stored chunk carries a content_hash
+payload field, so update_document only embeds chunks whose text is new or
+changed. Unchanged chunks keep their point IDs and vectors and are
+version-bumped in place; chunks no longer present are marked not current.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -21,13 +43,21 @@ from pydantic import BaseModel, Field
 
 from src.knowledge.embeddings import EmbeddingService
 from src.knowledge.ingestion.chunker import KnowledgeChunker
-from src.knowledge.ingestion.loaders import DocumentLoader, SUPPORTED_EXTENSIONS
+from src.knowledge.ingestion.loaders import DocumentLoader, RawSection, SUPPORTED_EXTENSIONS
 from src.knowledge.ingestion.metadata_extractor import MetadataExtractor
-from src.knowledge.models import KnowledgeChunk
+from src.knowledge.models import KnowledgeChunk, chunk_content_hash
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
+from src.knowledge.tokenizer import get_token_counter
 
 logger = logging.getLogger(__name__)
 
+# OpenAI embeddings API request limits (inputs per request, tokens per request)
+EMBED_BATCH_MAX_TEXTS = 2048
+EMBED_BATCH_MAX_TOKENS = 300_000
+
+# Chunks loaded, enriched, embedded and stored per step when streaming a document
+STREAM_BATCH_SIZE = 256
+
 
 # ── Result Model ──────────────────────────────────────────────────────────
 
@@ -36,18 +66,56 @@ class IngestionResult(BaseModel):
     """Result of a single document ingestion operation.
 
     Attributes:
-        chunks_created: Number of chunks successfully stored.
+        chunks_created: Number of new or changed chunks embedded and stored.
+        chunks_reused: Number of unchanged chunks whose stored vectors were
+            reused (updates only).
+        chunks_removed: Number of previously current chunks no longer in the
+            document, now marked is_current=False (updates only).
         document_source: Original document path or identifier.
         version: The version number assigned to these chunks.
         errors: List of error messages encountered during ingestion.
     """
 
     chunks_created: int = 0
+    chunks_reused: int = 0
+    chunks_removed: int = 0
     document_source: str = ""
     version: int = 1
     errors: list[str] = Field(default_factory=list)
 
 
+class DirectoryIngestionReport(BaseModel):
+    """Result of a pipelined directory ingestion.
+
+    Attributes:
+        results: One IngestionResult per file, in sorted file order.
+        chunks_created: Total chunks embedded and stored.
+        embed_batches: Number of embed_batch calls made.
+        upsert_batches: Number of upsert_chunks calls made.
+        elapsed_seconds: Wall time for the whole run.
+        chunks_per_second: Throughput (chunks_created / elapsed_seconds).
+    """
+
+    results: list[IngestionResult] = Field(default_factory=list)
+    chunks_created: int = 0
+    embed_batches: int = 0
+    upsert_batches: int = 0
+    elapsed_seconds: float = 0.0
+    chunks_per_second: float = 0.0
+
+
+@dataclass
+class _PendingChunk:
+    """A chunk in flight through the pipelined stages, tagged with its file."""
+
+    chunk: KnowledgeChunk
+    tokens: int
+    result: IngestionResult
+
+
+_STAGE_DONE = None  # Queue sentinel: upstream stage finished
+
+
 # ── Ingestion Pipeline ────────────────────────────────────────────────────
 
 
@@ -83,21 +151,27 @@ class IngestionPipeline:
         file_path: str | Path,
         tenant_id: str,
         metadata_overrides: dict[str, Any] | None = None,
+        stream_batch_size: int = STREAM_BATCH_SIZE,
     ) -> IngestionResult:
         """Ingest a single document through the full pipeline.
 
-        Steps:
-        1. Load document via DocumentLoader
-        2. Chunk sections via KnowledgeChunker
+        Steps, repeated per batch of at most stream_batch_size chunks:
+        1. Load document sections lazily via DocumentLoader.iter_sections
+        2. Chunk sections via KnowledgeChunker.iter_chunk_batches
         3. Enrich metadata via MetadataExtractor + apply overrides
         4. Generate embeddings via EmbeddingService
         5. Store in Qdrant via QdrantKnowledgeStore
 
+        Loading and chunking run in a worker thread. Documents smaller than
+        one batch are embedded and stored in a single call each. If a later
+        batch fails, the chunks already stored are kept and counted.
+
         Args:
             file_path: Path to the document file.
             tenant_id: Tenant to ingest for.
             metadata_overrides: Optional dict to force metadata field values
                 on all chunks (e.g., {"product_category": "billing"}).
+            stream_batch_size: Maximum chunks held in memory at once.
 
         Returns:
             IngestionResult with chunk count and any errors.
@@ -106,59 +180,107 @@ class IngestionPipeline:
         result = IngestionResult(document_source=str(path))
 
         try:
-            # 1. Load document into raw sections
-            sections = self._loader.load(path)
-            if not sections:
-                result.errors.append(f"No sections extracted from {path}")
-                return result
-
-            # Extract frontmatter from first section if available
-            frontmatter = None
-            for section in sections:
-                if section.frontmatter:
-                    frontmatter = section.frontmatter
-                    break
+            batches = self._iter_chunk_batches(
+                path, tenant_id, metadata_overrides, result, stream_batch_size
+            )
+            # 1-3. Load, chunk, enrich (one batch at a time, off the event loop)
+            while (chunks := await asyncio.to_thread(next, batches, None)) is not None:
+                # 4. Generate embeddings
+                await self._embed_chunks(chunks)
+
+                # 5. Store in Qdrant
+                await self._store.upsert_chunks(chunks, tenant_id)
+
+                result.chunks_created += len(chunks)
+
+            if result.chunks_created:
+                logger.info(
+                    "Ingested %s: %d chunks for tenant %s",
+                    path.name,
+                    result.chunks_created,
+                    tenant_id,
+                )
 
-            # 2. Chunk sections into KnowledgeChunks
-            chunks = self._chunker.chunk_sections(
-                sections=sections,
-                tenant_id=tenant_id,
-                document_source=str(path),
+        except Exception as e:
+            logger.error("Failed to ingest %s: %s", path, e)
+            result.errors.append(str(e))
+
+        return result
+
+    def _load_chunks(
+        self,
+        path: Path,
+        tenant_id: str,
+        metadata_overrides: dict[str, Any] | None,
+        result: IngestionResult,
+    ) -> list[KnowledgeChunk]:
+        """Load, chunk and enrich a whole document (no embeddings yet).
+
+        Appends to result.errors and returns an empty list when the document
+        yields no sections or no chunks.
+        """
+        return [
+            chunk
+            for batch in self._iter_chunk_batches(
+                path, tenant_id, metadata_overrides, result, STREAM_BATCH_SIZE
             )
-            if not chunks:
-                result.errors.append(f"No chunks produced from {path}")
-                return result
+            for chunk in batch
+        ]
+
+    def _iter_chunk_batches(
+        self,
+        path: Path,
+        tenant_id: str,
+        metadata_overrides: dict[str, Any] | None,
+        result: IngestionResult,
+        batch_size: int,
+    ) -> Iterator[list[KnowledgeChunk]]:
+        """Lazily load, chunk and enrich a document in batches (no embeddings yet).
+
+        Blocking (file I/O and parsing); callers on the event loop advance it
+        with asyncio.to_thread. Appends to result.errors once exhausted if the
+        document yielded no sections or no chunks.
+        """
+        frontmatter: dict[str, Any] | None = None
+        section_count = 0
 
+        def sections() -> Iterator[RawSection]:
+            nonlocal frontmatter, section_count
+            # 1. Load document into raw sections
+            for section in self._loader.iter_sections(path):
+                section_count += 1
+                if frontmatter is None and section.frontmatter:
+                    frontmatter = section.frontmatter
+                yield section
+
+        # 2. Chunk sections into KnowledgeChunks
+        chunk_count = 0
+        for chunks in self._chunker.iter_chunk_batches(
+            sections(),
+            tenant_id=tenant_id,
+            document_source=str(path),
+            batch_size=batch_size,
+        ):
+            chunk_count += len(chunks)
             # 3. Enrich metadata
-            chunks = self._extractor.enrich_chunks(
+            yield self._extractor.enrich_chunks(
                 chunks=chunks,
                 frontmatter=frontmatter,
                 overrides=metadata_overrides,
             )
 
-            # 4. Generate embeddings
-            texts = [chunk.content for chunk in chunks]
-            embeddings = await self._embedder.embed_batch(texts)
-            for chunk, (dense, sparse) in zip(chunks, embeddings, strict=True):
-                chunk.embedding_dense = dense
-                chunk.embedding_sparse = sparse
-
-            # 5. Store in Qdrant
-            await self._store.upsert_chunks(chunks, tenant_id)
-
-            result.chunks_created = len(chunks)
-            logger.info(
-                "Ingested %s: %d chunks for tenant %s",
-                path.name,
-                len(chunks),
-                tenant_id,
-            )
-
-        except Exception as e:
-            logger.error("Failed to ingest %s: %s", path, e)
-            result.errors.append(str(e))
+        if not section_count:
+            result.errors.append(f"No sections extracted from {path}")
+        elif not chunk_count:
+            result.errors.append(f"No chunks produced from {path}")
 
-        return result
+    async def _embed_chunks(self, chunks: list[KnowledgeChunk]) -> None:
+        """Generate dense + sparse embeddings for chunks in one batch."""
+        texts = [chunk.content for chunk in chunks]
+        embeddings = await self._embedder.embed_batch(texts, populate_cache=False)
+        for chunk, (dense, sparse) in zip(chunks, embeddings, strict=True):
+            chunk.embedding_dense = dense
+            chunk.embedding_sparse = sparse
 
     async def ingest_directory(
         self,
@@ -192,7 +314,183 @@ class IngestionPipeline:
                 )
             ]
 
-        # Collect supported files
+        files = self._collect_files(directory, recursive)
+        for file_path in files:
+            result = await self.ingest_document(
+                file_path=file_path,
+                tenant_id=tenant_id,
+                metadata_overrides=metadata_overrides,
+            )
+            results.append(result)
+
+        return results
+
+    async def ingest_directory_pipelined(
+        self,
+        dir_path: str | Path,
+        tenant_id: str,
+        recursive: bool = True,
+        metadata_overrides: dict[str, Any] | None = None,
+        load_workers: int = 4,
+        embed_batch_max_texts: int = EMBED_BATCH_MAX_TEXTS,
+        embed_batch_max_tokens: int = EMBED_BATCH_MAX_TOKENS,
+        upsert_batch_size: int = 512,
+        queue_size: int = 1024,
+    ) -> DirectoryIngestionReport:
+        """Bulk-ingest a directory with overlapping load, embed and upsert stages.
+
+        Unlike ingest_directory, which embeds and stores one file at a time,
+        chunks from many files are packed into each embedding request (up to
+        the provider's per-request input and token limits) and upserted in
+        large batches. Stages are connected by bounded queues so a slow
+        embedding provider applies backpressure to loading instead of
+        buffering the whole corpus in memory.
+
+        Args:
+            dir_path: Path to directory containing documents.
+            tenant_id: Tenant to ingest for.
+            recursive: Whether to walk subdirectories (default True).
+            metadata_overrides: Optional metadata overrides applied to all docs.
+            load_workers: Files loaded/chunked concurrently (in threads).
+            embed_batch_max_texts: Maximum chunks per embed_batch call.
+            embed_batch_max_tokens: Maximum total tokens per embed_batch call.
+            upsert_batch_size: Chunks per upsert_chunks call.
+            queue_size: Capacity (in chunks) of each inter-stage queue.
+
+        Returns:
+            DirectoryIngestionReport with per-file results and throughput.
+        """
+        directory = Path(dir_path)
+        if not directory.is_dir():
+            return DirectoryIngestionReport(
+                results=[
+                    IngestionResult(
+                        document_source=str(directory),
+                        errors=[f"Not a directory: {directory}"],
+                    )
+                ]
+            )
+
+        files = self._collect_files(directory, recursive)
+        report = DirectoryIngestionReport(
+            results=[IngestionResult(document_source=str(f)) for f in files]
+        )
+        if not files:
+            return report
+
+        started = time.perf_counter()
+        file_queue: asyncio.Queue[tuple[Path, IngestionResult]] = asyncio.Queue()
+        for item in zip(files, report.results, strict=True):
+            file_queue.put_nowait(item)
+        chunk_queue: asyncio.Queue[_PendingChunk | None] = asyncio.Queue(maxsize=queue_size)
+        upsert_queue: asyncio.Queue[_PendingChunk | None] = asyncio.Queue(maxsize=queue_size)
+        token_counter = get_token_counter()
+
+        def load_batch(
+            batches: Iterator[list[KnowledgeChunk]], result: IngestionResult
+        ) -> list[_PendingChunk] | None:
+            chunks = next(batches, None)
+            if chunks is None:
+                return None
+            counts = token_counter.count_batch([chunk.content for chunk in chunks], cache=False)
+            return [
+                _PendingChunk(chunk, tokens, result)
+                for chunk, tokens in zip(chunks, counts, strict=True)
+            ]
+
+        async def load_worker() -> None:
+            while not file_queue.empty():
+                path, result = file_queue.get_nowait()
+                batches = self._iter_chunk_batches(
+                    path, tenant_id, metadata_overrides, result, STREAM_BATCH_SIZE
+                )
+                try:
+                    while (pending := await asyncio.to_thread(load_batch, batches, result)) is not None:
+                        for item in pending:
+                            await chunk_queue.put(item)
+                except Exception as e:
+                    logger.error("Failed to load %s: %s", path, e)
+                    result.errors.append(str(e))
+
+        async def load_stage() -> None:
+            workers = max(1, min(load_workers, len(files)))
+            await asyncio.gather(*(load_worker() for _ in range(workers)))
+            await chunk_queue.put(_STAGE_DONE)
+
+        async def embed_batch(batch: list[_PendingChunk]) -> None:
+            report.embed_batches += 1
+            try:
+                await self._embed_chunks([item.chunk for item in batch])
+            except Exception as e:
+                logger.error("Failed to embed batch of %d chunks: %s", len(batch), e)
+                for result in {id(item.result): item.result for item in batch}.values():
+                    result.errors.append(f"Embedding failed: {e}")
+                return
+            for item in batch:
+                await upsert_queue.put(item)
+
+        async def embed_stage() -> None:
+            batch: list[_PendingChunk] = []
+            batch_tokens = 0
+            while (item := await chunk_queue.get()) is not _STAGE_DONE:
+                if batch and (
+                    len(batch) >= embed_batch_max_texts
+                    or batch_tokens + item.tokens > embed_batch_max_tokens
+                ):
+                    await embed_batch(batch)
+                    batch, batch_tokens = [], 0
+                batch.append(item)
+                batch_tokens += item.tokens
+            if batch:
+                await embed_batch(batch)
+            await upsert_queue.put(_STAGE_DONE)
+
+        async def upsert_batch(batch: list[_PendingChunk]) -> None:
+            report.upsert_batches += 1
+            try:
+                await self._store.upsert_chunks([item.chunk for item in batch], tenant_id)
+            except Exception as e:
+                logger.error("Failed to upsert batch of %d chunks: %s", len(batch), e)
+                for result in {id(item.result): item.result for item in batch}.values():
+                    result.errors.append(f"Upsert failed: {e}")
+                return
+            for item in batch:
+                item.result.chunks_created += 1
+            report.chunks_created += len(batch)
+
+        async def upsert_stage() -> None:
+            batch: list[_PendingChunk] = []
+            while (item := await upsert_queue.get()) is not _STAGE_DONE:
+                batch.append(item)
+                if len(batch) >= upsert_batch_size:
+                    await upsert_batch(batch)
+                    batch = []
+            if batch:
+                await upsert_batch(batch)
+
+        await asyncio.gather(load_stage(), embed_stage(), upsert_stage())
+
+        report.elapsed_seconds = time.perf_counter() - started
+        report.chunks_per_second = (
+            report.chunks_created / report.elapsed_seconds if report.elapsed_seconds else 0.0
+        )
+        logger.info(
+            "Pipelined ingestion of %s for tenant %s: %d files, %d chunks in %.2fs "
+            "(%.1f chunks/s, %d embed batches, %d upsert batches)",
+            directory,
+            tenant_id,
+            len(files),
+            report.chunks_created,
+            report.elapsed_seconds,
+            report.chunks_per_second,
+            report.embed_batches,
+            report.upsert_batches,
+        )
+        return report
+
+    @staticmethod
+    def _collect_files(directory: Path, recursive: bool) -> list[Path]:
+        """Collect supported files under directory in sorted order."""
         files: list[Path] = []
         if recursive:
             for ext in SUPPORTED_EXTENSIONS:
@@ -206,7 +504,7 @@ class IngestionPipeline:
 
         if not files:
             logger.warning("No supported files found in %s", directory)
-            return results
+            return files
 
         logger.info(
             "Found %d supported files in %s (recursive=%s)",
@@ -214,16 +512,7 @@ class IngestionPipeline:
             directory,
             recursive,
         )
-
-        for file_path in files:
-            result = await self.ingest_document(
-                file_path=file_path,
-                tenant_id=tenant_id,
-                metadata_overrides=metadata_overrides,
-            )
-            results.append(result)
-
-        return results
+        return files
 
     async def update_document(
         self,
@@ -231,12 +520,18 @@ class IngestionPipeline:
         tenant_id: str,
         metadata_overrides: dict[str, Any] | None = None,
     ) -> IngestionResult:
-        """Re-ingest a document, versioning old chunks.
-
-        1. Find existing chunks for this source_document + tenant_id
-        2. Mark all existing chunks as is_current=False
-        3. Determine next version number
-        4. Ingest new version with incremented version
+        """Incrementally re-ingest a document, versioning its chunks.
+
+        1. Load, chunk and enrich the new document content
+        2. Find existing chunks for this source_document + tenant_id
+        3. Match new chunks to current chunks by content_hash
+        4. Embed only new or changed chunks; unchanged chunks keep their
+           point ID and vectors and are rewritten with the new version and
+           metadata (version bump in place)
+        5. Mark current chunks no longer in the document as is_current=False
+           (all of them when the new content yields no chunks)
+        6. Invalidate cached RAG answers that cite this document (only if
+           any chunk was added or removed)
 
         Args:
             file_path: Path to the updated document.
@@ -244,71 +539,89 @@ class IngestionPipeline:
             metadata_overrides: Optional metadata overrides for new chunks.
 
         Returns:
-            IngestionResult for the new version.
+            IngestionResult for the new version with new (chunks_created),
+            reused and removed counts.
         """
         path = Path(file_path)
         source_document = str(path)
+        result = IngestionResult(document_source=source_document)
 
-        # Find existing chunks for this document + tenant
-        existing_chunks = await self._find_chunks_by_source(
-            source_document=source_document,
-            tenant_id=tenant_id,
-        )
-
-        # Determine next version
-        current_max_version = 0
-        if existing_chunks:
-            current_max_version = max(
-                c.get("version", 1) for c in existing_chunks
-            )
-
-        next_version = current_max_version + 1
+        try:
+            chunks = self._load_chunks(path, tenant_id, metadata_overrides, result)
 
-        # Mark old chunks as not current via set_payload
-        if existing_chunks:
-            old_ids = [c["id"] for c in existing_chunks]
-            self._store.client.set_payload(
-                collection_name=self._store._config.collection_knowledge,
-                payload={"is_current": False},
-                points=old_ids,
-            )
-            logger.info(
-                "Marked %d old chunks as is_current=False for %s (tenant %s)",
-                len(old_ids),
-                source_document,
-                tenant_id,
+            # Version from all history; reuse candidates from current chunks only
+            existing_chunks = await self._find_chunks_by_source(
+                source_document=source_document,
+                tenant_id=tenant_id,
             )
-
-        # Ingest new version
-        result = await self.ingest_document(
-            file_path=path,
-            tenant_id=tenant_id,
-            metadata_overrides=metadata_overrides,
-        )
-
-        # Update version on newly created chunks
-        if result.chunks_created > 0 and next_version > 1:
-            new_chunks = await self._find_chunks_by_source(
+            next_version = max((c["version"] for c in existing_chunks), default=0) + 1
+            current_chunks = await self._find_chunks_by_source(
                 source_document=source_document,
                 tenant_id=tenant_id,
                 is_current=True,
+                with_vectors=True,
             )
-            if new_chunks:
-                new_ids = [c["id"] for c in new_chunks]
-                self._store.client.set_payload(
+
+            # Pool current chunks by content hash (duplicates pair up in order)
+            reusable: dict[str, list[dict[str, Any]]] = {}
+            for existing in current_chunks:
+                reusable.setdefault(existing["content_hash"], []).append(existing)
+
+            now = datetime.now(timezone.utc)
+            to_embed: list[KnowledgeChunk] = []
+            reused_ids: set[str] = set()
+            for chunk in chunks:
+                chunk.metadata.version = next_version
+                chunk.metadata.is_current = True
+                candidates = reusable.get(chunk_content_hash(chunk.content))
+                match = candidates.pop(0) if candidates else None
+                if match is None or match["dense"] is None or match["sparse"] is None:
+                    to_embed.append(chunk)
+                    continue
+                chunk.id = match["id"]
+                chunk.embedding_dense = match["dense"]
+                chunk.embedding_sparse = match["sparse"]
+                if match["created_at"]:
+                    chunk.created_at = datetime.fromisoformat(match["created_at"])
+                chunk.updated_at = now
+                reused_ids.add(match["id"])
+
+            if to_embed:
+                await self._embed_chunks(to_embed)
+
+            if chunks:
+                await self._store.upsert_chunks(chunks, tenant_id)
+
+            removed_ids = [c["id"] for c in current_chunks if c["id"] not in reused_ids]
+            if removed_ids:
+                await self._store.client.set_payload(
                     collection_name=self._store._config.collection_knowledge,
-                    payload={"version": next_version},
-                    points=new_ids,
+                    payload={"is_current": False, "valid_until": now.isoformat()},
+                    points=removed_ids,
                 )
 
-        result.version = next_version
-        logger.info(
-            "Updated %s to version %d (%d chunks) for tenant %s",
-            source_document,
-            next_version,
-            result.chunks_created,
-            tenant_id,
-        )
+            result.chunks_created = len(to_embed)
+            result.chunks_reused = len(reused_ids)
+            result.chunks_removed = len(removed_ids)
+            result.version = next_version
+
+            answer_cache = self._store.answer_cache
+            if answer_cache is not None and (to_embed or removed_ids):
+                await answer_cache.invalidate_documents(tenant_id, [source_document])
+
+            logger.info(
+                "Updated %s to version %d for tenant %s: %d new, %d reused, %d removed",
+                source_document,
+                next_version,
+                tenant_id,
+                result.chunks_created,
+                result.chunks_reused,
+                result.chunks_removed,
+            )
+
+        except Exception as e:
+            logger.error("Failed to update %s: %s", path, e)
+            result.errors.append(str(e))
 
         return result
 
@@ -317,6 +630,7 @@ class IngestionPipeline:
         source_document: str,
         tenant_id: str,
         is_current: bool | None = None,
+        with_vectors: bool = False,
     ) -> list[dict[str, Any]]:
         """Find chunks by source_document and tenant_id using Qdrant scroll.
 
@@ -324,9 +638,13 @@ class IngestionPipeline:
             source_document: The source document path to filter on.
             tenant_id: The tenant ID to filter on.
             is_current: Optional filter for is_current field.
+            with_vectors: Also fetch stored vectors ('dense', 'sparse' keys;
+                None when not fetched).
 
         Returns:
-            List of dicts with 'id', 'version', and other payload fields.
+            List of dicts with 'id', 'version', 'content_hash', 'created_at'
+            and other payload fields. Chunks stored before content hashing
+            get their hash computed from the stored content.
         """
         from qdrant_client.models import FieldCondition, Filter, MatchValue
 
@@ -356,22 +674,34 @@ class IngestionPipeline:
         offset = None
 
         while True:
-            results, next_offset = self._store.client.scroll(
+            results, next_offset = await self._store.client.scroll(
                 collection_name=self._store._config.collection_knowledge,
                 scroll_filter=scroll_filter,
                 limit=100,
                 offset=offset,
                 with_payload=True,
+                with_vectors=with_vectors,
             )
 
             for point in results:
                 payload = point.payload or {}
+                vectors = point.vector if isinstance(point.vector, dict) else {}
+                sparse = vectors.get("bm25")
                 all_points.append(
                     {
                         "id": str(point.id),
                         "version": payload.get("version", 1),
                         "is_current": payload.get("is_current", True),
                         "source_document": payload.get("source_document", ""),
+                        "content_hash": payload.get("content_hash")
+                        or chunk_content_hash(payload.get("content", "")),
+                        "created_at": payload.get("created_at"),
+                        "dense": vectors.get("dense"),
+                        "sparse": (
+                            {"indices": list(sparse.indices), "values": list(sparse.values)}
+                            if sparse is not None
+                            else None
+                        ),
                     }
                 )
 
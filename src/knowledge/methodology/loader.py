@@ -9,8 +9,15 @@ relevant sales_stage. Regional chunks are tagged with content_type="regional"
 and the specific region code.
 
 Both content types are universal -- they are the same for all tenants.
-The tenant_id parameter is required by the Qdrant store for isolation,
-but the content itself is not tenant-specific.
+When the store has a shared partition (config.shared_tenant_id), they are
+stored there once and every tenant's search includes them, so provisioning
+another tenant adds no vectors and no embedding calls. Without one, each
+tenant gets its own copy as before.
+
+Chunk IDs are content-addressed (derived from the owning tenant, content
+type, source file and a hash of the section text), so reloading unchanged
+content is a no-op: only new or edited sections are embedded, and sections
+that disappeared from the bundled files are pruned from the shared partition.
 """
 
 from __future__ import annotations
@@ -21,11 +28,14 @@ import uuid
 from pathlib import Path
 
 from src.knowledge.embeddings import EmbeddingService
-from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+from src.knowledge.models import ChunkMetadata, KnowledgeChunk, chunk_content_hash
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
 
 logger = logging.getLogger(__name__)
 
+# Namespace for content-addressed static chunk IDs
+_STATIC_CHUNK_NAMESPACE = uuid.UUID("6f1c8a52-3b0e-4c1d-9a57-2e4b8d7f0c13")
+
 # Base paths for data files
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 _METHODOLOGY_DIR = _PROJECT_ROOT / "data" / "methodology"
@@ -112,6 +122,12 @@ def _chunk_markdown_by_sections(content: str) -> list[tuple[str, str]]:
     return chunks
 
 
+def _static_chunk_id(tenant_id: str, content_type: str, source_document: str, content: str) -> str:
+    """Deterministic chunk ID for a section of bundled static content."""
+    key = f"{tenant_id}:{content_type}:{source_document}:{chunk_content_hash(content)}"
+    return str(uuid.uuid5(_STATIC_CHUNK_NAMESPACE, key))
+
+
 def _classify_section_stage(heading: str) -> str:
     """Determine the sales stage for a methodology section heading.
 
@@ -169,16 +185,17 @@ class MethodologyLoader:
         and appropriate sales_stage metadata.
 
         Args:
-            tenant_id: Tenant ID for Qdrant storage (methodologies are
-                universal but stored per-tenant for isolation).
+            tenant_id: Tenant being provisioned. The chunks are stored under
+                the shared partition when the store has one.
 
         Returns:
-            Number of chunks created and stored.
+            Number of methodology chunks available to the tenant.
         """
         if not _METHODOLOGY_DIR.exists():
             logger.warning("Methodology data directory not found: %s", _METHODOLOGY_DIR)
             return 0
 
+        owner = self._store.shared_tenant_id or tenant_id
         chunks: list[KnowledgeChunk] = []
 
         for md_file in sorted(_METHODOLOGY_DIR.glob("*.md")):
@@ -194,8 +211,8 @@ class MethodologyLoader:
                 stage = _classify_section_stage(heading)
 
                 chunk = KnowledgeChunk(
-                    id=str(uuid.uuid4()),
-                    tenant_id=tenant_id,
+                    id=_static_chunk_id(owner, "methodology", md_file.name, body),
+                    tenant_id=owner,
                     content=body,
                     metadata=ChunkMetadata(
                         product_category="monetization",  # Methodology is cross-product
@@ -209,14 +226,14 @@ class MethodologyLoader:
                 )
                 chunks.append(chunk)
 
-        if chunks:
-            await self._store.upsert_chunks(chunks, tenant_id=tenant_id)
-            logger.info(
-                "Loaded %d methodology chunks for tenant %s",
-                len(chunks),
-                tenant_id,
-            )
-
+        stored = await self._store_static(chunks, owner, "methodology")
+        logger.info(
+            "Methodology for tenant %s: %d chunks (%d newly embedded under %s)",
+            tenant_id,
+            len(chunks),
+            stored,
+            owner,
+        )
         return len(chunks)
 
     async def load_regional_data(self, tenant_id: str) -> int:
@@ -227,15 +244,17 @@ class MethodologyLoader:
         region tag in metadata.
 
         Args:
-            tenant_id: Tenant ID for Qdrant storage.
+            tenant_id: Tenant being provisioned. The chunks are stored under
+                the shared partition when the store has one.
 
         Returns:
-            Number of chunks created and stored.
+            Number of regional chunks available to the tenant.
         """
         if not _REGIONAL_DIR.exists():
             logger.warning("Regional data directory not found: %s", _REGIONAL_DIR)
             return 0
 
+        owner = self._store.shared_tenant_id or tenant_id
         chunks: list[KnowledgeChunk] = []
 
         for md_file in sorted(_REGIONAL_DIR.glob("*.md")):
@@ -257,8 +276,8 @@ class MethodologyLoader:
                 stages = ["discovery", "negotiation"] if topic == "pricing" else ["discovery"]
 
                 chunk = KnowledgeChunk(
-                    id=str(uuid.uuid4()),
-                    tenant_id=tenant_id,
+                    id=_static_chunk_id(owner, "regional", md_file.name, body),
+                    tenant_id=owner,
                     content=body,
                     metadata=ChunkMetadata(
                         product_category="monetization",  # Regional is cross-product
@@ -272,16 +291,45 @@ class MethodologyLoader:
                 )
                 chunks.append(chunk)
 
-        if chunks:
-            await self._store.upsert_chunks(chunks, tenant_id=tenant_id)
-            logger.info(
-                "Loaded %d regional chunks for tenant %s",
-                len(chunks),
-                tenant_id,
-            )
-
+        stored = await self._store_static(chunks, owner, "regional")
+        logger.info(
+            "Regional content for tenant %s: %d chunks (%d newly embedded under %s)",
+            tenant_id,
+            len(chunks),
+            stored,
+            owner,
+        )
         return len(chunks)
 
+    async def _store_static(
+        self, chunks: list[KnowledgeChunk], owner: str, content_type: str
+    ) -> int:
+        """Upsert only the chunks not already stored under their content-addressed IDs.
+
+        In the shared partition, sections no longer present in the bundled
+        files are deleted as well, and so are the per-tenant copies of the
+        bundled files left by provisioning before the partition existed.
+
+        Returns:
+            Number of chunks embedded and upserted.
+        """
+        ids = [chunk.id for chunk in chunks]
+        existing = await self._store.existing_chunk_ids(ids, owner)
+        new_chunks = [chunk for chunk in chunks if chunk.id not in existing]
+        shared = owner == self._store.shared_tenant_id
+
+        if new_chunks:
+            if shared:
+                await self._store.upsert_shared_chunks(new_chunks)
+            else:
+                await self._store.upsert_chunks(new_chunks, tenant_id=owner)
+        if shared:
+            await self._store.prune_chunks(owner, ids, {"content_type": content_type})
+            await self._store.remove_tenant_copies(
+                content_type, sorted({chunk.metadata.source_document for chunk in chunks})
+            )
+        return len(new_chunks)
+
     async def load_all(self, tenant_id: str) -> dict[str, int]:
         """Load both methodology and regional content.
 
@@ -12,9 +12,11 @@ Product categories match the actual ESW product portfolio:
 
 from __future__ import annotations
 
+import hashlib
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -76,6 +78,15 @@ class ChunkMetadata(BaseModel):
 # ── Knowledge Chunk ─────────────────────────────────────────────────────────
 
 
+def chunk_content_hash(content: str) -> str:
+    """SHA-256 of a chunk's exact text.
+
+    Stored in every knowledge point's payload so re-ingestion can tell which
+    chunks are unchanged and reuse their vectors instead of re-embedding.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class KnowledgeChunk(BaseModel):
     """A single unit of knowledge stored in the vector database.
 
@@ -104,6 +115,29 @@ class KnowledgeChunk(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass(slots=True)
+class KnowledgeHit:
+    """Slim search result for the retrieval hot path.
+
+    Built straight from a projected Qdrant payload without Pydantic
+    validation or datetime parsing, for callers that only need a chunk's
+    identity, text and source (e.g. MultiSourceRetriever).
+
+    Attributes:
+        id: Chunk identifier.
+        content: The text content of the chunk.
+        source_document: Original document filename or identifier.
+        score: Normalized relevance score (0.0-1.0).
+        payload: Any other projected payload fields, unparsed.
+    """
+
+    id: str
+    content: str
+    source_document: str = ""
+    score: float = 0.0
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
 # ── Tenant Config ───────────────────────────────────────────────────────────
 
 
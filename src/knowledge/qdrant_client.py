@@ -1,6 +1,6 @@
 """Qdrant vector database client with tenant-scoped operations.
 
-Wraps the Qdrant Python client to provide:
+Wraps the async Qdrant Python client to provide:
 - Payload-based multi-tenant isolation (tenant_id with is_tenant=true index)
 - Per-tenant HNSW indexes (payload_m=16, m=0) for efficient tenant-scoped search
 - Hybrid search combining dense (semantic) + sparse (BM25) vectors via RRF fusion
@@ -10,18 +10,43 @@ The tenant isolation model uses Qdrant's recommended payload-based approach:
 each point carries a tenant_id field, and every query includes a mandatory
 tenant_id filter. The is_tenant=true index configuration creates per-tenant
 HNSW sub-indexes for optimal query performance.
+
+All network I/O goes through AsyncQdrantClient so vector searches never block
+the event loop. Remote mode uses a pooled REST (or gRPC) connection with a
+configurable timeout; local path mode remains available for tests and dev.
+
+Dense vectors are stored and searched according to the collection profiles
+selected in KnowledgeBaseConfig (quantization, on-disk originals, HNSW
+settings; see collection_profiles).
+
+Searches can project the payload to a subset of fields (payload_fields) to
+cut transfer size. The retrieval hot path uses search_hits_batch, which
+fetches only RETRIEVAL_PAYLOAD_FIELDS and returns slim KnowledgeHit objects
+instead of validating a full KnowledgeChunk per hit.
+
+Static content shared by all tenants (bundled methodology and regional
+guides) is stored once under config.shared_tenant_id; knowledge searches
+match the caller's tenant_id or that shared partition, which no tenant can
+write to or delete from.
+
+config.collection_knowledge is a Qdrant alias for a versioned collection
+(knowledge_base_v1, _v2, ...). Every read and write goes through the alias,
+so reindex.KnowledgeReindexer can rebuild into a new version and swap the
+alias without searches ever seeing a half-populated collection.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Any
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models.models import KeywordIndexParams
 from qdrant_client.models import (
-    Distance,
+    CreateAlias,
+    CreateAliasOperation,
     FieldCondition,
     Filter,
     Fusion,
@@ -31,18 +56,48 @@ from qdrant_client.models import (
     PayloadSchemaType,
     PointStruct,
     Prefetch,
+    QueryRequest,
     SparseIndexParams,
     SparseVector,
     SparseVectorParams,
-    VectorParams,
 )
 
+from src.knowledge.answer_cache import SemanticAnswerCache
+from src.knowledge.collection_profiles import CollectionProfile, get_profile
 from src.knowledge.config import KnowledgeBaseConfig
 from src.knowledge.embeddings import EmbeddingService
-from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+from src.knowledge.models import ChunkMetadata, KnowledgeChunk, KnowledgeHit, chunk_content_hash
 
 logger = logging.getLogger(__name__)
 
+# Qdrant's reciprocal rank fusion constant (score = 1 / (rank + RRF_K))
+RRF_K = 2
+
+# Number of prefetches fused per hybrid query (dense + BM25)
+HYBRID_PREFETCH_COUNT = 2
+
+# Payload fields the retrieval hot path needs (see search_hits_batch)
+RETRIEVAL_PAYLOAD_FIELDS: tuple[str, ...] = ("content", "source_document")
+
+
+def versioned_collection_name(alias: str, version: int) -> str:
+    """Physical collection name for a version of an aliased collection."""
+    return f"{alias}_v{version}"
+
+
+def collection_version(alias: str, name: str) -> int | None:
+    """Version number of a physical collection of alias, or None if not one.
+
+    A plain collection named like the alias itself (created before aliases
+    were introduced) counts as version 0.
+    """
+    if name == alias:
+        return 0
+    prefix = f"{alias}_v"
+    if name.startswith(prefix) and name[len(prefix) :].isdigit():
+        return int(name[len(prefix) :])
+    return None
+
 
 class QdrantKnowledgeStore:
     """Tenant-scoped vector store backed by Qdrant.
@@ -53,7 +108,12 @@ class QdrantKnowledgeStore:
     - conversations: Conversation messages indexed by session and channel.
 
     All operations require a tenant_id parameter and enforce tenant isolation
-    at the query level.
+    at the query level. Knowledge searches also include the read-only shared
+    partition (config.shared_tenant_id) holding static cross-tenant content.
+
+    When config.answer_cache_enabled is set the store also owns a
+    SemanticAnswerCache on the same client, and delete_chunks invalidates
+    cached answers built from the deleted chunks.
 
     Args:
         config: Knowledge base configuration.
@@ -65,50 +125,139 @@ class QdrantKnowledgeStore:
     ) -> None:
         self._config = config
         self._embeddings = embedding_service
+        self._shared_tenant_id = config.shared_tenant_id
+        self._knowledge_profile = get_profile(
+            config.knowledge_profile, config.hnsw_m, config.hnsw_ef_construct, config.hnsw_ef
+        )
+        self._conversations_profile = get_profile(
+            config.conversations_profile, config.hnsw_m, config.hnsw_ef_construct, config.hnsw_ef
+        )
 
         # Initialize Qdrant client: remote if URL provided, local otherwise
         if config.qdrant_url:
-            self._client = QdrantClient(
+            self._client = AsyncQdrantClient(
                 url=config.qdrant_url,
                 api_key=config.qdrant_api_key,
+                prefer_grpc=config.qdrant_prefer_grpc,
+                grpc_port=config.qdrant_grpc_port,
+                timeout=config.qdrant_timeout,
+                pool_size=config.qdrant_pool_size,
             )
         else:
-            self._client = QdrantClient(path=config.qdrant_path)
+            self._client = AsyncQdrantClient(path=config.qdrant_path)
+
+        self._answer_cache: SemanticAnswerCache | None = None
+        if config.answer_cache_enabled:
+            self._answer_cache = SemanticAnswerCache(
+                client=self._client,
+                embedding_service=embedding_service,
+                config=config,
+            )
 
     @property
-    def client(self) -> QdrantClient:
+    def client(self) -> AsyncQdrantClient:
         """Expose the underlying Qdrant client for advanced operations."""
         return self._client
 
+    @property
+    def knowledge_profile(self) -> CollectionProfile:
+        """Vector storage profile of the knowledge_base collection."""
+        return self._knowledge_profile
+
+    @property
+    def conversations_profile(self) -> CollectionProfile:
+        """Vector storage profile of the conversations collection.
+
+        Pass conversations_profile.search_params() to ConversationStore.
+        """
+        return self._conversations_profile
+
+    @property
+    def shared_tenant_id(self) -> str | None:
+        """Tenant ID of the shared static-content partition, if enabled."""
+        return self._shared_tenant_id
+
+    @property
+    def answer_cache(self) -> SemanticAnswerCache | None:
+        """Semantic answer cache sharing this store's client, if enabled."""
+        return self._answer_cache
+
     async def initialize_collections(self) -> None:
         """Create both collections if they don't already exist.
 
+        Dense vectors follow the configured collection profiles. Existing
+        collections are left as they are; migrate them with
+        scripts/apply_collection_profile.py.
+
         Sets up:
         - knowledge_base: Dense (1536d cosine) + sparse BM25 vectors, payload
           indexes for tenant_id (is_tenant), product_category, buyer_persona,
           sales_stage, region, content_type, is_current, version.
         - conversations: Dense (1536d cosine) vectors, payload indexes for
           tenant_id (is_tenant), session_id, channel, timestamp.
+        - rag_answer_cache: Only when the semantic answer cache is enabled.
         """
         await self._init_knowledge_collection()
         await self._init_conversations_collection()
+        if self._answer_cache is not None:
+            await self._answer_cache.initialize()
         logger.info("Qdrant collections initialized")
 
     async def _init_knowledge_collection(self) -> None:
-        """Create the knowledge_base collection with hybrid search support."""
-        name = self._config.collection_knowledge
+        """Create the knowledge_base collection behind an alias.
+
+        The points live in a versioned collection (knowledge_base_v1) and
+        config.collection_knowledge is an alias for it, so the reindex job
+        can build knowledge_base_v2 alongside and swap the alias atomically.
+        A plain collection left under the alias name by an earlier release
+        is used as-is until its first reindex.
+        """
+        alias = self._config.collection_knowledge
+
+        current = await self.resolve_knowledge_collection()
+        if current is not None:
+            logger.info("Collection %s already exists (%s), skipping creation", alias, current)
+            return
+
+        name = versioned_collection_name(alias, 1)
+        await self.create_knowledge_collection(name)
+        await self._client.update_collection_aliases(
+            change_aliases_operations=[
+                CreateAliasOperation(create_alias=CreateAlias(collection_name=name, alias_name=alias)),
+            ]
+        )
+        logger.info("Pointed alias %s at %s", alias, name)
+
+    async def resolve_knowledge_collection(self) -> str | None:
+        """Name of the physical collection behind config.collection_knowledge.
 
-        if self._client.collection_exists(name):
+        Returns the alias target, the name itself for a pre-alias plain
+        collection, or None if neither exists yet.
+        """
+        alias = self._config.collection_knowledge
+        response = await self._client.get_aliases()
+        for description in response.aliases:
+            if description.alias_name == alias:
+                return description.collection_name
+        if await self._client.collection_exists(alias):
+            return alias
+        return None
+
+    async def create_knowledge_collection(self, name: str) -> None:
+        """Create a physical knowledge collection with hybrid search support.
+
+        Uses the configured embedding dimensions and knowledge profile, so a
+        reindex into a new collection picks up changed settings. Does
+        nothing if the collection already exists.
+        """
+        if await self._client.collection_exists(name):
             logger.info("Collection %s already exists, skipping creation", name)
             return
 
-        self._client.create_collection(
+        await self._client.create_collection(
             collection_name=name,
             vectors_config={
-                "dense": VectorParams(
-                    size=self._config.embedding_dimensions,
-                    distance=Distance.COSINE,
-                ),
+                "dense": self._knowledge_profile.vector_params(self._config.embedding_dimensions),
             },
             sparse_vectors_config={
                 "bm25": SparseVectorParams(
@@ -119,7 +268,7 @@ class QdrantKnowledgeStore:
 
         # Payload indexes for filtered search
         # tenant_id with is_tenant=True for per-tenant HNSW indexes
-        self._client.create_payload_index(
+        await self._client.create_payload_index(
             collection_name=name,
             field_name="tenant_id",
             field_schema=KeywordIndexParams(
@@ -136,46 +285,49 @@ class QdrantKnowledgeStore:
             "region",
             "content_type",
         ]:
-            self._client.create_payload_index(
+            await self._client.create_payload_index(
                 collection_name=name,
                 field_name=field,
                 field_schema=PayloadSchemaType.KEYWORD,
             )
 
-        self._client.create_payload_index(
+        await self._client.create_payload_index(
             collection_name=name,
             field_name="is_current",
             field_schema=PayloadSchemaType.BOOL,
         )
 
-        self._client.create_payload_index(
+        await self._client.create_payload_index(
             collection_name=name,
             field_name="version",
             field_schema=PayloadSchemaType.INTEGER,
         )
 
-        logger.info("Created knowledge_base collection with hybrid search config")
+        logger.info(
+            "Created %s collection with hybrid search config (profile %s)",
+            name,
+            self._knowledge_profile.name,
+        )
 
     async def _init_conversations_collection(self) -> None:
         """Create the conversations collection for message history."""
         name = self._config.collection_conversations
 
-        if self._client.collection_exists(name):
+        if await self._client.collection_exists(name):
             logger.info("Collection %s already exists, skipping creation", name)
             return
 
-        self._client.create_collection(
+        await self._client.create_collection(
             collection_name=name,
             vectors_config={
-                "dense": VectorParams(
-                    size=self._config.embedding_dimensions,
-                    distance=Distance.COSINE,
+                "dense": self._conversations_profile.vector_params(
+                    self._config.embedding_dimensions
                 ),
             },
         )
 
         # tenant_id with is_tenant=True
-        self._client.create_payload_index(
+        await self._client.create_payload_index(
             collection_name=name,
             field_name="tenant_id",
             field_schema=KeywordIndexParams(
@@ -185,19 +337,21 @@ class QdrantKnowledgeStore:
         )
 
         for field in ["session_id", "channel"]:
-            self._client.create_payload_index(
+            await self._client.create_payload_index(
                 collection_name=name,
                 field_name=field,
                 field_schema=PayloadSchemaType.KEYWORD,
             )
 
-        self._client.create_payload_index(
+        await self._client.create_payload_index(
             collection_name=name,
             field_name="timestamp",
             field_schema=PayloadSchemaType.INTEGER,
         )
 
-        logger.info("Created conversations collection")
+        logger.info(
+            "Created conversations collection (profile %s)", self._conversations_profile.name
+        )
 
     async def upsert_chunks(
         self, chunks: list[KnowledgeChunk], tenant_id: str
@@ -214,8 +368,28 @@ class QdrantKnowledgeStore:
 
         Raises:
             ValueError: If any chunk's tenant_id doesn't match the provided
-                tenant_id parameter.
+                tenant_id parameter, or tenant_id is the shared partition
+                (only static loaders write there, via upsert_shared_chunks).
         """
+        if self._shared_tenant_id is not None and tenant_id == self._shared_tenant_id:
+            raise ValueError(
+                f"tenant_id {tenant_id} is the read-only shared partition; "
+                "use upsert_shared_chunks for static content"
+            )
+        await self._upsert_chunks(chunks, tenant_id)
+
+    async def upsert_shared_chunks(self, chunks: list[KnowledgeChunk]) -> None:
+        """Upsert static content into the shared partition (loaders only).
+
+        Raises:
+            ValueError: If the store has no shared partition, or a chunk is
+                not owned by it.
+        """
+        if self._shared_tenant_id is None:
+            raise ValueError("This store has no shared partition (shared_tenant_id=None)")
+        await self._upsert_chunks(chunks, self._shared_tenant_id)
+
+    async def _upsert_chunks(self, chunks: list[KnowledgeChunk], tenant_id: str) -> None:
         points: list[PointStruct] = []
 
         # Generate embeddings for chunks that don't have them
@@ -231,7 +405,7 @@ class QdrantKnowledgeStore:
 
         if texts_needing_embeddings:
             indices, texts = zip(*texts_needing_embeddings, strict=True)
-            embeddings = await self._embeddings.embed_batch(list(texts))
+            embeddings = await self._embeddings.embed_batch(list(texts), populate_cache=False)
             for idx, (dense, sparse) in zip(indices, embeddings, strict=True):
                 chunks[idx].embedding_dense = dense
                 chunks[idx].embedding_sparse = sparse
@@ -241,6 +415,7 @@ class QdrantKnowledgeStore:
             payload: dict[str, Any] = {
                 "tenant_id": tenant_id,
                 "content": chunk.content,
+                "content_hash": chunk_content_hash(chunk.content),
                 "product_category": chunk.metadata.product_category,
                 "buyer_persona": chunk.metadata.buyer_persona,
                 "sales_stage": chunk.metadata.sales_stage,
@@ -275,7 +450,7 @@ class QdrantKnowledgeStore:
             )
             points.append(point)
 
-        self._client.upsert(
+        await self._client.upsert(
             collection_name=self._config.collection_knowledge,
             points=points,
         )
@@ -289,6 +464,7 @@ class QdrantKnowledgeStore:
         tenant_id: str,
         filters: dict[str, Any] | None = None,
         top_k: int | None = None,
+        payload_fields: Sequence[str] | None = None,
     ) -> list[KnowledgeChunk]:
         """Search the knowledge base using hybrid dense + sparse with RRF fusion.
 
@@ -301,6 +477,8 @@ class QdrantKnowledgeStore:
             tenant_id: Tenant to search within.
             filters: Optional metadata filters (e.g., {"product_category": "billing"}).
             top_k: Number of results to return. Defaults to config.default_top_k.
+            payload_fields: Optional payload projection. Only these fields are
+                fetched; the rest take their KnowledgeChunk defaults.
 
         Returns:
             List of KnowledgeChunk objects ranked by hybrid score.
@@ -310,9 +488,143 @@ class QdrantKnowledgeStore:
         # Generate query embeddings
         dense_vector, sparse_vector = await self._embeddings.embed_text(query_text)
 
-        # Build tenant + metadata filter
+        # Hybrid search with prefetch + RRF fusion
+        results = await self._client.query_points(
+            collection_name=self._config.collection_knowledge,
+            prefetch=self._hybrid_prefetch(
+                dense_vector, sparse_vector, self._build_filter(tenant_id, filters), k
+            ),
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=k,
+            with_payload=self._payload_selector(payload_fields),
+        )
+
+        return [self._point_to_chunk(point, tenant_id) for point in results.points]
+
+    async def hybrid_search_batch(
+        self,
+        queries: list[tuple[str, dict[str, Any] | None]],
+        tenant_id: str,
+        top_k: int | None = None,
+        query_vectors: list[tuple[list[float], dict]] | None = None,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[list[tuple[KnowledgeChunk, float]]]:
+        """Run several hybrid searches in a single Qdrant batch request.
+
+        All query texts are embedded with one embed_batch call (unless
+        query_vectors are supplied) and the searches are sent together via
+        query_batch_points, so N sub-queries cost one embedding round trip
+        and one Qdrant round trip.
+
+        Scores are the fused RRF scores Qdrant returns, normalized to 0.0-1.0
+        by the best achievable score (rank 1 in both the dense and the BM25
+        prefetch).
+
+        Args:
+            queries: (query_text, filters) pairs, one per search.
+            tenant_id: Tenant to search within.
+            top_k: Results per search. Defaults to config.default_top_k.
+            query_vectors: Optional precomputed (dense, sparse) vectors aligned
+                with queries.
+            payload_fields: Optional payload projection. Only these fields are
+                fetched; the rest take their KnowledgeChunk defaults.
+
+        Returns:
+            One list of (KnowledgeChunk, score) pairs per query, in query order.
+        """
+        responses = await self._query_batch(
+            queries, tenant_id, top_k, query_vectors, self._payload_selector(payload_fields)
+        )
+        return [
+            [
+                (self._point_to_chunk(point, tenant_id), self._normalize_rrf_score(point.score))
+                for point in response.points
+            ]
+            for response in responses
+        ]
+
+    async def search_hits_batch(
+        self,
+        queries: list[tuple[str, dict[str, Any] | None]],
+        tenant_id: str,
+        top_k: int | None = None,
+        query_vectors: list[tuple[list[float], dict]] | None = None,
+        payload_fields: Sequence[str] = RETRIEVAL_PAYLOAD_FIELDS,
+    ) -> list[list[KnowledgeHit]]:
+        """Batched hybrid search returning slim KnowledgeHit results.
+
+        Same queries and scoring as hybrid_search_batch, but only
+        payload_fields are fetched and each hit is a plain KnowledgeHit
+        (no Pydantic validation or timestamp parsing). Fields beyond
+        content and source_document land in KnowledgeHit.payload.
+
+        Args:
+            queries: (query_text, filters) pairs, one per search.
+            tenant_id: Tenant to search within.
+            top_k: Results per search. Defaults to config.default_top_k.
+            query_vectors: Optional precomputed (dense, sparse) vectors aligned
+                with queries.
+            payload_fields: Payload fields to fetch.
+
+        Returns:
+            One list of KnowledgeHit per query (best first), in query order.
+        """
+        responses = await self._query_batch(
+            queries, tenant_id, top_k, query_vectors, self._payload_selector(payload_fields)
+        )
+        return [[self._point_to_hit(point) for point in response.points] for response in responses]
+
+    async def _query_batch(
+        self,
+        queries: list[tuple[str, dict[str, Any] | None]],
+        tenant_id: str,
+        top_k: int | None,
+        query_vectors: list[tuple[list[float], dict]] | None,
+        with_payload: bool | list[str],
+    ) -> list[Any]:
+        """Embed (if needed) and send hybrid queries as one query_batch_points call."""
+        if not queries:
+            return []
+
+        k = top_k or self._config.default_top_k
+
+        if query_vectors is None:
+            query_vectors = await self._embeddings.embed_batch([text for text, _ in queries])
+
+        requests = [
+            QueryRequest(
+                prefetch=self._hybrid_prefetch(
+                    dense, sparse, self._build_filter(tenant_id, filters), k
+                ),
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=k,
+                with_payload=with_payload,
+            )
+            for (_, filters), (dense, sparse) in zip(queries, query_vectors, strict=True)
+        ]
+
+        return await self._client.query_batch_points(
+            collection_name=self._config.collection_knowledge,
+            requests=requests,
+        )
+
+    @staticmethod
+    def _payload_selector(payload_fields: Sequence[str] | None) -> bool | list[str]:
+        """Translate an optional projection into Qdrant's with_payload value."""
+        return True if payload_fields is None else list(payload_fields)
+
+    def _build_filter(self, tenant_id: str, filters: dict[str, Any] | None) -> Filter:
+        """Build the mandatory tenant filter plus optional metadata conditions.
+
+        The tenant condition also admits the shared static-content partition.
+        List values become MatchAny conditions, scalars become MatchValue.
+        """
+        if self._shared_tenant_id is None or tenant_id == self._shared_tenant_id:
+            tenant_match: MatchValue | MatchAny = MatchValue(value=tenant_id)
+        else:
+            tenant_match = MatchAny(any=[tenant_id, self._shared_tenant_id])
         must_conditions: list[FieldCondition] = [
-            FieldCondition(key="tenant_id", match=MatchValue(value=tenant_id)),
+            FieldCondition(key="tenant_id", match=tenant_match),
         ]
 
         if filters:
@@ -326,61 +638,98 @@ class QdrantKnowledgeStore:
                         FieldCondition(key=field, match=MatchValue(value=value))
                     )
 
-        query_filter = Filter(must=must_conditions)
+        return Filter(must=must_conditions)
 
-        # Hybrid search with prefetch + RRF fusion
-        results = self._client.query_points(
-            collection_name=self._config.collection_knowledge,
-            prefetch=[
-                Prefetch(
-                    query=dense_vector,
-                    using="dense",
-                    limit=k * 2,
-                    filter=query_filter,
-                ),
-                Prefetch(
-                    query=SparseVector(
-                        indices=sparse_vector["indices"],
-                        values=sparse_vector["values"],
-                    ),
-                    using="bm25",
-                    limit=k * 2,
-                    filter=query_filter,
+    def _hybrid_prefetch(
+        self,
+        dense_vector: list[float],
+        sparse_vector: dict,
+        query_filter: Filter,
+        k: int,
+    ) -> list[Prefetch]:
+        """Build the dense + BM25 prefetch pair fused by RRF.
+
+        The dense prefetch carries the knowledge profile's search params
+        (hnsw_ef, quantized search with rescoring).
+        """
+        return [
+            Prefetch(
+                query=dense_vector,
+                using="dense",
+                limit=k * 2,
+                filter=query_filter,
+                params=self._knowledge_profile.search_params(),
+            ),
+            Prefetch(
+                query=SparseVector(
+                    indices=sparse_vector["indices"],
+                    values=sparse_vector["values"],
                 ),
-            ],
-            query=FusionQuery(fusion=Fusion.RRF),
-            limit=k,
-        )
+                using="bm25",
+                limit=k * 2,
+                filter=query_filter,
+            ),
+        ]
 
-        # Convert results back to KnowledgeChunk
-        chunks: list[KnowledgeChunk] = []
-        for point in results.points:
-            payload = point.payload or {}
-            valid_until_raw = payload.get("valid_until")
-            chunks.append(
-                KnowledgeChunk(
-                    id=str(point.id),
-                    tenant_id=payload.get("tenant_id", tenant_id),
-                    content=payload.get("content", ""),
-                    metadata=ChunkMetadata(
-                        product_category=payload.get("product_category", "monetization"),
-                        buyer_persona=payload.get("buyer_persona", []),
-                        sales_stage=payload.get("sales_stage", []),
-                        region=payload.get("region", []),
-                        content_type=payload.get("content_type", "product"),
-                        source_document=payload.get("source_document", ""),
-                        version=payload.get("version", 1),
-                        valid_from=payload.get("valid_from", datetime.now(timezone.utc).isoformat()),
-                        valid_until=valid_until_raw,
-                        is_current=payload.get("is_current", True),
-                        cross_references=payload.get("cross_references", []),
-                    ),
-                    created_at=payload.get("created_at", datetime.now(timezone.utc).isoformat()),
-                    updated_at=payload.get("updated_at", datetime.now(timezone.utc).isoformat()),
-                )
-            )
+    @staticmethod
+    def _normalize_rrf_score(score: float) -> float:
+        """Scale a fused RRF score into 0.0-1.0.
 
-        return chunks
+        Each prefetch contributes 1 / (rank + RRF_K) with a 0-based rank, so
+        the best possible fused score is HYBRID_PREFETCH_COUNT / RRF_K.
+        """
+        max_score = HYBRID_PREFETCH_COUNT / RRF_K
+        return max(0.0, min(1.0, score / max_score))
+
+    @staticmethod
+    def _point_to_chunk(point: Any, tenant_id: str) -> KnowledgeChunk:
+        """Convert a Qdrant point back into a KnowledgeChunk.
+
+        Payload fields missing from the point (e.g. outside a projection)
+        take defaults; the current time is only computed if a timestamp is
+        missing.
+        """
+        payload = point.payload or {}
+        valid_from = payload.get("valid_from")
+        created_at = payload.get("created_at")
+        updated_at = payload.get("updated_at")
+        if valid_from is None or created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc).isoformat()
+            valid_from = valid_from or now
+            created_at = created_at or now
+            updated_at = updated_at or now
+        return KnowledgeChunk(
+            id=str(point.id),
+            tenant_id=payload.get("tenant_id", tenant_id),
+            content=payload.get("content", ""),
+            metadata=ChunkMetadata(
+                product_category=payload.get("product_category", "monetization"),
+                buyer_persona=payload.get("buyer_persona", []),
+                sales_stage=payload.get("sales_stage", []),
+                region=payload.get("region", []),
+                content_type=payload.get("content_type", "product"),
+                source_document=payload.get("source_document", ""),
+                version=payload.get("version", 1),
+                valid_from=valid_from,
+                valid_until=payload.get("valid_until"),
+                is_current=payload.get("is_current", True),
+                cross_references=payload.get("cross_references", []),
+            ),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    @classmethod
+    def _point_to_hit(cls, point: Any) -> KnowledgeHit:
+        """Convert a (projected) Qdrant point into a slim KnowledgeHit."""
+        payload = dict(point.payload or {})
+        return KnowledgeHit(
+            id=str(point.id),
+            content=payload.pop("content", ""),
+            source_document=payload.pop("source_document", ""),
+            score=cls._normalize_rrf_score(point.score or 0.0),
+            payload=payload,
+        )
 
     async def delete_chunks(
         self, chunk_ids: list[str], tenant_id: str
@@ -388,7 +737,8 @@ class QdrantKnowledgeStore:
         """Delete chunks by IDs with tenant isolation guard.
 
         Only deletes points that match both the provided IDs AND the tenant_id,
-        preventing cross-tenant deletion.
+        preventing cross-tenant deletion. Cached answers built from any of the
+        deleted chunks are invalidated.
 
         Args:
             chunk_ids: List of chunk IDs to delete.
@@ -396,7 +746,7 @@ class QdrantKnowledgeStore:
         """
         from qdrant_client.models import FilterSelector, HasIdCondition, PointIdsList
 
-        self._client.delete(
+        await self._client.delete(
             collection_name=self._config.collection_knowledge,
             points_selector=FilterSelector(
                 filter=Filter(
@@ -414,21 +764,160 @@ class QdrantKnowledgeStore:
             "Deleted %d chunks for tenant %s", len(chunk_ids), tenant_id
         )
 
+        if self._answer_cache is not None:
+            await self._answer_cache.invalidate_chunks(tenant_id, chunk_ids)
+
+    async def existing_chunk_ids(self, chunk_ids: list[str], tenant_id: str) -> set[str]:
+        """Return which of the given chunk IDs are already stored for a tenant.
+
+        Lets loaders with content-addressed IDs skip re-embedding chunks
+        whose exact content is already indexed.
+        """
+        if not chunk_ids:
+            return set()
+        records = await self._client.retrieve(
+            collection_name=self._config.collection_knowledge,
+            ids=chunk_ids,
+            with_payload=["tenant_id"],
+        )
+        return {
+            str(record.id)
+            for record in records
+            if (record.payload or {}).get("tenant_id") == tenant_id
+        }
+
+    async def prune_chunks(
+        self, tenant_id: str, keep_ids: list[str], filters: dict[str, Any]
+    ) -> list[str]:
+        """Delete a tenant's chunks matching filters, except keep_ids.
+
+        Used to drop sections that disappeared from a re-loaded document set
+        (an edited section gets a new content-addressed ID, so its old
+        version is pruned too). Cached answers built from the pruned chunks
+        are invalidated -- for every tenant when they were shared.
+
+        Returns:
+            IDs of the deleted chunks.
+        """
+        from qdrant_client.models import HasIdCondition
+
+        conditions: list[FieldCondition] = [
+            FieldCondition(key="tenant_id", match=MatchValue(value=tenant_id)),
+        ]
+        conditions.extend(
+            FieldCondition(key=field, match=MatchValue(value=value))
+            for field, value in filters.items()
+        )
+        owned = await self._chunk_ids_by_tenant(
+            Filter(must=conditions, must_not=[HasIdCondition(has_id=keep_ids)])
+        )
+        pruned = owned.get(tenant_id, [])
+        if not pruned:
+            return []
+
+        await self._delete_points(pruned)
+        logger.info("Pruned %d chunks of tenant %s", len(pruned), tenant_id)
+        if self._answer_cache is not None:
+            if tenant_id == self._shared_tenant_id:
+                await self._answer_cache.invalidate_chunks_all_tenants(pruned)
+            else:
+                await self._answer_cache.invalidate_chunks(tenant_id, pruned)
+        return pruned
+
+    async def remove_tenant_copies(
+        self, content_type: str, source_documents: list[str]
+    ) -> int:
+        """Delete tenant-owned copies of static content now in the shared partition.
+
+        Before the shared partition existed, each tenant was provisioned with
+        its own copy of the bundled methodology and regional sections. Those
+        copies would now show up next to the shared ones in every search.
+        Only chunks of the given content_type that came from one of the
+        bundled source_documents are removed, so content a tenant ingested
+        itself is kept. A no-op once the copies are gone, or without a
+        shared partition.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        if self._shared_tenant_id is None or not source_documents:
+            return 0
+        by_tenant = await self._chunk_ids_by_tenant(
+            Filter(
+                must=[
+                    FieldCondition(key="content_type", match=MatchValue(value=content_type)),
+                    FieldCondition(key="source_document", match=MatchAny(any=source_documents)),
+                ],
+                must_not=[
+                    FieldCondition(key="tenant_id", match=MatchValue(value=self._shared_tenant_id)),
+                ],
+            )
+        )
+        removed = 0
+        for tenant_id, chunk_ids in by_tenant.items():
+            await self._delete_points(chunk_ids)
+            if self._answer_cache is not None:
+                await self._answer_cache.invalidate_chunks(tenant_id, chunk_ids)
+            removed += len(chunk_ids)
+            logger.info(
+                "Removed %d tenant copies of shared %s content for tenant %s",
+                len(chunk_ids),
+                content_type,
+                tenant_id,
+            )
+        return removed
+
+    async def _chunk_ids_by_tenant(self, selector: Filter) -> dict[str, list[str]]:
+        """IDs of the knowledge chunks matching selector, grouped by tenant_id."""
+        by_tenant: dict[str, list[str]] = {}
+        offset = None
+        while True:
+            records, offset = await self._client.scroll(
+                collection_name=self._config.collection_knowledge,
+                scroll_filter=selector,
+                limit=1024,
+                offset=offset,
+                with_payload=["tenant_id"],
+                with_vectors=False,
+            )
+            for record in records:
+                owner = str((record.payload or {}).get("tenant_id"))
+                by_tenant.setdefault(owner, []).append(str(record.id))
+            if offset is None:
+                return by_tenant
+
+    async def _delete_points(self, chunk_ids: list[str]) -> None:
+        from qdrant_client.models import PointIdsList
+
+        await self._client.delete(
+            collection_name=self._config.collection_knowledge,
+            points_selector=PointIdsList(points=chunk_ids),
+        )
+
     async def get_chunk(
-        self, chunk_id: str, tenant_id: str
+        self,
+        chunk_id: str,
+        tenant_id: str,
+        payload_fields: Sequence[str] | None = None,
     ) -> KnowledgeChunk | None:
         """Retrieve a single chunk by ID with tenant isolation guard.
 
         Args:
             chunk_id: The chunk's unique identifier.
             tenant_id: Expected owning tenant ID.
+            payload_fields: Optional payload projection (tenant_id is always
+                fetched for the isolation guard); the rest take defaults.
 
         Returns:
             KnowledgeChunk if found and belongs to tenant, None otherwise.
         """
-        results = self._client.retrieve(
+        if payload_fields is not None and "tenant_id" not in payload_fields:
+            payload_fields = [*payload_fields, "tenant_id"]
+
+        results = await self._client.retrieve(
             collection_name=self._config.collection_knowledge,
             ids=[chunk_id],
+            with_payload=self._payload_selector(payload_fields),
         )
 
         if not results:
@@ -437,8 +926,9 @@ class QdrantKnowledgeStore:
         point = results[0]
         payload = point.payload or {}
 
-        # Tenant isolation guard
-        if payload.get("tenant_id") != tenant_id:
+        # Tenant isolation guard (shared static content is readable by all)
+        owner = payload.get("tenant_id")
+        if owner != tenant_id and (owner is None or owner != self._shared_tenant_id):
             logger.warning(
                 "Tenant isolation violation: chunk %s belongs to %s, requested by %s",
                 chunk_id,
@@ -447,28 +937,8 @@ class QdrantKnowledgeStore:
             )
             return None
 
-        valid_until_raw = payload.get("valid_until")
-        return KnowledgeChunk(
-            id=str(point.id),
-            tenant_id=payload.get("tenant_id", tenant_id),
-            content=payload.get("content", ""),
-            metadata=ChunkMetadata(
-                product_category=payload.get("product_category", "monetization"),
-                buyer_persona=payload.get("buyer_persona", []),
-                sales_stage=payload.get("sales_stage", []),
-                region=payload.get("region", []),
-                content_type=payload.get("content_type", "product"),
-                source_document=payload.get("source_document", ""),
-                version=payload.get("version", 1),
-                valid_from=payload.get("valid_from", datetime.now(timezone.utc).isoformat()),
-                valid_until=valid_until_raw,
-                is_current=payload.get("is_current", True),
-                cross_references=payload.get("cross_references", []),
-            ),
-            created_at=payload.get("created_at", datetime.now(timezone.utc).isoformat()),
-            updated_at=payload.get("updated_at", datetime.now(timezone.utc).isoformat()),
-        )
+        return self._point_to_chunk(point, tenant_id)
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Close the Qdrant client connection."""
-        self._client.close()
+        await self._client.close()
@@ -11,7 +11,12 @@ Components:
 """
 
 from src.knowledge.rag.decomposer import QueryDecomposer, SubQuery
-from src.knowledge.rag.pipeline import AgenticRAGPipeline, RAGResponse, RAGState
+from src.knowledge.rag.pipeline import (
+    AgenticRAGPipeline,
+    RAGResponse,
+    RAGState,
+    RAGStreamEvent,
+)
 from src.knowledge.rag.retriever import MultiSourceRetriever, RetrievedChunk
 from src.knowledge.rag.synthesizer import (
     ResponseSynthesizer,
@@ -25,6 +30,7 @@ __all__ = [
     "QueryDecomposer",
     "RAGResponse",
     "RAGState",
+    "RAGStreamEvent",
     "ResponseSynthesizer",
     "RetrievedChunk",
     "SourceCitation",
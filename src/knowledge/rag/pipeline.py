@@ -7,13 +7,34 @@ The pipeline supports iterative retrieval: if document grading determines
 that >50% of retrieved chunks are irrelevant, the query is rewritten and
 retrieval is retried, up to max_iterations times.
 
+Grading runs in one of two modes, chosen per pipeline:
+- "per_chunk": one yes/no LLM call per chunk, run concurrently up to
+  grading_concurrency calls at a time (1 reproduces sequential grading).
+- "batch": a single structured LLM call grades every chunk at once and
+  returns a verdict per document ID. Falls back to per_chunk grading if the
+  call fails or its output cannot be parsed.
+
+run_stream() executes the same flow but yields RAGStreamEvent records as it
+goes -- sub-queries and candidate sources first, then answer tokens as the
+synthesis LLM produces them, then a final record with citations and
+confidence -- so callers can show the first token without waiting for the
+full answer.
+
+When an answer cache (SemanticAnswerCache) is supplied, near-duplicate
+queries from the same tenant with the same base filters return the stored
+RAGResponse without running the pipeline. Calls with conversation context
+bypass the cache, since their answers depend on the conversation.
+
 All operations are tenant-scoped and track iteration count for observability.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +50,17 @@ Query: {query}
 Document: {document}
 Answer with ONLY "yes" or "no"."""
 
+BATCH_GRADING_PROMPT = """For each document below, decide whether it is relevant to the query.
+Query: {query}
+
+Documents:
+{documents}
+
+Return ONLY a JSON object mapping every document ID to "yes" or "no",
+for example {{"1": "yes", "2": "no"}}. No explanation."""
+
+GradingMode = Literal["per_chunk", "batch"]
+
 REWRITE_PROMPT = """The following query did not retrieve relevant results.
 Rewrite it to improve retrieval from a sales knowledge base.
 
@@ -56,6 +88,26 @@ class RAGResponse(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0, default=0.0)
 
 
+class RAGStreamEvent(BaseModel):
+    """A single event emitted by AgenticRAGPipeline.run_stream().
+
+    Event types, in emission order:
+    - "sub_queries": data={"sub_queries": [...]} -- the decomposed queries.
+    - "sources": data={"sources": [...]} -- the chunks the answer will be
+      synthesized from, numbered as they will be cited ([N]).
+    - "token": data={"text": "..."} -- a piece of answer text (repeated).
+    - "done": data={"answer", "sources", "iterations", "confidence"} -- the
+      full answer, the sources it actually cited, and confidence.
+
+    Attributes:
+        type: Event type.
+        data: JSON-serializable event payload.
+    """
+
+    type: Literal["sub_queries", "sources", "token", "done"]
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
 class RAGState(BaseModel):
     """Internal state for the RAG pipeline execution.
 
@@ -90,6 +142,11 @@ class AgenticRAGPipeline:
         synthesizer: ResponseSynthesizer for producing grounded answers.
         grading_llm: LLM for document relevance grading.
         max_iterations: Maximum number of retrieve-grade cycles.
+        grading_mode: "per_chunk" (one call per chunk) or "batch" (one
+            structured call for all chunks).
+        grading_concurrency: Maximum per-chunk grading calls in flight.
+        answer_cache: Optional SemanticAnswerCache (usually
+            QdrantKnowledgeStore.answer_cache) for near-duplicate queries.
     """
 
     def __init__(
@@ -99,12 +156,20 @@ class AgenticRAGPipeline:
         synthesizer: ResponseSynthesizer,
         grading_llm: Any,
         max_iterations: int = 2,
+        grading_mode: GradingMode = "per_chunk",
+        grading_concurrency: int = 4,
+        answer_cache: Any = None,
     ) -> None:
+        if grading_mode not in ("per_chunk", "batch"):
+            raise ValueError(f"Unknown grading_mode: {grading_mode!r}")
         self._decomposer = decomposer
         self._retriever = retriever
         self._synthesizer = synthesizer
         self._grading_llm = grading_llm
         self._max_iterations = max_iterations
+        self._grading_mode = grading_mode
+        self._grading_concurrency = max(1, grading_concurrency)
+        self._answer_cache = answer_cache
 
     async def run(
         self,
@@ -125,6 +190,193 @@ class AgenticRAGPipeline:
         Returns:
             RAGResponse with answer, sources, sub-queries, and metadata.
         """
+        use_cache = self._answer_cache is not None and not conversation_context
+        if use_cache:
+            cached = await self._cached_response(query, tenant_id, base_filters)
+            if cached is not None:
+                return cached
+
+        state = await self._prepare(query, tenant_id, conversation_context, base_filters)
+
+        # Step 5: Synthesize
+        synthesized = await self._synthesizer.synthesize(
+            query=query,
+            chunks=state.relevant_chunks,
+            relevance_ratio=self._synthesis_relevance_ratio(state),
+        )
+
+        response = RAGResponse(
+            answer=synthesized.answer,
+            sources=synthesized.sources,
+            sub_queries=state.sub_queries,
+            iterations=state.iterations,
+            confidence=synthesized.confidence,
+        )
+        if use_cache:
+            await self._cache_response(query, state, response, base_filters)
+        return response
+
+    async def run_stream(
+        self,
+        query: str,
+        tenant_id: str,
+        conversation_context: list[ConversationMessage] | None = None,
+        base_filters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[RAGStreamEvent]:
+        """Execute the pipeline, streaming progress and answer tokens.
+
+        Decomposition, retrieval and grading run exactly as in run(); the
+        sub-queries and sources are emitted as soon as grading settles, then
+        the answer is streamed token by token from the synthesis LLM.
+
+        Args:
+            query: The user's natural language query.
+            tenant_id: Tenant scope for all operations.
+            conversation_context: Optional conversation history for context.
+            base_filters: Optional filters merged into every sub-query.
+
+        Yields:
+            RAGStreamEvent records: sub_queries, sources, token (repeated), done.
+            A cache hit yields the whole cached answer as a single token.
+
+        Raises:
+            Exception: If the synthesis stream fails after tokens were sent;
+                no done event is emitted and nothing is cached.
+        """
+        use_cache = self._answer_cache is not None and not conversation_context
+        if use_cache:
+            cached = await self._cached_response(query, tenant_id, base_filters)
+            if cached is not None:
+                for event in self._cached_events(cached):
+                    yield event
+                return
+
+        state = await self._prepare(query, tenant_id, conversation_context, base_filters)
+
+        yield RAGStreamEvent(
+            type="sub_queries",
+            data={"sub_queries": [sq.model_dump() for sq in state.sub_queries]},
+        )
+        yield RAGStreamEvent(
+            type="sources",
+            data={
+                "sources": [
+                    SourceCitation(
+                        citation_id=i,
+                        chunk_id=chunk.chunk_id,
+                        source_document=chunk.source_document,
+                        content_snippet=chunk.content[:150],
+                    ).model_dump()
+                    for i, chunk in enumerate(state.relevant_chunks, start=1)
+                ]
+            },
+        )
+
+        pieces: list[str] = []
+        async for text in self._synthesizer.stream_answer(query, state.relevant_chunks):
+            pieces.append(text)
+            yield RAGStreamEvent(type="token", data={"text": text})
+
+        synthesized = self._synthesizer.finalize(
+            "".join(pieces),
+            state.relevant_chunks,
+            relevance_ratio=self._synthesis_relevance_ratio(state),
+        )
+        yield RAGStreamEvent(
+            type="done",
+            data={
+                "answer": synthesized.answer,
+                "sources": [c.model_dump() for c in synthesized.sources],
+                "iterations": state.iterations,
+                "confidence": synthesized.confidence,
+            },
+        )
+
+        if use_cache:
+            response = RAGResponse(
+                answer=synthesized.answer,
+                sources=synthesized.sources,
+                sub_queries=state.sub_queries,
+                iterations=state.iterations,
+                confidence=synthesized.confidence,
+            )
+            await self._cache_response(query, state, response, base_filters)
+
+    async def _cached_response(
+        self,
+        query: str,
+        tenant_id: str,
+        base_filters: dict[str, Any] | None,
+    ) -> RAGResponse | None:
+        """Return a cached answer for a near-duplicate query, if any."""
+        cached = await self._answer_cache.lookup(query, tenant_id, base_filters)
+        if cached is None:
+            return None
+        try:
+            return RAGResponse.model_validate(cached)
+        except ValueError:
+            logger.warning("Discarding malformed cached answer for tenant %s", tenant_id)
+            return None
+
+    async def _cache_response(
+        self,
+        query: str,
+        state: RAGState,
+        response: RAGResponse,
+        base_filters: dict[str, Any] | None,
+    ) -> None:
+        """Cache an answer unless nothing was retrieved to ground it.
+
+        Answers with no retrieved chunks are not cached: the next ingestion
+        may make them answerable, and nothing would invalidate the entry.
+        """
+        if not state.retrieved_chunks:
+            return
+        await self._answer_cache.store(
+            query=query,
+            tenant_id=state.tenant_id,
+            response=response,
+            chunk_ids=[c.chunk_id for c in state.relevant_chunks],
+            source_documents=[
+                c.source_document for c in state.relevant_chunks if c.source_document
+            ],
+            filters=base_filters,
+        )
+
+    @staticmethod
+    def _cached_events(response: RAGResponse) -> list[RAGStreamEvent]:
+        """Replay a cached RAGResponse as a run_stream() event sequence."""
+        sources = [c.model_dump() for c in response.sources]
+        return [
+            RAGStreamEvent(
+                type="sub_queries",
+                data={"sub_queries": [sq.model_dump() for sq in response.sub_queries]},
+            ),
+            RAGStreamEvent(type="sources", data={"sources": sources}),
+            RAGStreamEvent(type="token", data={"text": response.answer}),
+            RAGStreamEvent(
+                type="done",
+                data={
+                    "answer": response.answer,
+                    "sources": sources,
+                    "iterations": response.iterations,
+                    "confidence": response.confidence,
+                },
+            ),
+        ]
+
+    async def _prepare(
+        self,
+        query: str,
+        tenant_id: str,
+        conversation_context: list[ConversationMessage] | None,
+        base_filters: dict[str, Any] | None,
+    ) -> RAGState:
+        """Run decompose and the retrieve-grade-rewrite loop (steps 1-4).
+
+        Returns:
+            State whose relevant_chunks are the chunks to synthesize from.
+        """
         state = RAGState(
             query=query,
             tenant_id=tenant_id,
@@ -163,21 +415,7 @@ class AgenticRAGPipeline:
         if not state.relevant_chunks:
             state.relevant_chunks = state.retrieved_chunks
 
-        # Step 5: Synthesize
-        relevant_ratio = self._relevance_ratio(state)
-        synthesized = await self._synthesizer.synthesize(
-            query=query,
-            chunks=state.relevant_chunks,
-            relevance_ratio=relevant_ratio if state.retrieved_chunks else None,
-        )
-
-        return RAGResponse(
-            answer=synthesized.answer,
-            sources=synthesized.sources,
-            sub_queries=state.sub_queries,
-            iterations=state.iterations,
-            confidence=synthesized.confidence,
-        )
+        return state
 
     async def _decompose(self, state: RAGState) -> RAGState:
         """Decompose the query into sub-queries.
@@ -213,11 +451,17 @@ class AgenticRAGPipeline:
 
     async def _grade(self, state: RAGState) -> RAGState:
         """Grade each retrieved chunk for relevance to the query."""
+        chunks = state.retrieved_chunks
+        verdicts: list[bool] | None = None
+
+        if chunks and self._grading_mode == "batch":
+            verdicts = await self._grade_batch(state.query, chunks)
+        if verdicts is None:
+            verdicts = await self._grade_per_chunk(state.query, chunks)
+
         relevant: list[RetrievedChunk] = []
         irrelevant: list[RetrievedChunk] = []
-
-        for chunk in state.retrieved_chunks:
-            is_relevant = await self._grade_chunk(state.query, chunk)
+        for chunk, is_relevant in zip(chunks, verdicts, strict=True):
             if is_relevant:
                 relevant.append(chunk)
             else:
@@ -227,13 +471,91 @@ class AgenticRAGPipeline:
         state.irrelevant_chunks = irrelevant
 
         logger.info(
-            "Grading complete: %d relevant, %d irrelevant (iteration %d)",
+            "Grading complete: %d relevant, %d irrelevant (iteration %d, mode %s)",
             len(relevant),
             len(irrelevant),
             state.iterations,
+            self._grading_mode,
         )
         return state
 
+    async def _grade_per_chunk(
+        self, query: str, chunks: list[RetrievedChunk]
+    ) -> list[bool]:
+        """Grade chunks with one LLM call each, bounded by grading_concurrency."""
+        semaphore = asyncio.Semaphore(self._grading_concurrency)
+
+        async def grade(chunk: RetrievedChunk) -> bool:
+            async with semaphore:
+                return await self._grade_chunk(query, chunk)
+
+        return list(await asyncio.gather(*(grade(chunk) for chunk in chunks)))
+
+    async def _grade_batch(
+        self, query: str, chunks: list[RetrievedChunk]
+    ) -> list[bool] | None:
+        """Grade all chunks in a single structured LLM call.
+
+        Documents are numbered 1..N in the prompt to keep IDs short. IDs
+        missing from an otherwise valid response are treated as relevant,
+        matching the fail-open behaviour of per-chunk grading.
+
+        Args:
+            query: The user's query.
+            chunks: Retrieved chunks to grade.
+
+        Returns:
+            Verdicts aligned with chunks, or None if the call failed or the
+            response could not be parsed (caller falls back to per-chunk).
+        """
+        documents = "\n\n".join(
+            f"[{i}] {chunk.content[:500]}" for i, chunk in enumerate(chunks, start=1)
+        )
+        prompt = BATCH_GRADING_PROMPT.format(query=query, documents=documents)
+
+        try:
+            response = await self._grading_llm.ainvoke(prompt)
+        except Exception:
+            logger.warning("Batch grading failed, falling back to per-chunk grading")
+            return None
+
+        parsed = self._parse_batch_grades(response)
+        if parsed is None:
+            logger.warning("Unparseable batch grading response, falling back to per-chunk grading")
+            return None
+
+        return [parsed.get(str(i), True) for i in range(1, len(chunks) + 1)]
+
+    @staticmethod
+    def _parse_batch_grades(response: str) -> dict[str, bool] | None:
+        """Parse a {"<id>": "yes"|"no"} JSON object from the grading LLM.
+
+        Boolean values are accepted as well as yes/no strings.
+
+        Returns:
+            Mapping of document ID to verdict, or None if parsing fails.
+        """
+        text = response.strip()
+        start = text.find("{")
+        end = text.rfind("}") + 1
+        if start == -1 or end == 0:
+            return None
+
+        try:
+            data = json.loads(text[start:end])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        grades: dict[str, bool] = {}
+        for key, value in data.items():
+            if isinstance(value, bool):
+                grades[str(key).strip("[] ")] = value
+            elif isinstance(value, str):
+                grades[str(key).strip("[] ")] = value.strip().lower().startswith("yes")
+        return grades
+
     async def _grade_chunk(self, query: str, chunk: RetrievedChunk) -> bool:
         """Grade a single chunk for relevance.
 
@@ -281,6 +603,11 @@ class AgenticRAGPipeline:
 
         return state
 
+    @classmethod
+    def _synthesis_relevance_ratio(cls, state: RAGState) -> float | None:
+        """Relevance ratio passed to synthesis (None when nothing was retrieved)."""
+        return cls._relevance_ratio(state) if state.retrieved_chunks else None
+
     @staticmethod
     def _relevance_ratio(state: RAGState) -> float:
         """Calculate the ratio of relevant chunks to total retrieved chunks."""
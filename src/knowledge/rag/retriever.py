@@ -4,11 +4,21 @@ Fetches knowledge chunks from multiple sources (product knowledge, methodology,
 regional content, conversation history) based on decomposed sub-queries.
 Results are merged, deduplicated by chunk ID, and ranked by relevance score.
 
+Sub-queries are embedded together in one embed_batch call, knowledge-base
+sub-queries go to Qdrant as a single batch query (fetching only the payload
+fields needed, as slim KnowledgeHit results), and conversation searches
+run concurrently under a bounded semaphore. Qdrant's scores are on
+different scales per source (rank-based RRF for hybrid search, raw cosine
+for conversations), so each sub-query's hits are min-max normalized to
+0.0-1.0 before merging: a chunk's relevance score says how it ranks among
+its own sub-query's hits, which is comparable across sources.
+
 All operations are tenant-scoped to enforce multi-tenant isolation.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -42,14 +52,17 @@ class RetrievedChunk(BaseModel):
 class MultiSourceRetriever:
     """Retrieves and merges chunks from multiple knowledge sources.
 
-    Executes each sub-query against the appropriate store (knowledge base
-    or conversation store), deduplicates results by chunk ID, and returns
-    the top_k most relevant chunks.
+    Executes all sub-queries against the appropriate store (knowledge base
+    or conversation store) concurrently, deduplicates results by chunk ID,
+    and returns the top_k most relevant chunks.
 
     Args:
         knowledge_store: QdrantKnowledgeStore for product/methodology/regional.
         conversation_store: ConversationStore for conversation history.
         top_k: Maximum number of results to return.
+        embedder: Optional EmbeddingService used to embed every sub-query in
+            one batch. Without it, each store embeds its own queries.
+        max_concurrency: Maximum conversation searches in flight at once.
     """
 
     def __init__(
@@ -57,10 +70,14 @@ class MultiSourceRetriever:
         knowledge_store: Any,
         conversation_store: Any,
         top_k: int = 7,
+        embedder: Any = None,
+        max_concurrency: int = 4,
     ) -> None:
         self._knowledge_store = knowledge_store
         self._conversation_store = conversation_store
         self._top_k = top_k
+        self._embedder = embedder
+        self._max_concurrency = max_concurrency
 
     @property
     def top_k(self) -> int:
@@ -74,9 +91,12 @@ class MultiSourceRetriever:
     ) -> list[RetrievedChunk]:
         """Retrieve chunks for all sub-queries, merge and deduplicate.
 
-        For each sub-query:
-        - "conversation" source_type -> searches conversation store
-        - All others -> searches knowledge base with metadata filters
+        - All sub-query texts are embedded in one batch (when an embedder
+          is configured)
+        - "conversation" sub-queries search the conversation store
+          concurrently, bounded by max_concurrency
+        - All other sub-queries search the knowledge base in one batch
+          request with their metadata filters
 
         Args:
             sub_queries: Decomposed sub-queries with source types and filters.
@@ -85,13 +105,40 @@ class MultiSourceRetriever:
         Returns:
             Deduplicated list of RetrievedChunk objects, limited to top_k.
         """
-        all_chunks: list[RetrievedChunk] = []
+        if not sub_queries:
+            return []
 
-        for sq in sub_queries:
-            if sq.source_type == "conversation":
-                chunks = await self._retrieve_conversations(sq, tenant_id)
-            else:
-                chunks = await self._retrieve_knowledge(sq, tenant_id)
+        vectors = await self._embed_sub_queries(sub_queries)
+
+        knowledge_indices = [
+            i for i, sq in enumerate(sub_queries) if sq.source_type != "conversation"
+        ]
+        conversation_indices = [
+            i for i, sq in enumerate(sub_queries) if sq.source_type == "conversation"
+        ]
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks = []
+        if knowledge_indices:
+            tasks.append(
+                self._retrieve_knowledge(
+                    [sub_queries[i] for i in knowledge_indices],
+                    tenant_id,
+                    [vectors[i] for i in knowledge_indices] if vectors else None,
+                )
+            )
+        for i in conversation_indices:
+            tasks.append(
+                self._retrieve_conversations(
+                    sub_queries[i],
+                    tenant_id,
+                    vectors[i][0] if vectors else None,
+                    semaphore,
+                )
+            )
+
+        all_chunks: list[RetrievedChunk] = []
+        for chunks in await asyncio.gather(*tasks):
             all_chunks.extend(chunks)
 
         # Deduplicate by chunk_id, keeping highest relevance score
@@ -102,80 +149,121 @@ class MultiSourceRetriever:
 
         return deduplicated[: self._top_k]
 
+    async def _embed_sub_queries(
+        self, sub_queries: list[SubQuery]
+    ) -> list[tuple[list[float], dict]] | None:
+        """Embed every sub-query text in a single batch call.
+
+        Returns:
+            (dense, sparse) vectors aligned with sub_queries, or None when no
+            embedder is configured or embedding fails (stores then embed
+            their own queries).
+        """
+        if self._embedder is None:
+            return None
+
+        try:
+            return await self._embedder.embed_batch([sq.query for sq in sub_queries])
+        except Exception:
+            logger.warning(
+                "Batch sub-query embedding failed, stores will embed individually",
+                exc_info=True,
+            )
+            return None
+
     async def _retrieve_knowledge(
-        self, sub_query: SubQuery, tenant_id: str
+        self,
+        sub_queries: list[SubQuery],
+        tenant_id: str,
+        vectors: list[tuple[list[float], dict]] | None = None,
     ) -> list[RetrievedChunk]:
-        """Retrieve from the knowledge base using hybrid search.
+        """Retrieve from the knowledge base with one batched hybrid search.
 
         Args:
-            sub_query: Sub-query with filters for metadata-scoped retrieval.
+            sub_queries: Knowledge sub-queries with metadata filters.
             tenant_id: Tenant scope.
+            vectors: Optional precomputed query vectors aligned with sub_queries.
 
         Returns:
             List of RetrievedChunk objects from knowledge base.
         """
         try:
-            results = await self._knowledge_store.hybrid_search(
-                query_text=sub_query.query,
+            batch_results = await self._knowledge_store.search_hits_batch(
+                queries=[(sq.query, sq.filters if sq.filters else None) for sq in sub_queries],
                 tenant_id=tenant_id,
-                filters=sub_query.filters if sub_query.filters else None,
                 top_k=self._top_k,
+                query_vectors=vectors,
             )
 
             chunks: list[RetrievedChunk] = []
-            for i, chunk in enumerate(results):
-                chunks.append(
-                    RetrievedChunk(
-                        chunk_id=chunk.id,
-                        content=chunk.content,
-                        relevance_score=self._position_score(i),
-                        source_type=sub_query.source_type,
-                        source_document=chunk.metadata.source_document,
-                        sub_query=sub_query.query,
+            for sub_query, hits in zip(sub_queries, batch_results, strict=True):
+                chunks.extend(
+                    self._normalize_scores(
+                        [
+                            RetrievedChunk(
+                                chunk_id=hit.id,
+                                content=hit.content,
+                                relevance_score=hit.score,
+                                source_type=sub_query.source_type,
+                                source_document=hit.source_document,
+                                sub_query=sub_query.query,
+                            )
+                            for hit in hits
+                        ]
                     )
                 )
             return chunks
 
         except Exception:
             logger.warning(
-                "Knowledge retrieval failed for sub-query: %s",
-                sub_query.query,
+                "Knowledge retrieval failed for sub-queries: %s",
+                [sq.query for sq in sub_queries],
                 exc_info=True,
             )
             return []
 
     async def _retrieve_conversations(
-        self, sub_query: SubQuery, tenant_id: str
+        self,
+        sub_query: SubQuery,
+        tenant_id: str,
+        query_vector: list[float] | None = None,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[RetrievedChunk]:
         """Retrieve from conversation history using semantic search.
 
         Args:
             sub_query: Sub-query targeting conversation history.
             tenant_id: Tenant scope.
+            query_vector: Optional precomputed dense query embedding.
+            semaphore: Optional semaphore bounding concurrent searches.
 
         Returns:
             List of RetrievedChunk objects from conversation history.
         """
         try:
-            results = await self._conversation_store.search_conversations(
-                tenant_id=tenant_id,
-                query=sub_query.query,
-                top_k=self._top_k,
-            )
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._max_concurrency)
+            async with semaphore:
+                results = await self._conversation_store.search_conversations_scored(
+                    tenant_id=tenant_id,
+                    query=sub_query.query,
+                    top_k=self._top_k,
+                    query_vector=query_vector,
+                )
 
             chunks: list[RetrievedChunk] = []
-            for i, msg in enumerate(results):
+            for msg, score in results:
                 chunks.append(
                     RetrievedChunk(
                         chunk_id=msg.id,
                         content=msg.content,
-                        relevance_score=self._position_score(i),
+                        relevance_score=score,
                         source_type="conversation",
                         source_document=f"conversation:{msg.session_id}",
                         sub_query=sub_query.query,
                     )
                 )
-            return chunks
+            return self._normalize_scores(chunks)
 
         except Exception:
             logger.warning(
@@ -186,20 +274,25 @@ class MultiSourceRetriever:
             return []
 
     @staticmethod
-    def _position_score(index: int, decay: float = 0.1) -> float:
-        """Calculate a decaying relevance score based on result position.
-
-        Results earlier in the list get higher scores, decaying by
-        the specified amount per position.
+    def _normalize_scores(chunks: list[RetrievedChunk]) -> list[RetrievedChunk]:
+        """Min-max scale one sub-query's scores to 0.0-1.0 (all 1.0 when tied).
 
         Args:
-            index: Zero-based position in the result list.
-            decay: Score reduction per position.
+            chunks: Hits of a single sub-query from a single source.
 
         Returns:
-            Float between 0.1 and 1.0.
+            The chunks with rescaled relevance scores, in the same order.
         """
-        return max(0.1, min(1.0, 1.0 - (index * decay)))
+        if not chunks:
+            return chunks
+        low = min(c.relevance_score for c in chunks)
+        span = max(c.relevance_score for c in chunks) - low
+        return [
+            c.model_copy(
+                update={"relevance_score": (c.relevance_score - low) / span if span else 1.0}
+            )
+            for c in chunks
+        ]
 
     @staticmethod
     def _deduplicate(chunks: list[RetrievedChunk]) -> list[RetrievedChunk]:
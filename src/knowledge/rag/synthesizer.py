@@ -6,12 +6,17 @@ is mapped to source citations for traceability.
 
 The synthesizer also computes a confidence score based on the ratio of
 relevant chunks to total chunks provided.
+
+stream_answer() yields the answer incrementally when the LLM exposes an
+async astream(prompt) method; finalize() then turns the accumulated text
+into the same SynthesizedResponse that synthesize() returns.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -77,7 +82,8 @@ class ResponseSynthesizer:
     them back to source chunks.
 
     Args:
-        llm: LLM instance with an async ainvoke(prompt) method.
+        llm: LLM instance with an async ainvoke(prompt) method and, for
+            streaming, an optional async astream(prompt) generator.
     """
 
     def __init__(self, llm: Any) -> None:
@@ -100,27 +106,84 @@ class ResponseSynthesizer:
             SynthesizedResponse with answer, citations, and confidence.
         """
         if not chunks:
-            return SynthesizedResponse(
-                answer=NO_SOURCES_RESPONSE,
-                sources=[],
-                confidence=0.0,
-            )
+            return self.finalize(NO_SOURCES_RESPONSE, chunks, relevance_ratio)
 
-        # Build numbered source list for the prompt
-        source_texts = []
-        for i, chunk in enumerate(chunks, 1):
-            source_texts.append(
-                f"[{i}] (Source: {chunk.source_document})\n{chunk.content}"
-            )
+        try:
+            answer = await self._llm.ainvoke(self._build_prompt(query, chunks))
+        except Exception:
+            logger.warning("LLM synthesis failed", exc_info=True)
+            answer = NO_SOURCES_RESPONSE
 
-        sources_str = "\n\n".join(source_texts)
-        prompt = SYNTHESIS_PROMPT.format(query=query, sources=sources_str)
+        return self.finalize(answer, chunks, relevance_ratio)
+
+    async def stream_answer(
+        self,
+        query: str,
+        chunks: list[RetrievedChunk],
+    ) -> AsyncIterator[str]:
+        """Stream the synthesized answer text as the LLM produces it.
+
+        Uses the LLM's astream(prompt) when available (plain strings or
+        message chunks with a .content attribute), otherwise yields the full
+        ainvoke() result as a single piece. If streaming fails before any
+        text is produced, falls back to ainvoke(); if it fails after, the
+        error is re-raised so a truncated answer is never taken as complete.
+
+        Args:
+            query: The original user query.
+            chunks: Retrieved and graded chunks to synthesize from.
+
+        Yields:
+            Pieces of answer text in order; concatenated they form the answer.
+
+        Raises:
+            Exception: The stream's error, when it fails mid-answer.
+        """
+        if not chunks:
+            yield NO_SOURCES_RESPONSE
+            return
+
+        prompt = self._build_prompt(query, chunks)
+        produced = False
+
+        astream = getattr(self._llm, "astream", None)
+        if astream is not None:
+            try:
+                async for piece in astream(prompt):
+                    text = piece if isinstance(piece, str) else getattr(piece, "content", "")
+                    if text:
+                        produced = True
+                        yield text
+                return
+            except Exception:
+                if produced:
+                    raise
+                logger.warning("LLM synthesis stream failed", exc_info=True)
 
         try:
-            answer = await self._llm.ainvoke(prompt)
+            yield await self._llm.ainvoke(prompt)
         except Exception:
             logger.warning("LLM synthesis failed", exc_info=True)
-            answer = NO_SOURCES_RESPONSE
+            yield NO_SOURCES_RESPONSE
+
+    def finalize(
+        self,
+        answer: str,
+        chunks: list[RetrievedChunk],
+        relevance_ratio: float | None = None,
+    ) -> SynthesizedResponse:
+        """Build the SynthesizedResponse for a completed answer.
+
+        Args:
+            answer: The full answer text.
+            chunks: The chunks the answer was synthesized from.
+            relevance_ratio: Optional pre-computed relevance ratio for confidence.
+
+        Returns:
+            SynthesizedResponse with citations and confidence.
+        """
+        if not chunks:
+            return SynthesizedResponse(answer=answer, sources=[], confidence=0.0)
 
         # Extract citations from the answer
         citations = self._extract_citations(answer, chunks)
@@ -138,6 +201,18 @@ class ResponseSynthesizer:
             confidence=confidence,
         )
 
+    @staticmethod
+    def _build_prompt(query: str, chunks: list[RetrievedChunk]) -> str:
+        """Build the synthesis prompt with a numbered source list."""
+        source_texts = []
+        for i, chunk in enumerate(chunks, 1):
+            source_texts.append(
+                f"[{i}] (Source: {chunk.source_document})\n{chunk.content}"
+            )
+
+        sources_str = "\n\n".join(source_texts)
+        return SYNTHESIS_PROMPT.format(query=query, sources=sources_str)
+
     @staticmethod
     def _extract_citations(
         answer: str, chunks: list[RetrievedChunk]
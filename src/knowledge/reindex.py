@@ -0,0 +1,587 @@
+"""Zero-downtime reindexing of the knowledge_base collection.
+
+Changing the embedding model, the dimensions or the knowledge collection
+profile means every chunk has to be re-embedded. Doing that in place would
+leave hybrid_search serving a half-populated collection, so the reindex job
+builds a shadow collection instead:
+
+1. Create knowledge_base_v{N+1} with the store's current settings next to
+   the collection the knowledge_base alias points at.
+2. Scroll the live collection and re-embed the stored chunk content in
+   batches, several batches in flight at once, upserting each point into
+   the shadow collection under the same ID with the same payload.
+3. Reconcile chunks written or deleted by live ingestion during the copy,
+   then verify the point count of every tenant matches.
+4. Swap the alias to the shadow collection in one atomic alias operation.
+
+Searches keep using the alias throughout and never see the shadow
+collection until it is complete. The previous collection is kept for
+rollback (point the alias back) unless drop_previous is set.
+
+A deployment from before aliases has a plain collection under the alias
+name. It has to be deleted before the alias can be created, so this
+one-time cutover is not zero-downtime: searches fail between the delete
+and the alias creation. Unless drop_previous is set, the plain collection
+is first copied as-is (vectors included) into knowledge_base_v0 to keep a
+rollback copy. The checkpoint records the cutover before the delete, so a
+job that dies in between only creates the alias when rerun.
+
+Progress is checkpointed to a JSON state file after every wave of batches,
+so a job killed midway resumes from the last scroll offset instead of
+starting over; re-upserting the in-flight wave is harmless because points
+are keyed by chunk ID. max_points_per_second and concurrency throttle the
+job so it does not starve live embedding and search traffic.
+
+Payload edits to chunks that were already copied (e.g. a document update
+that rewrites an existing chunk's payload) are not replayed; run the job
+while ingestion is quiet, or rerun it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    Record,
+    SparseVector,
+)
+
+from src.knowledge.qdrant_client import (
+    QdrantKnowledgeStore,
+    collection_version,
+    versioned_collection_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on distinct tenants counted per collection during verification
+MAX_TENANTS = 100_000
+
+
+class ReindexError(Exception):
+    """The reindex could not complete; the alias was not swapped."""
+
+
+class ReindexState(BaseModel):
+    """Checkpoint of a reindex job, persisted between waves.
+
+    Attributes:
+        alias: Alias being reindexed (config.collection_knowledge).
+        source: Physical collection the alias pointed at when the job started.
+        target: Shadow collection being built.
+        offset: Next scroll offset in the source (None before the first wave).
+        copied: Points re-embedded and written to the target so far.
+        copy_done: The full scroll of the source has been copied.
+        cutover: Deletion of a plain source collection has started (see
+            the module docstring); the source may no longer exist.
+        tenant_counts: Verified point count per tenant, recorded before a
+            cutover so a resumed job can check the target without the source.
+        started_at: When the job was first started.
+    """
+
+    alias: str
+    source: str
+    target: str
+    offset: int | str | None = None
+    copied: int = 0
+    copy_done: bool = False
+    cutover: bool = False
+    tenant_counts: dict[str, int] = Field(default_factory=dict)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+@dataclass
+class ReindexReport:
+    """Outcome of a reindex run.
+
+    Attributes:
+        source: Collection the alias pointed at before the swap.
+        target: Collection the alias points at after the swap.
+        copied: Points copied by the bulk scroll (across resumed runs).
+        reconciled: Points added or removed afterwards to match live writes.
+        tenant_counts: Verified point count per tenant.
+        resumed: Whether the run continued from a saved checkpoint.
+        swapped: Whether the alias was swapped (False for a dry run).
+        cutover: The source was a plain pre-alias collection, replaced by
+            the alias (with a brief outage) if swapped.
+        rollback: Collection holding the previous data after the swap, or
+            None if it was dropped.
+        seconds: Wall-clock duration of this run.
+    """
+
+    source: str
+    target: str
+    copied: int = 0
+    reconciled: int = 0
+    tenant_counts: dict[str, int] = field(default_factory=dict)
+    resumed: bool = False
+    swapped: bool = False
+    cutover: bool = False
+    rollback: str | None = None
+    seconds: float = 0.0
+
+
+class KnowledgeReindexer:
+    """Rebuild the aliased knowledge collection into a new version and swap.
+
+    The store supplies the target settings: its embedding service decides
+    the model and dimensions the content is re-embedded with, and its
+    knowledge profile the storage of the new collection. Build it from the
+    new configuration; the collection currently behind the alias is read
+    without looking at its vectors.
+
+    Args:
+        store: Knowledge store configured with the target settings.
+        state_path: JSON checkpoint file (resumes from it if present).
+        batch_size: Points scrolled and embedded per batch.
+        concurrency: Batches embedded and upserted concurrently per wave.
+        max_points_per_second: Throughput cap (None = unthrottled).
+        drop_previous: Delete the old collection after a successful swap.
+    """
+
+    def __init__(
+        self,
+        store: QdrantKnowledgeStore,
+        state_path: str | Path,
+        batch_size: int = 128,
+        concurrency: int = 4,
+        max_points_per_second: float | None = None,
+        drop_previous: bool = False,
+    ) -> None:
+        self._store = store
+        self._client = store.client
+        self._alias = store._config.collection_knowledge
+        self._state_path = Path(state_path)
+        self._batch_size = batch_size
+        self._concurrency = max(1, concurrency)
+        self._max_points_per_second = max_points_per_second
+        self._drop_previous = drop_previous
+
+    async def run(self, swap: bool = True) -> ReindexReport:
+        """Build (or finish building) the shadow collection, verify, then swap.
+
+        Args:
+            swap: Swap the alias after verification. With swap=False the
+                verified shadow collection and the checkpoint are left in
+                place; a later run(swap=True) only reconciles and swaps.
+
+        Raises:
+            ReindexError: If there is nothing to reindex, the alias moved
+                since the checkpoint, or tenant counts do not match.
+        """
+        start = time.perf_counter()
+        state, current, resumed = await self._load_or_start()
+        report = ReindexReport(
+            source=state.source,
+            target=state.target,
+            resumed=resumed,
+            cutover=state.source == state.alias,
+        )
+
+        if current is None:
+            # A previous run deleted the plain source but died before
+            # creating the alias
+            await self._finish_cutover(state)
+            await asyncio.to_thread(self._state_path.unlink, missing_ok=True)
+            report.copied = state.copied
+            report.tenant_counts = state.tenant_counts
+            report.swapped = True
+            report.rollback = await self._rollback_collection(state)
+            report.seconds = time.perf_counter() - start
+            return report
+
+        if current == state.target:
+            # A previous run swapped but died before removing its checkpoint
+            await asyncio.to_thread(self._state_path.unlink, missing_ok=True)
+            report.copied = state.copied
+            report.swapped = True
+            report.rollback = await self._rollback_collection(state)
+            return report
+
+        if not state.copy_done:
+            await self._copy(state)
+        report.copied = state.copied
+
+        report.reconciled = await self._reconcile(state)
+        report.tenant_counts = await self._verify(state)
+
+        if swap:
+            await self._swap(state, report.tenant_counts)
+            report.swapped = True
+            report.rollback = await self._rollback_collection(state)
+            await asyncio.to_thread(self._state_path.unlink, missing_ok=True)
+
+        report.seconds = time.perf_counter() - start
+        logger.info(
+            "Reindex %s -> %s: %d copied, %d reconciled, %d tenants verified, swapped=%s in %.1fs",
+            state.source,
+            state.target,
+            report.copied,
+            report.reconciled,
+            len(report.tenant_counts),
+            report.swapped,
+            report.seconds,
+        )
+        return report
+
+    async def _load_or_start(self) -> tuple[ReindexState, str, bool]:
+        """Resume the checkpointed job, or create the next shadow collection.
+
+        Returns:
+            The job state, the collection the alias currently resolves to
+            (None if a cutover deleted the plain source before the alias
+            was created), and whether the job was resumed.
+        """
+        source = await self._store.resolve_knowledge_collection()
+
+        if self._state_path.exists():
+            state = ReindexState.model_validate_json(
+                await asyncio.to_thread(self._state_path.read_text, encoding="utf-8")
+            )
+            if state.alias != self._alias:
+                raise ReindexError(
+                    f"Checkpoint {self._state_path} belongs to alias {state.alias}, not {self._alias}"
+                )
+            if source is None and state.cutover:
+                logger.info("Resuming cutover of %s to alias -> %s", state.alias, state.target)
+                return state, None, True
+            if source is None:
+                raise ReindexError(
+                    f"{self._alias} does not exist; delete {self._state_path} to start over"
+                )
+            if source not in (state.source, state.target):
+                raise ReindexError(
+                    f"{self._alias} now points at {source}, but the checkpoint was taken "
+                    f"against {state.source}; delete {self._state_path} to start over"
+                )
+            logger.info(
+                "Resuming reindex %s -> %s after %d points", state.source, state.target, state.copied
+            )
+            return state, source, True
+
+        if source is None:
+            raise ReindexError(f"Nothing to reindex: {self._alias} does not exist")
+
+        response = await self._client.get_collections()
+        versions = [
+            version
+            for description in response.collections
+            if (version := collection_version(self._alias, description.name)) is not None
+        ]
+        target = versioned_collection_name(self._alias, max(versions, default=0) + 1)
+
+        state = ReindexState(alias=self._alias, source=source, target=target)
+        await self._store.create_knowledge_collection(target)
+        await self._save(state)
+        logger.info("Started reindex %s -> %s", source, target)
+        return state, source, False
+
+    async def _copy(self, state: ReindexState) -> None:
+        """Scroll the source in waves of batches, checkpointing after each wave."""
+        while not state.copy_done:
+            wave_start = time.perf_counter()
+            pages: list[list[Record]] = []
+            offset = state.offset
+            for _ in range(self._concurrency):
+                records, offset = await self._client.scroll(
+                    collection_name=state.source,
+                    limit=self._batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+                if records:
+                    pages.append(records)
+                if offset is None:
+                    break
+
+            await asyncio.gather(*(self._copy_records(state.target, page) for page in pages))
+
+            copied = sum(len(page) for page in pages)
+            state.offset = offset
+            state.copied += copied
+            state.copy_done = offset is None
+            await self._save(state)
+            logger.info("Reindex %s: %d points copied", state.target, state.copied)
+
+            await self._throttle(copied, time.perf_counter() - wave_start)
+
+    async def _copy_records(self, target: str, records: list[Record]) -> None:
+        """Re-embed stored chunk content and upsert it under the same IDs."""
+        if not records:
+            return
+        embeddings = await self._store._embeddings.embed_batch(
+            [(record.payload or {}).get("content", "") for record in records],
+            populate_cache=False,
+        )
+        await self._client.upsert(
+            collection_name=target,
+            points=[
+                PointStruct(
+                    id=record.id,
+                    vector={
+                        "dense": dense,
+                        "bm25": SparseVector(indices=sparse["indices"], values=sparse["values"]),
+                    },
+                    payload=record.payload,
+                )
+                for record, (dense, sparse) in zip(records, embeddings, strict=True)
+            ],
+        )
+
+    async def _throttle(self, points: int, elapsed: float) -> None:
+        """Sleep so the job stays under max_points_per_second."""
+        if not self._max_points_per_second or not points:
+            return
+        remaining = points / self._max_points_per_second - elapsed
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    async def _reconcile(self, state: ReindexState) -> int:
+        """Catch the target up with writes made to the source during the copy.
+
+        Every tenant's point IDs are diffed (IDs only, no payloads or
+        vectors): missing points are copied, points deleted from the source
+        are removed. Comparing counts alone would miss a tenant that had as
+        many chunks deleted as added.
+
+        Returns:
+            Number of points added or removed.
+        """
+        source_counts = await self._tenant_counts(state.source)
+        target_counts = await self._tenant_counts(state.target)
+        changed = 0
+        for tenant_id in sorted(source_counts.keys() | target_counts.keys()):
+            source_ids = await self._tenant_point_ids(state.source, tenant_id)
+            target_ids = await self._tenant_point_ids(state.target, tenant_id)
+            missing = list(source_ids - target_ids)
+            extra = list(target_ids - source_ids)
+
+            for i in range(0, len(missing), self._batch_size):
+                batch_start = time.perf_counter()
+                records = await self._client.retrieve(
+                    collection_name=state.source,
+                    ids=missing[i : i + self._batch_size],
+                    with_payload=True,
+                )
+                await self._copy_records(state.target, records)
+                await self._throttle(len(records), time.perf_counter() - batch_start)
+            if extra:
+                await self._client.delete(
+                    collection_name=state.target,
+                    points_selector=PointIdsList(points=extra),
+                )
+
+            if not missing and not extra:
+                continue
+            changed += len(missing) + len(extra)
+            logger.info(
+                "Reconciled tenant %s in %s: %d added, %d removed",
+                tenant_id,
+                state.target,
+                len(missing),
+                len(extra),
+            )
+        return changed
+
+    async def _verify(self, state: ReindexState) -> dict[str, int]:
+        """Check every tenant has the same number of points in both collections.
+
+        Raises:
+            ReindexError: Listing the tenants whose counts differ.
+        """
+        source_counts = await self._tenant_counts(state.source)
+        target_counts = await self._tenant_counts(state.target)
+        mismatched = {
+            tenant_id: (source_counts.get(tenant_id, 0), target_counts.get(tenant_id, 0))
+            for tenant_id in source_counts.keys() | target_counts.keys()
+            if source_counts.get(tenant_id, 0) != target_counts.get(tenant_id, 0)
+        }
+        if mismatched:
+            details = ", ".join(
+                f"{tenant_id}: {source} != {target}"
+                for tenant_id, (source, target) in sorted(mismatched.items())
+            )
+            raise ReindexError(f"Point counts differ between {state.source} and {state.target}: {details}")
+        return source_counts
+
+    async def _swap(self, state: ReindexState, tenant_counts: dict[str, int]) -> None:
+        """Point the alias at the target in one atomic alias update."""
+        if state.source == state.alias:
+            await self._cutover(state, tenant_counts)
+            return
+
+        await self._client.update_collection_aliases(
+            change_aliases_operations=[
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=state.alias)),
+                self._create_alias(state),
+            ]
+        )
+        logger.info("Swapped alias %s: %s -> %s", state.alias, state.source, state.target)
+
+        if self._drop_previous:
+            await self._client.delete_collection(state.source)
+            logger.info("Dropped previous collection %s", state.source)
+
+    async def _cutover(self, state: ReindexState, tenant_counts: dict[str, int]) -> None:
+        """Replace a pre-alias plain collection by the alias (one-time, not atomic).
+
+        The plain collection occupies the alias name, so it has to be
+        deleted before the alias can exist. Unless drop_previous is set it
+        is first copied to the rollback collection, and the checkpoint
+        records the cutover before the delete so a rerun can finish it.
+        """
+        if not self._drop_previous:
+            await self._copy_collection(state.source, versioned_collection_name(state.alias, 0))
+
+        state.cutover = True
+        state.tenant_counts = tenant_counts
+        await self._save(state)
+
+        logger.warning(
+            "Replacing plain collection %s with alias to %s; searches fail until the alias exists",
+            state.source,
+            state.target,
+        )
+        await self._client.delete_collection(state.source)
+        await self._finish_cutover(state)
+
+    async def _finish_cutover(self, state: ReindexState) -> None:
+        """Create the alias once the plain source is gone, after re-checking the target.
+
+        Raises:
+            ReindexError: If the target's tenant counts no longer match the
+                counts verified before the source was deleted.
+        """
+        target_counts = await self._tenant_counts(state.target)
+        if target_counts != state.tenant_counts:
+            raise ReindexError(
+                f"{state.target} no longer matches the counts verified before {state.source} "
+                f"was deleted; restore from {versioned_collection_name(state.alias, 0)} if kept"
+            )
+        await self._client.update_collection_aliases(
+            change_aliases_operations=[self._create_alias(state)]
+        )
+        logger.info("Created alias %s -> %s", state.alias, state.target)
+
+    async def _copy_collection(self, source: str, destination: str) -> None:
+        """Copy a collection as-is (stored vectors, payloads and payload indexes).
+
+        Idempotent: points are upserted under their own IDs, so a copy
+        interrupted by a crash is completed by the next run.
+
+        Raises:
+            ReindexError: If the copy does not end up with the source's count.
+        """
+        info = await self._client.get_collection(source)
+        if not await self._client.collection_exists(destination):
+            await self._client.create_collection(
+                collection_name=destination,
+                vectors_config=info.config.params.vectors,
+                sparse_vectors_config=info.config.params.sparse_vectors,
+            )
+            for field_name, index in (info.payload_schema or {}).items():
+                await self._client.create_payload_index(
+                    collection_name=destination,
+                    field_name=field_name,
+                    field_schema=index.params or index.data_type,
+                )
+
+        offset = None
+        while True:
+            batch_start = time.perf_counter()
+            records, offset = await self._client.scroll(
+                collection_name=source,
+                limit=self._batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            if records:
+                await self._client.upsert(
+                    collection_name=destination,
+                    points=[
+                        PointStruct(id=record.id, vector=record.vector, payload=record.payload)
+                        for record in records
+                    ],
+                )
+            await self._throttle(len(records), time.perf_counter() - batch_start)
+            if offset is None:
+                break
+
+        source_count = (await self._client.count(source, exact=True)).count
+        copied = (await self._client.count(destination, exact=True)).count
+        if copied != source_count:
+            raise ReindexError(
+                f"Rollback copy {destination} has {copied} points, {source} has {source_count}"
+            )
+        logger.info("Copied %s to %s for rollback (%d points)", source, destination, copied)
+
+    async def _rollback_collection(self, state: ReindexState) -> str | None:
+        """Collection holding the pre-swap data, or None if it was dropped."""
+        name = versioned_collection_name(state.alias, 0) if state.source == state.alias else state.source
+        if await self._client.collection_exists(name):
+            return name
+        return None
+
+    @staticmethod
+    def _create_alias(state: ReindexState) -> CreateAliasOperation:
+        return CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=state.target, alias_name=state.alias)
+        )
+
+    async def _tenant_counts(self, collection: str) -> dict[str, int]:
+        """Exact point count per tenant_id in a collection."""
+        response = await self._client.facet(
+            collection_name=collection, key="tenant_id", limit=MAX_TENANTS, exact=True
+        )
+        return {str(hit.value): hit.count for hit in response.hits}
+
+    async def _tenant_point_ids(self, collection: str, tenant_id: str) -> set[str]:
+        """All point IDs of one tenant in a collection."""
+        tenant_filter = Filter(
+            must=[FieldCondition(key="tenant_id", match=MatchValue(value=tenant_id))]
+        )
+        ids: set[str] = set()
+        offset = None
+        while True:
+            records, offset = await self._client.scroll(
+                collection_name=collection,
+                scroll_filter=tenant_filter,
+                limit=1024,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            ids.update(str(record.id) for record in records)
+            if offset is None:
+                return ids
+
+    async def _save(self, state: ReindexState) -> None:
+        """Write the checkpoint atomically (write temp file, then rename)."""
+        await asyncio.to_thread(self._write_state, state.model_dump_json(indent=2))
+
+    def _write_state(self, data: str) -> None:
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._state_path.with_suffix(self._state_path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._state_path)
@@ -0,0 +1,115 @@
+"""Single-flight coalescing of identical concurrent async calls.
+
+When several coroutines request the same thing at the same moment (a
+burst of webhook events touching one account, scheduler ticks fanning out),
+SingleFlight lets the first caller start the upstream call and every
+concurrent caller with the same key await that call instead of issuing
+its own. Keys are forgotten as soon as the call finishes: this is not a
+cache, later callers start a new call.
+
+The upstream call runs in its own task, so a caller that is cancelled
+does not cancel the call for the others. Failures propagate to every
+caller sharing the call.
+
+Shared by the knowledge layer (EmbeddingService) and the app layer
+(LLMService).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesces concurrent calls that share a key into one upstream call."""
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        """Number of keys currently in flight."""
+        return len(self._calls)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """Run fn() unless a call for key is already in flight, then join it.
+
+        Returns:
+            (result, shared) where shared is True if this caller joined a
+            call started by another caller.
+        """
+
+        async def run(_keys: list[K]) -> list[V]:
+            return [await fn()]
+
+        values, shared = await self.do_many([key], run)
+        return values[0], shared == 1
+
+    async def do_many(
+        self, keys: Sequence[K], fn: Callable[[list[K]], Awaitable[list[V]]]
+    ) -> tuple[list[V], int]:
+        """Batch form of do(): join in-flight keys, compute the rest in one call.
+
+        Args:
+            keys: Distinct keys to resolve.
+            fn: Called once with the keys not already in flight; returns
+                one value per key, in order.
+
+        Returns:
+            (values in key order, number of keys joined from other calls).
+        """
+        futures: list[asyncio.Future[V]] = []
+        missing: list[K] = []
+        missing_futures: list[asyncio.Future[V]] = []
+        shared = 0
+        loop = asyncio.get_running_loop()
+
+        for key in keys:
+            future = self._calls.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._calls[key] = future
+                future.add_done_callback(lambda f, key=key: self._forget(key, f))
+                missing.append(key)
+                missing_futures.append(future)
+            else:
+                shared += 1
+            futures.append(future)
+
+        if missing:
+            batch = asyncio.ensure_future(fn(missing))
+            batch.add_done_callback(lambda t: self._resolve(t, missing_futures))
+
+        values = await asyncio.gather(*(asyncio.shield(f) for f in futures))
+        return list(values), shared
+
+    @staticmethod
+    def _resolve(batch: asyncio.Future[list[V]], futures: list[asyncio.Future[V]]) -> None:
+        """Settle the per-key futures of a finished batch call."""
+        if batch.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        exc = batch.exception()
+        if exc is None and len(batch.result()) != len(futures):
+            exc = RuntimeError(
+                f"single-flight call returned {len(batch.result())} values for {len(futures)} keys"
+            )
+        for index, future in enumerate(futures):
+            if future.done():
+                continue
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(batch.result()[index])
+
+    def _forget(self, key: K, future: asyncio.Future[V]) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Retrieve the exception so an error no caller awaited is not reported
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,195 @@
+"""Shared token accounting on top of tiktoken.
+
+Token counts used to be computed independently by the working-context
+compiler, the chunker and the summarizer, one string at a time, with the
+chunker even looking up the encoding on every call. Session messages were
+re-encoded on every context compile although they never change.
+
+TokenCounter centralizes that:
+- The tiktoken encoding is loaded once per process (lazily, on first use).
+- count_batch() / encode_batch() encode all uncached texts with tiktoken's
+  multithreaded batch API in a single call.
+- Token counts are memoized in a bounded LRU keyed by a BLAKE2b digest of
+  the text, so a message seen in the previous compile costs one hash.
+- truncate() keeps a prefix of at most max_tokens tokens while encoding
+  only a window of the text, not the whole of a long document.
+
+Special-token markers such as "<|endoftext|>" are counted as ordinary text
+(encode_ordinary), so user content can never make counting raise.
+
+Use get_token_counter() to share one instance (and its cache) per encoding.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
+import tiktoken
+
+# cl100k_base works as a reasonable approximation for both Claude and GPT models
+DEFAULT_ENCODING = "cl100k_base"
+
+# Characters of text encoded per requested token when truncating; BPE tokens
+# of English text average ~4 characters, so this almost always suffices.
+TRUNCATE_CHARS_PER_TOKEN = 8
+
+
+class TokenCounter:
+    """Cached tiktoken encoder with batch counting and prefix truncation.
+
+    Thread-safe: the pipeline counts tokens from worker threads.
+
+    Args:
+        encoding_name: tiktoken encoding name.
+        cache_size: Maximum token counts kept in the LRU.
+        num_threads: Threads tiktoken uses for batch encoding.
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = DEFAULT_ENCODING,
+        cache_size: int = 65_536,
+        num_threads: int = 8,
+    ) -> None:
+        self._encoding_name = encoding_name
+        self._encoding: tiktoken.Encoding | None = None
+        self._cache_size = cache_size
+        self._num_threads = num_threads
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        """The tiktoken encoding, loaded on first use."""
+        if self._encoding is None:
+            self._encoding = tiktoken.get_encoding(self._encoding_name)
+        return self._encoding
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def count(self, text: str) -> int:
+        """Number of tokens in text (memoized)."""
+        if not text:
+            return 0
+        key = self._key(text)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        tokens = len(self.encoding.encode_ordinary(text))
+        self._put(key, tokens)
+        return tokens
+
+    def count_batch(self, texts: list[str], cache: bool = True) -> list[int]:
+        """Token counts for many texts; misses are encoded in one batch call.
+
+        Pass cache=False for one-off texts (e.g. ingested chunks) so they
+        do not evict the counts of recurring ones.
+        """
+        if not cache:
+            encoded = self.encoding.encode_ordinary_batch(texts, num_threads=self._num_threads)
+            return [len(tokens) for tokens in encoded]
+
+        counts: list[int] = [0] * len(texts)
+        keys: list[bytes | None] = [None] * len(texts)
+        misses: list[int] = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._key(text)
+            cached = self._get(key)
+            if cached is None:
+                keys[i] = key
+                misses.append(i)
+            else:
+                counts[i] = cached
+
+        if misses:
+            encoded = self.encoding.encode_ordinary_batch(
+                [texts[i] for i in misses], num_threads=self._num_threads
+            )
+            for i, tokens in zip(misses, encoded, strict=True):
+                counts[i] = len(tokens)
+                self._put(keys[i], counts[i])  # type: ignore[arg-type]
+        return counts
+
+    def encode(self, text: str) -> list[int]:
+        """Token IDs of text."""
+        return self.encoding.encode_ordinary(text)
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Token IDs of many texts, encoded in parallel threads.
+
+        Also records each text's count in the LRU.
+        """
+        encoded = self.encoding.encode_ordinary_batch(texts, num_threads=self._num_threads)
+        for text, tokens in zip(texts, encoded, strict=True):
+            if text:
+                self._put(self._key(text), len(tokens))
+        return encoded
+
+    def decode(self, tokens: list[int]) -> str:
+        """Text of token IDs."""
+        return self.encoding.decode(tokens)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest token prefix of text with at most max_tokens tokens.
+
+        Returns text unchanged when it fits. Text that is provably short
+        enough (no more UTF-8 bytes than max_tokens, or a cached count
+        within budget) is never encoded, and a long text only has its
+        first max_tokens * TRUNCATE_CHARS_PER_TOKEN characters encoded.
+        """
+        if not text:
+            return text
+        if max_tokens <= 0:
+            return ""
+        # Every token covers at least one byte
+        if len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens:
+            return text
+        cached = self._get(self._key(text))
+        if cached is not None and cached <= max_tokens:
+            return text
+
+        window = text[: max_tokens * TRUNCATE_CHARS_PER_TOKEN]
+        tokens = self.encoding.encode_ordinary(window)
+        if len(tokens) <= max_tokens:
+            if len(window) == len(text):
+                return text
+            # Unusually long tokens: the window was too small, encode it all
+            tokens = self.encoding.encode_ordinary(text)
+            if len(tokens) <= max_tokens:
+                return text
+        return self.encoding.decode(tokens[:max_tokens])
+
+    def clear(self) -> None:
+        """Drop all memoized counts."""
+        with self._lock:
+            self._counts.clear()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _get(self, key: bytes) -> int | None:
+        with self._lock:
+            tokens = self._counts.get(key)
+            if tokens is not None:
+                self._counts.move_to_end(key)
+            return tokens
+
+    def _put(self, key: bytes, tokens: int) -> None:
+        with self._lock:
+            self._counts[key] = tokens
+            self._counts.move_to_end(key)
+            while len(self._counts) > self._cache_size:
+                self._counts.popitem(last=False)
+
+
+@functools.cache
+def get_token_counter(encoding_name: str = DEFAULT_ENCODING) -> TokenCounter:
+    """Process-wide TokenCounter for an encoding."""
+    return TokenCounter(encoding_name)
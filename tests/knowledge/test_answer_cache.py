@@ -0,0 +1,339 @@
+"""Tests for the tenant-scoped semantic answer cache.
+
+Uses local Qdrant (tmp_path) and an embedder with hand-picked vectors so
+similarity between queries is controlled exactly.
+
+Tests cover:
+- Near-duplicate hits above the threshold, misses below it
+- Tenant and base-filter scoping
+- TTL expiry
+- Invalidation on chunk deletion and document update
+- AgenticRAGPipeline integration (hit short-circuits, bypass with context)
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.knowledge.answer_cache import SemanticAnswerCache
+from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.ingestion.chunker import KnowledgeChunker
+from src.knowledge.ingestion.metadata_extractor import MetadataExtractor
+from src.knowledge.ingestion.pipeline import IngestionPipeline
+from src.knowledge.models import ConversationMessage
+from src.knowledge.qdrant_client import QdrantKnowledgeStore
+from src.knowledge.rag.pipeline import AgenticRAGPipeline, RAGResponse
+from src.knowledge.rag.retriever import RetrievedChunk
+from src.knowledge.rag.synthesizer import SourceCitation, SynthesizedResponse
+
+DIMS = 8
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+def _unit(angle: float) -> list[float]:
+    """8d unit vector at `angle` radians in the first plane (cosine = cos(delta))."""
+    return [math.cos(angle), math.sin(angle)] + [0.0] * (DIMS - 2)
+
+
+class AngleEmbedder:
+    """Embeds known queries at fixed angles; unknown text lands far away."""
+
+    ANGLES = {
+        "What is enterprise pricing?": 0.0,
+        "what's enterprise pricing": 0.1,  # cos(0.1) ~ 0.995
+        "How does Salesforce sync work?": 1.2,  # cos(1.2) ~ 0.36
+    }
+
+    async def embed_text(self, text: str) -> tuple[list[float], dict]:
+        return _unit(self.ANGLES.get(text, 2.5)), {"indices": [1], "values": [1.0]}
+
+    async def embed_batch(
+        self, texts: list[str], populate_cache: bool = True
+    ) -> list[tuple[list[float], dict]]:
+        return [await self.embed_text(t) for t in texts]
+
+
+def _response(answer: str = "Enterprise starts at $50k [1].") -> RAGResponse:
+    return RAGResponse(
+        answer=answer,
+        sources=[
+            SourceCitation(citation_id=1, chunk_id="chunk-1", source_document="pricing.md")
+        ],
+        iterations=1,
+        confidence=0.9,
+    )
+
+
+# ── Fixtures ─────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def config(tmp_path) -> KnowledgeBaseConfig:
+    return KnowledgeBaseConfig(
+        qdrant_path=str(tmp_path / "qdrant_answer_cache"),
+        openai_api_key="test-key-not-used",
+        embedding_dimensions=DIMS,
+        answer_cache_similarity_threshold=0.95,
+    )
+
+
+@pytest.fixture
+async def store(config) -> QdrantKnowledgeStore:
+    store = QdrantKnowledgeStore(config=config, embedding_service=AngleEmbedder())
+    await store.initialize_collections()
+    yield store
+    await store.close()
+
+
+@pytest.fixture
+def cache(store: QdrantKnowledgeStore) -> SemanticAnswerCache:
+    assert store.answer_cache is not None
+    return store.answer_cache
+
+
+async def _seed(cache: SemanticAnswerCache, **overrides: Any) -> None:
+    kwargs: dict[str, Any] = {
+        "query": "What is enterprise pricing?",
+        "tenant_id": "tenant-1",
+        "response": _response(),
+        "chunk_ids": ["chunk-1", "chunk-2"],
+        "source_documents": ["pricing.md"],
+    }
+    kwargs.update(overrides)
+    await cache.store(**kwargs)
+
+
+# ── Tests: Lookup ────────────────────────────────────────────────────────────
+
+
+async def test_collection_created_with_store(store: QdrantKnowledgeStore):
+    """initialize_collections creates the answer cache collection."""
+    assert await store.client.collection_exists("rag_answer_cache")
+
+
+async def test_near_duplicate_query_hits(cache: SemanticAnswerCache):
+    """A paraphrase above the similarity threshold returns the stored answer."""
+    await _seed(cache)
+
+    hit = await cache.lookup("what's enterprise pricing", "tenant-1")
+
+    assert hit is not None
+    assert RAGResponse.model_validate(hit) == _response()
+
+
+async def test_dissimilar_query_misses(cache: SemanticAnswerCache):
+    """A different question below the threshold is a miss."""
+    await _seed(cache)
+
+    assert await cache.lookup("How does Salesforce sync work?", "tenant-1") is None
+
+
+async def test_lookup_is_tenant_scoped(cache: SemanticAnswerCache):
+    """Another tenant never sees a cached answer."""
+    await _seed(cache)
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-2") is None
+
+
+async def test_lookup_is_filter_scoped(cache: SemanticAnswerCache):
+    """Answers produced under different base filters are not shared."""
+    await _seed(cache, filters={"region": "emea"})
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is None
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1", {"region": "emea"})
+
+
+async def test_expired_entries_ignored(config, store: QdrantKnowledgeStore):
+    """Entries past their TTL are not returned."""
+    expired = SemanticAnswerCache(
+        client=store.client,
+        embedding_service=AngleEmbedder(),
+        config=config.model_copy(update={"answer_cache_ttl_seconds": 0}),
+    )
+    await _seed(expired)
+
+    assert await expired.lookup("What is enterprise pricing?", "tenant-1") is None
+
+
+async def test_lookup_error_is_a_miss(cache: SemanticAnswerCache):
+    """Qdrant failures never surface to the caller."""
+    cache._client = MagicMock()
+    cache._client.query_points = AsyncMock(side_effect=RuntimeError("down"))
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is None
+
+
+async def test_unreadable_entry_is_a_miss(cache: SemanticAnswerCache):
+    """A corrupt cached payload is counted as an error and treated as a miss."""
+    await _seed(cache)
+    points, _ = await cache._client.scroll("rag_answer_cache", with_payload=True)
+    await cache._client.set_payload(
+        "rag_answer_cache", payload={"response": "{not json"}, points=[points[0].id]
+    )
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is None
+
+
+async def test_store_purges_expired_entries(
+    config, store: QdrantKnowledgeStore, cache: SemanticAnswerCache
+):
+    """Expired entries are deleted by store() rather than accumulating."""
+    expired = SemanticAnswerCache(
+        client=store.client,
+        embedding_service=AngleEmbedder(),
+        config=config.model_copy(update={"answer_cache_ttl_seconds": 0}),
+    )
+    await _seed(expired)
+
+    await _seed(cache, query="How does Salesforce sync work?")
+
+    points, _ = await store.client.scroll("rag_answer_cache", with_payload=True)
+    assert [p.payload["query"] for p in points] == ["How does Salesforce sync work?"]
+
+
+# ── Tests: Invalidation ──────────────────────────────────────────────────────
+
+
+async def test_delete_chunks_invalidates(store: QdrantKnowledgeStore, cache: SemanticAnswerCache):
+    """Deleting a chunk an answer depends on drops that answer."""
+    await _seed(cache)
+    await _seed(cache, query="How does Salesforce sync work?", chunk_ids=["chunk-9"])
+
+    await store.delete_chunks(["chunk-2"], tenant_id="tenant-1")
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is None
+    assert await cache.lookup("How does Salesforce sync work?", "tenant-1") is not None
+
+
+async def test_invalidation_is_tenant_scoped(cache: SemanticAnswerCache):
+    """Invalidating one tenant's chunks leaves other tenants untouched."""
+    await _seed(cache)
+    await _seed(cache, tenant_id="tenant-2")
+
+    await cache.invalidate_chunks("tenant-2", ["chunk-1"])
+
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is not None
+    assert await cache.lookup("What is enterprise pricing?", "tenant-2") is None
+
+
+async def test_update_document_invalidates(
+    store: QdrantKnowledgeStore, cache: SemanticAnswerCache, tmp_path: Path
+):
+    """Re-ingesting a document drops answers that cite it."""
+    doc = tmp_path / "pricing.md"
+    doc.write_text("# Pricing\n\nEnterprise starts at $50k per year.\n")
+    ingestion = IngestionPipeline(
+        store=store,
+        embedder=AngleEmbedder(),  # type: ignore[arg-type]
+        chunker=KnowledgeChunker(chunk_size=512, overlap_pct=0.15),
+        extractor=MetadataExtractor(),
+    )
+    await ingestion.ingest_document(doc, tenant_id="tenant-1")
+    await _seed(cache, source_documents=[str(doc)])
+
+    doc.write_text("# Pricing\n\nEnterprise starts at $60k per year.\n")
+    result = await ingestion.update_document(doc, tenant_id="tenant-1")
+
+    assert result.version == 2
+    assert await cache.lookup("What is enterprise pricing?", "tenant-1") is None
+
+
+# ── Tests: Pipeline Integration ──────────────────────────────────────────────
+
+
+@pytest.fixture
+def mock_pipeline_parts() -> dict[str, Any]:
+    decomposer = MagicMock()
+    decomposer.decompose = AsyncMock(return_value=[])
+    retriever = MagicMock()
+    retriever.retrieve = AsyncMock(
+        return_value=[
+            RetrievedChunk(
+                chunk_id="chunk-1",
+                content="Enterprise starts at $50k.",
+                relevance_score=0.9,
+                source_type="product",
+                source_document="pricing.md",
+            )
+        ]
+    )
+    synthesizer = MagicMock()
+    synthesizer.synthesize = AsyncMock(
+        return_value=SynthesizedResponse(answer="Fresh answer [1].", confidence=0.8)
+    )
+    grading_llm = MagicMock()
+    grading_llm.ainvoke = AsyncMock(return_value="yes")
+    return {
+        "decomposer": decomposer,
+        "retriever": retriever,
+        "synthesizer": synthesizer,
+        "grading_llm": grading_llm,
+    }
+
+
+async def test_pipeline_returns_cached_answer(cache: SemanticAnswerCache, mock_pipeline_parts):
+    """A cache hit skips decompose, retrieve, grade and synthesize."""
+    await _seed(cache)
+    pipeline = AgenticRAGPipeline(**mock_pipeline_parts, answer_cache=cache)
+
+    response = await pipeline.run("what's enterprise pricing", tenant_id="tenant-1")
+
+    assert response == _response()
+    mock_pipeline_parts["decomposer"].decompose.assert_not_awaited()
+    mock_pipeline_parts["synthesizer"].synthesize.assert_not_awaited()
+
+
+async def test_pipeline_stores_answer_on_miss(cache: SemanticAnswerCache, mock_pipeline_parts):
+    """A miss runs the pipeline and caches the result for the next caller."""
+    pipeline = AgenticRAGPipeline(**mock_pipeline_parts, answer_cache=cache)
+
+    first = await pipeline.run("What is enterprise pricing?", tenant_id="tenant-1")
+    second = await pipeline.run("what's enterprise pricing", tenant_id="tenant-1")
+
+    assert first.answer == "Fresh answer [1]."
+    assert second == first
+    assert mock_pipeline_parts["synthesizer"].synthesize.await_count == 1
+
+
+async def test_pipeline_stream_replays_cached_answer(
+    cache: SemanticAnswerCache, mock_pipeline_parts
+):
+    """run_stream on a hit yields the cached answer as a single token."""
+    await _seed(cache)
+    pipeline = AgenticRAGPipeline(**mock_pipeline_parts, answer_cache=cache)
+
+    events = [e async for e in pipeline.run_stream("What is enterprise pricing?", "tenant-1")]
+
+    assert [e.type for e in events] == ["sub_queries", "sources", "token", "done"]
+    assert events[2].data["text"] == _response().answer
+    mock_pipeline_parts["retriever"].retrieve.assert_not_awaited()
+
+
+async def test_pipeline_bypasses_cache_with_conversation_context(
+    cache: SemanticAnswerCache, mock_pipeline_parts
+):
+    """Conversation-dependent answers are neither served from nor written to the cache."""
+    await _seed(cache)
+    pipeline = AgenticRAGPipeline(**mock_pipeline_parts, answer_cache=cache)
+    context = [
+        ConversationMessage(
+            tenant_id="tenant-1",
+            session_id="s-1",
+            channel="web",
+            role="user",
+            content="We talked about discounts",
+        )
+    ]
+
+    response = await pipeline.run(
+        "What is enterprise pricing?", tenant_id="tenant-1", conversation_context=context
+    )
+
+    assert response.answer == "Fresh answer [1]."
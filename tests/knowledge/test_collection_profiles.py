@@ -0,0 +1,131 @@
+"""Tests for Qdrant collection storage profiles.
+
+Covers profile lookup and HNSW overrides, the Qdrant configs each profile
+produces, collection creation with the configured profiles, and in-place
+migration via apply_profile (mocked client).
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from qdrant_client.models import (
+    BinaryQuantization,
+    Disabled,
+    ScalarQuantization,
+    ScalarType,
+)
+
+from src.knowledge.collection_profiles import (
+    COLLECTION_PROFILES,
+    apply_profile,
+    get_profile,
+)
+from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.qdrant_client import QdrantKnowledgeStore
+
+
+def test_default_profile_is_plain_float32():
+    """The default profile keeps Qdrant defaults and needs no search params."""
+    profile = get_profile("default")
+    params = profile.vector_params(1536)
+
+    assert params.size == 1536
+    assert params.on_disk is False
+    assert params.quantization_config is None
+    assert params.hnsw_config is None
+    assert profile.search_params() is None
+
+
+def test_quantized_profiles_build_quantization_and_rescoring():
+    """Scalar, binary and on_disk profiles quantize and rescore with oversampling."""
+    scalar = get_profile("scalar").quantization_config()
+    assert isinstance(scalar, ScalarQuantization)
+    assert scalar.scalar.type == ScalarType.INT8
+    assert scalar.scalar.always_ram is True
+
+    assert isinstance(get_profile("binary").quantization_config(), BinaryQuantization)
+
+    on_disk = get_profile("on_disk")
+    assert on_disk.vector_params(1536).on_disk is True
+    search = on_disk.search_params()
+    assert search.quantization.rescore is True
+    assert search.quantization.oversampling == 2.0
+
+
+def test_hnsw_overrides_apply_to_any_profile():
+    """HNSW m / ef_construct / ef overrides are layered onto the named profile."""
+    profile = get_profile("binary", hnsw_m=32, hnsw_ef_construct=256, hnsw_ef=128)
+
+    assert profile.quantization == "binary"
+    assert profile.hnsw_config().m == 32
+    assert profile.hnsw_config().ef_construct == 256
+    assert profile.search_params().hnsw_ef == 128
+    assert COLLECTION_PROFILES["binary"].hnsw_m is None
+
+
+def test_unknown_profile_raises():
+    """An unknown profile name lists the known ones."""
+    with pytest.raises(ValueError, match="Known profiles"):
+        get_profile("float16")
+
+
+async def test_apply_profile_updates_collection_in_place():
+    """Migration sends the profile's vector diff; leaving quantization disables it."""
+    client = MagicMock()
+    client.update_collection = AsyncMock()
+
+    await apply_profile(client, "conversations", get_profile("on_disk", hnsw_m=24))
+    kwargs = client.update_collection.await_args.kwargs
+    dense = kwargs["vectors_config"]["dense"]
+    assert kwargs["collection_name"] == "conversations"
+    assert dense.on_disk is True
+    assert isinstance(dense.quantization_config, ScalarQuantization)
+    assert dense.hnsw_config.m == 24
+
+    await apply_profile(client, "conversations", get_profile("default"))
+    dense = client.update_collection.await_args.kwargs["vectors_config"]["dense"]
+    assert dense.on_disk is False
+    assert dense.quantization_config == Disabled.DISABLED
+
+
+async def test_store_creates_collections_with_configured_profiles():
+    """initialize_collections uses each collection's profile; searches use its params."""
+    config = KnowledgeBaseConfig(
+        qdrant_url="http://qdrant.internal:6333",
+        openai_api_key="test-key-not-used",
+        knowledge_profile="scalar",
+        conversations_profile="on_disk",
+        hnsw_ef=96,
+        answer_cache_enabled=False,
+    )
+    embedder = MagicMock()
+    embedder.embed_text = AsyncMock(return_value=([0.1] * 1536, {"indices": [1], "values": [1.0]}))
+
+    with patch("src.knowledge.qdrant_client.AsyncQdrantClient") as client_cls:
+        client = client_cls.return_value
+        client.get_aliases = AsyncMock(return_value=MagicMock(aliases=[]))
+        client.update_collection_aliases = AsyncMock()
+        client.collection_exists = AsyncMock(return_value=False)
+        client.create_collection = AsyncMock()
+        client.create_payload_index = AsyncMock()
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+        store = QdrantKnowledgeStore(config=config, embedding_service=embedder)
+
+        await store.initialize_collections()
+        await store.hybrid_search("pricing", tenant_id="tenant-1")
+
+    created = {
+        call.kwargs["collection_name"]: call.kwargs["vectors_config"]["dense"]
+        for call in client.create_collection.await_args_list
+    }
+    assert isinstance(created["knowledge_base_v1"].quantization_config, ScalarQuantization)
+    assert created["knowledge_base_v1"].on_disk is False
+    assert created["conversations"].on_disk is True
+    assert store.conversations_profile.search_params().hnsw_ef == 96
+
+    dense_prefetch, sparse_prefetch = client.query_points.await_args.kwargs["prefetch"]
+    assert dense_prefetch.params.hnsw_ef == 96
+    assert dense_prefetch.params.quantization.rescore is True
+    assert sparse_prefetch.params is None
@@ -10,10 +10,12 @@ OpenAI API calls during testing. Tests cover:
 - Session lifecycle management
 - Time-range queries
 - Session deletion
+- Write-behind batching, spill recovery and shutdown flush
 """
 
 from __future__ import annotations
 
+import asyncio
 import math
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -24,6 +26,7 @@ import pytest
 from src.knowledge.config import KnowledgeBaseConfig
 from src.knowledge.conversations.session import ConversationSession, SessionManager
 from src.knowledge.conversations.store import ConversationStore
+from src.knowledge.conversations.write_buffer import ConversationWriteBuffer
 from src.knowledge.embeddings import EmbeddingService
 from src.knowledge.models import ConversationMessage
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
@@ -93,7 +96,7 @@ def mock_embedder() -> EmbeddingService:
     service.embed_text = AsyncMock(side_effect=mock_embed_text)
 
     async def mock_embed_batch(
-        texts: list[str],
+        texts: list[str], populate_cache: bool = True
     ) -> list[tuple[list[float], dict]]:
         results = []
         for text in texts:
@@ -112,7 +115,7 @@ async def qdrant_store(config, mock_embedder) -> QdrantKnowledgeStore:
     store = QdrantKnowledgeStore(config=config, embedding_service=mock_embedder)
     await store.initialize_collections()
     yield store
-    store.close()
+    await store.close()
 
 
 @pytest.fixture
@@ -226,6 +229,29 @@ async def test_cross_session_search(conv_store: ConversationStore):
     assert len(session_1_results) > 0
 
 
+async def test_search_conversations_scored(conv_store: ConversationStore):
+    """Scored search returns (message, similarity) pairs with scores in 0.0-1.0."""
+    tenant = "tenant-scored-1"
+    session = str(uuid.uuid4())
+    await conv_store.add_messages(
+        [
+            _make_message(tenant_id=tenant, session_id=session, content="Enterprise pricing"),
+            _make_message(tenant_id=tenant, session_id=session, content="Salesforce sync"),
+        ]
+    )
+
+    results = await conv_store.search_conversations_scored(
+        tenant_id=tenant,
+        query="Enterprise pricing",
+        top_k=5,
+    )
+
+    assert len(results) == 2
+    assert results[0][0].content == "Enterprise pricing"
+    assert results[0][1] == pytest.approx(1.0, abs=1e-3)
+    assert all(0.0 <= score <= 1.0 for _, score in results)
+
+
 # ── Tests: Tenant Isolation ────────────────────────────────────────────────
 
 
@@ -574,6 +600,165 @@ async def test_add_messages_empty_list(conv_store: ConversationStore):
     assert ids == []
 
 
+# ── Tests: Write-Behind ────────────────────────────────────────────────────
+
+
+def _write_behind_store(
+    qdrant_store: QdrantKnowledgeStore, embedder: EmbeddingService, spill_dir, **kwargs
+) -> ConversationStore:
+    return ConversationStore(
+        qdrant_client=qdrant_store.client,
+        embedder=embedder,
+        collection_name="conversations",
+        spill_dir=spill_dir,
+        **kwargs,
+    )
+
+
+async def test_write_behind_coalesces_per_tenant(qdrant_store, mock_embedder, tmp_path):
+    """A full batch is written with one embed_batch call; futures resolve to IDs."""
+    store = _write_behind_store(
+        qdrant_store, mock_embedder, tmp_path / "spill", write_batch_size=4, write_max_delay=60
+    )
+    session = str(uuid.uuid4())
+    messages = [
+        _make_message(tenant_id="tenant-wb-1", session_id=session, content=f"Chat message {i}")
+        for i in range(4)
+    ]
+
+    futures = [await store.submit_message(m) for m in messages]
+
+    assert await asyncio.gather(*futures) == [m.id for m in messages]
+    mock_embedder.embed_batch.assert_awaited_once_with(
+        [m.content for m in messages], populate_cache=False
+    )
+    mock_embedder.embed_text.assert_not_called()
+    assert list((tmp_path / "spill").glob("*.jsonl")) == []
+    history = await store.get_session_history(tenant_id="tenant-wb-1", session_id=session)
+    assert [m.id for m in history] == [m.id for m in messages]
+
+
+async def test_write_behind_flushes_after_delay(qdrant_store, mock_embedder, tmp_path):
+    """A partial batch is flushed once max_delay elapses."""
+    store = _write_behind_store(
+        qdrant_store, mock_embedder, tmp_path / "spill", write_batch_size=100, write_max_delay=0.05
+    )
+    message = _make_message(tenant_id="tenant-wb-2", session_id=str(uuid.uuid4()))
+
+    future = await store.submit_message(message)
+
+    assert await asyncio.wait_for(future, timeout=5) == message.id
+    mock_embedder.embed_batch.assert_awaited_once()
+
+
+async def test_write_behind_reads_own_writes_and_flushes(qdrant_store, mock_embedder, tmp_path):
+    """Pending messages appear in session history; flush() persists them."""
+    store = _write_behind_store(
+        qdrant_store, mock_embedder, tmp_path / "spill", write_batch_size=100, write_max_delay=60
+    )
+    session_mgr = SessionManager(store=store)
+    session = await session_mgr.create_session(tenant_id="tenant-wb-3", channel="email")
+
+    msg = await session_mgr.add_message_to_session(session, role="user", content="Renewal terms?")
+
+    history = await store.get_session_history(tenant_id="tenant-wb-3", session_id=session.session_id)
+    assert [m.id for m in history] == [msg.id]
+    mock_embedder.embed_batch.assert_not_called()
+
+    await store.flush()
+
+    mock_embedder.embed_batch.assert_awaited_once_with(["Renewal terms?"], populate_cache=False)
+    assert store._write_buffer.pending("tenant-wb-3") == []
+    history = await store.get_session_history(tenant_id="tenant-wb-3", session_id=session.session_id)
+    assert [m.id for m in history] == [msg.id]
+
+
+async def test_write_behind_recovers_spill_after_failure(qdrant_store, mock_embedder, tmp_path):
+    """A failed flush stays pending and spilled; the next process replays it."""
+    spill_dir = tmp_path / "spill"
+    failing = MagicMock(spec=EmbeddingService)
+    failing.embed_batch = AsyncMock(side_effect=RuntimeError("embedding outage"))
+    crashed = _write_behind_store(qdrant_store, failing, spill_dir, write_batch_size=2)
+    session = str(uuid.uuid4())
+    messages = [
+        _make_message(tenant_id="tenant-wb-4", session_id=session, content=f"Email {i}")
+        for i in range(2)
+    ]
+
+    futures = [await crashed.submit_message(m) for m in messages]
+    with pytest.raises(RuntimeError, match="embedding outage"):
+        await futures[0]
+    history = await crashed.get_session_history(tenant_id="tenant-wb-4", session_id=session)
+    assert [m.id for m in history] == [m.id for m in messages]
+    assert len(list(spill_dir.rglob("*.jsonl"))) == 1
+
+    # Releasing the spill lock is what the crashed process's exit does.
+    crashed._write_buffer.close()
+    restarted = _write_behind_store(qdrant_store, mock_embedder, spill_dir)
+    assert await restarted.recover_spilled() == 2
+
+    assert list(spill_dir.rglob("*.jsonl")) == []
+    history = await restarted.get_session_history(tenant_id="tenant-wb-4", session_id=session)
+    assert {m.id for m in history} == {m.id for m in messages}
+    await restarted.close()
+
+
+async def test_write_buffer_retries_failed_batch(tmp_path):
+    """A failed batch goes back into pending and is retried with backoff."""
+    writer = AsyncMock(side_effect=[RuntimeError("qdrant down"), ["m-1", "m-2"]])
+    buffer = ConversationWriteBuffer(
+        writer, tmp_path / "spill", max_batch_size=2, retry_delay=0.05
+    )
+    messages = [_make_message(tenant_id="tenant-wb-6", session_id="s-6", content=f"Chat {i}") for i in range(2)]
+
+    futures = [await buffer.submit(m) for m in messages]
+    with pytest.raises(RuntimeError, match="qdrant down"):
+        await futures[0]
+    assert buffer.pending("tenant-wb-6") == messages
+
+    for _ in range(100):
+        if writer.await_count == 2:
+            break
+        await asyncio.sleep(0.01)
+    await buffer.flush()
+
+    assert writer.await_count == 2
+    assert writer.await_args.args[0] == messages
+    assert buffer.pending("tenant-wb-6") == []
+    assert list((tmp_path / "spill").rglob("*.jsonl")) == []
+    buffer.close()
+
+
+async def test_write_behind_recover_skips_live_workers(qdrant_store, mock_embedder, tmp_path):
+    """Workers sharing a spill_dir never replay each other's live segments."""
+    spill_dir = tmp_path / "spill"
+    live = _write_behind_store(
+        qdrant_store, mock_embedder, spill_dir, write_batch_size=100, write_max_delay=60
+    )
+    message = _make_message(tenant_id="tenant-wb-7", session_id=str(uuid.uuid4()))
+    future = await live.submit_message(message)
+
+    starting = _write_behind_store(qdrant_store, mock_embedder, spill_dir)
+    assert await starting.recover_spilled() == 0
+
+    assert len(list(spill_dir.rglob("*.jsonl"))) == 1
+    assert live._write_buffer.pending("tenant-wb-7") == [message]
+    await live.close()
+    assert future.result() == message.id
+    await starting.close()
+
+
+async def test_submit_message_without_write_behind(conv_store: ConversationStore):
+    """Without a spill dir, submit_message writes through."""
+    message = _make_message(tenant_id="tenant-wb-5", session_id=str(uuid.uuid4()))
+
+    future = await conv_store.submit_message(message)
+
+    assert future.done() and future.result() == message.id
+    assert not conv_store.write_behind
+    assert await conv_store.recover_spilled() == 0
+
+
 # ── Tests: Recent Context ─────────────────────────────────────────────────
 
 
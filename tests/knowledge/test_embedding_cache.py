@@ -0,0 +1,239 @@
+"""Tests for EmbeddingCache and the cached EmbeddingService paths.
+
+The OpenAI and BM25 backends are patched out so every test counts upstream
+calls directly. Redis is replaced with a small in-memory fake that supports
+the mget/pipeline subset the cache uses.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from unittest.mock import AsyncMock, MagicMock
+
+from prometheus_client import REGISTRY
+
+from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.embedding_cache import EmbeddingCache, normalize_text
+from src.knowledge.embeddings import EmbeddingService
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for mget + pipelined set."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True) -> FakeRedis._Pipeline:
+        return FakeRedis._Pipeline(self)
+
+    class _Pipeline:
+        def __init__(self, redis: FakeRedis) -> None:
+            self._redis = redis
+            self._ops: list[tuple[str, str, int | None]] = []
+
+        def set(self, key: str, value: str, ex: int | None = None) -> None:
+            self._ops.append((key, value, ex))
+
+        async def execute(self) -> list[bool]:
+            for key, value, ex in self._ops:
+                self._redis.store[key] = value
+                self._redis.ttls[key] = ex
+            return [True] * len(self._ops)
+
+
+def _make_service(redis_client=None, **overrides) -> EmbeddingService:
+    """Create an EmbeddingService whose dense/sparse backends are mocked."""
+    config = KnowledgeBaseConfig(openai_api_key="test-key-not-used", **overrides)
+    service = EmbeddingService(config, redis_client=redis_client)
+
+    async def fake_dense(texts: list[str], max_retries: int = 3) -> list[list[float]]:
+        return [[float(len(t)), 1.0] for t in texts]
+
+    def fake_sparse(texts: list[str]) -> list[dict]:
+        return [{"indices": [len(t)], "values": [1.0]} for t in texts]
+
+    service._embed_dense = AsyncMock(side_effect=fake_dense)  # type: ignore[method-assign]
+    service._embed_sparse = MagicMock(side_effect=fake_sparse)  # type: ignore[method-assign]
+    return service
+
+
+def _metric(tier: str, result: str) -> float:
+    return REGISTRY.get_sample_value(
+        "embedding_cache_requests_total", {"tier": tier, "result": result}
+    ) or 0.0
+
+
+# ── Tests: EmbeddingService caching ────────────────────────────────────────
+
+
+async def test_repeated_query_hits_cache():
+    """Embedding the same text twice calls OpenAI and BM25 only once."""
+    service = _make_service()
+
+    first = await service.embed_text("What does billing cost?")
+    second = await service.embed_text("What does billing cost?")
+
+    assert first == second
+    assert service._embed_dense.await_count == 1
+    assert service._embed_sparse.call_count == 1
+
+
+async def test_normalized_whitespace_shares_entry():
+    """Texts differing only in whitespace map to the same cache entry."""
+    service = _make_service()
+
+    await service.embed_text("pricing  for\nenterprise ")
+    await service.embed_text("pricing for enterprise")
+
+    assert service._embed_dense.await_count == 1
+    assert normalize_text("  a \t b\n") == "a b"
+
+
+async def test_batch_embeds_only_distinct_misses():
+    """embed_batch sends only uncached, de-duplicated texts upstream."""
+    service = _make_service()
+    await service.embed_text("alpha")
+
+    results = await service.embed_batch(["alpha", "beta", "beta", "gamma"])
+
+    assert len(results) == 4
+    assert results[1] == results[2]
+    service._embed_dense.assert_awaited_with(["beta", "gamma"])
+
+
+async def test_bulk_writes_do_not_populate_cache():
+    """populate_cache=False embeds without filling either tier."""
+    redis = FakeRedis()
+    service = _make_service(redis_client=redis)
+
+    await service.embed_batch(["ingested chunk"], populate_cache=False)
+    await service.embed_batch(["ingested chunk"], populate_cache=False)
+
+    assert service._embed_dense.await_count == 2
+    assert len(service.cache) == 0
+    assert redis.store == {}
+
+
+async def test_cache_disabled_always_calls_upstream():
+    """With caching disabled every call reaches the backends."""
+    service = _make_service(embedding_cache_enabled=False)
+
+    await service.embed_text("same")
+    await service.embed_text("same")
+
+    assert service.cache is None
+    assert service._embed_dense.await_count == 2
+
+
+# ── Tests: EmbeddingCache tiers ────────────────────────────────────────────
+
+
+async def test_keys_include_model_and_dimensions():
+    """Different model or dimensions never share cache keys."""
+    small = EmbeddingCache(model="text-embedding-3-small", dimensions=1536)
+    large = EmbeddingCache(model="text-embedding-3-large", dimensions=1536)
+    short = EmbeddingCache(model="text-embedding-3-small", dimensions=512)
+
+    keys = {small.key_for("q"), large.key_for("q"), short.key_for("q")}
+    assert len(keys) == 3
+
+
+async def test_lru_eviction_by_size():
+    """The least recently used entry is evicted once max_entries is exceeded."""
+    cache = EmbeddingCache(model="m", dimensions=2, max_entries=2)
+    pair = ([0.25, 0.5], {"indices": [1], "values": [1.0]})
+
+    await cache.set_many(["a", "b"], [pair, pair])
+    await cache.get_many(["a"])  # touch "a" so "b" becomes LRU
+    await cache.set_many(["c"], [pair])
+
+    assert len(cache) == 2
+    assert await cache.get_many(["a", "b", "c"]) == [pair, None, pair]
+
+
+async def test_ttl_expiry(monkeypatch):
+    """Entries older than the TTL are treated as misses."""
+    clock = [1000.0]
+    monkeypatch.setattr("src.knowledge.embedding_cache.time.monotonic", lambda: clock[0])
+    cache = EmbeddingCache(model="m", dimensions=2, ttl_seconds=60)
+    pair = ([0.25], {"indices": [], "values": []})
+
+    await cache.set_many(["q"], [pair])
+    clock[0] += 30
+    assert await cache.get_many(["q"]) == [pair]
+    clock[0] += 61
+    assert await cache.get_many(["q"]) == [None]
+
+
+async def test_redis_tier_shared_across_instances():
+    """A fresh service (empty LRU) is served from Redis and records a redis hit."""
+    redis = FakeRedis()
+    writer = _make_service(redis_client=redis, embedding_cache_ttl_seconds=120)
+    vector = await writer.embed_text("shared question")
+    assert set(redis.ttls.values()) == {120}
+
+    redis_hits_before = _metric("redis", "hit")
+    reader = _make_service(redis_client=redis)
+    assert await reader.embed_text("shared question") == vector
+
+    reader._embed_dense.assert_not_awaited()
+    assert _metric("redis", "hit") == redis_hits_before + 1
+
+
+async def test_vectors_stored_as_float32():
+    """Both tiers hold dense vectors as packed float32, not lists of floats."""
+    redis = FakeRedis()
+    cache = EmbeddingCache(model="m", dimensions=2, redis_client=redis)
+    pair = ([0.25, -1.5], {"indices": [3], "values": [0.5]})
+
+    await cache.set_many(["q"], [pair])
+
+    key = cache.key_for("q")
+    assert cache._entries[key][1] == array("f", [0.25, -1.5])
+    assert isinstance(json.loads(redis.store[key])["dense"], str)
+    cache.clear()
+    assert await cache.get_many(["q"]) == [pair]
+
+
+async def test_redis_reads_legacy_float_lists():
+    """Entries written as JSON float lists before packing are still served."""
+    redis = FakeRedis()
+    cache = EmbeddingCache(model="m", dimensions=2, redis_client=redis)
+    pair = ([0.1, 0.2], {"indices": [1], "values": [1.0]})
+    redis.store[cache.key_for("q")] = json.dumps({"dense": pair[0], "sparse": pair[1]})
+
+    assert await cache.get_many(["q"]) == [pair]
+
+
+async def test_redis_errors_fail_open():
+    """Redis read/write failures degrade to a miss instead of raising."""
+    broken = MagicMock()
+    broken.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+    broken.pipeline = MagicMock(side_effect=ConnectionError("redis down"))
+    service = _make_service(redis_client=broken)
+
+    dense, sparse = await service.embed_text("resilient")
+
+    assert dense == [float(len("resilient")), 1.0]
+    assert sparse["indices"] == [len("resilient")]
+
+
+async def test_memory_hit_miss_metrics():
+    """In-process hits and misses are reported to Prometheus."""
+    service = _make_service()
+    hits_before = _metric("memory", "hit")
+    misses_before = _metric("memory", "miss")
+
+    await service.embed_text("metrics probe")
+    await service.embed_text("metrics probe")
+
+    assert _metric("memory", "miss") == misses_before + 1
+    assert _metric("memory", "hit") == hits_before + 1
@@ -0,0 +1,178 @@
+"""Tests for off-loop BM25 sparse encoding in EmbeddingService.
+
+The OpenAI backend and the fastembed model are patched out; tests check
+where the BM25 work runs, how batches are split, warm-up and metrics.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+from prometheus_client import REGISTRY
+
+from src.knowledge import embeddings as embeddings_module
+from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.embeddings import EmbeddingService
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────
+
+
+class FakeSparseEmbedding:
+    def __init__(self, text: str) -> None:
+        self.indices = np.array([len(text)])
+        self.values = np.array([1.0])
+
+
+class FakeBM25Model:
+    """Records the thread each embed() call runs on."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], int]] = []
+
+    def embed(self, texts: list[str]):
+        self.calls.append((list(texts), threading.get_ident()))
+        return (FakeSparseEmbedding(t) for t in texts)
+
+
+def _make_service(**overrides) -> tuple[EmbeddingService, FakeBM25Model]:
+    config = KnowledgeBaseConfig(
+        openai_api_key="test-key-not-used", embedding_cache_enabled=False, **overrides
+    )
+    service = EmbeddingService(config)
+    model = FakeBM25Model()
+    service._bm25_model = model
+
+    async def fake_dense(texts: list[str], max_retries: int = 3) -> list[list[float]]:
+        return [[float(len(t))] for t in texts]
+
+    service._embed_dense = AsyncMock(side_effect=fake_dense)  # type: ignore[method-assign]
+    return service, model
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+# ── Tests ──────────────────────────────────────────────────────────────────
+
+
+async def test_sparse_encoding_runs_off_event_loop():
+    """BM25 encoding runs on the dedicated executor thread, not the loop thread."""
+    service, model = _make_service()
+
+    result = await service.embed_batch(["pricing", "billing tiers"])
+
+    assert result == [
+        ([7.0], {"indices": [7], "values": [1.0]}),
+        ([13.0], {"indices": [13], "values": [1.0]}),
+    ]
+    assert model.calls
+    assert all(ident != threading.get_ident() for _, ident in model.calls)
+    await service.close()
+
+
+async def test_large_batch_split_into_slices_in_order():
+    """Batches are split into sparse_batch_size slices; output keeps input order."""
+    service, model = _make_service(sparse_batch_size=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    result = await service.embed_batch(texts)
+
+    assert sorted(batch for batch, _ in model.calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert [sparse["indices"] for _, sparse in result] == [[1], [2], [3], [4], [5]]
+    await service.close()
+
+
+async def test_sparse_metrics_recorded():
+    """Each encoded batch records its wall time and text count."""
+    service, _ = _make_service()
+    labels = {"executor": "thread"}
+    count_before = _sample("embedding_sparse_encode_seconds_count", labels)
+    texts_before = _sample("embedding_sparse_texts_total", labels)
+
+    await service.embed_batch(["one", "two", "three"])
+
+    assert _sample("embedding_sparse_encode_seconds_count", labels) == count_before + 1
+    assert _sample("embedding_sparse_texts_total", labels) == texts_before + 3
+    await service.close()
+
+
+async def test_warm_up_loads_model_on_executor(monkeypatch):
+    """warm_up() loads the BM25 model ahead of the first request, off the loop."""
+    loaded_on: list[int] = []
+
+    def fake_load() -> FakeBM25Model:
+        loaded_on.append(threading.get_ident())
+        return FakeBM25Model()
+
+    monkeypatch.setattr(embeddings_module, "_load_bm25_model", fake_load)
+    service = EmbeddingService(KnowledgeBaseConfig(openai_api_key="test-key-not-used"))
+
+    await service.warm_up()
+
+    assert len(loaded_on) == 1
+    assert loaded_on[0] != threading.get_ident()
+    assert isinstance(service._bm25_model, FakeBM25Model)
+    await service.close()
+
+
+def test_executor_selection():
+    """Thread mode uses one dedicated thread; process mode sizes a process pool."""
+    thread_service = EmbeddingService(KnowledgeBaseConfig(openai_api_key="k"))
+    assert isinstance(thread_service._sparse_executor, ThreadPoolExecutor)
+    assert thread_service._sparse_workers == 1
+
+    process_service = EmbeddingService(
+        KnowledgeBaseConfig(openai_api_key="k", sparse_executor="process", sparse_max_workers=3)
+    )
+    assert isinstance(process_service._sparse_executor, ProcessPoolExecutor)
+    assert process_service._sparse_workers == 3
+    process_service._sparse_executor.shutdown(wait=False)
+
+
+def test_worker_encode_uses_process_local_model(monkeypatch):
+    """The process-pool entry point loads the model once and converts results."""
+    model = FakeBM25Model()
+    load = MagicMock(return_value=model)
+    monkeypatch.setattr(embeddings_module, "_load_bm25_model", load)
+    monkeypatch.setattr(embeddings_module, "_worker_bm25_model", None)
+
+    first = embeddings_module._sparse_worker_encode(["ab"])
+    second = embeddings_module._sparse_worker_encode(["abc"])
+
+    assert first == [{"indices": [2], "values": [1.0]}]
+    assert second == [{"indices": [3], "values": [1.0]}]
+    assert load.call_count == 1
+
+
+async def test_concurrent_batches_share_in_flight_texts():
+    """Texts another caller is embedding are joined, not sent upstream again."""
+    import asyncio
+
+    service, _ = _make_service()
+    release = asyncio.Event()
+
+    async def slow_dense(texts: list[str], max_retries: int = 3) -> list[list[float]]:
+        await release.wait()
+        return [[float(len(t))] for t in texts]
+
+    service._embed_dense = AsyncMock(side_effect=slow_dense)  # type: ignore[method-assign]
+    coalesced_before = _sample("embedding_coalesced_texts_total", {})
+
+    first = asyncio.create_task(service.embed_batch(["pricing", "billing"]))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(service.embed_batch(["billing", "renewal"]))
+    await asyncio.sleep(0)
+    release.set()
+    first_result, second_result = await asyncio.gather(first, second)
+
+    sent = [call.args[0] for call in service._embed_dense.await_args_list]
+    assert sent == [["pricing", "billing"], ["renewal"]]
+    assert first_result[1] == second_result[0]
+    assert second_result[1][0] == [7.0]
+    assert _sample("embedding_coalesced_texts_total", {}) == coalesced_before + 1
+    await service.close()
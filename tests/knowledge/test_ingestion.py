@@ -18,7 +18,7 @@ from pathlib import Path
 import pytest
 
 from src.knowledge.ingestion.chunker import KnowledgeChunker, _count_tokens
-from src.knowledge.ingestion.loaders import DocumentLoader, RawSection, load_document
+from src.knowledge.ingestion.loaders import DocumentLoader, RawSection, iter_document, load_document
 from src.knowledge.ingestion.metadata_extractor import MetadataExtractor
 from src.knowledge.models import ChunkMetadata, KnowledgeChunk
 
@@ -176,6 +176,49 @@ class TestCsvLoading:
             Path(tmp_path).unlink()
 
 
+class TestStreamingLoading:
+    """Tests for lazy section loading via iter_sections."""
+
+    def test_csv_streams_rows_lazily(self, tmp_path: Path):
+        """Verify CSV rows are yielded one at a time and match load()."""
+        csv_path = tmp_path / "price-book.csv"
+        csv_path.write_text("Product,Price\nMonetization,2500\nCharging,1500\nBilling,900\n")
+
+        loader = DocumentLoader()
+        stream = loader.iter_sections(csv_path)
+        first = next(stream)
+
+        assert first.section_title == "Monetization"
+        assert [s.section_title for s in stream] == ["Charging", "Billing"]
+        assert [s.content for s in loader.load(csv_path)][0] == first.content
+
+    def test_csv_stream_detects_non_utf8_encoding(self, tmp_path: Path):
+        """Verify streamed CSVs fall back to detected encodings."""
+        csv_path = tmp_path / "regional.csv"
+        csv_path.write_bytes("Region,Notes\nEMEA,Zürich and Malmö offices\n".encode("latin-1"))
+
+        sections = list(DocumentLoader().iter_sections(csv_path))
+
+        assert len(sections) == 1
+        assert "Region: EMEA" in sections[0].content
+
+    def test_iter_sections_validates_eagerly(self, tmp_path: Path):
+        """Verify missing files and bad formats raise before iteration."""
+        bad = tmp_path / "notes.xyz"
+        bad.write_text("content")
+        loader = DocumentLoader()
+
+        with pytest.raises(FileNotFoundError):
+            loader.iter_sections("/nonexistent/file.csv")
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            loader.iter_sections(bad)
+
+    def test_iter_document_markdown_matches_load(self):
+        """Verify whole-file formats yield the same sections as load()."""
+        streamed = list(iter_document(SAMPLE_PRODUCT_MD))
+        assert streamed == load_document(SAMPLE_PRODUCT_MD)
+
+
 # ── Test: Text Loading ─────────────────────────────────────────────────────
 
 
@@ -314,6 +357,23 @@ class TestChunking:
         for chunk in chunks:
             assert len(chunk.content) > 0
 
+    def test_iter_chunk_batches_matches_chunk_sections(self):
+        """Verify streamed chunking yields the same chunks in bounded batches."""
+        large_content = " ".join(["This is a sentence about charging features."] * 200)
+        sections = [
+            RawSection(content=f"Feature {i}: short description.", source="charging.md")
+            for i in range(5)
+        ] + [RawSection(content=large_content, source="charging.md")]
+
+        chunker = KnowledgeChunker(chunk_size=512, overlap_pct=0.15)
+        expected = chunker.chunk_sections(sections, "tenant-1", "charging.md")
+        batches = list(chunker.iter_chunk_batches(iter(sections), "tenant-1", "charging.md", batch_size=3))
+
+        assert all(0 < len(batch) <= 3 for batch in batches)
+        streamed = [chunk for batch in batches for chunk in batch]
+        assert [c.content for c in streamed] == [c.content for c in expected]
+        assert {c.metadata.product_category for c in streamed} == {"charging"}
+
 
 # ── Test: Metadata Extraction ──────────────────────────────────────────────
 
@@ -651,6 +711,7 @@ class TestImports:
             KnowledgeChunker,
             MetadataExtractor,
             RawSection,
+            iter_document,
             load_document,
         )
 
@@ -659,3 +720,4 @@ class TestImports:
         assert MetadataExtractor is not None
         assert RawSection is not None
         assert load_document is not None
+        assert iter_document is not None
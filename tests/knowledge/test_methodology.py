@@ -68,7 +68,7 @@ def mock_embedding_service(config) -> EmbeddingService:
     service.embed_text = AsyncMock(side_effect=mock_embed_text)
 
     async def mock_embed_batch(
-        texts: list[str],
+        texts: list[str], populate_cache: bool = True
     ) -> list[tuple[list[float], dict]]:
         results = []
         for text in texts:
@@ -90,7 +90,7 @@ async def store(config, mock_embedding_service) -> QdrantKnowledgeStore:
     )
     await store.initialize_collections()
     yield store
-    store.close()
+    await store.close()
 
 
 @pytest.fixture
@@ -289,16 +289,120 @@ class TestMethodologyIngestion:
         for chunk in results:
             assert "discovery" in chunk.metadata.sales_stage
 
-    async def test_methodology_tenant_isolation(
+    async def test_methodology_shared_across_tenants(
         self, store: QdrantKnowledgeStore, mock_embedding_service
     ):
-        """Methodology loaded for one tenant is not visible to another."""
+        """Methodology is stored and embedded once, then visible to every tenant."""
         loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
-        await loader.load_methodologies(tenant_id="tenant-a")
+        count = await loader.load_methodologies(tenant_id="tenant-a")
+        stored = (await store.client.count(collection_name="knowledge_base")).count
+        mock_embedding_service.embed_batch.reset_mock()
+
+        assert await loader.load_methodologies(tenant_id="tenant-b") == count
+        assert (await store.client.count(collection_name="knowledge_base")).count == stored
+        mock_embedding_service.embed_batch.assert_not_awaited()
 
         results = await store.hybrid_search(
             query_text="MEDDIC methodology",
             tenant_id="tenant-b",
         )
+        assert len(results) > 0
+        assert {chunk.tenant_id for chunk in results} == {store.shared_tenant_id}
+        assert await store.get_chunk(results[0].id, tenant_id="tenant-b") is not None
+
+    async def test_methodology_per_tenant_without_shared_partition(
+        self, tmp_path, mock_embedding_service
+    ):
+        """With shared_tenant_id=None each tenant gets its own isolated copy."""
+        config = KnowledgeBaseConfig(
+            qdrant_path=str(tmp_path / "qdrant_per_tenant"),
+            openai_api_key="test-key-not-used",
+            shared_tenant_id=None,
+        )
+        store = QdrantKnowledgeStore(config=config, embedding_service=mock_embedding_service)
+        await store.initialize_collections()
+        loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
+        count = await loader.load_methodologies(tenant_id="tenant-a")
+        # Reloading is idempotent thanks to content-addressed chunk IDs
+        await loader.load_methodologies(tenant_id="tenant-a")
 
+        assert (await store.client.count(collection_name="knowledge_base")).count == count
+        results = await store.hybrid_search(
+            query_text="MEDDIC methodology",
+            tenant_id="tenant-b",
+        )
         assert len(results) == 0
+        await store.close()
+
+    async def test_methodology_load_removes_legacy_tenant_copies(
+        self, store: QdrantKnowledgeStore, mock_embedding_service
+    ):
+        """Per-tenant copies of bundled files are replaced by the shared partition."""
+        from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+
+        def tenant_chunk(source_document: str) -> KnowledgeChunk:
+            return KnowledgeChunk(
+                id=str(uuid.uuid4()),
+                tenant_id="tenant-a",
+                content=f"Tenant copy of {source_document}",
+                metadata=ChunkMetadata(
+                    product_category="monetization",
+                    buyer_persona=["technical"],
+                    sales_stage=["discovery"],
+                    region=["global"],
+                    content_type="methodology",
+                    source_document=source_document,
+                ),
+            )
+
+        legacy = tenant_chunk("meddic.md")
+        own = tenant_chunk("our-playbook.md")
+        await store.upsert_chunks([legacy, own], "tenant-a")
+
+        loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
+        await loader.load_methodologies(tenant_id="tenant-b")
+
+        assert await store.get_chunk(legacy.id, tenant_id="tenant-a") is None
+        assert await store.get_chunk(own.id, tenant_id="tenant-a") is not None
+
+    async def test_shared_partition_is_read_only_for_tenants(
+        self, store: QdrantKnowledgeStore
+    ):
+        """upsert_chunks refuses to write into the shared partition."""
+        from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+
+        chunk = KnowledgeChunk(
+            id=str(uuid.uuid4()),
+            tenant_id=store.shared_tenant_id,
+            content="Injected",
+            metadata=ChunkMetadata(
+                product_category="monetization",
+                buyer_persona=["technical"],
+                sales_stage=["discovery"],
+                region=["global"],
+                content_type="methodology",
+                source_document="meddic.md",
+            ),
+        )
+        with pytest.raises(ValueError, match="shared partition"):
+            await store.upsert_chunks([chunk], store.shared_tenant_id)
+
+    async def test_pruning_shared_chunks_invalidates_every_tenants_answers(
+        self, store: QdrantKnowledgeStore, mock_embedding_service
+    ):
+        """Removed or edited shared sections drop cached answers across tenants."""
+        loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
+        await loader.load_methodologies(tenant_id="tenant-a")
+        records, _ = await store.client.scroll("knowledge_base", limit=1000)
+        ids = sorted(str(record.id) for record in records)
+        store._answer_cache = MagicMock(
+            invalidate_chunks=AsyncMock(), invalidate_chunks_all_tenants=AsyncMock()
+        )
+
+        pruned = await store.prune_chunks(
+            store.shared_tenant_id, ids[1:], {"content_type": "methodology"}
+        )
+
+        assert pruned == [ids[0]]
+        store._answer_cache.invalidate_chunks_all_tenants.assert_awaited_once_with([ids[0]])
+        store._answer_cache.invalidate_chunks.assert_not_awaited()
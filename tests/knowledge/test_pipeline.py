@@ -6,7 +6,10 @@ local Qdrant (tmp_path) for fully offline, reproducible testing.
 Tests cover:
 - Single document ingestion through full pipeline
 - Directory ingestion with multiple files
+- Pipelined directory ingestion (cross-document batching, backpressure)
+- Streaming ingestion of a large CSV under a fixed memory ceiling
 - Document update with versioning
+- Incremental updates (unchanged chunks reuse stored vectors)
 - Tenant-scoped isolation
 - Metadata overrides
 """
@@ -14,6 +17,7 @@ Tests cover:
 from __future__ import annotations
 
 import json
+import tracemalloc
 import uuid
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -48,7 +52,9 @@ class MockEmbeddingService:
         sparse = self._make_sparse(text)
         return dense, sparse
 
-    async def embed_batch(self, texts: list[str]) -> list[tuple[list[float], dict]]:
+    async def embed_batch(
+        self, texts: list[str], populate_cache: bool = True
+    ) -> list[tuple[list[float], dict]]:
         """Generate deterministic embeddings for a batch of texts."""
         results = []
         for text in texts:
@@ -220,7 +226,7 @@ async def test_ingest_single_document(
     # Scroll to find stored chunks
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_results, _ = store.client.scroll(
+    scroll_results, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -267,7 +273,7 @@ async def test_ingest_directory(
     # Verify all chunks are stored with correct tenant
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_results, _ = store.client.scroll(
+    scroll_results, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -281,6 +287,164 @@ async def test_ingest_directory(
     assert len(scroll_results) == total_chunks
 
 
+@pytest.mark.asyncio
+async def test_pipelined_directory_matches_sequential(
+    pipeline: IngestionPipeline,
+    store: QdrantKnowledgeStore,
+    mock_embedder: MockEmbeddingService,
+    sample_markdown: Path,
+    sample_json: Path,
+    sample_text: Path,
+):
+    """Pipelined ingestion stores the same chunks, packing files into one embed call."""
+    directory = sample_markdown.parent
+    sequential = await pipeline.ingest_directory(directory, tenant_id="test-tenant-seq")
+
+    mock_embedder.embed_batch = AsyncMock(side_effect=mock_embedder.embed_batch)
+    report = await pipeline.ingest_directory_pipelined(directory, tenant_id="test-tenant-pipe")
+
+    assert [r.document_source for r in report.results] == [r.document_source for r in sequential]
+    assert [r.chunks_created for r in report.results] == [r.chunks_created for r in sequential]
+    assert all(r.errors == [] for r in report.results)
+    assert report.chunks_created == sum(r.chunks_created for r in sequential)
+    assert report.embed_batches == 1
+    assert mock_embedder.embed_batch.await_count == 1
+    assert report.upsert_batches == 1
+    assert report.chunks_per_second > 0
+
+    from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+    count = await store.client.count(
+        collection_name=store._config.collection_knowledge,
+        count_filter=Filter(
+            must=[FieldCondition(key="tenant_id", match=MatchValue(value="test-tenant-pipe"))]
+        ),
+    )
+    assert count.count == report.chunks_created
+
+
+@pytest.mark.asyncio
+async def test_pipelined_directory_respects_batch_limits(
+    pipeline: IngestionPipeline,
+    mock_embedder: MockEmbeddingService,
+    docs_dir: Path,
+):
+    """Embed and upsert batches honour their limits with tiny queues (backpressure)."""
+    for i in range(6):
+        (docs_dir / f"doc_{i}.md").write_text(
+            f"# Doc {i}\n\nFirst section {i}.\n\n# More {i}\n\nSecond section {i}.\n"
+        )
+    mock_embedder.embed_batch = AsyncMock(side_effect=mock_embedder.embed_batch)
+
+    report = await pipeline.ingest_directory_pipelined(
+        docs_dir,
+        tenant_id="test-tenant-limits",
+        load_workers=3,
+        embed_batch_max_texts=5,
+        upsert_batch_size=4,
+        queue_size=1,
+    )
+
+    assert report.chunks_created == 12
+    assert all(r.chunks_created == 2 for r in report.results)
+    batch_sizes = [len(call.args[0]) for call in mock_embedder.embed_batch.await_args_list]
+    assert batch_sizes == [5, 5, 2]
+    assert report.upsert_batches == 3
+
+
+@pytest.mark.asyncio
+async def test_pipelined_directory_token_budget_and_failures(
+    pipeline: IngestionPipeline,
+    mock_embedder: MockEmbeddingService,
+    docs_dir: Path,
+):
+    """The token budget splits batches; an embedding failure is reported per file."""
+    for name in ["a", "b", "c"]:
+        (docs_dir / f"{name}.txt").write_text(f"Document {name} " * 20)
+    calls = 0
+    original = mock_embedder.embed_batch
+
+    async def flaky_embed(texts: list[str], populate_cache: bool = True):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("rate limited")
+        return await original(texts)
+
+    mock_embedder.embed_batch = flaky_embed  # type: ignore[method-assign]
+
+    report = await pipeline.ingest_directory_pipelined(
+        docs_dir, tenant_id="test-tenant-budget", load_workers=1, embed_batch_max_tokens=50
+    )
+
+    assert report.embed_batches == 3
+    assert report.chunks_created == 2
+    failed = [r for r in report.results if r.errors]
+    assert len(failed) == 1
+    assert failed[0].errors == ["Embedding failed: rate limited"]
+    assert failed[0].chunks_created == 0
+
+
+@pytest.mark.asyncio
+async def test_pipelined_directory_nonexistent(pipeline: IngestionPipeline):
+    """A missing directory returns a single error result."""
+    report = await pipeline.ingest_directory_pipelined("/nonexistent/dir", tenant_id="t")
+    assert len(report.results) == 1
+    assert "Not a directory" in report.results[0].errors[0]
+    assert report.chunks_created == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_large_csv_streams_under_memory_ceiling(
+    chunker: KnowledgeChunker,
+    extractor: MetadataExtractor,
+    docs_dir: Path,
+):
+    """A ~20 MB CSV price book is ingested in bounded batches, not materialized."""
+    rows = 30_000
+    csv_path = docs_dir / "price_book.csv"
+    description = "Usage-based rating tier with volume discounts and overage billing. " * 10
+    with csv_path.open("w") as f:
+        f.write("SKU,Product,Price,Description\n")
+        for i in range(rows):
+            f.write(f"SKU-{i:06d},Charging Platform,{1000 + i},{description}\n")
+    assert csv_path.stat().st_size > 20_000_000
+
+    upserted: list[int] = []
+
+    class CountingStore:
+        async def upsert_chunks(self, chunks: list, tenant_id: str) -> None:
+            upserted.append(len(chunks))
+
+    pipeline = IngestionPipeline(
+        store=CountingStore(),  # type: ignore[arg-type]
+        embedder=MockEmbeddingService(dimensions=8),  # type: ignore[arg-type]
+        chunker=chunker,
+        extractor=extractor,
+    )
+
+    # Warm up tokenizer and regex caches outside the measured window
+    warmup = docs_dir / "warmup.csv"
+    warmup.write_text("SKU,Product\nSKU-0,Billing Platform\n")
+    await pipeline.ingest_document(warmup, tenant_id="test-tenant-stream")
+    upserted.clear()
+
+    tracemalloc.start()
+    try:
+        result = await pipeline.ingest_document(
+            csv_path, tenant_id="test-tenant-stream", stream_batch_size=200
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.errors == []
+    assert result.chunks_created == rows
+    assert sum(upserted) == rows
+    assert max(upserted) == 200
+    assert peak < 16 * 1024 * 1024, f"peak traced memory {peak / 1e6:.1f} MB"
+
+
 @pytest.mark.asyncio
 async def test_document_update_versioning(
     pipeline: IngestionPipeline,
@@ -335,7 +499,7 @@ Multi-currency support added.
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
     # Get all chunks for this document
-    all_chunks, _ = store.client.scroll(
+    all_chunks, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -364,6 +528,129 @@ Multi-currency support added.
         assert chunk.payload["version"] == 2
 
 
+async def _scroll_document(store: QdrantKnowledgeStore, tenant_id: str, doc_path: Path):
+    from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+    points, _ = await store.client.scroll(
+        collection_name=store._config.collection_knowledge,
+        scroll_filter=Filter(
+            must=[
+                FieldCondition(key="tenant_id", match=MatchValue(value=tenant_id)),
+                FieldCondition(key="source_document", match=MatchValue(value=str(doc_path))),
+            ]
+        ),
+        limit=200,
+        with_payload=True,
+        with_vectors=True,
+    )
+    return points
+
+
+@pytest.mark.asyncio
+async def test_update_unchanged_document_reuses_all_chunks(
+    pipeline: IngestionPipeline,
+    store: QdrantKnowledgeStore,
+    mock_embedder: MockEmbeddingService,
+    sample_markdown: Path,
+):
+    """Re-ingesting identical content embeds nothing and bumps versions in place."""
+    tenant_id = "test-tenant-unchanged"
+    result_v1 = await pipeline.ingest_document(sample_markdown, tenant_id=tenant_id)
+    before = {p.id: p for p in await _scroll_document(store, tenant_id, sample_markdown)}
+
+    mock_embedder.embed_batch = AsyncMock(side_effect=mock_embedder.embed_batch)
+    result_v2 = await pipeline.update_document(sample_markdown, tenant_id=tenant_id)
+
+    assert result_v2.errors == []
+    assert result_v2.version == 2
+    assert result_v2.chunks_created == 0
+    assert result_v2.chunks_reused == result_v1.chunks_created
+    assert result_v2.chunks_removed == 0
+    mock_embedder.embed_batch.assert_not_awaited()
+
+    after = await _scroll_document(store, tenant_id, sample_markdown)
+    assert {p.id for p in after} == set(before)
+    for point in after:
+        assert point.payload["version"] == 2
+        assert point.payload["is_current"] is True
+        assert point.payload["content_hash"] == before[point.id].payload["content_hash"]
+        assert point.vector["dense"] == pytest.approx(before[point.id].vector["dense"], rel=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_update_embeds_only_changed_chunks(
+    pipeline: IngestionPipeline,
+    store: QdrantKnowledgeStore,
+    mock_embedder: MockEmbeddingService,
+    docs_dir: Path,
+):
+    """Changing one section embeds only that chunk; the old one is retired."""
+    tenant_id = "test-tenant-incremental"
+    doc_path = docs_dir / "incremental.md"
+    sections = {
+        "Overview": "Billing platform overview for enterprise teams.",
+        "Invoicing": "Invoices are generated monthly as PDF.",
+        "Support": "Support is available around the clock.",
+    }
+    doc_path.write_text(
+        "".join(f"# {title}\n\n{body}\n\n" for title, body in sections.items())
+    )
+    result_v1 = await pipeline.ingest_document(doc_path, tenant_id=tenant_id)
+    assert result_v1.chunks_created == 3
+    v1_ids = {p.id for p in await _scroll_document(store, tenant_id, doc_path)}
+
+    sections["Invoicing"] = "Invoices are generated monthly as PDF or CSV."
+    doc_path.write_text(
+        "".join(f"# {title}\n\n{body}\n\n" for title, body in sections.items())
+    )
+    mock_embedder.embed_batch = AsyncMock(side_effect=mock_embedder.embed_batch)
+    result_v2 = await pipeline.update_document(doc_path, tenant_id=tenant_id)
+
+    assert result_v2.errors == []
+    assert (result_v2.chunks_created, result_v2.chunks_reused, result_v2.chunks_removed) == (1, 2, 1)
+    embedded_texts = mock_embedder.embed_batch.await_args.args[0]
+    assert len(embedded_texts) == 1
+    assert "CSV" in embedded_texts[0]
+
+    points = await _scroll_document(store, tenant_id, doc_path)
+    current = [p for p in points if p.payload["is_current"] is True]
+    retired = [p for p in points if p.payload["is_current"] is False]
+    assert len(current) == 3
+    assert all(p.payload["version"] == 2 for p in current)
+    assert len({p.id for p in current} & v1_ids) == 2
+    assert len(retired) == 1
+    assert retired[0].payload["version"] == 1
+    assert retired[0].payload["valid_until"] is not None
+    assert "CSV" not in retired[0].payload["content"]
+
+
+@pytest.mark.asyncio
+async def test_update_to_empty_document_retires_current_chunks(
+    pipeline: IngestionPipeline,
+    store: QdrantKnowledgeStore,
+    docs_dir: Path,
+):
+    """A document updated to no content has every current chunk retired."""
+    tenant_id = "test-tenant-emptied"
+    doc_path = docs_dir / "emptied.md"
+    doc_path.write_text("# Overview\n\nBilling overview.\n\n# Support\n\nSupport hours.\n")
+    result_v1 = await pipeline.ingest_document(doc_path, tenant_id=tenant_id)
+    assert result_v1.chunks_created == 2
+
+    doc_path.write_text("")
+    answer_cache = MagicMock()
+    answer_cache.invalidate_documents = AsyncMock()
+    store._answer_cache = answer_cache
+    result_v2 = await pipeline.update_document(doc_path, tenant_id=tenant_id)
+
+    assert result_v2.chunks_created == 0
+    assert result_v2.chunks_removed == 2
+    points = await _scroll_document(store, tenant_id, doc_path)
+    assert all(p.payload["is_current"] is False for p in points)
+    assert all(p.payload["valid_until"] is not None for p in points)
+    answer_cache.invalidate_documents.assert_awaited_once_with(tenant_id, [str(doc_path)])
+
+
 @pytest.mark.asyncio
 async def test_tenant_scoped_ingestion(
     pipeline: IngestionPipeline,
@@ -384,7 +671,7 @@ async def test_tenant_scoped_ingestion(
     # Verify tenant A can see the chunks
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    results_a, _ = store.client.scroll(
+    results_a, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -397,7 +684,7 @@ async def test_tenant_scoped_ingestion(
     assert len(results_a) == result.chunks_created
 
     # Verify tenant B cannot see the chunks
-    results_b, _ = store.client.scroll(
+    results_b, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -435,7 +722,7 @@ async def test_metadata_overrides(
     # Verify overrides are in the stored payload
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    stored, _ = store.client.scroll(
+    stored, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -52,7 +52,9 @@ class MockEmbeddingService:
         sparse = self._make_sparse(text)
         return dense, sparse
 
-    async def embed_batch(self, texts: list[str]) -> list[tuple[list[float], dict]]:
+    async def embed_batch(
+        self, texts: list[str], populate_cache: bool = True
+    ) -> list[tuple[list[float], dict]]:
         """Generate deterministic embeddings for a batch of texts."""
         results = []
         for text in texts:
@@ -174,7 +176,7 @@ async def test_ingest_monetization_platform(
     # Verify chunks are stored with correct product_category
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_results, _ = store.client.scroll(
+    scroll_results, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -223,7 +225,7 @@ async def test_ingest_all_products(
     # Verify all chunks are stored
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_results, _ = store.client.scroll(
+    scroll_results, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -371,7 +373,7 @@ async def test_cross_product_references(
     # Scroll all chunks and check cross-references
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_results, _ = store.client.scroll(
+    scroll_results, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -438,7 +440,7 @@ async def test_tenant_scoped_product_retrieval(
     # Also verify via scroll that tenant B has zero chunks
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-    scroll_b, _ = store.client.scroll(
+    scroll_b, _ = await store.client.scroll(
         collection_name=store._config.collection_knowledge,
         scroll_filter=Filter(
             must=[
@@ -16,7 +16,7 @@ import pytest
 
 from src.knowledge.config import KnowledgeBaseConfig
 from src.knowledge.embeddings import EmbeddingService
-from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+from src.knowledge.models import ChunkMetadata, KnowledgeChunk, KnowledgeHit
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
 
 
@@ -96,7 +96,7 @@ def mock_embedding_service(config) -> EmbeddingService:
 
     # Mock embed_batch
     async def mock_embed_batch(
-        texts: list[str],
+        texts: list[str], populate_cache: bool = True
     ) -> list[tuple[list[float], dict]]:
         results = []
         for text in texts:
@@ -118,7 +118,7 @@ async def store(config, mock_embedding_service) -> QdrantKnowledgeStore:
     )
     await store.initialize_collections()
     yield store
-    store.close()
+    await store.close()
 
 
 # ── Tests: Collection Initialization ────────────────────────────────────────
@@ -129,14 +129,14 @@ async def test_collection_creation(store: QdrantKnowledgeStore):
     client = store.client
 
     # knowledge_base collection exists
-    assert client.collection_exists("knowledge_base")
-    kb_info = client.get_collection("knowledge_base")
+    assert await client.collection_exists("knowledge_base")
+    kb_info = await client.get_collection("knowledge_base")
     assert kb_info.config.params.vectors["dense"].size == 1536
     assert kb_info.config.params.vectors["dense"].distance.name == "COSINE"
 
     # conversations collection exists
-    assert client.collection_exists("conversations")
-    conv_info = client.get_collection("conversations")
+    assert await client.collection_exists("conversations")
+    conv_info = await client.get_collection("conversations")
     assert conv_info.config.params.vectors["dense"].size == 1536
 
 
@@ -151,8 +151,37 @@ async def test_idempotent_collection_creation(
     await store.initialize_collections()
     # Second call should be idempotent
     await store.initialize_collections()
-    assert store.client.collection_exists("knowledge_base")
-    store.close()
+    assert await store.client.collection_exists("knowledge_base")
+    await store.close()
+
+
+def test_remote_client_uses_async_pooled_connection(mock_embedding_service):
+    """Remote mode builds an AsyncQdrantClient with gRPC, timeout and pool settings."""
+    remote_config = KnowledgeBaseConfig(
+        qdrant_url="http://qdrant.internal:6333",
+        qdrant_api_key="secret",
+        qdrant_prefer_grpc=True,
+        qdrant_grpc_port=7334,
+        qdrant_timeout=5,
+        qdrant_pool_size=8,
+        openai_api_key="test-key-not-used",
+    )
+
+    with patch("src.knowledge.qdrant_client.AsyncQdrantClient") as client_cls:
+        store = QdrantKnowledgeStore(
+            config=remote_config,
+            embedding_service=mock_embedding_service,
+        )
+
+    client_cls.assert_called_once_with(
+        url="http://qdrant.internal:6333",
+        api_key="secret",
+        prefer_grpc=True,
+        grpc_port=7334,
+        timeout=5,
+        pool_size=8,
+    )
+    assert store.client is client_cls.return_value
 
 
 # ── Tests: Upsert and Retrieval ─────────────────────────────────────────────
@@ -372,3 +401,104 @@ async def test_hybrid_search_empty_for_wrong_tenant(
     )
 
     assert len(results) == 0
+
+
+async def test_hybrid_search_batch_returns_scored_results_per_query(
+    store: QdrantKnowledgeStore,
+    mock_embedding_service: EmbeddingService,
+):
+    """Batch search embeds once and returns normalized scores in query order."""
+    chunks = [
+        _make_chunk(
+            tenant_id="tenant-1",
+            content=f"Knowledge chunk number {i}",
+            dense_seed=0.1 * (i + 1),
+            sparse_terms=[1, 5, 10 + i, 50, 100],
+        )
+        for i in range(5)
+    ]
+    await store.upsert_chunks(chunks, tenant_id="tenant-1")
+    mock_embedding_service.embed_batch.reset_mock()
+
+    results = await store.hybrid_search_batch(
+        queries=[
+            ("knowledge chunk", None),
+            ("missing category", {"product_category": "nonexistent"}),
+        ],
+        tenant_id="tenant-1",
+        top_k=3,
+    )
+
+    mock_embedding_service.embed_batch.assert_awaited_once_with(
+        ["knowledge chunk", "missing category"]
+    )
+    assert len(results) == 2
+    assert 0 < len(results[0]) <= 3
+    assert results[1] == []
+    for chunk, score in results[0]:
+        assert chunk.tenant_id == "tenant-1"
+        assert 0.0 < score <= 1.0
+    scores = [score for _, score in results[0]]
+    assert scores == sorted(scores, reverse=True)
+
+
+async def test_hybrid_search_batch_empty_queries(store: QdrantKnowledgeStore):
+    """An empty batch short-circuits without touching Qdrant."""
+    assert await store.hybrid_search_batch(queries=[], tenant_id="tenant-1") == []
+    assert await store.search_hits_batch(queries=[], tenant_id="tenant-1") == []
+
+
+async def test_search_hits_batch_returns_projected_hits(store: QdrantKnowledgeStore):
+    """Slim hits carry only the projected payload and match the full search."""
+    chunks = [
+        _make_chunk(
+            tenant_id="tenant-1",
+            content=f"Knowledge chunk number {i}",
+            dense_seed=0.1 * (i + 1),
+            sparse_terms=[1, 5, 10 + i, 50, 100],
+        )
+        for i in range(5)
+    ]
+    await store.upsert_chunks(chunks, tenant_id="tenant-1")
+    queries = [("knowledge chunk", None)]
+
+    full = await store.hybrid_search_batch(queries=queries, tenant_id="tenant-1", top_k=3)
+    hits = await store.search_hits_batch(queries=queries, tenant_id="tenant-1", top_k=3)
+
+    assert len(hits) == 1
+    assert all(isinstance(hit, KnowledgeHit) for hit in hits[0])
+    assert [(h.id, h.content, h.score) for h in hits[0]] == [
+        (c.id, c.content, score) for c, score in full[0]
+    ]
+    assert all(hit.source_document == "test_doc.pdf" for hit in hits[0])
+    assert all(hit.payload == {} for hit in hits[0])
+
+    extra = await store.search_hits_batch(
+        queries=queries,
+        tenant_id="tenant-1",
+        top_k=1,
+        payload_fields=["content", "source_document", "product_category"],
+    )
+    assert extra[0][0].payload == {"product_category": "monetization"}
+
+
+async def test_payload_projection_on_search_and_get(store: QdrantKnowledgeStore):
+    """Projected searches fetch only the requested fields; the rest default."""
+    chunk = _make_chunk(
+        tenant_id="tenant-1", content="Billing overview", product_category="billing"
+    )
+    await store.upsert_chunks([chunk], tenant_id="tenant-1")
+
+    results = await store.hybrid_search(
+        query_text="billing",
+        tenant_id="tenant-1",
+        payload_fields=["content"],
+    )
+    assert results[0].content == "Billing overview"
+    assert results[0].metadata.source_document == ""
+
+    retrieved = await store.get_chunk(chunk.id, tenant_id="tenant-1", payload_fields=["content"])
+    assert retrieved is not None
+    assert retrieved.tenant_id == "tenant-1"
+    assert retrieved.metadata.product_category == "monetization"  # default, not fetched
+    assert await store.get_chunk(chunk.id, tenant_id="tenant-2", payload_fields=["content"]) is None
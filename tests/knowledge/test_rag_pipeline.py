@@ -12,6 +12,7 @@ Qdrant operations use mock stores returning deterministic results.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from typing import Any
@@ -19,11 +20,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.knowledge.models import ChunkMetadata, ConversationMessage, KnowledgeChunk
+from src.knowledge.models import ChunkMetadata, ConversationMessage, KnowledgeChunk, KnowledgeHit
 from src.knowledge.rag.decomposer import QueryDecomposer, SubQuery
-from src.knowledge.rag.pipeline import AgenticRAGPipeline, RAGResponse
+from src.knowledge.rag.pipeline import AgenticRAGPipeline, RAGResponse, RAGState
 from src.knowledge.rag.retriever import MultiSourceRetriever, RetrievedChunk
 from src.knowledge.rag.synthesizer import (
+    NO_SOURCES_RESPONSE,
     ResponseSynthesizer,
     SourceCitation,
     SynthesizedResponse,
@@ -187,6 +189,31 @@ def mock_knowledge_store() -> MagicMock:
         return product_chunks
 
     store.hybrid_search = AsyncMock(side_effect=mock_hybrid_search)
+
+    async def mock_search_hits_batch(
+        queries: list[tuple[str, dict | None]],
+        tenant_id: str,
+        top_k: int | None = None,
+        query_vectors: list | None = None,
+    ) -> list[list[KnowledgeHit]]:
+        """Batch variant: same results as slim hits, by descending fused score."""
+        batch = []
+        for query_text, filters in queries:
+            results = await mock_hybrid_search(query_text, tenant_id, filters, top_k)
+            batch.append(
+                [
+                    KnowledgeHit(
+                        id=chunk.id,
+                        content=chunk.content,
+                        source_document=chunk.metadata.source_document,
+                        score=0.9 - 0.1 * i,
+                    )
+                    for i, chunk in enumerate(results)
+                ]
+            )
+        return batch
+
+    store.search_hits_batch = AsyncMock(side_effect=mock_search_hits_batch)
     return store
 
 
@@ -211,6 +238,18 @@ def mock_conversation_store() -> MagicMock:
         return conversation_results
 
     store.search_conversations = AsyncMock(side_effect=mock_search_conversations)
+
+    async def mock_search_conversations_scored(
+        tenant_id: str,
+        query: str,
+        top_k: int = 10,
+        **kwargs: Any,
+    ) -> list[tuple[ConversationMessage, float]]:
+        return [(msg, 0.8) for msg in conversation_results]
+
+    store.search_conversations_scored = AsyncMock(
+        side_effect=mock_search_conversations_scored
+    )
     return store
 
 
@@ -436,6 +475,112 @@ class TestMultiSourceRetriever:
             assert isinstance(r.relevance_score, float)
             assert 0.0 <= r.relevance_score <= 1.0
 
+    async def test_retrieval_normalizes_scores_across_sources(
+        self,
+        mock_knowledge_store: MagicMock,
+        mock_conversation_store: MagicMock,
+    ):
+        """RRF and cosine scores are rescaled per sub-query before merging."""
+        messages = [
+            _make_conversation_message(content=f"Pricing call {i}", session_id="s-prev")
+            for i in range(3)
+        ]
+        mock_conversation_store.search_conversations_scored = AsyncMock(
+            return_value=list(zip(messages, [0.55, 0.4, 0.25], strict=True))
+        )
+        retriever = MultiSourceRetriever(
+            knowledge_store=mock_knowledge_store,
+            conversation_store=mock_conversation_store,
+        )
+        sub_queries = [
+            SubQuery(query="Monetization Platform", source_type="product", filters={}),
+            SubQuery(query="previous pricing talks", source_type="conversation", filters={}),
+        ]
+
+        results = await retriever.retrieve(sub_queries=sub_queries, tenant_id="test-tenant")
+
+        by_id = {r.chunk_id: r for r in results}
+        assert by_id[messages[0].id].relevance_score == 1.0
+        assert by_id[messages[1].id].relevance_score == pytest.approx(0.5)
+        assert by_id[messages[2].id].relevance_score == 0.0
+        product = [r for r in results if r.source_type == "product"]
+        assert max(r.relevance_score for r in product) == 1.0
+        # The best conversation hit now outranks weaker product hits
+        assert results.index(by_id[messages[0].id]) < results.index(
+            min(product, key=lambda r: r.relevance_score)
+        )
+        assert [r.relevance_score for r in results] == sorted(
+            (r.relevance_score for r in results), reverse=True
+        )
+
+    async def test_knowledge_sub_queries_use_single_batch(
+        self,
+        mock_knowledge_store: MagicMock,
+        mock_conversation_store: MagicMock,
+    ):
+        """All sub-queries embed in one call; knowledge searches go in one batch."""
+        embedder = MagicMock()
+        embedder.embed_batch = AsyncMock(
+            side_effect=lambda texts: [([float(i)], {"indices": [i], "values": [1.0]}) for i in range(len(texts))]
+        )
+        retriever = MultiSourceRetriever(
+            knowledge_store=mock_knowledge_store,
+            conversation_store=mock_conversation_store,
+            embedder=embedder,
+        )
+        sub_queries = [
+            SubQuery(query="features", source_type="product", filters={"content_type": "product"}),
+            SubQuery(query="history", source_type="conversation", filters={}),
+            SubQuery(query="MEDDIC", source_type="methodology", filters={"content_type": "methodology"}),
+        ]
+
+        await retriever.retrieve(sub_queries=sub_queries, tenant_id="test-tenant")
+
+        embedder.embed_batch.assert_awaited_once_with(["features", "history", "MEDDIC"])
+        mock_knowledge_store.search_hits_batch.assert_awaited_once()
+        kwargs = mock_knowledge_store.search_hits_batch.call_args.kwargs
+        assert kwargs["queries"] == [
+            ("features", {"content_type": "product"}),
+            ("MEDDIC", {"content_type": "methodology"}),
+        ]
+        assert [v[0] for v in kwargs["query_vectors"]] == [[0.0], [2.0]]
+        conv_kwargs = mock_conversation_store.search_conversations_scored.call_args.kwargs
+        assert conv_kwargs["query_vector"] == [1.0]
+        mock_knowledge_store.hybrid_search.assert_not_called()
+
+    async def test_conversation_searches_bounded_concurrency(
+        self,
+        mock_knowledge_store: MagicMock,
+        mock_conversation_store: MagicMock,
+    ):
+        """Conversation sub-queries run concurrently but never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(tenant_id: str, query: str, top_k: int = 10, **kwargs: Any):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        mock_conversation_store.search_conversations_scored = AsyncMock(side_effect=slow_search)
+        retriever = MultiSourceRetriever(
+            knowledge_store=mock_knowledge_store,
+            conversation_store=mock_conversation_store,
+            max_concurrency=2,
+        )
+        sub_queries = [
+            SubQuery(query=f"history {i}", source_type="conversation", filters={})
+            for i in range(5)
+        ]
+
+        await retriever.retrieve(sub_queries=sub_queries, tenant_id="test-tenant")
+
+        assert mock_conversation_store.search_conversations_scored.await_count == 5
+        assert peak == 2
+
 
 # ── Tests: ResponseSynthesizer ───────────────────────────────────────────────
 
@@ -647,7 +792,8 @@ class TestAgenticRAGPipeline:
         # Verify the retriever was called with correct tenant_id
         retriever = pipeline._retriever
         store = retriever._knowledge_store
-        for call in store.hybrid_search.call_args_list:
+        assert store.search_hits_batch.call_args_list
+        for call in store.search_hits_batch.call_args_list:
             _, kwargs = call
             assert kwargs.get("tenant_id") == "test-tenant"
 
@@ -671,3 +817,216 @@ class TestAgenticRAGPipeline:
         assert isinstance(response, RAGResponse)
         assert isinstance(response.confidence, float)
         assert 0.0 <= response.confidence <= 1.0
+
+
+# ── Tests: Grading Modes ─────────────────────────────────────────────────────
+
+
+def _make_retrieved(n: int) -> list[RetrievedChunk]:
+    return [
+        RetrievedChunk(
+            chunk_id=f"chunk-{i}",
+            content=f"Document body {i}",
+            source_type="product",
+            relevance_score=0.5,
+        )
+        for i in range(n)
+    ]
+
+
+class TestGradingModes:
+    """Tests for per-chunk concurrent and single-call batch grading."""
+
+    def _pipeline(self, grading_llm: Any, **kwargs: Any) -> AgenticRAGPipeline:
+        return AgenticRAGPipeline(
+            decomposer=MagicMock(),
+            retriever=MagicMock(),
+            synthesizer=MagicMock(),
+            grading_llm=grading_llm,
+            **kwargs,
+        )
+
+    async def test_batch_grading_uses_single_call(self):
+        """Batch mode grades every chunk with one LLM call and maps verdicts by ID."""
+        llm = MockLLM(default_response='{"1": "yes", "2": "no", "3": "yes"}')
+        pipeline = self._pipeline(llm, grading_mode="batch")
+
+        verdicts = await pipeline._grade_batch("pricing?", _make_retrieved(3))
+
+        assert verdicts == [True, False, True]
+        assert len(llm.call_history) == 1
+        assert "[3] Document body 2" in llm.call_history[0]
+
+    async def test_batch_grading_missing_ids_fail_open(self):
+        """IDs the LLM omits are treated as relevant."""
+        llm = MockLLM(default_response='Here you go: {"1": false, "[2]": true}')
+        pipeline = self._pipeline(llm, grading_mode="batch")
+
+        verdicts = await pipeline._grade_batch("pricing?", _make_retrieved(3))
+
+        assert verdicts == [False, True, True]
+
+    async def test_batch_grading_falls_back_to_per_chunk(self):
+        """Unparseable batch output falls back to per-chunk grading."""
+        llm = MockLLM(
+            response_map={"for each document": "not json", "Document body 1": "no"},
+            default_response="yes",
+        )
+        pipeline = self._pipeline(llm, grading_mode="batch")
+        state = RAGState(query="pricing?", tenant_id="t", retrieved_chunks=_make_retrieved(3))
+
+        state = await pipeline._grade(state)
+
+        assert [c.chunk_id for c in state.irrelevant_chunks] == ["chunk-1"]
+        assert len(state.relevant_chunks) == 2
+        assert len(llm.call_history) == 4  # 1 batch attempt + 3 per-chunk
+
+    async def test_per_chunk_grading_bounded_concurrency(self):
+        """Per-chunk grades run concurrently, never above grading_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_grade(prompt: str, **kwargs: Any) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "no" if "Document body 0" in prompt else "yes"
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(side_effect=slow_grade)
+        pipeline = self._pipeline(llm, grading_concurrency=3)
+        state = RAGState(query="pricing?", tenant_id="t", retrieved_chunks=_make_retrieved(7))
+
+        state = await pipeline._grade(state)
+
+        assert llm.ainvoke.await_count == 7
+        assert peak == 3
+        # Order of the original retrieval is preserved
+        assert [c.chunk_id for c in state.relevant_chunks] == [f"chunk-{i}" for i in range(1, 7)]
+        assert [c.chunk_id for c in state.irrelevant_chunks] == ["chunk-0"]
+
+    def test_unknown_grading_mode_rejected(self):
+        """An unknown grading mode raises at construction time."""
+        with pytest.raises(ValueError, match="grading_mode"):
+            self._pipeline(MockLLM(), grading_mode="parallel")
+
+
+# ── Tests: Streaming ─────────────────────────────────────────────────────────
+
+
+class StreamingMockLLM(MockLLM):
+    """MockLLM that also streams its response word by word."""
+
+    async def astream(self, prompt: str, **kwargs: Any):
+        response = await self.ainvoke(prompt)
+        for i, word in enumerate(response.split(" ")):
+            yield word if i == 0 else f" {word}"
+
+
+class TestStreaming:
+    """Tests for ResponseSynthesizer.stream_answer and AgenticRAGPipeline.run_stream."""
+
+    async def test_stream_answer_uses_astream(self):
+        """Tokens come from astream and concatenate to the full answer."""
+        llm = StreamingMockLLM(default_response="Pricing starts at $500 [1].")
+        synthesizer = ResponseSynthesizer(llm=llm)
+
+        pieces = [p async for p in synthesizer.stream_answer("pricing?", _make_retrieved(2))]
+
+        assert len(pieces) > 1
+        assert "".join(pieces) == "Pricing starts at $500 [1]."
+
+    async def test_stream_answer_falls_back_to_ainvoke(self):
+        """An LLM without astream yields the full answer as one piece."""
+        synthesizer = ResponseSynthesizer(llm=MockLLM(default_response="Answer [1]."))
+
+        pieces = [p async for p in synthesizer.stream_answer("pricing?", _make_retrieved(2))]
+
+        assert pieces == ["Answer [1]."]
+
+    async def test_stream_answer_no_chunks(self):
+        """No chunks yields the no-sources response."""
+        synthesizer = ResponseSynthesizer(llm=StreamingMockLLM())
+
+        pieces = [p async for p in synthesizer.stream_answer("pricing?", [])]
+
+        assert pieces == [NO_SOURCES_RESPONSE]
+
+    async def test_run_stream_event_order(self, pipeline: AgenticRAGPipeline):
+        """run_stream emits sub_queries, sources, tokens, then done."""
+        pipeline._synthesizer._llm = StreamingMockLLM(
+            default_response="The platform supports usage-based pricing [1]."
+        )
+
+        events = [
+            e
+            async for e in pipeline.run_stream(
+                query="What is Monetization Platform pricing?",
+                tenant_id="test-tenant",
+            )
+        ]
+
+        types = [e.type for e in events]
+        assert types[0] == "sub_queries"
+        assert types[1] == "sources"
+        assert types[-1] == "done"
+        assert set(types[2:-1]) == {"token"}
+        assert len(types) > 4
+
+        sources = events[1].data["sources"]
+        assert [s["citation_id"] for s in sources] == list(range(1, len(sources) + 1))
+
+        done = events[-1].data
+        streamed = "".join(e.data["text"] for e in events if e.type == "token")
+        assert done["answer"] == streamed
+        assert [s["citation_id"] for s in done["sources"]] == [1]
+        assert done["iterations"] == 1
+        assert 0.0 <= done["confidence"] <= 1.0
+
+    async def test_run_stream_failure_after_first_token_is_not_cached(
+        self, pipeline: AgenticRAGPipeline
+    ):
+        """A stream that breaks mid-answer raises instead of finishing as done."""
+
+        class BrokenStreamLLM(MockLLM):
+            async def astream(self, prompt: str, **kwargs: Any):
+                yield "The platform"
+                raise ConnectionError("stream reset")
+
+        pipeline._synthesizer._llm = BrokenStreamLLM()
+        answer_cache = MagicMock()
+        answer_cache.lookup = AsyncMock(return_value=None)
+        answer_cache.store = AsyncMock()
+        pipeline._answer_cache = answer_cache
+
+        events = []
+        with pytest.raises(ConnectionError, match="stream reset"):
+            async for event in pipeline.run_stream(
+                query="What is Monetization Platform pricing?",
+                tenant_id="test-tenant",
+            ):
+                events.append(event)
+
+        assert [e.type for e in events] == ["sub_queries", "sources", "token"]
+        answer_cache.store.assert_not_awaited()
+
+    async def test_run_stream_matches_run(self, pipeline: AgenticRAGPipeline):
+        """The final streamed record matches the non-streaming response."""
+        response = await pipeline.run(
+            query="What is Monetization Platform pricing?",
+            tenant_id="test-tenant",
+        )
+        events = [
+            e
+            async for e in pipeline.run_stream(
+                query="What is Monetization Platform pricing?",
+                tenant_id="test-tenant",
+            )
+        ]
+
+        done = events[-1].data
+        assert done["answer"] == response.answer
+        assert done["confidence"] == response.confidence
+        assert done["sources"] == [s.model_dump() for s in response.sources]
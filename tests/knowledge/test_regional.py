@@ -11,6 +11,7 @@ Tests cover:
 from __future__ import annotations
 
 import math
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -18,6 +19,7 @@ import pytest
 from src.knowledge.config import KnowledgeBaseConfig
 from src.knowledge.embeddings import EmbeddingService
 from src.knowledge.methodology.loader import MethodologyLoader
+from src.knowledge.models import ChunkMetadata, KnowledgeChunk
 from src.knowledge.qdrant_client import QdrantKnowledgeStore
 from src.knowledge.regional.nuances import RegionalNuances, get_regional_context
 
@@ -64,7 +66,7 @@ def mock_embedding_service(config) -> EmbeddingService:
     service.embed_text = AsyncMock(side_effect=mock_embed_text)
 
     async def mock_embed_batch(
-        texts: list[str],
+        texts: list[str], populate_cache: bool = True
     ) -> list[tuple[list[float], dict]]:
         results = []
         for text in texts:
@@ -86,7 +88,7 @@ async def store(config, mock_embedding_service) -> QdrantKnowledgeStore:
     )
     await store.initialize_collections()
     yield store
-    store.close()
+    await store.close()
 
 
 @pytest.fixture
@@ -272,19 +274,50 @@ class TestRegionalIngestion:
         for chunk in results:
             assert "apac" in chunk.metadata.region
 
-    async def test_regional_tenant_isolation(
+    async def test_regional_shared_across_tenants(
         self, store: QdrantKnowledgeStore, mock_embedding_service
     ):
-        """Regional data loaded for one tenant is not visible to another."""
+        """Regional data is stored once in the shared partition for all tenants."""
         loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
-        await loader.load_regional_data(tenant_id="tenant-x")
+        count = await loader.load_regional_data(tenant_id="tenant-x")
+        await loader.load_regional_data(tenant_id="tenant-y")
 
+        assert (await store.client.count(collection_name="knowledge_base")).count == count
         results = await store.hybrid_search(
             query_text="APAC regional nuances",
             tenant_id="tenant-y",
         )
+        assert len(results) > 0
+        assert {chunk.tenant_id for chunk in results} == {store.shared_tenant_id}
 
-        assert len(results) == 0
+    async def test_shared_partition_does_not_leak_tenant_content(
+        self, store: QdrantKnowledgeStore, mock_embedding_service
+    ):
+        """Tenant-owned chunks stay private while shared content is visible to all."""
+        loader = MethodologyLoader(store=store, embedder=mock_embedding_service)
+        await loader.load_regional_data(tenant_id="tenant-x")
+        private = KnowledgeChunk(
+            id=str(uuid.uuid4()),
+            tenant_id="tenant-x",
+            content="Tenant X confidential APAC discount schedule",
+            metadata=ChunkMetadata(
+                product_category="monetization",
+                buyer_persona=["business"],
+                sales_stage=["negotiation"],
+                region=["apac"],
+                content_type="regional",
+                source_document="private.md",
+            ),
+        )
+        await store.upsert_chunks([private], tenant_id="tenant-x")
+
+        results = await store.hybrid_search(
+            query_text="APAC discount schedule",
+            tenant_id="tenant-y",
+            top_k=50,
+        )
+        assert private.id not in {chunk.id for chunk in results}
+        assert await store.get_chunk(private.id, tenant_id="tenant-y") is None
 
     async def test_load_all_loads_both_types(
         self, store: QdrantKnowledgeStore, mock_embedding_service
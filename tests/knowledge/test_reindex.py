@@ -0,0 +1,328 @@
+"""Tests for alias-based knowledge collection versioning and KnowledgeReindexer.
+
+Uses Qdrant local mode with tmp_path. Embeddings are mocked; the reindex
+target uses different dimensions so the tests can tell which collection
+(and which embedding settings) served each point.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchValue,
+    SparseIndexParams,
+    SparseVectorParams,
+    VectorParams,
+)
+
+from src.knowledge.config import KnowledgeBaseConfig
+from src.knowledge.embeddings import EmbeddingService
+from src.knowledge.models import ChunkMetadata, KnowledgeChunk
+from src.knowledge.qdrant_client import QdrantKnowledgeStore, collection_version
+from src.knowledge.reindex import KnowledgeReindexer, ReindexError
+
+OLD_DIMS = 16
+NEW_DIMS = 8
+
+
+def _embedder(dims: int) -> MagicMock:
+    """Mock EmbeddingService producing deterministic vectors of the given size."""
+    service = MagicMock(spec=EmbeddingService)
+
+    async def embed_batch(
+        texts: list[str], populate_cache: bool = True
+    ) -> list[tuple[list[float], dict]]:
+        return [
+            (
+                [math.sin((len(text) + 1) * (i + 1)) for i in range(dims)],
+                {"indices": [1, 2], "values": [0.5, 0.5]},
+            )
+            for text in texts
+        ]
+
+    async def embed_text(text: str) -> tuple[list[float], dict]:
+        return (await embed_batch([text]))[0]
+
+    service.embed_batch = AsyncMock(side_effect=embed_batch)
+    service.embed_text = AsyncMock(side_effect=embed_text)
+    return service
+
+
+def _config(tmp_path, dims: int) -> KnowledgeBaseConfig:
+    return KnowledgeBaseConfig(
+        qdrant_path=str(tmp_path / "qdrant"),
+        openai_api_key="test-key-not-used",
+        embedding_dimensions=dims,
+        answer_cache_enabled=False,
+    )
+
+
+def _chunk(tenant_id: str, content: str) -> KnowledgeChunk:
+    return KnowledgeChunk(
+        id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        content=content,
+        metadata=ChunkMetadata(
+            product_category="monetization",
+            buyer_persona=["technical"],
+            sales_stage=["discovery"],
+            region=["global"],
+            content_type="product",
+            source_document="pricing.md",
+        ),
+    )
+
+
+async def _seeded_store(tmp_path, counts: dict[str, int]) -> QdrantKnowledgeStore:
+    """A store on OLD_DIMS with counts[tenant] chunks per tenant."""
+    store = QdrantKnowledgeStore(_config(tmp_path, OLD_DIMS), _embedder(OLD_DIMS))
+    await store.initialize_collections()
+    for tenant_id, count in counts.items():
+        chunks = [_chunk(tenant_id, f"{tenant_id} chunk {i}") for i in range(count)]
+        await store.upsert_chunks(chunks, tenant_id)
+    return store
+
+
+async def _reopen(store: QdrantKnowledgeStore, tmp_path) -> QdrantKnowledgeStore:
+    """Close the old-settings store and open the same path with NEW_DIMS."""
+    await store.close()
+    return QdrantKnowledgeStore(_config(tmp_path, NEW_DIMS), _embedder(NEW_DIMS))
+
+
+async def _alias_target(store: QdrantKnowledgeStore) -> str | None:
+    return await store.resolve_knowledge_collection()
+
+
+# ── Alias setup ─────────────────────────────────────────────────────────────
+
+
+def test_collection_version_parsing():
+    assert collection_version("knowledge_base", "knowledge_base") == 0
+    assert collection_version("knowledge_base", "knowledge_base_v12") == 12
+    assert collection_version("knowledge_base", "knowledge_base_vx") is None
+    assert collection_version("knowledge_base", "conversations") is None
+
+
+async def test_initialize_creates_versioned_collection_behind_alias(tmp_path):
+    """The store reads and writes knowledge_base through an alias to _v1."""
+    store = await _seeded_store(tmp_path, {"t1": 3})
+
+    assert await _alias_target(store) == "knowledge_base_v1"
+    assert (await store.client.count("knowledge_base_v1")).count == 3
+    assert len(await store.hybrid_search("t1 chunk 1", tenant_id="t1")) == 3
+
+    # Idempotent: a second initialize keeps the same alias target
+    await store.initialize_collections()
+    assert await _alias_target(store) == "knowledge_base_v1"
+    await store.close()
+
+
+# ── Reindex ─────────────────────────────────────────────────────────────────
+
+
+async def test_reindex_rebuilds_and_swaps_alias(tmp_path):
+    """Points are re-embedded into _v2 with the new settings, then the alias moves."""
+    old = await _seeded_store(tmp_path, {"t1": 5, "t2": 3})
+    store = await _reopen(old, tmp_path)
+    state_path = tmp_path / "reindex.json"
+
+    report = await KnowledgeReindexer(store, state_path, batch_size=2, concurrency=2).run()
+
+    assert (report.source, report.target) == ("knowledge_base_v1", "knowledge_base_v2")
+    assert report.copied == 8
+    assert report.tenant_counts == {"t1": 5, "t2": 3}
+    assert report.swapped and not report.resumed
+    assert not state_path.exists()
+
+    assert await _alias_target(store) == "knowledge_base_v2"
+    info = await store.client.get_collection("knowledge_base_v2")
+    assert info.config.params.vectors["dense"].size == NEW_DIMS
+    # Previous collection kept for rollback
+    assert await store.client.collection_exists("knowledge_base_v1")
+
+    hits = await store.hybrid_search("t2 chunk 0", tenant_id="t2")
+    assert {hit.tenant_id for hit in hits} == {"t2"}
+    assert len(hits) == 3
+    await store.close()
+
+
+async def test_reindex_resumes_from_checkpoint_after_crash(tmp_path):
+    """A job killed midway continues from the saved offset, not from scratch."""
+    old = await _seeded_store(tmp_path, {"t1": 6})
+    store = await _reopen(old, tmp_path)
+    state_path = tmp_path / "reindex.json"
+
+    embed_batch = store._embeddings.embed_batch.side_effect
+    calls = 0
+
+    async def flaky_embed_batch(texts: list[str], populate_cache: bool = True):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("embedding provider unavailable")
+        return await embed_batch(texts)
+
+    store._embeddings.embed_batch.side_effect = flaky_embed_batch
+    reindexer = KnowledgeReindexer(store, state_path, batch_size=2, concurrency=1)
+    with pytest.raises(RuntimeError):
+        await reindexer.run()
+
+    checkpoint = json.loads(state_path.read_text())
+    assert checkpoint["copied"] == 4
+    assert checkpoint["copy_done"] is False
+    assert await _alias_target(store) == "knowledge_base_v1"
+
+    store._embeddings.embed_batch.side_effect = embed_batch
+    store._embeddings.embed_batch.reset_mock()
+    report = await KnowledgeReindexer(store, state_path, batch_size=2, concurrency=1).run()
+
+    assert report.resumed
+    assert report.copied == 6
+    assert report.tenant_counts == {"t1": 6}
+    # Only the remaining batch was re-embedded
+    assert store._embeddings.embed_batch.await_count == 1
+    assert await _alias_target(store) == "knowledge_base_v2"
+    await store.close()
+
+
+async def test_reindex_reconciles_live_writes_before_swap(tmp_path):
+    """Chunks added or deleted after the copy are caught up before the swap.
+
+    t2 loses one chunk and gains one, so its count alone looks unchanged.
+    """
+    old = await _seeded_store(tmp_path, {"t1": 4, "t2": 2})
+    store = await _reopen(old, tmp_path)
+    state_path = tmp_path / "reindex.json"
+
+    report = await KnowledgeReindexer(store, state_path).run(swap=False)
+    assert not report.swapped
+    assert await _alias_target(store) == "knowledge_base_v1"
+
+    # Live traffic keeps writing through the alias into _v1
+    records, _ = await store.client.scroll(
+        "knowledge_base_v1",
+        scroll_filter=Filter(must=[FieldCondition(key="tenant_id", match=MatchValue(value="t2"))]),
+        limit=1,
+    )
+    await store.delete_chunks([str(records[0].id)], "t2")
+    store._config.embedding_dimensions = OLD_DIMS
+    store._embeddings = _embedder(OLD_DIMS)
+    await store.upsert_chunks([_chunk("t2", "late chunk")], "t2")
+    store._config.embedding_dimensions = NEW_DIMS
+    store._embeddings = _embedder(NEW_DIMS)
+
+    report = await KnowledgeReindexer(store, state_path).run()
+
+    assert report.reconciled == 2
+    assert report.swapped
+    assert report.tenant_counts == {"t1": 4, "t2": 2}
+    hits = await store.hybrid_search("late chunk", tenant_id="t2")
+    assert "late chunk" in {hit.content for hit in hits}
+    assert str(records[0].id) not in {hit.id for hit in hits}
+    await store.close()
+
+
+async def test_reindex_migrates_pre_alias_collection(tmp_path):
+    """A plain knowledge_base collection is replaced by an alias to _v1."""
+    config = _config(tmp_path, OLD_DIMS)
+    store = QdrantKnowledgeStore(config, _embedder(OLD_DIMS))
+    await store.client.create_collection(
+        collection_name="knowledge_base",
+        vectors_config={"dense": VectorParams(size=OLD_DIMS, distance="Cosine")},
+        sparse_vectors_config={"bm25": SparseVectorParams(index=SparseIndexParams())},
+    )
+    await store.initialize_collections()
+    assert await _alias_target(store) == "knowledge_base"
+    await store.upsert_chunks([_chunk("t1", "legacy chunk")], "t1")
+
+    store = await _reopen(store, tmp_path)
+    report = await KnowledgeReindexer(store, tmp_path / "reindex.json").run()
+
+    assert (report.source, report.target) == ("knowledge_base", "knowledge_base_v1")
+    assert report.cutover is True
+    assert await _alias_target(store) == "knowledge_base_v1"
+    assert len(await store.hybrid_search("legacy chunk", tenant_id="t1")) == 1
+
+    # The legacy collection is kept, vectors and all, for rollback
+    assert report.rollback == "knowledge_base_v0"
+    records, _ = await store.client.scroll("knowledge_base_v0", with_vectors=True)
+    assert [record.payload["content"] for record in records] == ["legacy chunk"]
+    assert len(records[0].vector["dense"]) == OLD_DIMS
+    await store.close()
+
+
+async def _plain_store(tmp_path) -> QdrantKnowledgeStore:
+    """A NEW_DIMS store over a pre-alias plain knowledge_base with one chunk."""
+    store = QdrantKnowledgeStore(_config(tmp_path, OLD_DIMS), _embedder(OLD_DIMS))
+    await store.client.create_collection(
+        collection_name="knowledge_base",
+        vectors_config={"dense": VectorParams(size=OLD_DIMS, distance="Cosine")},
+        sparse_vectors_config={"bm25": SparseVectorParams(index=SparseIndexParams())},
+    )
+    await store.initialize_collections()
+    await store.upsert_chunks([_chunk("t1", "legacy chunk")], "t1")
+    return await _reopen(store, tmp_path)
+
+
+async def test_reindex_resumes_cutover_after_source_deleted(tmp_path):
+    """A crash between deleting the plain collection and creating the alias is resumable."""
+    store = await _plain_store(tmp_path)
+    state_path = tmp_path / "reindex.json"
+
+    with patch.object(
+        store.client, "update_collection_aliases", new=AsyncMock(side_effect=RuntimeError("crash"))
+    ):
+        with pytest.raises(RuntimeError, match="crash"):
+            await KnowledgeReindexer(store, state_path).run()
+    assert await _alias_target(store) is None
+    assert json.loads(state_path.read_text())["cutover"] is True
+
+    report = await KnowledgeReindexer(store, state_path).run()
+
+    assert report.resumed and report.swapped
+    assert report.tenant_counts == {"t1": 1}
+    assert report.rollback == "knowledge_base_v0"
+    assert await _alias_target(store) == "knowledge_base_v1"
+    assert len(await store.hybrid_search("legacy chunk", tenant_id="t1")) == 1
+    assert not state_path.exists()
+    await store.close()
+
+
+async def test_reindex_cutover_with_drop_previous_keeps_no_copy(tmp_path):
+    store = await _plain_store(tmp_path)
+
+    report = await KnowledgeReindexer(store, tmp_path / "reindex.json", drop_previous=True).run()
+
+    assert report.swapped and report.rollback is None
+    assert not await store.client.collection_exists("knowledge_base_v0")
+    assert await _alias_target(store) == "knowledge_base_v1"
+    await store.close()
+
+
+async def test_reindex_without_collection_raises(tmp_path):
+    store = QdrantKnowledgeStore(_config(tmp_path, NEW_DIMS), _embedder(NEW_DIMS))
+    with pytest.raises(ReindexError, match="Nothing to reindex"):
+        await KnowledgeReindexer(store, tmp_path / "reindex.json").run()
+    await store.close()
+
+
+async def test_reindex_throttles_to_max_points_per_second(tmp_path):
+    """Each wave sleeps long enough to stay under the throughput cap."""
+    old = await _seeded_store(tmp_path, {"t1": 4})
+    store = await _reopen(old, tmp_path)
+
+    with patch("src.knowledge.reindex.asyncio.sleep", new=AsyncMock()) as sleep:
+        await KnowledgeReindexer(
+            store, tmp_path / "reindex.json", batch_size=2, concurrency=1, max_points_per_second=1
+        ).run()
+
+    assert sleep.await_count == 2
+    assert all(0 < call.args[0] <= 2 for call in sleep.await_args_list)
+    await store.close()
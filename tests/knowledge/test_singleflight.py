@@ -0,0 +1,103 @@
+"""Tests for SingleFlight coalescing of concurrent identical calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.knowledge.singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_upstream_call():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def upstream() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(flight.do("k", upstream)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert [value for value, _ in results] == [42] * 5
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert len(flight) == 0
+
+
+async def test_sequential_calls_are_not_coalesced():
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def upstream() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("k", upstream) == (1, False)
+    assert await flight.do("k", upstream) == (2, False)
+
+
+async def test_failure_propagates_to_every_caller():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def upstream() -> int:
+        await release.wait()
+        raise ValueError("provider down")
+
+    tasks = [asyncio.create_task(flight.do("k", upstream)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(flight) == 0
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def upstream() -> int:
+        await release.wait()
+        return 7
+
+    leader = asyncio.create_task(flight.do("k", upstream))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", upstream))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == (7, True)
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_do_many_computes_only_keys_not_in_flight():
+    flight: SingleFlight[str, str] = SingleFlight()
+    release = asyncio.Event()
+    batches: list[list[str]] = []
+
+    async def upstream(keys: list[str]) -> list[str]:
+        batches.append(keys)
+        await release.wait()
+        return [k.upper() for k in keys]
+
+    first = asyncio.create_task(flight.do_many(["a", "b"], upstream))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(flight.do_many(["b", "c"], upstream))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == (["A", "B"], 0)
+    assert await second == (["B", "C"], 1)
+    assert batches == [["a", "b"], ["c"]]
@@ -0,0 +1,110 @@
+"""Tests for the shared TokenCounter.
+
+The real cl100k_base encoding needs a download, so tiktoken.get_encoding is
+patched to a byte-level encoding (one token per whitespace-delimited piece
+byte) wrapped in a MagicMock that counts encode calls.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import tiktoken
+
+from src.knowledge.tokenizer import TRUNCATE_CHARS_PER_TOKEN, TokenCounter
+
+_BYTES = tiktoken.Encoding(
+    name="bytes",
+    pat_str=r"\S+|\s+",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={},
+)
+
+
+@pytest.fixture
+def encoding():
+    wrapped = MagicMock(wraps=_BYTES)
+    with patch("src.knowledge.tokenizer.tiktoken.get_encoding", return_value=wrapped):
+        yield wrapped
+
+
+def test_count_is_memoized(encoding):
+    counter = TokenCounter()
+
+    assert counter.count("hello world") == 11
+    assert counter.count("hello world") == 11
+    assert counter.count("") == 0
+    assert encoding.encode_ordinary.call_count == 1
+    assert len(counter) == 1
+
+
+def test_count_batch_encodes_misses_in_one_call(encoding):
+    counter = TokenCounter()
+    counter.count("cached")
+    encoding.reset_mock()
+
+    counts = counter.count_batch(["cached", "", "ab", "abc", "ab"])
+
+    assert counts == [6, 0, 2, 3, 2]
+    assert encoding.encode_ordinary.call_count == 0
+    encoding.encode_ordinary_batch.assert_called_once()
+    assert encoding.encode_ordinary_batch.call_args.args[0] == ["ab", "abc", "ab"]
+    assert counter.count_batch(["ab", "abc"]) == [2, 3]
+    assert encoding.encode_ordinary_batch.call_count == 1
+
+
+def test_count_batch_without_cache_leaves_lru_untouched(encoding):
+    counter = TokenCounter()
+
+    assert counter.count_batch(["one", "three"], cache=False) == [3, 5]
+    assert len(counter) == 0
+
+
+def test_special_token_markers_count_as_text(encoding):
+    assert TokenCounter().count("<|endoftext|>") == len("<|endoftext|>")
+
+
+def test_lru_is_bounded(encoding):
+    counter = TokenCounter(cache_size=2)
+    for text in ("a", "b", "c"):
+        counter.count(text)
+
+    assert len(counter) == 2
+    encoding.reset_mock()
+    counter.count("a")  # evicted first
+    assert encoding.encode_ordinary.call_count == 1
+
+
+def test_truncate_keeps_text_that_fits(encoding):
+    counter = TokenCounter()
+
+    assert counter.truncate("short", 10) == "short"
+    assert counter.truncate("anything", 0) == ""
+    # Provably short enough: never encoded
+    assert encoding.encode_ordinary.call_count == 0
+
+    counter.count("x" * 50)
+    assert counter.truncate("x" * 50, 50) == "x" * 50
+    assert encoding.encode_ordinary.call_count == 1
+
+
+def test_truncate_encodes_only_a_window(encoding):
+    counter = TokenCounter()
+    text = "word " * 10_000
+
+    truncated = counter.truncate(text, 20)
+
+    assert truncated == text[:20]
+    window = encoding.encode_ordinary.call_args.args[0]
+    assert len(window) == 20 * TRUNCATE_CHARS_PER_TOKEN
+
+
+def test_truncate_handles_multibyte_text(encoding):
+    counter = TokenCounter()
+    text = "é" * 10  # two bytes, so two tokens, each
+
+    truncated = counter.truncate(text, 6)
+
+    assert truncated == "é" * 3
+    assert counter.count(truncated) <= 6
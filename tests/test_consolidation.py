@@ -1,6 +1,6 @@
 """Comprehensive tests for cross-channel data consolidation.
 
-Tests EntityLinker (6 tests), ContextSummarizer (5 tests), and
+Tests EntityLinker (6 tests), ContextSummarizer (6 tests), and
 CustomerViewService (5 tests) using in-memory test doubles.
 No database or external services required.
 """
@@ -296,7 +296,7 @@ class TestEntityLinkerConflictResolution:
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-#  ContextSummarizer Tests (5)
+#  ContextSummarizer Tests (6)
 # ══════════════════════════════════════════════════════════════════════════════
 
 
@@ -435,6 +435,24 @@ class TestContextSummarizer:
             # Rule-based prefix includes the period label in brackets
             assert "[" in s["summary"]
 
+    @pytest.mark.asyncio
+    async def test_cached_llm_summary_is_deterministic(self) -> None:
+        """Cached period summaries are requested at temperature 0."""
+        calls: list[dict[str, Any]] = []
+
+        class _RecordingLLM:
+            async def completion(self, **kwargs: Any) -> dict[str, Any]:
+                calls.append(kwargs)
+                return {"content": "Summary"}
+
+        summarizer = ContextSummarizer(llm_service=_RecordingLLM())
+
+        result = await summarizer.summarize_timeline([_make_interaction(45)])
+
+        assert result.medium_summaries[0]["summary"] == "Summary"
+        assert calls[0]["temperature"] == 0.0
+        assert calls[0]["cache_ttl"] == ContextSummarizer.DEFAULT_CACHE_TTL
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  CustomerViewService Tests (5)
@@ -0,0 +1,137 @@
+"""Tests for the knowledge base SSE streaming endpoint.
+
+Uses a minimal FastAPI app with the knowledge router, overridden auth and
+tenant dependencies, and a fake RAG pipeline on app.state. No database or
+Qdrant required.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.knowledge.rag.pipeline import RAGStreamEvent
+
+TENANT_ID = str(uuid.uuid4())
+
+
+# ── Test Doubles ─────────────────────────────────────────────────────────────
+
+
+class FakeUser:
+    """Minimal User stand-in for authentication dependency override."""
+
+    id = "test-user-1"
+    tenant_id = TENANT_ID
+    is_active = True
+
+
+class FakeTenantContext:
+    """Minimal TenantContext stand-in."""
+
+    tenant_id = TENANT_ID
+    slug = "test-tenant"
+
+
+class FakeStreamingPipeline:
+    """Records run_stream calls and replays a fixed event sequence."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._fail_after = fail_after
+
+    async def run_stream(self, **kwargs: Any):
+        self.calls.append(kwargs)
+        events = [
+            RAGStreamEvent(type="sub_queries", data={"sub_queries": [{"query": "pricing"}]}),
+            RAGStreamEvent(type="sources", data={"sources": [{"citation_id": 1}]}),
+            RAGStreamEvent(type="token", data={"text": "Pricing"}),
+            RAGStreamEvent(type="token", data={"text": " is $500 [1]."}),
+            RAGStreamEvent(
+                type="done",
+                data={"answer": "Pricing is $500 [1].", "sources": [], "iterations": 1, "confidence": 0.9},
+            ),
+        ]
+        for i, event in enumerate(events):
+            if self._fail_after is not None and i == self._fail_after:
+                raise RuntimeError("boom")
+            yield event
+
+
+def _create_test_app(pipeline: Any = None) -> FastAPI:
+    """Create a minimal FastAPI app with the knowledge router and mock deps."""
+    from src.app.api.deps import get_current_user, get_tenant
+    from src.app.api.v1 import knowledge
+
+    app = FastAPI()
+    app.include_router(knowledge.router)
+
+    async def fake_get_user():
+        return FakeUser()
+
+    async def fake_get_tenant():
+        return FakeTenantContext()
+
+    app.dependency_overrides[get_current_user] = fake_get_user
+    app.dependency_overrides[get_tenant] = fake_get_tenant
+    app.state.rag_pipeline = pipeline
+    return app
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+# ── Tests ────────────────────────────────────────────────────────────────────
+
+
+class TestKnowledgeStreamEndpoint:
+    """Tests for POST /knowledge/query/stream."""
+
+    def test_503_when_pipeline_not_initialized(self):
+        """Returns 503 when no RAG pipeline is on app.state."""
+        client = TestClient(_create_test_app(pipeline=None))
+        resp = client.post("/knowledge/query/stream", json={"query": "pricing?"})
+        assert resp.status_code == 503
+
+    def test_streams_pipeline_events_as_sse(self):
+        """Each pipeline event becomes one named SSE event."""
+        pipeline = FakeStreamingPipeline()
+        client = TestClient(_create_test_app(pipeline))
+
+        resp = client.post(
+            "/knowledge/query/stream",
+            json={"query": "pricing?", "filters": {"region": "emea"}},
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(resp.text)
+        assert [name for name, _ in events] == ["sub_queries", "sources", "token", "token", "done"]
+        assert events[-1][1]["answer"] == "Pricing is $500 [1]."
+        assert pipeline.calls == [
+            {"query": "pricing?", "tenant_id": TENANT_ID, "base_filters": {"region": "emea"}}
+        ]
+
+    def test_error_event_on_pipeline_failure(self):
+        """A mid-stream failure ends the stream with an error event."""
+        client = TestClient(_create_test_app(FakeStreamingPipeline(fail_after=3)))
+
+        resp = client.post("/knowledge/query/stream", json={"query": "pricing?"})
+
+        events = _parse_sse(resp.text)
+        assert [name for name, _ in events] == ["sub_queries", "sources", "token", "error"]
+
+    def test_empty_query_rejected(self):
+        """An empty query fails validation."""
+        client = TestClient(_create_test_app(FakeStreamingPipeline()))
+        resp = client.post("/knowledge/query/stream", json={"query": ""})
+        assert resp.status_code == 422
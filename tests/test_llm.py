@@ -9,6 +9,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
 
 # ── LLM Completion Tests ─────────────────────────────────────────────────────
@@ -124,3 +125,441 @@ async def test_llm_fallback_on_primary_failure():
     model_names = [m["model_name"] for m in service.router.model_list]
     assert model_names.count("reasoning") == 2  # Claude + GPT-4o
     assert model_names.count("fast") == 2  # Haiku + GPT-4o-mini
+
+
+# ── Response Cache Tests ─────────────────────────────────────────────────────
+
+
+def _cached_service(redis=None):
+    """LLMService with a mocked router and a response cache."""
+    from src.app.services.llm import LLMService
+    from src.app.services.llm_cache import LLMResponseCache
+
+    with patch("src.app.services.llm.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.ANTHROPIC_API_KEY = "test-anthropic-key"
+        settings.OPENAI_API_KEY = ""
+        settings.LLM_TIMEOUT = 30
+        settings.LLM_MAX_RETRIES = 3
+        mock_settings.return_value = settings
+        service = LLMService(response_cache=LLMResponseCache(redis=redis))
+
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = '{"valid": true}'
+    response.model = "claude-haiku"
+    response.usage.prompt_tokens = 40
+    response.usage.completion_tokens = 5
+    response.usage.total_tokens = 45
+    service.router = MagicMock()
+    service.router.acompletion = AsyncMock(return_value=response)
+    return service
+
+
+@pytest.fixture
+def tenant_ctx():
+    from src.app.core.tenant import TenantContext, _tenant_context, set_tenant_context
+
+    token = set_tenant_context(TenantContext("tenant-a", "alpha", "tenant_alpha"))
+    yield
+    _tenant_context.reset(token)
+
+
+async def test_completion_cache_is_opt_in(tenant_ctx):
+    service = _cached_service()
+    messages = [{"role": "user", "content": "Route this"}]
+
+    await service.completion(messages, model="fast", temperature=0.0)
+    await service.completion(messages, model="fast", temperature=0.0)
+
+    assert service.router.acompletion.await_count == 2
+    assert len(service.response_cache) == 0
+
+
+async def test_completion_cache_hit_skips_provider_and_records_usage(tenant_ctx):
+    from prometheus_client import REGISTRY
+
+    service = _cached_service()
+    messages = [{"role": "user", "content": "Route this"}]
+    labels = {"model": "fast", "tenant_id": "tenant-a"}
+    saved_before = REGISTRY.get_sample_value(
+        "llm_cache_tokens_saved_total", {**labels, "token_type": "prompt"}
+    ) or 0
+
+    first = await service.completion(messages, model="fast", temperature=0.0, cache_ttl=60)
+    # Whitespace-only differences map to the same entry
+    second = await service.completion(
+        [{"role": "user", "content": "  Route this\n"}], model="fast", temperature=0.0, cache_ttl=60
+    )
+
+    service.router.acompletion.assert_awaited_once()
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert second["content"] == first["content"]
+    assert second["usage"] == first["usage"]
+    assert second["tenant_id"] == "tenant-a"
+    assert REGISTRY.get_sample_value(
+        "llm_cache_tokens_saved_total", {**labels, "token_type": "prompt"}
+    ) == saved_before + 40
+
+
+async def test_completion_cache_keys_on_sampling_params_and_bypass(tenant_ctx):
+    service = _cached_service()
+    messages = [{"role": "user", "content": "Route this"}]
+
+    await service.completion(messages, model="fast", temperature=0.0, cache_ttl=60)
+    await service.completion(messages, model="fast", temperature=0.5, cache_ttl=60)
+    await service.completion(messages, model="reasoning", temperature=0.0, cache_ttl=60)
+    await service.completion(messages, model="fast", temperature=0.0, cache_ttl=60, bypass_cache=True)
+
+    assert service.router.acompletion.await_count == 4
+
+
+async def test_completion_cache_is_tenant_scoped():
+    from src.app.core.tenant import TenantContext, _tenant_context, set_tenant_context
+
+    service = _cached_service()
+    messages = [{"role": "user", "content": "Route this"}]
+    for tenant_id in ("tenant-a", "tenant-b"):
+        token = set_tenant_context(TenantContext(tenant_id, tenant_id, tenant_id))
+        try:
+            await service.completion(messages, model="fast", cache_ttl=60)
+        finally:
+            _tenant_context.reset(token)
+
+    assert service.router.acompletion.await_count == 2
+
+
+async def test_completion_cache_redis_tier(tenant_ctx):
+    import json
+
+    redis = MagicMock()
+    stored = {"content": "shared", "model": "claude-haiku", "usage": {"prompt_tokens": 40}}
+    redis.get = AsyncMock(return_value=json.dumps(stored))
+    redis.ttl = AsyncMock(return_value=120)
+    redis.set = AsyncMock()
+    service = _cached_service(redis=redis)
+    messages = [{"role": "user", "content": "Route this"}]
+
+    result = await service.completion(messages, model="fast", cache_ttl=60)
+    again = await service.completion(messages, model="fast", cache_ttl=60)
+
+    service.router.acompletion.assert_not_awaited()
+    assert result["content"] == again["content"] == "shared"
+    redis.get.assert_awaited_once()  # second call served in-process
+    assert redis.get.call_args.args[0].startswith("llm:cache:fast:")
+
+
+async def test_completion_cache_survives_redis_errors(tenant_ctx):
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    redis.set = AsyncMock(side_effect=ConnectionError("down"))
+    service = _cached_service(redis=redis)
+    messages = [{"role": "user", "content": "Route this"}]
+
+    result = await service.completion(messages, model="fast", cache_ttl=60)
+    again = await service.completion(messages, model="fast", cache_ttl=60)
+
+    assert result["content"] == again["content"] == '{"valid": true}'
+    service.router.acompletion.assert_awaited_once()
+
+
+# ── Prompt Caching Tests ─────────────────────────────────────────────────────
+
+
+def test_prompt_caching_marks_fully_static_system_prompt():
+    from src.app.services.llm import PROMPT_CACHE_MIN_CHARS, apply_prompt_caching
+
+    system = "Static methodology. " * (PROMPT_CACHE_MIN_CHARS // 10)
+    messages = [
+        {"role": "system", "content": system, "cache_prefix": system},
+        {"role": "user", "content": "Draft the email"},
+    ]
+
+    result = apply_prompt_caching(messages)
+
+    assert result[0]["content"] == [
+        {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+    ]
+    assert result[1] == messages[1]
+    assert messages[0]["content"] == system  # input untouched
+
+
+def test_prompt_caching_leaves_unmarked_system_prompt_alone():
+    """A long system prompt without cache_prefix may be dynamic, so it is not marked."""
+    from src.app.services.llm import PROMPT_CACHE_MIN_CHARS, apply_prompt_caching
+
+    messages = [
+        {"role": "system", "content": "Existing deals: ..." * PROMPT_CACHE_MIN_CHARS},
+        {"role": "user", "content": "Detect opportunities"},
+    ]
+
+    assert apply_prompt_caching(messages) == messages
+
+
+def test_prompt_caching_splits_at_cache_prefix():
+    from src.app.services.llm import PROMPT_CACHE_MIN_CHARS, apply_prompt_caching
+
+    static = "x" * PROMPT_CACHE_MIN_CHARS
+    messages = [
+        {"role": "system", "content": static + "\n\nDeal stage: discovery", "cache_prefix": static},
+        {"role": "user", "content": "Draft the email"},
+    ]
+
+    result = apply_prompt_caching(messages)
+
+    assert "cache_prefix" not in result[0]
+    assert result[0]["content"] == [
+        {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "\n\nDeal stage: discovery"},
+    ]
+
+
+def test_prompt_caching_skips_short_prefixes_and_disabled():
+    from src.app.services.llm import PROMPT_CACHE_MIN_CHARS, apply_prompt_caching
+
+    short = [{"role": "system", "content": "Be brief.", "cache_prefix": "Be"}]
+    assert apply_prompt_caching(short) == [{"role": "system", "content": "Be brief."}]
+
+    long = [{"role": "system", "content": "x" * PROMPT_CACHE_MIN_CHARS}]
+    assert apply_prompt_caching(long, enabled=False) == long
+
+
+def test_extract_usage_reports_prompt_cache_tokens():
+    from types import SimpleNamespace
+
+    from src.app.services.llm import extract_usage
+
+    anthropic = SimpleNamespace(
+        prompt_tokens=1500,
+        completion_tokens=80,
+        total_tokens=1580,
+        cache_read_input_tokens=1400,
+        cache_creation_input_tokens=0,
+    )
+    openai = SimpleNamespace(
+        prompt_tokens=1500,
+        completion_tokens=80,
+        total_tokens=1580,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+    )
+
+    assert extract_usage(anthropic)["cache_read_tokens"] == 1400
+    assert extract_usage(anthropic)["cache_write_tokens"] == 0
+    assert extract_usage(openai)["cache_read_tokens"] == 1024
+    assert extract_usage(openai)["cache_write_tokens"] == 0
+    assert extract_usage(None) == {}
+
+
+async def test_completion_sends_cache_control_and_returns_cache_usage(tenant_ctx):
+    from src.app.agents.sales.prompts import STATIC_SYSTEM_PROMPT, build_email_prompt
+    from src.app.agents.sales.schemas import DealStage, PersonaType
+
+    service = _cached_service()
+    usage = service.router.acompletion.return_value.usage
+    usage.cache_read_input_tokens = 1300
+    usage.cache_creation_input_tokens = 0
+    messages = build_email_prompt(
+        persona=PersonaType.MANAGER,
+        deal_stage=DealStage.DISCOVERY,
+        context_summary="Account: Acme",
+        task_description="Follow up on pricing",
+    )
+
+    result = await service.completion(messages)
+
+    sent = service.router.acompletion.call_args.kwargs["messages"]
+    assert sent[0]["content"][0] == {
+        "type": "text",
+        "text": STATIC_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert "adapted for manager persona" in sent[0]["content"][1]["text"]
+    assert result["usage"]["cache_read_tokens"] == 1300
+    assert result["usage"]["cache_write_tokens"] == 0
+
+
+# ── Request Coalescing Tests ─────────────────────────────────────────────────
+
+
+async def test_concurrent_identical_completions_share_one_call(tenant_ctx):
+    import asyncio
+
+    from prometheus_client import REGISTRY
+
+    service = _cached_service()
+    release = asyncio.Event()
+    response = service.router.acompletion.return_value
+
+    async def slow_completion(**kwargs):
+        await release.wait()
+        return response
+
+    service.router.acompletion = AsyncMock(side_effect=slow_completion)
+    labels = {"model": "fast", "tenant_id": "tenant-a"}
+    before = REGISTRY.get_sample_value("llm_coalesced_requests_total", labels) or 0
+    messages = [{"role": "user", "content": "Summarize account acct-1"}]
+
+    tasks = [
+        asyncio.create_task(service.completion(messages, model="fast", temperature=0.0))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    service.router.acompletion.assert_awaited_once()
+    assert {r["content"] for r in results} == {'{"valid": true}'}
+    assert sum(bool(r.get("coalesced")) for r in results) == 2
+    assert REGISTRY.get_sample_value("llm_coalesced_requests_total", labels) == before + 2
+
+
+async def test_coalescing_is_scoped_per_tenant():
+    import asyncio
+
+    from src.app.core.tenant import TenantContext, _tenant_context, set_tenant_context
+
+    service = _cached_service()
+    release = asyncio.Event()
+    response = service.router.acompletion.return_value
+
+    async def slow_completion(**kwargs):
+        await release.wait()
+        return response
+
+    service.router.acompletion = AsyncMock(side_effect=slow_completion)
+    messages = [{"role": "user", "content": "Summarize account acct-1"}]
+
+    async def call_as(tenant_id: str) -> dict:
+        token = set_tenant_context(TenantContext(tenant_id, tenant_id, tenant_id))
+        try:
+            return await service.completion(messages, model="fast")
+        finally:
+            _tenant_context.reset(token)
+
+    tasks = [asyncio.create_task(call_as(t)) for t in ("tenant-a", "tenant-b")]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert service.router.acompletion.await_count == 2
+    assert [r["tenant_id"] for r in results] == ["tenant-a", "tenant-b"]
+    assert not any(r.get("coalesced") for r in results)
+
+
+# ── Structured Completion Tests ──────────────────────────────────────────────
+
+
+def _structured_service(arguments: dict):
+    """LLMService whose router answers with a tool call carrying arguments."""
+    import json
+
+    import litellm
+
+    service = _cached_service()
+    response = litellm.ModelResponse(
+        model="claude-sonnet",
+        choices=[{
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{
+                    "id": "call-1",
+                    "type": "function",
+                    "function": {"name": "Signals", "arguments": json.dumps(arguments)},
+                }],
+            },
+        }],
+        usage={"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150},
+    )
+    service.router.acompletion = AsyncMock(return_value=response)
+    return service
+
+
+class Signals(BaseModel):
+    confidence: float
+    topics: list[str]
+
+
+async def test_structured_completion_routes_through_router_with_metrics(tenant_ctx):
+    from prometheus_client import REGISTRY
+
+    service = _structured_service({"confidence": 0.9, "topics": ["budget"]})
+    labels = {"model": "reasoning", "tenant_id": "tenant-a"}
+    requests_before = REGISTRY.get_sample_value(
+        "llm_requests_total", {**labels, "status": "success"}
+    ) or 0
+    tokens_before = REGISTRY.get_sample_value(
+        "llm_tokens_used_total", {**labels, "token_type": "prompt"}
+    ) or 0
+
+    result = await service.structured_completion(
+        [{"role": "user", "content": "Extract signals"}],
+        response_model=Signals,
+        metadata={"purpose": "test"},
+    )
+
+    assert result == Signals(confidence=0.9, topics=["budget"])
+    kwargs = service.router.acompletion.await_args.kwargs
+    assert kwargs["model"] == "reasoning"
+    assert kwargs["metadata"] == {"tenant_id": "tenant-a", "tenant_slug": "alpha", "purpose": "test"}
+    assert REGISTRY.get_sample_value(
+        "llm_requests_total", {**labels, "status": "success"}
+    ) == requests_before + 1
+    assert REGISTRY.get_sample_value(
+        "llm_tokens_used_total", {**labels, "token_type": "prompt"}
+    ) == tokens_before + 120
+
+
+async def test_structured_completion_cache_returns_fresh_instances(tenant_ctx):
+    service = _structured_service({"confidence": 0.4, "topics": ["timeline"]})
+    messages = [{"role": "user", "content": "Extract signals"}]
+
+    first = await service.structured_completion(messages, response_model=Signals, cache_ttl=60)
+    first.topics.append("mutated by caller")
+    second = await service.structured_completion(messages, response_model=Signals, cache_ttl=60)
+
+    service.router.acompletion.assert_awaited_once()
+    assert second == Signals(confidence=0.4, topics=["timeline"])
+
+
+async def test_structured_completion_keys_on_response_model(tenant_ctx):
+    class OtherSignals(BaseModel):
+        confidence: float
+        topics: list[str]
+        reasoning: str = ""
+
+    service = _structured_service({"confidence": 0.4, "topics": []})
+    messages = [{"role": "user", "content": "Extract signals"}]
+
+    await service.structured_completion(messages, response_model=Signals, cache_ttl=60)
+    await service.structured_completion(messages, response_model=OtherSignals, cache_ttl=60)
+
+    assert service.router.acompletion.await_count == 2
+
+
+async def test_structured_completion_coalesces_concurrent_calls(tenant_ctx):
+    import asyncio
+
+    service = _structured_service({"confidence": 0.7, "topics": ["pain"]})
+    release = asyncio.Event()
+    response = service.router.acompletion.return_value
+
+    async def slow_completion(**kwargs):
+        await release.wait()
+        return response
+
+    service.router.acompletion = AsyncMock(side_effect=slow_completion)
+    messages = [{"role": "user", "content": "Extract signals"}]
+
+    tasks = [
+        asyncio.create_task(service.structured_completion(messages, response_model=Signals))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    service.router.acompletion.assert_awaited_once()
+    assert all(r == Signals(confidence=0.7, topics=["pain"]) for r in results)
+    assert len({id(r) for r in results}) == 3
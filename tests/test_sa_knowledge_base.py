@@ -67,7 +67,7 @@ async def test_hybrid_search_filter_accepts_list_values(tmp_path):
     )
 
     # Mock query_points to avoid actual Qdrant call and capture the filter arg
-    mock_query_points = MagicMock(return_value=MagicMock(points=[]))
+    mock_query_points = AsyncMock(return_value=MagicMock(points=[]))
     store._client.query_points = mock_query_points
 
     await store.hybrid_search(